@@ -67,8 +67,10 @@ from ..prod.product_aux import get_prodgen_func
 
 try:
     import dask
+    _DASK_AVAILABLE = True
 except ImportError:
     warn('dask not available: The processing will not be parallelized')
+    _DASK_AVAILABLE = False
 
 PROFILE_LEVEL = 0
 
@@ -776,7 +778,9 @@ def _generate_dataset(dsname, cfg, dscfg, proc_status=0, radar_list=None,
         string containing run info
     MULTIPROCESSING_PROD : Bool
         If true the generation of products from each dataset will be
-        parallelized
+        parallelized using dask worker processes. Without dask the products
+        are generated sequentially since the plotting code relies on the
+        global state of pyplot and is not thread safe
 
     Returns
     -------
@@ -824,16 +828,20 @@ def _generate_dataset(dsname, cfg, dscfg, proc_status=0, radar_list=None,
 
     # create the data set products
     if 'products' in dscfg:
-        if MULTIPROCESSING_PROD:
+        if MULTIPROCESSING_PROD and _DASK_AVAILABLE:
+            # delay the data hashing. The dataset and the configuration
+            # enter the task graph once and are shared by all the products
+            new_dataset_aux = dask.delayed(new_dataset)
+            cfg_aux = dask.delayed(cfg)
             jobs = []
             for product in dscfg['products']:
-                # delay the data hashing
-                new_dataset = dask.delayed(new_dataset)
                 jobs.append(dask.delayed(_generate_prod)(
-                    new_dataset, cfg, product, prod_func, dscfg['dsname'],
-                    voltime, runinfo=runinfo))
+                    new_dataset_aux, cfg_aux, product, prod_func,
+                    dscfg['dsname'], voltime, runinfo=runinfo))
 
             dask.compute(*jobs)
+            del new_dataset_aux
+            del cfg_aux
 
         else:
             for product in dscfg['products']:
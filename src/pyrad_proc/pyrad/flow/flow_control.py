@@ -87,7 +87,9 @@ def main(cfgfile, starttime=None, endtime=None, trajfile="", trajtype='plane',
         be parallelized
     MULTIPROCESSING_PROD : Bool
         If true the generation of products from each dataset will be
-        parallelized
+        parallelized. Requires dask. Without dask the products are generated
+        sequentially since the plotting code relies on the global state of
+        pyplot and is not thread safe
     PROFILE_MULTIPROCESSING : Bool
         If true and code parallelized the multiprocessing is profiled
     USE_CHILD_PROCESS : Bool
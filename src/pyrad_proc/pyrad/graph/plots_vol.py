@@ -494,13 +494,13 @@ def plot_bscope(radar, field_name, ind_sweep, prdcfg, fname_list,
     radar_aux = radar.extract_sweeps([ind_sweep])
     if ray_dim == 'ang':
         if radar_aux.scan_type == 'ppi':
-            ray = np.sort(radar_aux.azimuth['data'])
             ind_ray = np.argsort(radar_aux.azimuth['data'])
+            ray = radar_aux.azimuth['data'][ind_ray]
             field = radar_aux.fields[field_name]['data'][ind_ray, :]
             ray_label = 'azimuth angle (degrees)'
         elif radar_aux.scan_type == 'rhi':
-            ray = np.sort(radar_aux.elevation['data'])
             ind_ray = np.argsort(radar_aux.elevation['data'])
+            ray = radar_aux.elevation['data'][ind_ray]
             field = radar_aux.fields[field_name]['data'][ind_ray, :]
             ray_label = 'elevation angle (degrees)'
         else:
@@ -508,10 +508,10 @@ def plot_bscope(radar, field_name, ind_sweep, prdcfg, fname_list,
             ray = np.array(range(radar_aux.nrays))
             ray_label = 'ray number'
     else:
-        ray = np.sort(radar_aux.time['data'])
+        ind_ray = np.argsort(radar_aux.time['data'])
+        ray = radar_aux.time['data'][ind_ray]
         start_time = ray[0]
         ray -= start_time
-        ind_ray = np.argsort(radar_aux.time['data'])
         field = radar_aux.fields[field_name]['data'][ind_ray, :]
         sweep_start_time = num2date(
             start_time, radar_aux.time['units'], radar_aux.time['calendar'])
@@ -519,6 +519,9 @@ def plot_bscope(radar, field_name, ind_sweep, prdcfg, fname_list,
             'time [s from ' +
             sweep_start_time.strftime('%Y-%m-%d %H:%M:%S')+' UTC]')
 
+    # single precision is enough for plotting
+    field = field.astype(np.float32, copy=False)
+
     # display data
     titl = pyart.graph.common.generate_title(radar_aux, field_name, 0)
     label = get_colobar_label(radar_aux.fields[field_name], field_name)
@@ -605,7 +608,10 @@ def plot_time_range(radar, field_name, ind_sweep, prdcfg, fname_list,
 
     """
     radar_aux = radar.extract_sweeps([ind_sweep])
-    field = radar_aux.fields[field_name]['data']
+
+    # single precision is enough for plotting
+    field = radar_aux.fields[field_name]['data'].astype(
+        np.float32, copy=False)
 
     # display data
     titl = pyart.graph.common.generate_title(radar_aux, field_name, ind_sweep)
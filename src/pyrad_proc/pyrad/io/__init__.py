@@ -148,7 +148,9 @@ Auxiliary functions
     map_hydro
     map_Doppler
     get_save_dir
+    get_product_save_dir
     make_filename
+    make_single_filename
     generate_field_name_str
     get_fieldname_pyart
     get_fieldname_cosmo
@@ -234,6 +236,7 @@ from .write_data import write_trt_thundertracking_data, write_ts_grid_data
 from .write_data import write_trt_rpc
 
 from .io_aux import get_save_dir, make_filename, get_new_rainbow_file_name
+from .io_aux import make_single_filename, get_product_save_dir
 from .io_aux import get_datetime, get_dataset_fields, map_hydro, map_Doppler
 from .io_aux import get_file_list, get_trtfile_list, get_datatype_fields
 from .io_aux import get_fieldname_pyart, get_field_unit, get_fieldname_cosmo
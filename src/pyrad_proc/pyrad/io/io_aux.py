@@ -11,7 +11,9 @@ Auxiliary functions for reading/writing files
     map_hydro
     map_Doppler
     get_save_dir
+    get_product_save_dir
     make_filename
+    make_single_filename
     generate_field_name_str
     get_datatype_metranet
     get_datatype_odim
@@ -46,6 +48,7 @@ import datetime
 
 from warnings import warn
 from copy import deepcopy
+from functools import lru_cache
 import numpy as np
 
 from pyart.config import get_metadata
@@ -411,12 +414,42 @@ def get_save_dir(basepath, procname, dsname, prdname, timeinfo=None,
     if create_dir is False:
         return savedir
 
-    if not os.path.isdir(savedir):
-        os.makedirs(savedir)
+    os.makedirs(savedir, exist_ok=True)
 
     return savedir
 
 
+def get_product_save_dir(prdcfg, timeinfo, prdsavedir=None):
+    """
+    obtains the path to the directory of a product from its configuration
+    and creates it if it does not exist
+
+    Parameters
+    ----------
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+    timeinfo : datetime or None
+        time info to generate the date directory. If None there is no time
+        format in the path
+    prdsavedir : str or None
+        name of the product directory. If None it is obtained from the
+        product configuration
+
+    Returns
+    -------
+    savedir : str
+        path to product
+
+    """
+    dssavedir = prdcfg.get('dssavename', prdcfg['dsname'])
+    if prdsavedir is None:
+        prdsavedir = prdcfg.get('prdsavedir', prdcfg['prdname'])
+
+    return get_save_dir(
+        prdcfg['basepath'], prdcfg['procname'], dssavedir, prdsavedir,
+        timeinfo=timeinfo)
+
+
 def make_filename(prdtype, dstype, dsname, ext_list, prdcfginfo=None,
                   timeinfo=None, timeformat='%Y%m%d%H%M%S',
                   runinfo=None):
@@ -447,6 +480,44 @@ def make_filename(prdtype, dstype, dsname, ext_list, prdcfginfo=None,
     fname_list : list of str
         list of file names (as many as extensions)
 
+    """
+    fname_root = make_single_filename(
+        prdtype, dstype, dsname, '', prdcfginfo=prdcfginfo,
+        timeinfo=timeinfo, timeformat=timeformat, runinfo=runinfo)
+
+    return [fname_root + ext for ext in ext_list]
+
+
+def make_single_filename(prdtype, dstype, dsname, ext, prdcfginfo=None,
+                         timeinfo=None, timeformat='%Y%m%d%H%M%S',
+                         runinfo=None):
+    """
+    creates a product file name with a single extension
+
+    Parameters
+    ----------
+    prdtype : str
+        product type, i.e. 'ppi', etc.
+    dstype : str
+        data set type, i.e. 'raw', etc.
+    dsname : str
+        data set name
+    ext : str
+        file name extension, i.e. 'csv'
+    prdcfginfo : str
+        Optional. string to add product configuration information, i.e. 'el0.4'
+    timeinfo : datetime
+        time info to generate the date directory
+    timeformat : str
+        Optional. The time format
+    runinfo : str
+        Optional. Additional information about the test (e.g. 'RUN01', 'TS011')
+
+    Returns
+    -------
+    fname : str
+        the file name
+
     """
     if timeinfo is None:
         timeinfostr = ''
@@ -463,12 +534,8 @@ def make_filename(prdtype, dstype, dsname, ext_list, prdcfginfo=None,
     else:
         runstr = runinfo + '_'
 
-    fname_list = list()
-    for ext in ext_list:
-        fname_list.append(timeinfostr + runstr + prdtype + '_' +
-                          dstype + '_' + dsname + cfgstr + '.' + ext)
-
-    return fname_list
+    return (timeinfostr + runstr + prdtype + '_' + dstype + '_' + dsname +
+            cfgstr + '.' + ext)
 
 
 def generate_field_name_str(datatype):
@@ -1009,10 +1076,12 @@ def get_datatype_odim(datatype):
     return {datatype_odim: field_name}
 
 
+@lru_cache(maxsize=256)
 def get_fieldname_pyart(datatype):
     """
     maps the config file radar data type name into the corresponding rainbow
-    Py-ART field name
+    Py-ART field name. The mapping is cached since the same data types are
+    requested for every product
 
     Parameters
     ----------
@@ -883,23 +883,18 @@ def read_timeseries(fname):
     """
     try:
         with open(fname, 'r', newline='') as csvfile:
-            # first count the lines
-            reader = csv.DictReader(
-                row for row in csvfile if not row.startswith('#'))
-            nrows = sum(1 for row in reader)
-            value = np.ma.empty(nrows, dtype=float)
-
-            # now read the data
-            csvfile.seek(0)
+            # read the data in a single pass over the file
             reader = csv.DictReader(
                 row for row in csvfile if not row.startswith('#'))
             date = list()
-            for i, row in enumerate(reader):
+            value = list()
+            for row in reader:
                 date.append(datetime.datetime.strptime(
                     row['date'][0:19], '%Y-%m-%d %H:%M:%S'))
-                value[i] = float(row['value'])
+                value.append(float(row['value']))
 
-            value = np.ma.masked_values(value, get_fillvalue())
+            value = np.ma.masked_values(
+                np.array(value, dtype=float), get_fillvalue())
 
             csvfile.close()
 
@@ -1049,37 +1044,32 @@ def read_monitoring_ts(fname, sort_by_date=False):
                     else:
                         time.sleep(0.1)
 
-            # first count the lines
+            # read the data in a single pass over the file
             reader = csv.DictReader(
                 row for row in csvfile if not row.startswith('#'))
-            nrows = sum(1 for row in reader)
-            np_t = np.zeros(nrows, dtype=int)
-            central_quantile = np.ma.empty(nrows, dtype=float)
-            low_quantile = np.ma.empty(nrows, dtype=float)
-            high_quantile = np.ma.empty(nrows, dtype=float)
-            date = np.empty(nrows, dtype=datetime.datetime)
-
-            # now read the data
-            csvfile.seek(0)
-            reader = csv.DictReader(
-                row for row in csvfile if not row.startswith('#'))
-            for i, row in enumerate(reader):
-                date[i] = datetime.datetime.strptime(
-                    row['date'], '%Y%m%d%H%M%S')
-                np_t[i] = int(row['NP'])
-                central_quantile[i] = float(row['central_quantile'])
-                low_quantile[i] = float(row['low_quantile'])
-                high_quantile[i] = float(row['high_quantile'])
+            date = list()
+            np_t = list()
+            quantiles = list()
+            for row in reader:
+                date.append(datetime.datetime.strptime(
+                    row['date'], '%Y%m%d%H%M%S'))
+                np_t.append(int(row['NP']))
+                quantiles.append((
+                    float(row['central_quantile']),
+                    float(row['low_quantile']),
+                    float(row['high_quantile'])))
 
             fcntl.flock(csvfile, fcntl.LOCK_UN)
             csvfile.close()
 
-            central_quantile = np.ma.masked_values(
-                central_quantile, get_fillvalue())
-            low_quantile = np.ma.masked_values(
-                low_quantile, get_fillvalue())
-            high_quantile = np.ma.masked_values(
-                high_quantile, get_fillvalue())
+            date = np.array(date, dtype=datetime.datetime)
+            np_t = np.array(np_t, dtype=int)
+            quantiles = np.ma.masked_values(
+                np.array(quantiles, dtype=float).reshape(-1, 3),
+                get_fillvalue())
+            central_quantile = quantiles[:, 0]
+            low_quantile = quantiles[:, 1]
+            high_quantile = quantiles[:, 2]
 
             if sort_by_date:
                 ind = np.argsort(date)
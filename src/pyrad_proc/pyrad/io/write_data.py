@@ -1582,18 +1582,10 @@ def write_excess_gates(excess_dict, fname):
         fieldnames = [
             'ray_ind', 'rng_ind', 'ele', 'azi', 'rng', 'nsamples',
             'occurrence', 'freq_occu']
-        writer = csv.DictWriter(csvfile, fieldnames)
-        writer.writeheader()
-        for i, ray_ind in enumerate(excess_dict['ray_ind']):
-            writer.writerow({
-                'ray_ind': ray_ind,
-                'rng_ind': excess_dict['rng_ind'][i],
-                'ele': excess_dict['ele'][i],
-                'azi': excess_dict['azi'][i],
-                'rng': excess_dict['rng'][i],
-                'nsamples': excess_dict['nsamples'][i],
-                'occurrence': excess_dict['occurrence'][i],
-                'freq_occu': excess_dict['freq_occu'][i]})
+        writer = csv.writer(csvfile)
+        writer.writerow(fieldnames)
+        writer.writerows(
+            zip(*[excess_dict[fieldname] for fieldname in fieldnames]))
 
         csvfile.close()
 
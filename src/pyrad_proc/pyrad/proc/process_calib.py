@@ -30,6 +30,7 @@ from ..io.read_data_radar import interpol_field
 
 from ..util.radar_utils import get_closest_solar_flux, get_histogram_bins
 from ..util.radar_utils import find_ray_index, find_rng_index
+from ..util.radar_utils import compute_histogram_counts
 
 
 def process_correct_bias(procstatus, dscfg, radar_list=None):
@@ -355,8 +356,8 @@ def process_gc_monitoring(procstatus, dscfg, radar_list=None):
         field[field < bin_centers[0]] = bin_centers[0]
         field[field > bin_centers[-1]] = bin_centers[-1]
 
-        field_dict['data'][0, :], bin_edges = np.histogram(
-            field, bins=bin_edges)
+        field_dict['data'][0, :] = compute_histogram_counts(
+            field, bin_edges)
         radar_aux.add_field(field_name, field_dict)
         start_time = pyart.graph.common.generate_radar_time_begin(radar_aux)
 
@@ -514,16 +515,16 @@ def process_occurrence(procstatus, dscfg, radar_list=None):
         # filter out out of range data
         rmin = dscfg.get('rmin', -1.)
         rmax = dscfg.get('rmax', -1.)
+        # the range gates are sorted. The slices are empty when there
+        # are no gates outside the limits
         if rmin >= 0.:
-            ind_min = np.where(radar_aux.range['data'] < rmin)[0]
-            if ind_min:
-                ind_min = ind_min[-1]
-                occu_dict['data'][:, 0:ind_min+1] = 0
+            ind_min = np.searchsorted(
+                radar_aux.range['data'], rmin, side='left')
+            occu_dict['data'][:, :ind_min] = 0
         if rmax >= 0.:
-            ind_max = np.where(radar_aux.range['data'] > rmax)[0]
-            if ind_max:
-                ind_max = ind_max[0]
-                occu_dict['data'][:, ind_max:radar_aux.ngates] = 0
+            ind_max = np.searchsorted(
+                radar_aux.range['data'], rmax, side='right')
+            occu_dict['data'][:, ind_max:] = 0
 
         radar_aux.add_field('occurrence', occu_dict)
 
@@ -721,16 +722,16 @@ def process_time_avg_std(procstatus, dscfg, radar_list=None):
         # filter out out of range data
         rmin = dscfg.get('rmin', -1.)
         rmax = dscfg.get('rmax', -1.)
+        # the range gates are sorted. The slices are empty when there
+        # are no gates outside the limits
         if rmin >= 0.:
-            ind_min = np.where(radar.range['data'] < rmin)[0]
-            if ind_min:
-                ind_min = ind_min[-1]
-                mask[:, 0:ind_min+1] = 1
+            ind_min = np.searchsorted(
+                radar.range['data'], rmin, side='left')
+            mask[:, :ind_min] = 1
         if rmax >= 0.:
-            ind_max = np.where(radar.range['data'] > rmax)[0]
-            if ind_max:
-                ind_max = ind_max[0]
-                mask[:, ind_max:radar.ngates] = 1
+            ind_max = np.searchsorted(
+                radar.range['data'], rmax, side='right')
+            mask[:, ind_max:] = 1
 
         # prepare field number of samples and values sum
         field = deepcopy(radar.fields[field_name]['data'])
@@ -911,17 +912,16 @@ def process_occurrence_period(procstatus, dscfg, radar_list=None):
         # filter out out of range data
         rmin = dscfg.get('rmin', -1.)
         rmax = dscfg.get('rmax', -1.)
+        # the range gates are sorted. The slices are empty when there
+        # are no gates outside the limits
         if rmin >= 0.:
-            ind_min = np.where(radar_aux.range['data'] < rmin)[0]
-            if ind_min:
-                ind_min = ind_min[-1]
-                radar_aux.fields['occurrence']['data'][:, 0:ind_min+1] = 0
+            ind_min = np.searchsorted(
+                radar_aux.range['data'], rmin, side='left')
+            radar_aux.fields['occurrence']['data'][:, :ind_min] = 0
         if rmax >= 0.:
-            ind_max = np.where(radar_aux.range['data'] > rmax)[0]
-            if ind_max:
-                ind_max = ind_max[0]
-                radar_aux.fields['occurrence']['data'][
-                    :, ind_max:radar_aux.ngates] = 0
+            ind_max = np.searchsorted(
+                radar_aux.range['data'], rmax, side='right')
+            radar_aux.fields['occurrence']['data'][:, ind_max:] = 0
 
         # first volume: initialize radar object
         if dscfg['initialized'] == 0:
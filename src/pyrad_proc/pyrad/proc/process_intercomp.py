@@ -17,6 +17,7 @@ Functions used in the inter-comparison between radars
     process_intercomp_time_avg
     process_fields_diff
     process_intercomp_fields
+    _range_window
 
 """
 
@@ -1518,27 +1519,13 @@ def process_intercomp(procstatus, dscfg, radar_list=None):
         rad2_ray_ind = rad2_ray_ind[isvalid]
         rad2_rng_ind = rad2_rng_ind[isvalid]
 
-        # if averaging required loop over valid gates and average
+        # if averaging required average the gates in a range window
+        # around each valid gate. Only if all gates in the window valid
         if avg_rad1:
-            ngates_valid = len(rad1_ray_ind)
-            val1_vec = np.ma.masked_all(ngates_valid, dtype=float)
-            is_valid_avg = np.zeros(ngates_valid, dtype=bool)
-            for i in range(ngates_valid):
-                if rad1_rng_ind[i]+avg_rad_lim[1] >= radar1.ngates:
-                    continue
-                if rad1_rng_ind[i]+avg_rad_lim[0] < 0:
-                    continue
-                ind_rng = list(range(rad1_rng_ind[i]+avg_rad_lim[0],
-                                     rad1_rng_ind[i]+avg_rad_lim[1]+1))
-
-                if np.any(np.ma.getmaskarray(
-                        rad1_field[rad1_ray_ind[i], ind_rng])):
-                    continue
-
-                val1_vec[i] = np.ma.asarray(np.ma.mean(
-                    rad1_field[rad1_ray_ind[i], ind_rng]))
-
-                is_valid_avg[i] = True
+            val1_win, is_valid_avg = _range_window(
+                rad1_field, rad1_ray_ind, rad1_rng_ind, avg_rad_lim)
+            val1_vec = np.ma.asarray(
+                np.ma.getdata(val1_win).mean(axis=1))
 
             rad1_ray_ind = rad1_ray_ind[is_valid_avg]
             rad1_rng_ind = rad1_rng_ind[is_valid_avg]
@@ -1549,25 +1536,10 @@ def process_intercomp(procstatus, dscfg, radar_list=None):
             val2_vec = rad2_field[rad2_ray_ind, rad2_rng_ind]
 
         elif avg_rad2:
-            ngates_valid = len(rad2_ray_ind)
-            val2_vec = np.ma.masked_all(ngates_valid, dtype=float)
-            is_valid_avg = np.zeros(ngates_valid, dtype=bool)
-            for i in range(ngates_valid):
-                if rad2_rng_ind[i]+avg_rad_lim[1] >= radar2.ngates:
-                    continue
-                if rad2_rng_ind[i]+avg_rad_lim[0] < 0:
-                    continue
-                ind_rng = list(range(rad2_rng_ind[i]+avg_rad_lim[0],
-                                     rad2_rng_ind[i]+avg_rad_lim[1]+1))
-
-                if np.any(np.ma.getmaskarray(
-                        rad2_field[rad2_ray_ind[i], ind_rng])):
-                    continue
-
-                val2_vec[i] = np.ma.asarray(np.ma.mean(
-                    rad2_field[rad2_ray_ind[i], ind_rng]))
-
-                is_valid_avg[i] = True
+            val2_win, is_valid_avg = _range_window(
+                rad2_field, rad2_ray_ind, rad2_rng_ind, avg_rad_lim)
+            val2_vec = np.ma.asarray(
+                np.ma.getdata(val2_win).mean(axis=1))
 
             rad1_ray_ind = rad1_ray_ind[is_valid_avg]
             rad1_rng_ind = rad1_rng_ind[is_valid_avg]
@@ -1865,46 +1837,33 @@ def process_intercomp_time_avg(procstatus, dscfg, radar_list=None):
         rad2_ray_ind = rad2_ray_ind[isvalid]
         rad2_rng_ind = rad2_rng_ind[isvalid]
 
-        # if averaging required loop over valid gates and average
-        # only if all gates valid
+        # if averaging required average the gates in a range window
+        # around each valid gate. Only if all gates in the window valid
         if avg_rad1:
-            ngates_valid = len(rad1_ray_ind)
-            refl1_vec = np.ma.masked_all(ngates_valid, dtype=float)
-            phidp1_vec = np.ma.masked_all(ngates_valid, dtype=float)
-            flag1_vec = np.ma.masked_all(ngates_valid, dtype=int)
-            is_valid_avg = np.zeros(ngates_valid, dtype=bool)
-            for i in range(ngates_valid):
-                if rad1_rng_ind[i]+avg_rad_lim[1] >= radar1.ngates:
-                    continue
-                if rad1_rng_ind[i]+avg_rad_lim[0] < 0:
-                    continue
-                ind_rng = list(range(rad1_rng_ind[i]+avg_rad_lim[0],
-                                     rad1_rng_ind[i]+avg_rad_lim[1]+1))
-
-                if np.any(np.ma.getmaskarray(
-                        refl1[rad1_ray_ind[i], ind_rng])):
-                    continue
-                if np.any(np.ma.getmaskarray(
-                        phidp1[rad1_ray_ind[i], ind_rng])):
-                    continue
-
-                refl1_vec[i] = np.ma.asarray(np.ma.mean(
-                    refl1[rad1_ray_ind[i], ind_rng]))
-                phidp1_vec[i] = np.ma.asarray(np.ma.mean(
-                    phidp1[rad1_ray_ind[i], ind_rng]))
-
-                rad1_flag = flag1[rad1_ray_ind[i], ind_rng]
-
-                rad1_excess_phi = rad1_flag % 100
-                rad1_clt = ((rad1_flag-rad1_excess_phi) % 10000) / 100
-                rad1_prec = (
-                    ((rad1_flag-rad1_clt*100-rad1_excess_phi) % 1000000) /
-                    10000)
-
-                flag1_vec[i] = int(
-                    10000*np.max(rad1_prec)+100*np.max(rad1_clt) +
-                    np.max(rad1_excess_phi))
-                is_valid_avg[i] = True
+            refl1_win, is_valid_avg = _range_window(
+                refl1, rad1_ray_ind, rad1_rng_ind, avg_rad_lim)
+            phidp1_win, is_valid_phidp = _range_window(
+                phidp1, rad1_ray_ind, rad1_rng_ind, avg_rad_lim)
+            rad1_flag, _ = _range_window(
+                flag1, rad1_ray_ind, rad1_rng_ind, avg_rad_lim)
+            is_valid_avg &= is_valid_phidp
+
+            refl1_vec = np.ma.asarray(
+                np.ma.getdata(refl1_win).mean(axis=1))
+            phidp1_vec = np.ma.asarray(
+                np.ma.getdata(phidp1_win).mean(axis=1))
+
+            # the flag of the window is made of the worst value of each
+            # of its components
+            rad1_excess_phi = rad1_flag % 100
+            rad1_clt = ((rad1_flag-rad1_excess_phi) % 10000) / 100
+            rad1_prec = (
+                ((rad1_flag-rad1_clt*100-rad1_excess_phi) % 1000000) /
+                10000)
+            flag1_vec = (
+                10000*np.ma.max(rad1_prec, axis=1) +
+                100*np.ma.max(rad1_clt, axis=1) +
+                np.ma.max(rad1_excess_phi, axis=1)).astype(int)
 
             rad1_ray_ind = rad1_ray_ind[is_valid_avg]
             rad1_rng_ind = rad1_rng_ind[is_valid_avg]
@@ -1920,43 +1879,30 @@ def process_intercomp_time_avg(procstatus, dscfg, radar_list=None):
             flag2_vec = flag2[rad2_ray_ind, rad2_rng_ind]
 
         elif avg_rad2:
-            ngates_valid = len(rad2_ray_ind)
-            refl2_vec = np.ma.masked_all(ngates_valid, dtype=float)
-            phidp2_vec = np.ma.masked_all(ngates_valid, dtype=float)
-            flag2_vec = np.ma.masked_all(ngates_valid, dtype=int)
-            is_valid_avg = np.zeros(ngates_valid, dtype=bool)
-            for i in range(ngates_valid):
-                if rad2_rng_ind[i]+avg_rad_lim[1] >= radar2.ngates:
-                    continue
-                if rad2_rng_ind[i]+avg_rad_lim[0] < 0:
-                    continue
-                ind_rng = list(range(rad2_rng_ind[i]+avg_rad_lim[0],
-                                     rad2_rng_ind[i]+avg_rad_lim[1]+1))
-
-                if np.any(np.ma.getmaskarray(
-                        refl2[rad2_ray_ind[i], ind_rng])):
-                    continue
-                if np.any(np.ma.getmaskarray(
-                        phidp2[rad2_ray_ind[i], ind_rng])):
-                    continue
-
-                refl2_vec[i] = np.ma.asarray(np.ma.mean(
-                    refl2[rad2_ray_ind[i], ind_rng]))
-                phidp2_vec[i] = np.ma.asarray(np.ma.mean(
-                    phidp2[rad2_ray_ind[i], ind_rng]))
-
-                rad2_flag = flag2[rad2_ray_ind[i], ind_rng]
-
-                rad2_excess_phi = rad2_flag % 100
-                rad2_clt = ((rad2_flag-rad2_excess_phi) % 10000) / 100
-                rad2_prec = (
-                    ((rad2_flag-rad2_clt*100-rad2_excess_phi) % 1000000) /
-                    10000)
-
-                flag2_vec[i] = int(
-                    10000*np.max(rad2_prec)+100*np.max(rad2_clt) +
-                    np.max(rad2_excess_phi))
-                is_valid_avg[i] = True
+            refl2_win, is_valid_avg = _range_window(
+                refl2, rad2_ray_ind, rad2_rng_ind, avg_rad_lim)
+            phidp2_win, is_valid_phidp = _range_window(
+                phidp2, rad2_ray_ind, rad2_rng_ind, avg_rad_lim)
+            rad2_flag, _ = _range_window(
+                flag2, rad2_ray_ind, rad2_rng_ind, avg_rad_lim)
+            is_valid_avg &= is_valid_phidp
+
+            refl2_vec = np.ma.asarray(
+                np.ma.getdata(refl2_win).mean(axis=1))
+            phidp2_vec = np.ma.asarray(
+                np.ma.getdata(phidp2_win).mean(axis=1))
+
+            # the flag of the window is made of the worst value of each
+            # of its components
+            rad2_excess_phi = rad2_flag % 100
+            rad2_clt = ((rad2_flag-rad2_excess_phi) % 10000) / 100
+            rad2_prec = (
+                ((rad2_flag-rad2_clt*100-rad2_excess_phi) % 1000000) /
+                10000)
+            flag2_vec = (
+                10000*np.ma.max(rad2_prec, axis=1) +
+                100*np.ma.max(rad2_clt, axis=1) +
+                np.ma.max(rad2_excess_phi, axis=1)).astype(int)
 
             rad1_ray_ind = rad1_ray_ind[is_valid_avg]
             rad1_rng_ind = rad1_rng_ind[is_valid_avg]
@@ -2244,3 +2190,41 @@ def process_intercomp_fields(procstatus, dscfg, radar_list=None):
                    'final': False}
 
     return new_dataset, None
+
+
+def _range_window(field, ray_ind, rng_ind, avg_rad_lim):
+    """
+    Gets the values of a field in a window of range gates around each of
+    the selected gates
+
+    Parameters
+    ----------
+    field : 2D masked array
+        the radar field
+    ray_ind, rng_ind : 1D int array
+        the ray and range indices of the selected gates
+    avg_rad_lim : array of two ints
+        the limits of the window with respect to the selected gate
+
+    Returns
+    -------
+    values : 2D masked array
+        the values in the window of each selected gate (one row per gate)
+    is_valid : 1D bool array
+        True if the window of the gate is within the radar range and all
+        its values are valid
+
+    """
+    ngates = field.shape[1]
+    ind_rng = (
+        rng_ind[:, np.newaxis] +
+        np.arange(avg_rad_lim[0], avg_rad_lim[1]+1)[np.newaxis, :])
+    is_valid = np.logical_and(
+        rng_ind+avg_rad_lim[0] >= 0, rng_ind+avg_rad_lim[1] < ngates)
+
+    # windows out of range are clipped. They are not valid anyway
+    values = field[ray_ind[:, np.newaxis], np.clip(ind_rng, 0, ngates-1)]
+    is_valid &= np.logical_not(
+        np.any(np.ma.getmaskarray(values), axis=1))
+
+    return values, is_valid
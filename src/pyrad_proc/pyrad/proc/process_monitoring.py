@@ -28,7 +28,7 @@ from ..io.io_aux import get_datatype_fields, get_fieldname_pyart
 from ..io.read_data_other import read_selfconsistency
 from ..io.read_data_radar import interpol_field
 
-from ..util.radar_utils import get_histogram_bins
+from ..util.radar_utils import get_histogram_bins, find_rng_limits
 from ..util.stat_utils import ratio_bootstrapping
 
 
@@ -930,8 +930,12 @@ def process_estimate_phidp0(procstatus, dscfg, radar_list=None):
         warn('Unable to estimate PhiDP system offset. Missing data')
         return None, None
 
-    ind_rmin = np.where(radar.range['data'] > dscfg['rmin'])[0][0]
-    ind_rmax = np.where(radar.range['data'] < dscfg['rmax'])[0][-1]
+    ind_rmin, ind_rmax = find_rng_limits(
+        radar.range['data'], dscfg['rmin'], dscfg['rmax'])
+    if ind_rmin is None:
+        warn('Unable to estimate PhiDP system offset. ' +
+             'No range gates between rmin and rmax')
+        return None, None
     r_res = radar.range['data'][1]-radar.range['data'][0]
     min_rcons = int(dscfg['rcell']/r_res)
 
@@ -1074,8 +1078,12 @@ def process_rhohv_rain(procstatus, dscfg, radar_list=None):
     if 'ml_thickness' in dscfg:
         thickness = dscfg['ml_thickness']
 
-    ind_rmin = np.where(radar.range['data'] > rmin)[0][0]
-    ind_rmax = np.where(radar.range['data'] < rmax)[0][-1]
+    ind_rmin, ind_rmax = find_rng_limits(
+        radar.range['data'], rmin, rmax)
+    if ind_rmin is None:
+        warn('Unable to estimate RhoHV in rain. ' +
+             'No range gates between rmin and rmax')
+        return None, None
 
     rhohv_rain = pyart.correct.est_rhohv_rain(
         radar, ind_rmin=ind_rmin, ind_rmax=ind_rmax, zmin=zmin,
@@ -1256,8 +1264,12 @@ def process_zdr_precip(procstatus, dscfg, radar_list=None):
     if 'ml_thickness' in dscfg:
         thickness = dscfg['ml_thickness']
 
-    ind_rmin = np.where(radar.range['data'] > rmin)[0][0]
-    ind_rmax = np.where(radar.range['data'] < rmax)[0][-1]
+    ind_rmin, ind_rmax = find_rng_limits(
+        radar.range['data'], rmin, rmax)
+    if ind_rmin is None:
+        warn('Unable to estimate ZDR in rain. ' +
+             'No range gates between rmin and rmax')
+        return None, None
 
     zdr_precip = pyart.correct.est_zdr_precip(
         radar, ind_rmin=ind_rmin, ind_rmax=ind_rmax, zmin=zmin,
@@ -1407,8 +1419,12 @@ def process_zdr_snow(procstatus, dscfg, radar_list=None):
     tempmax = dscfg.get('TEMPmax', None)
     hydroclass = dscfg.get('hydroclass', [2])
 
-    ind_rmin = np.where(radar.range['data'] > rmin)[0][0]
-    ind_rmax = np.where(radar.range['data'] < rmax)[0][-1]
+    ind_rmin, ind_rmax = find_rng_limits(
+        radar.range['data'], rmin, rmax)
+    if ind_rmin is None:
+        warn('Unable to estimate ZDR in snow. ' +
+             'No range gates between rmin and rmax')
+        return None, None
 
     zdr_snow = pyart.correct.est_zdr_snow(
         radar, ind_rmin=ind_rmin, ind_rmax=ind_rmax, zmin=zmin, zmax=zmax,
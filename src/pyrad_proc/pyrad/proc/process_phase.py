@@ -30,6 +30,7 @@ import numpy as np
 import pyart
 
 from ..io.io_aux import get_datatype_fields
+from ..util.radar_utils import find_rng_limits
 
 
 def process_correct_phidp0(procstatus, dscfg, radar_list=None):
@@ -94,8 +95,12 @@ def process_correct_phidp0(procstatus, dscfg, radar_list=None):
         warn('Unable to correct PhiDP system offset. Missing data')
         return None, None
 
-    ind_rmin = np.where(radar.range['data'] > dscfg['rmin'])[0][0]
-    ind_rmax = np.where(radar.range['data'] < dscfg['rmax'])[0][-1]
+    ind_rmin, ind_rmax = find_rng_limits(
+        radar.range['data'], dscfg['rmin'], dscfg['rmax'])
+    if ind_rmin is None:
+        warn('Unable to correct PhiDP system offset. ' +
+             'No range gates between rmin and rmax')
+        return None, None
     r_res = radar.range['data'][1]-radar.range['data'][0]
     min_rcons = int(dscfg['rcell']/r_res)
 
@@ -183,8 +188,12 @@ def process_smooth_phidp_single_window(procstatus, dscfg, radar_list=None):
         warn('Unable to smooth PhiDP. Missing data')
         return None, None
 
-    ind_rmin = np.where(radar.range['data'] > dscfg['rmin'])[0][0]
-    ind_rmax = np.where(radar.range['data'] < dscfg['rmax'])[0][-1]
+    ind_rmin, ind_rmax = find_rng_limits(
+        radar.range['data'], dscfg['rmin'], dscfg['rmax'])
+    if ind_rmin is None:
+        warn('Unable to smooth PhiDP. ' +
+             'No range gates between rmin and rmax')
+        return None, None
     r_res = radar.range['data'][1]-radar.range['data'][0]
     min_rcons = int(dscfg['rcell']/r_res)
     wind_len = int(dscfg['rwind']/r_res)
@@ -279,8 +288,12 @@ def process_smooth_phidp_double_window(procstatus, dscfg, radar_list=None):
         warn('Unable to smooth PhiDP. Missing data')
         return None, None
 
-    ind_rmin = np.where(radar.range['data'] > dscfg['rmin'])[0][0]
-    ind_rmax = np.where(radar.range['data'] < dscfg['rmax'])[0][-1]
+    ind_rmin, ind_rmax = find_rng_limits(
+        radar.range['data'], dscfg['rmin'], dscfg['rmax'])
+    if ind_rmin is None:
+        warn('Unable to smooth PhiDP. ' +
+             'No range gates between rmin and rmax')
+        return None, None
     r_res = radar.range['data'][1]-radar.range['data'][0]
     min_rcons = int(dscfg['rcell']/r_res)
     swind_len = int(dscfg['rwinds']/r_res)
@@ -429,8 +442,12 @@ def process_phidp_kdp_Maesaka(procstatus, dscfg, radar_list=None):
     radar_aux = deepcopy(radar)
 
     # correct PhiDP0
-    ind_rmin = np.where(radar_aux.range['data'] > dscfg['rmin'])[0][0]
-    ind_rmax = np.where(radar_aux.range['data'] < dscfg['rmax'])[0][-1]
+    ind_rmin, ind_rmax = find_rng_limits(
+        radar_aux.range['data'], dscfg['rmin'], dscfg['rmax'])
+    if ind_rmin is None:
+        warn('Unable to retrieve PhiDP KDP using the Maesaka approach. ' +
+             'No range gates between rmin and rmax')
+        return None, None
     r_res = radar_aux.range['data'][1]-radar_aux.range['data'][0]
     min_rcons = int(dscfg['rcell']/r_res)
 
@@ -403,9 +403,9 @@ def process_spectra_point(procstatus, dscfg, radar_list=None):
         psr_poi.elevation['data'], np.zeros(nrays)+el)
     start_time = num2date(
         0, psr_poi.time['units'], psr_poi.time['calendar'])
-    for i in range(nrays):
-        psr_poi.time['data'] = np.append(
-            psr_poi.time['data'], (time_poi[i] - start_time).total_seconds())
+    psr_poi.time['data'] = np.append(
+        psr_poi.time['data'],
+        [(time_poi[i] - start_time).total_seconds() for i in range(nrays)])
 
     psr_poi.gate_longitude['data'] = (
         np.ones((psr_poi.nrays, psr_poi.ngates), dtype='float64')*lon)
@@ -10,11 +10,21 @@ Functions for obtaining Pyrad products from gridded datasets
     generate_grid_time_avg_products
     generate_sparse_grid_products
     generate_grid_products
+    _generate_surface_image
+    _generate_surface_contour
+    _generate_surface_contour_overplot
+    _generate_latitude_slice
+    _generate_longitude_slice
+    _generate_cross_section
+    _generate_histogram
+    _generate_savevol
+    _generate_saveall
 
 """
 
+import os
 from warnings import warn
-from copy import deepcopy
+from copy import copy
 
 import numpy as np
 
@@ -22,6 +32,7 @@ import pyart
 
 from ..io.io_aux import get_fieldname_pyart
 from ..io.io_aux import get_save_dir, make_filename
+from ..io.io_aux import get_product_save_dir, make_single_filename
 from ..io.write_data import write_histogram
 
 from ..graph.plots_grid import plot_surface, plot_surface_contour
@@ -31,6 +42,7 @@ from ..graph.plots_aux import get_colobar_label, get_field_name
 from ..graph.plots import plot_histogram, plot_pos
 
 from ..util.radar_utils import compute_histogram
+from ..util.radar_utils import compute_histogram_counts
 
 
 def generate_grid_time_avg_products(dataset, prdcfg):
@@ -100,13 +112,12 @@ def generate_sparse_grid_products(dataset, prdcfg):
             prdcfg['imgformat'], timeinfo=prdcfg['timeinfo'],
             runinfo=prdcfg['runinfo'])
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+        fname_list = [os.path.join(savedir, fname) for fname in fname_list]
 
         cb_label = get_colobar_label(
             dataset['radar_out']['fields'][field_name], field_name)
 
-        titl = (prdcfg['timeinfo'].strftime('%Y-%m-%dT%H:%M%SZ')+'\n' +
+        titl = (prdcfg['timeinfo'].strftime('%Y-%m-%dT%H:%M:%SZ')+'\n' +
                 get_field_name(dataset['radar_out']['fields'][field_name],
                                field_name))
 
@@ -196,373 +207,542 @@ def generate_grid_products(dataset, prdcfg):
     None or name of generated files
 
     """
+    handler = _GRID_HANDLERS.get(prdcfg['type'])
+    if handler is not None:
+        return handler(dataset, prdcfg)
 
-    dssavedir = prdcfg['dsname']
-    if 'dssavename' in prdcfg:
-        dssavedir = prdcfg['dssavename']
+    warn(' Unsupported product type: ' + prdcfg['type'])
+    return None
 
-    if prdcfg['type'] == 'SURFACE_IMAGE':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
 
-        # user defined values
-        level = prdcfg.get('level', 0)
+def _generate_surface_image(dataset, prdcfg):
+    """
+    Plots a surface image of gridded data. The user defined parameters are
+    documented in generate_grid_products
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=prdcfg['timeinfo'])
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a grid object
 
-        fname_list = make_filename(
-            'surface', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'], prdcfginfo='l'+str(level),
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
 
-        plot_surface(
-            dataset['radar_out'], field_name, level, prdcfg, fname_list)
+    """
 
-        print('----- save to '+' '.join(fname_list))
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
 
-        return fname_list
+    # user defined values
+    level = prdcfg.get('level', 0)
 
-    if prdcfg['type'] == 'SURFACE_CONTOUR':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
 
-        # user defined values
-        contour_values = prdcfg.get('contour_values', None)
-        level = prdcfg.get('level', 0)
+    fname_list = make_filename(
+        'surface', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'], prdcfginfo='l'+str(level),
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=prdcfg['timeinfo'])
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
 
-        fname_list = make_filename(
-            'surface', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'], prdcfginfo='l'+str(level),
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+    plot_surface(
+        dataset['radar_out'], field_name, level, prdcfg, fname_list)
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+    print('----- save to '+' '.join(fname_list))
 
-        plot_surface_contour(
-            dataset['radar_out'], field_name, level, prdcfg, fname_list,
-            contour_values=contour_values)
+    return fname_list
 
-        print('----- save to '+' '.join(fname_list))
 
-        return fname_list
+def _generate_surface_contour(dataset, prdcfg):
+    """
+    Plots a surface contour plot of gridded data. The user defined parameters
+    are documented in generate_grid_products
 
-    if prdcfg['type'] == 'SURFACE_CONTOUR_OVERPLOT':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a grid object
 
-        contour_name = get_fieldname_pyart(prdcfg['contourtype'])
-        if contour_name not in dataset['radar_out'].fields:
-            warn(
-                'Contour type ' + contour_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
 
-        contour_values = prdcfg.get('contour_values', None)
-        level = prdcfg.get('level', 0)
-        contour_level = prdcfg.get('contour_level', level)
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=prdcfg['timeinfo'])
+    """
 
-        fname_list = make_filename(
-            'surface', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'], prdcfginfo='l'+str(level),
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+    # user defined values
+    contour_values = prdcfg.get('contour_values', None)
+    level = prdcfg.get('level', 0)
 
-        titl = (
-            pyart.graph.common.generate_grid_title(
-                dataset['radar_out'], field_name, level) +
-            ' - ' +
-            pyart.graph.common.generate_field_name(
-                dataset['radar_out'], contour_name))
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
 
-        fig, ax, display = plot_surface(
-            dataset['radar_out'], field_name, level, prdcfg, fname_list,
-            titl=titl, save_fig=False)
+    fname_list = make_filename(
+        'surface', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'], prdcfginfo='l'+str(level),
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
 
-        fname_list = plot_surface_contour(
-            dataset['radar_out'], contour_name, contour_level, prdcfg,
-            fname_list, contour_values=contour_values, ax=ax, fig=fig,
-            display=display, save_fig=True)
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
 
-        print('----- save to '+' '.join(fname_list))
+    plot_surface_contour(
+        dataset['radar_out'], field_name, level, prdcfg, fname_list,
+        contour_values=contour_values)
 
-        return fname_list
+    print('----- save to '+' '.join(fname_list))
 
-    if prdcfg['type'] == 'LATITUDE_SLICE':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+    return fname_list
 
-        # user defined values
-        lon = prdcfg.get(
-            'lon', dataset['radar_out'].origin_longitude['data'][0])
-        lat = prdcfg.get(
-            'lat', dataset['radar_out'].origin_latitude['data'][0])
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=prdcfg['timeinfo'])
+def _generate_surface_contour_overplot(dataset, prdcfg):
+    """
+    Plots a surface image of gridded data with contours of another field. The
+    user defined parameters are documented in generate_grid_products
 
-        fname_list = make_filename(
-            'lat_slice', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'], prdcfginfo='lat'+'{:.2f}'.format(lat),
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a grid object
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
 
-        plot_latitude_slice(
-            dataset['radar_out'], field_name, lon, lat, prdcfg, fname_list)
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
 
-        print('----- save to '+' '.join(fname_list))
+    """
 
-        return fname_list
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
 
-    if prdcfg['type'] == 'LONGITUDE_SLICE':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+    contour_name = get_fieldname_pyart(prdcfg['contourtype'])
+    if contour_name not in dataset['radar_out'].fields:
+        warn(
+            'Contour type ' + contour_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
 
-        # user defined values
-        lon = prdcfg.get(
-            'lon', dataset['radar_out'].origin_longitude['data'][0])
-        lat = prdcfg.get(
-            'lat', dataset['radar_out'].origin_latitude['data'][0])
+    contour_values = prdcfg.get('contour_values', None)
+    level = prdcfg.get('level', 0)
+    contour_level = prdcfg.get('contour_level', level)
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=prdcfg['timeinfo'])
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
 
-        fname_list = make_filename(
-            'lon_slice', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'], prdcfginfo='lon'+'{:.2f}'.format(lon),
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+    fname_list = make_filename(
+        'surface', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'], prdcfginfo='l'+str(level),
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
 
-        plot_longitude_slice(
-            dataset['radar_out'], field_name, lon, lat, prdcfg, fname_list)
+    titl = (
+        pyart.graph.common.generate_grid_title(
+            dataset['radar_out'], field_name, level) +
+        ' - ' +
+        pyart.graph.common.generate_field_name(
+            dataset['radar_out'], contour_name))
 
-        print('----- save to '+' '.join(fname_list))
+    fig, ax, display = plot_surface(
+        dataset['radar_out'], field_name, level, prdcfg, fname_list,
+        titl=titl, save_fig=False)
 
-        return fname_list
+    fname_list = plot_surface_contour(
+        dataset['radar_out'], contour_name, contour_level, prdcfg,
+        fname_list, contour_values=contour_values, ax=ax, fig=fig,
+        display=display, save_fig=True)
 
-    if prdcfg['type'] == 'CROSS_SECTION':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+    print('----- save to '+' '.join(fname_list))
 
-        # user defined values
-        lon1 = dataset['radar_out'].point_longitude['data'][0, 0, 0]
-        lat1 = dataset['radar_out'].point_latitude['data'][0, 0, 0]
-
-        lon2 = dataset['radar_out'].point_longitude['data'][0, -1, -1]
-        lat2 = dataset['radar_out'].point_latitude['data'][0, -1, -1]
-        if 'coord1' in prdcfg:
-            if 'lon' in prdcfg['coord1']:
-                lon1 = prdcfg['coord1']['lon']
-            if 'lat' in prdcfg['coord1']:
-                lat1 = prdcfg['coord1']['lat']
-        if 'coord2' in prdcfg:
-            if 'lon' in prdcfg['coord2']:
-                lon2 = prdcfg['coord2']['lon']
-            if 'lat' in prdcfg['coord2']:
-                lat2 = prdcfg['coord2']['lat']
-
-        coord1 = (lon1, lat1)
-        coord2 = (lon2, lat2)
+    return fname_list
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=prdcfg['timeinfo'])
 
-        fname_list = make_filename(
-            'lonlat', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'],
-            prdcfginfo='lon-lat1_'+'{:.2f}'.format(lon1)+'-' +
-            '{:.2f}'.format(lat1)+'_lon-lat2_' +
-            '{:.2f}'.format(lon2)+'-'+'{:.2f}'.format(lat2),
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+def _generate_latitude_slice(dataset, prdcfg):
+    """
+    Plots a cross-section of gridded data over a constant latitude. The user
+    defined parameters are documented in generate_grid_products
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a grid object
 
-        plot_latlon_slice(
-            dataset['radar_out'], field_name, coord1, coord2, prdcfg,
-            fname_list)
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
 
-        print('----- save to '+' '.join(fname_list))
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
 
-        return fname_list
+    """
 
-    if prdcfg['type'] == 'HISTOGRAM':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
 
-        step = prdcfg.get('step', None)
-        mask_val = prdcfg.get('mask_val', None)
-        write_data = prdcfg.get('write_data', 0)
+    # user defined values
+    lon = prdcfg.get(
+        'lon', dataset['radar_out'].origin_longitude['data'][0])
+    lat = prdcfg.get(
+        'lat', dataset['radar_out'].origin_latitude['data'][0])
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=prdcfg['timeinfo'])
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
 
-        fname_list = make_filename(
-            'histogram', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'],
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+    fname_list = make_filename(
+        'lat_slice', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'], prdcfginfo=f'lat{lat:.2f}',
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
 
-        values = dataset['radar_out'].fields[field_name]['data']
-        if mask_val is not None:
-            values = np.ma.masked_values(values, mask_val)
-        bin_edges, values = compute_histogram(values, field_name, step=step)
+    plot_latitude_slice(
+        dataset['radar_out'], field_name, lon, lat, prdcfg, fname_list)
 
-        titl = (
-            pyart.graph.common.generate_grid_time_begin(
-                dataset['radar_out']).isoformat() + 'Z' + '\n' +
-            get_field_name(
-                dataset['radar_out'].fields[field_name], field_name))
+    print('----- save to '+' '.join(fname_list))
 
-        labelx = get_colobar_label(
-            dataset['radar_out'].fields[field_name], field_name)
+    return fname_list
 
-        plot_histogram(bin_edges, values, fname_list, labelx=labelx,
-                       labely='Number of Samples', titl=titl)
 
-        print('----- save to '+' '.join(fname_list))
+def _generate_longitude_slice(dataset, prdcfg):
+    """
+    Plots a cross-section of gridded data over a constant longitude. The user
+    defined parameters are documented in generate_grid_products
 
-        if write_data:
-            fname = savedir+make_filename(
-                'histogram', prdcfg['dstype'], prdcfg['voltype'],
-                ['csv'], timeinfo=prdcfg['timeinfo'],
-                runinfo=prdcfg['runinfo'])[0]
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a grid object
 
-            hist, _ = np.histogram(values, bins=bin_edges)
-            write_histogram(
-                bin_edges, hist, fname, datatype=prdcfg['voltype'], step=step)
-            print('----- save to '+fname)
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
 
-            return fname
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
 
-        return fname_list
+    """
 
-    if prdcfg['type'] == 'SAVEVOL':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
 
-        new_dataset = deepcopy(dataset['radar_out'])
-        new_dataset.fields = dict()
-        new_dataset.add_field(
-            field_name, dataset['radar_out'].fields[field_name])
+    # user defined values
+    lon = prdcfg.get(
+        'lon', dataset['radar_out'].origin_longitude['data'][0])
+    lat = prdcfg.get(
+        'lat', dataset['radar_out'].origin_latitude['data'][0])
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=prdcfg['timeinfo'])
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
 
-        fname = make_filename(
-            'savevol', prdcfg['dstype'], prdcfg['voltype'], ['nc'],
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])[0]
+    fname_list = make_filename(
+        'lon_slice', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'], prdcfginfo=f'lon{lon:.2f}',
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
 
-        fname = savedir+fname
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
 
-        pyart.io.write_grid(fname, new_dataset, write_point_x_y_z=True,
-                            write_point_lon_lat_alt=True)
-        print('saved file: '+fname)
+    plot_longitude_slice(
+        dataset['radar_out'], field_name, lon, lat, prdcfg, fname_list)
 
-        return fname
+    print('----- save to '+' '.join(fname_list))
 
-    if prdcfg['type'] == 'SAVEALL':
-        datatypes = prdcfg.get('datatypes', None)
+    return fname_list
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=prdcfg['timeinfo'])
 
-        fname = make_filename(
-            'savevol', prdcfg['dstype'], 'all_fields', ['nc'],
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])[0]
-
-        fname = savedir+fname
-
-        field_names = None
-        if datatypes is not None:
-            field_names = []
-            for datatype in datatypes:
-                field_names.append(get_fieldname_pyart(datatype))
-
-        if field_names is not None:
-            new_dataset = deepcopy(dataset['radar_out'])
-            new_dataset.fields = dict()
-            for field_name in field_names:
-                if field_name not in dataset['radar_out'].fields:
-                    warn(field_name+' not in grid object')
-                else:
-                    new_dataset.add_field(
-                        field_name, dataset['radar_out'].fields[field_name])
-        else:
-            new_dataset = dataset['radar_out']
+def _generate_cross_section(dataset, prdcfg):
+    """
+    Plots a cross-section of gridded data. The user defined parameters are
+    documented in generate_grid_products
+
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a grid object
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
+
+    """
+
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
+
+    # user defined values
+    lon1 = dataset['radar_out'].point_longitude['data'][0, 0, 0]
+    lat1 = dataset['radar_out'].point_latitude['data'][0, 0, 0]
+
+    lon2 = dataset['radar_out'].point_longitude['data'][0, -1, -1]
+    lat2 = dataset['radar_out'].point_latitude['data'][0, -1, -1]
+    if 'coord1' in prdcfg:
+        if 'lon' in prdcfg['coord1']:
+            lon1 = prdcfg['coord1']['lon']
+        if 'lat' in prdcfg['coord1']:
+            lat1 = prdcfg['coord1']['lat']
+    if 'coord2' in prdcfg:
+        if 'lon' in prdcfg['coord2']:
+            lon2 = prdcfg['coord2']['lon']
+        if 'lat' in prdcfg['coord2']:
+            lat2 = prdcfg['coord2']['lat']
+
+    coord1 = (lon1, lat1)
+    coord2 = (lon2, lat2)
+
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
+
+    fname_list = make_filename(
+        'lonlat', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'],
+        prdcfginfo=(
+            f'lon-lat1_{lon1:.2f}-{lat1:.2f}_lon-lat2_{lon2:.2f}-'
+            f'{lat2:.2f}'),
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
+
+    plot_latlon_slice(
+        dataset['radar_out'], field_name, coord1, coord2, prdcfg,
+        fname_list)
+
+    print('----- save to '+' '.join(fname_list))
+
+    return fname_list
+
+
+def _generate_histogram(dataset, prdcfg):
+    """
+    Plots and writes a histogram of the gridded data. The user defined
+    parameters are documented in generate_grid_products
+
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a grid object
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
+
+    """
+
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
+
+    step = prdcfg.get('step', None)
+    mask_val = prdcfg.get('mask_val', None)
+    write_data = prdcfg.get('write_data', 0)
+
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
+
+    fname_list = make_filename(
+        'histogram', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'],
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
+
+    values = dataset['radar_out'].fields[field_name]['data']
+    if mask_val is not None:
+        values = np.ma.masked_values(values, mask_val)
+    bin_edges, values = compute_histogram(values, field_name, step=step)
+
+    titl = (
+        pyart.graph.common.generate_grid_time_begin(
+            dataset['radar_out']).isoformat() + 'Z' + '\n' +
+        get_field_name(
+            dataset['radar_out'].fields[field_name], field_name))
+
+    labelx = get_colobar_label(
+        dataset['radar_out'].fields[field_name], field_name)
+
+    plot_histogram(bin_edges, values, fname_list, labelx=labelx,
+                   labely='Number of Samples', titl=titl)
+
+    print('----- save to '+' '.join(fname_list))
 
-        pyart.io.write_grid(fname, new_dataset, write_point_x_y_z=True,
-                            write_point_lon_lat_alt=True)
-        print('saved file: '+fname)
+    if write_data:
+        fname = make_single_filename(
+            'histogram', prdcfg['dstype'], prdcfg['voltype'], 'csv',
+            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+        fname = os.path.join(savedir, fname)
+
+        hist = compute_histogram_counts(values, bin_edges)
+        write_histogram(
+            bin_edges, hist, fname, datatype=prdcfg['voltype'], step=step)
+        print('----- save to '+fname)
 
         return fname
 
-    warn(' Unsupported product type: ' + prdcfg['type'])
-    return None
+    return fname_list
+
+
+def _generate_savevol(dataset, prdcfg):
+    """
+    Saves a field of a gridded data object in a netcdf file. The user defined
+    parameters are documented in generate_grid_products
+
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a grid object
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
+
+    """
+
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
+
+    # a shallow copy shares the coordinates with the original grid object.
+    # Only the fields dictionary is replaced
+    new_dataset = copy(dataset['radar_out'])
+    new_dataset.fields = dict()
+    new_dataset.add_field(
+        field_name, dataset['radar_out'].fields[field_name])
+
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
+
+    fname = make_filename(
+        'savevol', prdcfg['dstype'], prdcfg['voltype'], ['nc'],
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])[0]
+
+    fname = os.path.join(savedir, fname)
+
+    pyart.io.write_grid(fname, new_dataset, write_point_x_y_z=True,
+                        write_point_lon_lat_alt=True)
+    print('saved file: '+fname)
+
+    return fname
+
+
+def _generate_saveall(dataset, prdcfg):
+    """
+    Saves all or a list of fields of a gridded data object in a netcdf file.
+    The user defined parameters are documented in generate_grid_products
+
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a grid object
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
+
+    """
+
+    datatypes = prdcfg.get('datatypes', None)
+
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
+
+    fname = make_filename(
+        'savevol', prdcfg['dstype'], 'all_fields', ['nc'],
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])[0]
+
+    fname = os.path.join(savedir, fname)
+
+    field_names = None
+    if datatypes is not None:
+        field_names = []
+        for datatype in datatypes:
+            field_names.append(get_fieldname_pyart(datatype))
+
+    if field_names is not None:
+        new_dataset = copy(dataset['radar_out'])
+        new_dataset.fields = dict()
+        for field_name in field_names:
+            if field_name not in dataset['radar_out'].fields:
+                warn(field_name+' not in grid object')
+            else:
+                new_dataset.add_field(
+                    field_name, dataset['radar_out'].fields[field_name])
+    else:
+        new_dataset = dataset['radar_out']
+
+    pyart.io.write_grid(fname, new_dataset, write_point_x_y_z=True,
+                        write_point_lon_lat_alt=True)
+    print('saved file: '+fname)
+
+    return fname
+
+
+_GRID_HANDLERS = {
+    'SURFACE_IMAGE': _generate_surface_image,
+    'SURFACE_CONTOUR': _generate_surface_contour,
+    'SURFACE_CONTOUR_OVERPLOT': _generate_surface_contour_overplot,
+    'LATITUDE_SLICE': _generate_latitude_slice,
+    'LONGITUDE_SLICE': _generate_longitude_slice,
+    'CROSS_SECTION': _generate_cross_section,
+    'HISTOGRAM': _generate_histogram,
+    'SAVEVOL': _generate_savevol,
+    'SAVEALL': _generate_saveall}
+
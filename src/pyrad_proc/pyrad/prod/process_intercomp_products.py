@@ -11,10 +11,16 @@ intercomparison process
     generate_intercomp_products
     generate_colocated_gates_products
     generate_time_avg_products
+    _generate_write_intercomp
+    _generate_write_intercomp_time_avg
+    _generate_plot_scatter_intercomp
+    _generate_plot_and_write_intercomp_ts
+    _as_masked
 
 """
 
 from warnings import warn
+import os
 
 import numpy as np
 
@@ -22,6 +28,8 @@ from .process_vol_products import generate_vol_products
 
 from ..io.io_aux import get_fieldname_pyart
 from ..io.io_aux import get_save_dir, make_filename
+from ..io.io_aux import get_product_save_dir
+from ..io.io_aux import make_single_filename
 
 from ..io.read_data_other import read_intercomp_scores_ts
 
@@ -88,212 +96,9 @@ def generate_intercomp_products(dataset, prdcfg):
         the name of the file created. None otherwise
 
     """
-
-    dssavedir = prdcfg['dsname']
-    if 'dssavename' in prdcfg:
-        dssavedir = prdcfg['dssavename']
-
-    if prdcfg['type'] == 'WRITE_INTERCOMP':
-        if dataset['final']:
-            return None
-
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=dataset['timeinfo'])
-
-        fname = make_filename(
-            'colocated_data', prdcfg['dstype'], prdcfg['voltype'],
-            ['csv'], timeinfo=dataset['timeinfo'],
-            timeformat='%Y%m%d')
-
-        fname = savedir+fname[0]
-
-        write_colocated_data(dataset['intercomp_dict'], fname)
-
-        print('saved colocated data file: '+fname)
-
-        return fname
-
-    if prdcfg['type'] == 'WRITE_INTERCOMP_TIME_AVG':
-        if dataset['final']:
-            return None
-
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=dataset['timeinfo'])
-
-        fname = make_filename(
-            'colocated_data', prdcfg['dstype'], prdcfg['voltype'],
-            ['csv'], timeinfo=dataset['timeinfo'],
-            timeformat='%Y%m%d')
-
-        fname = savedir+fname[0]
-
-        write_colocated_data_time_avg(dataset['intercomp_dict'], fname)
-
-        print('saved colocated time averaged data file: '+fname)
-
-        return fname
-
-    if prdcfg['type'] == 'PLOT_SCATTER_INTERCOMP':
-        scatter_type = prdcfg.get('scatter_type', 'cumulative')
-        if scatter_type == 'cumulative' and not dataset['final']:
-            return None
-
-        timeformat = '%Y%m%d'
-        if scatter_type == 'instant':
-            timeformat = '%Y%m%d%H%M%S'
-
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=dataset['timeinfo'])
-
-        fname_list = make_filename(
-            'scatter', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'], timeinfo=dataset['timeinfo'],
-            timeformat=timeformat)
-
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
-
-        step = prdcfg.get('step', None)
-
-        hist_2d, bin_edges1, bin_edges2, stats = compute_2d_stats(
-            np.ma.asarray(dataset['intercomp_dict']['rad1_val']),
-            np.ma.asarray(dataset['intercomp_dict']['rad2_val']),
-            field_name, field_name, step1=step, step2=step)
-        if hist_2d is None:
-            return None
-
-        metadata = (
-            'npoints: '+str(stats['npoints'])+'\n' +
-            'mode bias: '+'{:.2f}'.format(float(stats['modebias']))+'\n' +
-            'median bias: '+'{:.2f}'.format(float(stats['medianbias']))+'\n' +
-            'mean bias: '+'{:.2f}'.format(float(stats['meanbias']))+'\n' +
-            'intercep slope 1: '+'{:.2f}'.format(
-                float(stats['intercep_slope_1']))+'\n' +
-            'corr: '+'{:.2f}'.format(float(stats['corr']))+'\n' +
-            'slope: '+'{:.2f}'.format(float(stats['slope']))+'\n' +
-            'intercep: '+'{:.2f}'.format(float(stats['intercep']))+'\n')
-
-        plot_scatter(bin_edges1, bin_edges2, np.ma.asarray(hist_2d), field_name,
-                     field_name, fname_list, prdcfg, metadata=metadata,
-                     lin_regr=[stats['slope'], stats['intercep']],
-                     lin_regr_slope1=stats['intercep_slope_1'],
-                     rad1_name=dataset['intercomp_dict']['rad1_name'],
-                     rad2_name=dataset['intercomp_dict']['rad2_name'])
-
-        print('----- save to '+' '.join(fname_list))
-
-        return fname_list
-
-    if prdcfg['type'] == 'PLOT_AND_WRITE_INTERCOMP_TS':
-        if not dataset['final']:
-            return None
-
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        step = prdcfg.get('step', None)
-
-        rad1_name = dataset['intercomp_dict']['rad1_name']
-        rad2_name = dataset['intercomp_dict']['rad2_name']
-
-        hist_2d, bin_edges1, bin_edges2, stats = compute_2d_stats(
-            np.ma.asarray(dataset['intercomp_dict']['rad1_val']),
-            np.ma.asarray(dataset['intercomp_dict']['rad2_val']),
-            field_name, field_name, step1=step, step2=step)
-
-        # put time info in file path and name
-        csvtimeinfo_file = None
-        timeformat = None
-        sort_by_date = False
-        rewrite = False
-        if 'add_date_in_fname' in prdcfg:
-            if prdcfg['add_date_in_fname']:
-                csvtimeinfo_file = dataset['timeinfo']
-                timeformat = '%Y'
-        if 'sort_by_date' in prdcfg:
-            sort_by_date = prdcfg['sort_by_date']
-        if 'rewrite' in prdcfg:
-            rewrite = prdcfg['rewrite']
-
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=None)
-
-        csvfname = make_filename(
-            'ts', prdcfg['dstype'], prdcfg['voltype'], ['csv'],
-            prdcfginfo=rad1_name+'-'+rad2_name,
-            timeinfo=csvtimeinfo_file, timeformat=timeformat)[0]
-
-        csvfname = savedir+csvfname
-
-        write_intercomp_scores_ts(
-            dataset['timeinfo'], stats, field_name, csvfname,
-            rad1_name=rad1_name, rad2_name=rad2_name)
-        print('saved CSV file: '+csvfname)
-
-        (date_vec, np_vec, meanbias_vec, medianbias_vec, quant25bias_vec,
-         quant75bias_vec, modebias_vec, corr_vec, slope_vec, intercep_vec,
-         intercep_slope1_vec) = (
-             read_intercomp_scores_ts(csvfname, sort_by_date=sort_by_date))
-
-        if date_vec is None:
-            warn(
-                'Unable to plot time series. No valid data')
-            return None
-
-        if len(date_vec) < 2:
-            warn(
-                'Unable to plot time series. Not enough points')
-            return None
-
-        if rewrite:
-            stats = {
-                'npoints': np_vec,
-                'meanbias': meanbias_vec,
-                'medianbias': medianbias_vec,
-                'quant25bias': quant25bias_vec,
-                'quant75bias': quant75bias_vec,
-                'modebias': modebias_vec,
-                'corr': corr_vec,
-                'slope': slope_vec,
-                'intercep': intercep_vec,
-                'intercep_slope_1': intercep_slope1_vec
-            }
-            write_intercomp_scores_ts(
-                date_vec, stats, field_name, csvfname,
-                rad1_name=rad1_name, rad2_name=rad2_name)
-
-        figtimeinfo = None
-        titldate = (date_vec[0].strftime('%Y%m%d')+'-' +
-                    date_vec[-1].strftime('%Y%m%d'))
-        if 'add_date_in_fname' in prdcfg:
-            if prdcfg['add_date_in_fname']:
-                figtimeinfo = date_vec[0]
-                timeformat = '%Y'
-
-        figfname_list = make_filename(
-            'ts', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'], prdcfginfo=rad1_name+'-'+rad2_name,
-            timeinfo=figtimeinfo, timeformat=timeformat)
-
-        for i, figfname in enumerate(figfname_list):
-            figfname_list[i] = savedir+figfname
-
-        np_min = prdcfg.get('npoints_min', 0)
-        corr_min = prdcfg.get('corr_min', 0.)
-
-        titl = (rad1_name+'-'+rad2_name+' '+field_name+' intercomparison ' +
-                titldate)
-        plot_intercomp_scores_ts(
-            date_vec, np_vec, meanbias_vec, medianbias_vec, quant25bias_vec,
-            quant75bias_vec, modebias_vec, corr_vec, slope_vec, intercep_vec,
-            intercep_slope1_vec, figfname_list, ref_value=0., np_min=np_min,
-            corr_min=corr_min, labelx='Time UTC', titl=titl)
-        print('----- save to '+' '.join(figfname_list))
-
-        return figfname_list
+    handler = _INTERCOMP_HANDLERS.get(prdcfg['type'])
+    if handler is not None:
+        return handler(dataset, prdcfg)
 
     warn(' Unsupported product type: ' + prdcfg['type'])
     return None
@@ -331,11 +136,11 @@ def generate_colocated_gates_products(dataset, prdcfg):
             prdcfg['basepath'], prdcfg['procname'], 'colocated_gates',
             prdcfg['prdname'], timeinfo=None)
 
-        fname = make_filename(
-            'info', prdcfg['dstype'], prdcfg['prdname'], ['csv'],
+        fname = make_single_filename(
+            'info', prdcfg['dstype'], prdcfg['prdname'], 'csv',
             timeinfo=None)
 
-        fname = savedir+fname[0]
+        fname = os.path.join(savedir, fname)
 
         write_colocated_gates(
             dataset[prdcfg['radar']]['coloc_dict'], fname)
@@ -375,3 +180,315 @@ def generate_time_avg_products(dataset, prdcfg):
     prdcfg['timeinfo'] = dataset['timeinfo']
 
     return generate_vol_products(dataset, prdcfg)
+
+
+def _generate_write_intercomp(dataset, prdcfg):
+    """
+    Writes the colocated data of the intercomparison. The user defined
+    parameters are documented in generate_intercomp_products
+
+    Parameters
+    ----------
+    dataset : tuple
+        values of colocated gates dictionary
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
+
+    """
+
+    if dataset['final']:
+        return None
+
+    savedir = get_product_save_dir(prdcfg, dataset['timeinfo'])
+
+    fname = make_single_filename(
+        'colocated_data', prdcfg['dstype'], prdcfg['voltype'],
+        'csv', timeinfo=dataset['timeinfo'],
+        timeformat='%Y%m%d')
+
+    fname = os.path.join(savedir, fname)
+
+    write_colocated_data(dataset['intercomp_dict'], fname)
+
+    print('saved colocated data file: '+fname)
+
+    return fname
+
+
+def _generate_write_intercomp_time_avg(dataset, prdcfg):
+    """
+    Writes the time averaged colocated data of the intercomparison. The user
+    defined parameters are documented in generate_intercomp_products
+
+    Parameters
+    ----------
+    dataset : tuple
+        values of colocated gates dictionary
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
+
+    """
+
+    if dataset['final']:
+        return None
+
+    savedir = get_product_save_dir(prdcfg, dataset['timeinfo'])
+
+    fname = make_single_filename(
+        'colocated_data', prdcfg['dstype'], prdcfg['voltype'],
+        'csv', timeinfo=dataset['timeinfo'],
+        timeformat='%Y%m%d')
+
+    fname = os.path.join(savedir, fname)
+
+    write_colocated_data_time_avg(dataset['intercomp_dict'], fname)
+
+    print('saved colocated time averaged data file: '+fname)
+
+    return fname
+
+
+def _generate_plot_scatter_intercomp(dataset, prdcfg):
+    """
+    Plots a scatter plot of the colocated data. The user defined parameters are
+    documented in generate_intercomp_products
+
+    Parameters
+    ----------
+    dataset : tuple
+        values of colocated gates dictionary
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
+
+    """
+
+    scatter_type = prdcfg.get('scatter_type', 'cumulative')
+    if scatter_type == 'cumulative' and not dataset['final']:
+        return None
+
+    timeformat = '%Y%m%d'
+    if scatter_type == 'instant':
+        timeformat = '%Y%m%d%H%M%S'
+
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    step = prdcfg.get('step', None)
+
+    hist_2d, bin_edges1, bin_edges2, stats = compute_2d_stats(
+        _as_masked(dataset['intercomp_dict']['rad1_val']),
+        _as_masked(dataset['intercomp_dict']['rad2_val']),
+        field_name, field_name, step1=step, step2=step)
+    if hist_2d is None:
+        return None
+
+    savedir = get_product_save_dir(prdcfg, dataset['timeinfo'])
+
+    fname_list = make_filename(
+        'scatter', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'], timeinfo=dataset['timeinfo'],
+        timeformat=timeformat)
+
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
+
+    metadata_lines = [f"npoints: {stats['npoints']}"]
+    for label, key in (
+            ('mode bias', 'modebias'), ('median bias', 'medianbias'),
+            ('mean bias', 'meanbias'),
+            ('intercep slope 1', 'intercep_slope_1'), ('corr', 'corr'),
+            ('slope', 'slope'), ('intercep', 'intercep')):
+        metadata_lines.append(f'{label}: {float(stats[key]):.2f}')
+    metadata = '\n'.join(metadata_lines)+'\n'
+
+    plot_scatter(bin_edges1, bin_edges2, hist_2d, field_name,
+                 field_name, fname_list, prdcfg, metadata=metadata,
+                 lin_regr=[stats['slope'], stats['intercep']],
+                 lin_regr_slope1=stats['intercep_slope_1'],
+                 rad1_name=dataset['intercomp_dict']['rad1_name'],
+                 rad2_name=dataset['intercomp_dict']['rad2_name'])
+
+    print('----- save to '+' '.join(fname_list))
+
+    return fname_list
+
+
+def _generate_plot_and_write_intercomp_ts(dataset, prdcfg):
+    """
+    Writes and plots a time series of the intercomparison scores. The user
+    defined parameters are documented in generate_intercomp_products
+
+    Parameters
+    ----------
+    dataset : tuple
+        values of colocated gates dictionary
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
+
+    """
+
+    if not dataset['final']:
+        return None
+
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    step = prdcfg.get('step', None)
+
+    rad1_name = dataset['intercomp_dict']['rad1_name']
+    rad2_name = dataset['intercomp_dict']['rad2_name']
+
+    hist_2d, bin_edges1, bin_edges2, stats = compute_2d_stats(
+        _as_masked(dataset['intercomp_dict']['rad1_val']),
+        _as_masked(dataset['intercomp_dict']['rad2_val']),
+        field_name, field_name, step1=step, step2=step)
+
+    # put time info in file path and name
+    csvtimeinfo_file = None
+    timeformat = None
+    if prdcfg.get('add_date_in_fname', False):
+        csvtimeinfo_file = dataset['timeinfo']
+        timeformat = '%Y'
+    sort_by_date = prdcfg.get('sort_by_date', False)
+    rewrite = prdcfg.get('rewrite', False)
+
+    savedir = get_product_save_dir(prdcfg, None)
+
+    csvfname = make_single_filename(
+        'ts', prdcfg['dstype'], prdcfg['voltype'], 'csv',
+        prdcfginfo=rad1_name+'-'+rad2_name,
+        timeinfo=csvtimeinfo_file, timeformat=timeformat)
+
+    csvfname = os.path.join(savedir, csvfname)
+
+    write_intercomp_scores_ts(
+        dataset['timeinfo'], stats, field_name, csvfname,
+        rad1_name=rad1_name, rad2_name=rad2_name)
+    print('saved CSV file: '+csvfname)
+
+    (date_vec, np_vec, meanbias_vec, medianbias_vec, quant25bias_vec,
+     quant75bias_vec, modebias_vec, corr_vec, slope_vec, intercep_vec,
+     intercep_slope1_vec) = read_intercomp_scores_ts(
+         csvfname, sort_by_date=False)
+
+    if date_vec is None:
+        warn(
+            'Unable to plot time series. No valid data')
+        return None
+
+    if len(date_vec) < 2:
+        warn(
+            'Unable to plot time series. Not enough points')
+        return None
+
+    # sort the data in memory. The file only has to be rewritten if the
+    # order of the data has changed
+    reordered = False
+    if sort_by_date:
+        ind = np.argsort(date_vec, kind='stable')
+        reordered = np.any(ind != np.arange(ind.size))
+        if reordered:
+            date_vec = date_vec[ind]
+            np_vec = np_vec[ind]
+            meanbias_vec = meanbias_vec[ind]
+            medianbias_vec = medianbias_vec[ind]
+            quant25bias_vec = quant25bias_vec[ind]
+            quant75bias_vec = quant75bias_vec[ind]
+            modebias_vec = modebias_vec[ind]
+            corr_vec = corr_vec[ind]
+            slope_vec = slope_vec[ind]
+            intercep_vec = intercep_vec[ind]
+            intercep_slope1_vec = intercep_slope1_vec[ind]
+
+    if rewrite and reordered:
+        stats = {
+            'npoints': np_vec,
+            'meanbias': meanbias_vec,
+            'medianbias': medianbias_vec,
+            'quant25bias': quant25bias_vec,
+            'quant75bias': quant75bias_vec,
+            'modebias': modebias_vec,
+            'corr': corr_vec,
+            'slope': slope_vec,
+            'intercep': intercep_vec,
+            'intercep_slope_1': intercep_slope1_vec
+        }
+        write_intercomp_scores_ts(
+            date_vec, stats, field_name, csvfname,
+            rad1_name=rad1_name, rad2_name=rad2_name, rewrite=True)
+
+    figtimeinfo = None
+    titldate = (date_vec[0].strftime('%Y%m%d')+'-' +
+                date_vec[-1].strftime('%Y%m%d'))
+    if prdcfg.get('add_date_in_fname', False):
+        figtimeinfo = date_vec[0]
+        timeformat = '%Y'
+
+    figfname_list = make_filename(
+        'ts', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'], prdcfginfo=rad1_name+'-'+rad2_name,
+        timeinfo=figtimeinfo, timeformat=timeformat)
+
+    figfname_list = [
+        os.path.join(savedir, figfname) for figfname in figfname_list]
+
+    np_min = prdcfg.get('npoints_min', 0)
+    corr_min = prdcfg.get('corr_min', 0.)
+
+    titl = (rad1_name+'-'+rad2_name+' '+field_name+' intercomparison ' +
+            titldate)
+    plot_intercomp_scores_ts(
+        date_vec, np_vec, meanbias_vec, medianbias_vec, quant25bias_vec,
+        quant75bias_vec, modebias_vec, corr_vec, slope_vec, intercep_vec,
+        intercep_slope1_vec, figfname_list, ref_value=0., np_min=np_min,
+        corr_min=corr_min, labelx='Time UTC', titl=titl)
+    print('----- save to '+' '.join(figfname_list))
+
+    return figfname_list
+
+
+_INTERCOMP_HANDLERS = {
+    'WRITE_INTERCOMP': _generate_write_intercomp,
+    'WRITE_INTERCOMP_TIME_AVG': _generate_write_intercomp_time_avg,
+    'PLOT_SCATTER_INTERCOMP': _generate_plot_scatter_intercomp,
+    'PLOT_AND_WRITE_INTERCOMP_TS': _generate_plot_and_write_intercomp_ts}
+
+
+def _as_masked(data):
+    """
+    Returns the data as a masked array. The data is returned as it is if it
+    is already masked
+
+    Parameters
+    ----------
+    data : array like
+        the data
+
+    Returns
+    -------
+    data : masked array
+        the data as masked array
+
+    """
+    if isinstance(data, np.ma.MaskedArray):
+        return data
+    return np.ma.asarray(data)
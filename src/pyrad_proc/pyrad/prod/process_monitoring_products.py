@@ -8,10 +8,13 @@ Functions for obtaining Pyrad products from monitoring datasets
     :toctree: generated/
 
     generate_monitoring_products
+    send_monitoring_alarm
+    _hist_sum
+    _monitoring_trend
 
 """
 
-from copy import deepcopy
+from copy import copy
 from warnings import warn
 import os
 
@@ -21,7 +24,7 @@ import pyart
 
 from ..io.io_aux import get_fieldname_pyart
 from ..io.io_aux import get_save_dir, make_filename
-from ..io.io_aux import generate_field_name_str
+from ..io.io_aux import generate_field_name_str, make_single_filename
 
 from ..io.read_data_other import read_monitoring_ts
 
@@ -33,6 +36,7 @@ from ..graph.plots_timeseries import plot_monitoring_ts
 from ..graph.plots_aux import get_colobar_label, get_field_name
 
 from ..util.radar_utils import compute_quantiles_from_hist
+from ..util.radar_utils import get_fixed_angle_order, get_field_metadata
 
 
 def generate_monitoring_products(dataset, prdcfg):
@@ -217,16 +221,15 @@ def generate_monitoring_products(dataset, prdcfg):
 
         fname_list = make_filename(
             'histogram', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'],
-            timeinfo=dataset['timeinfo'], timeformat=timeformat)
+            prdcfg['imgformat'], timeinfo=dataset['timeinfo'],
+            timeformat=timeformat)
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+        fname_list = [os.path.join(savedir, fname) for fname in fname_list]
 
         labelx = get_colobar_label(hist_obj.fields[field_name], field_name)
 
         bin_centers = hist_obj.range['data']
-        hist = np.sum(hist_obj.fields[field_name]['data'], axis=0)
+        hist = _hist_sum(hist_obj.fields[field_name]['data'])
         plot_histogram2(
             bin_centers, hist, fname_list, labelx=labelx,
             labely='Number of Samples', titl=titl)
@@ -234,10 +237,10 @@ def generate_monitoring_products(dataset, prdcfg):
         print('----- save to '+' '.join(fname_list))
 
         if write_data:
-            fname = savedir+make_filename(
-                'histogram', prdcfg['dstype'], prdcfg['voltype'],
-                ['csv'], timeinfo=dataset['timeinfo'],
-                timeformat=timeformat)[0]
+            fname = make_single_filename(
+                'histogram', prdcfg['dstype'], prdcfg['voltype'], 'csv',
+                timeinfo=dataset['timeinfo'], timeformat=timeformat)
+            fname = os.path.join(savedir, fname)
 
             step = bin_centers[1]-bin_centers[0]
             bin_edges = np.append(
@@ -259,20 +262,19 @@ def generate_monitoring_products(dataset, prdcfg):
                 prdcfg['type'])
             return None
 
-        el_vec = np.sort(hist_obj.fixed_angle['data'])
-        el = el_vec[prdcfg['anglenr']]
-        ind_el = np.where(hist_obj.fixed_angle['data'] == el)[0][0]
+        ind_el = get_fixed_angle_order(hist_obj)[prdcfg['anglenr']]
+        el = hist_obj.fixed_angle['data'][ind_el]
 
         timeformat = '%Y%m%d'
         titl = (
-            '{:.1f}'.format(el)+' Deg. ' +
+            f'{el:.1f} Deg. ' +
             pyart.graph.common.generate_radar_time_begin(
                 hist_obj).strftime('%Y-%m-%d') + '\n' +
             get_field_name(hist_obj.fields[field_name], field_name))
         if hist_type == 'instant':
             timeformat = '%Y%m%d%H%M%S'
             titl = (
-                '{:.1f}'.format(el)+' Deg. ' +
+                f'{el:.1f} Deg. ' +
                 pyart.graph.common.generate_radar_time_begin(
                     hist_obj).isoformat() + 'Z' + '\n' +
                 get_field_name(hist_obj.fields[field_name], field_name))
@@ -283,19 +285,18 @@ def generate_monitoring_products(dataset, prdcfg):
 
         fname_list = make_filename(
             'ppi', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'], prdcfginfo='el'+'{:.1f}'.format(el),
+            prdcfg['imgformat'], prdcfginfo=f'el{el:.1f}',
             timeinfo=dataset['timeinfo'], timeformat=timeformat)
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+        fname_list = [os.path.join(savedir, fname) for fname in fname_list]
 
         labelx = get_colobar_label(hist_obj.fields[field_name], field_name)
 
-        sweep_start = hist_obj.sweep_start_ray_index['data'][ind_el]
-        sweep_end = hist_obj.sweep_end_ray_index['data'][ind_el]
-        values = hist_obj.fields[field_name]['data'][sweep_start:sweep_end, :]
+        # the sweep slice includes the last ray of the sweep
+        values = hist_obj.fields[field_name]['data'][
+            hist_obj.get_slice(ind_el)]
         plot_histogram2(
-            hist_obj.range['data'], np.sum(values, axis=0),
+            hist_obj.range['data'], _hist_sum(values),
             fname_list, labelx=labelx, labely='Number of Samples',
             titl=titl)
 
@@ -312,9 +313,8 @@ def generate_monitoring_products(dataset, prdcfg):
                 prdcfg['type'])
             return None
 
-        el_vec = np.sort(hist_obj.fixed_angle['data'])
-        el = el_vec[prdcfg['anglenr']]
-        ind_el = np.where(hist_obj.fixed_angle['data'] == el)[0][0]
+        ind_el = get_fixed_angle_order(hist_obj)[prdcfg['anglenr']]
+        el = hist_obj.fixed_angle['data'][ind_el]
 
         timeformat = '%Y%m%d'
         if hist_type == 'instant':
@@ -326,11 +326,10 @@ def generate_monitoring_products(dataset, prdcfg):
 
         fname_list = make_filename(
             'ppi', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'], prdcfginfo='el'+'{:.1f}'.format(el),
+            prdcfg['imgformat'], prdcfginfo=f'el{el:.1f}',
             timeinfo=dataset['timeinfo'], timeformat=timeformat)
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+        fname_list = [os.path.join(savedir, fname) for fname in fname_list]
 
         quantiles = prdcfg.get('quantiles', np.array([25., 50., 75.]))
         ref_value = prdcfg.get('ref_value', 0.)
@@ -380,21 +379,19 @@ def generate_monitoring_products(dataset, prdcfg):
             timeinfo=csvtimeinfo_file, timeformat=timeformat,
             runinfo=prdcfg['runinfo'])[0]
 
-        csvfname = savedir+csvfname
+        csvfname = os.path.join(savedir, csvfname)
 
+        # histogram of the whole volume
+        hist = _hist_sum(hist_obj.fields[field_name]['data'])
         quantiles, values = compute_quantiles_from_hist(
-            hist_obj.range['data'],
-            np.ma.sum(hist_obj.fields[field_name]['data'], axis=0),
-            quantiles=quantiles)
+            hist_obj.range['data'], hist, quantiles=quantiles)
 
         start_time = pyart.graph.common.generate_radar_time_begin(hist_obj)
-        np_t = np.ma.sum(hist_obj.fields[field_name]['data'], dtype=int)
-        if np.ma.getmaskarray(np_t):
-            np_t = 0
+        np_t = np.ma.sum(hist, dtype=int)
+        np_t = 0 if np.ma.is_masked(np_t) else int(np_t)
 
         write_monitoring_ts(
-            start_time, np_t, values, quantiles, prdcfg['voltype'],
-            csvfname)
+            start_time, np_t, values, quantiles, prdcfg['voltype'], csvfname)
         print('saved CSV file: '+csvfname)
 
         date, np_t_vec, cquant_vec, lquant_vec, hquant_vec = (
@@ -406,8 +403,10 @@ def generate_monitoring_products(dataset, prdcfg):
             return None
 
         if rewrite:
-            val_vec = np.ma.asarray(
-                [lquant_vec, cquant_vec, hquant_vec]).T
+            val_vec = np.ma.empty((cquant_vec.size, 3), dtype=float)
+            val_vec[:, 0] = lquant_vec
+            val_vec[:, 1] = cquant_vec
+            val_vec[:, 2] = hquant_vec
             write_monitoring_ts(
                 date, np_t_vec, val_vec, quantiles, prdcfg['voltype'],
                 csvfname, rewrite=True)
@@ -430,8 +429,8 @@ def generate_monitoring_products(dataset, prdcfg):
             timeinfo=figtimeinfo, timeformat=timeformat,
             runinfo=prdcfg['runinfo'])
 
-        for i, figfname in enumerate(figfname_list):
-            figfname_list[i] = savedir+figfname
+        figfname_list = [
+            os.path.join(savedir, figfname) for figfname in figfname_list]
 
         titl = (prdcfg['runinfo']+' Monitoring '+titldate)
 
@@ -452,99 +451,9 @@ def generate_monitoring_products(dataset, prdcfg):
         if not alarm:
             return figfname_list
 
-        if 'tol_abs' not in prdcfg:
-            warn('unable to send alarm. Missing tolerance on target')
-            return None
-
-        if 'tol_trend' not in prdcfg:
-            warn('unable to send alarm. Missing tolerance in trend')
-            return None
-
-        if 'nevents_min' not in prdcfg:
-            warn('unable to send alarm. ' +
-                 'Missing minimum number of events to compute trend')
-            return None
-
-        if 'sender' not in prdcfg:
-            warn('unable to send alarm. Missing email sender')
-            return None
-        if 'receiver_list' not in prdcfg:
-            warn('unable to send alarm. Missing email receivers')
-            return None
-
-        tol_abs = prdcfg['tol_abs']
-        tol_trend = prdcfg['tol_trend']
-        nevents_min = prdcfg['nevents_min']
-        sender = prdcfg['sender']
-        receiver_list = prdcfg['receiver_list']
-
-        np_last = np_t_vec[-1]
-        value_last = cquant_vec[-1]
-
-        if np_last < np_min:
-            warn('No valid data on day '+date[-1].strftime('%d-%m-%Y'))
-            return None
-
-        # check if absolute value exceeded
-        abs_exceeded = False
-        if ((value_last > ref_value+tol_abs) or
-                (value_last < ref_value-tol_abs)):
-            warn('Value '+str(value_last)+' exceeds target '+str(ref_value) +
-                 ' +/- '+str(tol_abs))
-            abs_exceeded = True
-
-        # compute trend and check if last value exceeds it
-        mask = np.ma.getmaskarray(cquant_vec)
-        ind = np.where(np.logical_and(
-            np.logical_not(mask), np_t_vec >= np_min))[0]
-        nvalid = len(ind)
-        if nvalid <= nevents_min:
-            warn('Not enough points to compute reliable trend')
-            np_trend = 0
-            value_trend = np.ma.masked
-        else:
-            np_trend_vec = np_t_vec[ind][-(nevents_min+1):-1]
-            data_trend_vec = cquant_vec[ind][-(nevents_min+1):-1]
-
-            np_trend = np.sum(np_trend_vec)
-            value_trend = np.sum(data_trend_vec*np_trend_vec)/np_trend
-
-        trend_exceeded = False
-        if np_trend > 0:
-            if ((value_last > value_trend+tol_trend) or
-                    (value_last < value_trend-tol_trend)):
-                warn('Value '+str(value_last)+'exceeds trend ' +
-                     str(value_trend)+' +/- '+str(tol_trend))
-                trend_exceeded = True
-
-        if abs_exceeded is False and trend_exceeded is False:
-            return None
-
-        alarm_dir = savedir+'/alarms/'
-        if not os.path.isdir(alarm_dir):
-            os.makedirs(alarm_dir)
-        alarm_fname = make_filename(
-            'alarm', prdcfg['dstype'], prdcfg['voltype'], ['txt'],
-            timeinfo=start_time, timeformat='%Y%m%d')[0]
-        alarm_fname = alarm_dir+alarm_fname
-
-        field_dict = pyart.config.get_metadata(field_name)
-        param_name = get_field_name(field_dict, field_name)
-        param_name_unit = param_name+' ['+field_dict['units']+']'
-
-        write_alarm_msg(
-            prdcfg['RadarName'][0], param_name_unit, start_time, ref_value,
-            tol_abs, np_trend, value_trend, tol_trend, nevents_min, np_last,
-            value_last, alarm_fname)
-
-        print('----- saved monitoring alarm to '+alarm_fname)
-
-        subject = ('NO REPLY: '+param_name+' monitoring alarm for radar ' +
-                   prdcfg['RadarName'][0]+' on day ' +
-                   start_time.strftime('%d-%m-%Y'))
-        send_msg(sender, receiver_list, subject, alarm_fname)
-
-        return alarm_fname
+        return send_monitoring_alarm(
+            date, np_t_vec, cquant_vec, start_time, field_name, savedir,
+            ref_value, np_min, prdcfg)
 
     if prdcfg['type'] == 'CUMUL_VOL_TS':
         field_name = get_fieldname_pyart(prdcfg['voltype'])
@@ -574,7 +483,7 @@ def generate_monitoring_products(dataset, prdcfg):
             timeinfo=csvtimeinfo_file, timeformat=timeformat,
             runinfo=prdcfg['runinfo'])[0]
 
-        csvfname = savedir+csvfname
+        csvfname = os.path.join(savedir, csvfname)
 
         date, np_t_vec, cquant_vec, lquant_vec, hquant_vec = (
             read_monitoring_ts(csvfname))
@@ -584,14 +493,14 @@ def generate_monitoring_products(dataset, prdcfg):
                 'Unable to plot time series. No valid data')
             return None
 
-        cquant = np.ma.average(cquant_vec, weights=np_t_vec)
-        lquant = np.ma.average(lquant_vec, weights=np_t_vec)
-        hquant = np.ma.average(hquant_vec, weights=np_t_vec)
-        values = np.ma.asarray([lquant, cquant, hquant])
+        # average of the low, central and high quantiles weighted by the
+        # number of points of each event
+        values = np.ma.average(
+            np.ma.column_stack((lquant_vec, cquant_vec, hquant_vec)),
+            axis=0, weights=np_t_vec)
         start_time = date[0]
         np_t = np.ma.sum(np_t_vec, dtype=int)
-        if np.ma.getmaskarray(np_t):
-            np_t = 0
+        np_t = 0 if np.ma.is_masked(np_t) else int(np_t)
 
         csvtimeinfo_path = None
         csvtimeinfo_file = None
@@ -609,7 +518,7 @@ def generate_monitoring_products(dataset, prdcfg):
             timeinfo=csvtimeinfo_file, timeformat=timeformat,
             runinfo=prdcfg['runinfo'])[0]
 
-        csvfname = savedir+csvfname
+        csvfname = os.path.join(savedir, csvfname)
 
         write_monitoring_ts(
             start_time, np_t, values, quantiles, prdcfg['voltype'], csvfname)
@@ -624,8 +533,10 @@ def generate_monitoring_products(dataset, prdcfg):
             return None
 
         if rewrite:
-            val_vec = np.ma.asarray(
-                [lquant_vec, cquant_vec, hquant_vec]).T
+            val_vec = np.ma.empty((cquant_vec.size, 3), dtype=float)
+            val_vec[:, 0] = lquant_vec
+            val_vec[:, 1] = cquant_vec
+            val_vec[:, 2] = hquant_vec
             write_monitoring_ts(
                 date, np_t_vec, val_vec, quantiles, prdcfg['voltype'],
                 csvfname, rewrite=True)
@@ -644,8 +555,8 @@ def generate_monitoring_products(dataset, prdcfg):
             timeinfo=figtimeinfo, timeformat=timeformat,
             runinfo=prdcfg['runinfo'])
 
-        for i, figfname in enumerate(figfname_list):
-            figfname_list[i] = savedir+figfname
+        figfname_list = [
+            os.path.join(savedir, figfname) for figfname in figfname_list]
 
         titl = (prdcfg['runinfo']+' Monitoring '+titldate)
 
@@ -666,99 +577,9 @@ def generate_monitoring_products(dataset, prdcfg):
         if not alarm:
             return figfname_list
 
-        if 'tol_abs' not in prdcfg:
-            warn('unable to send alarm. Missing tolerance on target')
-            return None
-
-        if 'tol_trend' not in prdcfg:
-            warn('unable to send alarm. Missing tolerance in trend')
-            return None
-
-        if 'nevents_min' not in prdcfg:
-            warn('unable to send alarm. ' +
-                 'Missing minimum number of events to compute trend')
-            return None
-
-        if 'sender' not in prdcfg:
-            warn('unable to send alarm. Missing email sender')
-            return None
-        if 'receiver_list' not in prdcfg:
-            warn('unable to send alarm. Missing email receivers')
-            return None
-
-        tol_abs = prdcfg['tol_abs']
-        tol_trend = prdcfg['tol_trend']
-        nevents_min = prdcfg['nevents_min']
-        sender = prdcfg['sender']
-        receiver_list = prdcfg['receiver_list']
-
-        np_last = np_t_vec[-1]
-        value_last = cquant_vec[-1]
-
-        if np_last < np_min:
-            warn('No valid data on day '+date[-1].strftime('%d-%m-%Y'))
-            return None
-
-        # check if absolute value exceeded
-        abs_exceeded = False
-        if ((value_last > ref_value+tol_abs) or
-                (value_last < ref_value-tol_abs)):
-            warn('Value '+str(value_last)+' exceeds target '+str(ref_value) +
-                 ' +/- '+str(tol_abs))
-            abs_exceeded = True
-
-        # compute trend and check if last value exceeds it
-        mask = np.ma.getmaskarray(cquant_vec)
-        ind = np.where(np.logical_and(
-            np.logical_not(mask), np_t_vec >= np_min))[0]
-        nvalid = len(ind)
-        if nvalid <= nevents_min:
-            warn('Not enough points to compute reliable trend')
-            np_trend = 0
-            value_trend = np.ma.masked
-        else:
-            np_trend_vec = np_t_vec[ind][-(nevents_min+1):-1]
-            data_trend_vec = cquant_vec[ind][-(nevents_min+1):-1]
-
-            np_trend = np.sum(np_trend_vec)
-            value_trend = np.sum(data_trend_vec*np_trend_vec)/np_trend
-
-        trend_exceeded = False
-        if np_trend > 0:
-            if ((value_last > value_trend+tol_trend) or
-                    (value_last < value_trend-tol_trend)):
-                warn('Value '+str(value_last)+'exceeds trend ' +
-                     str(value_trend)+' +/- '+str(tol_trend))
-                trend_exceeded = True
-
-        if abs_exceeded is False and trend_exceeded is False:
-            return None
-
-        alarm_dir = savedir+'/alarms/'
-        if not os.path.isdir(alarm_dir):
-            os.makedirs(alarm_dir)
-        alarm_fname = make_filename(
-            'alarm', prdcfg['dstype'], prdcfg['voltype'], ['txt'],
-            timeinfo=start_time, timeformat='%Y%m%d')[0]
-        alarm_fname = alarm_dir+alarm_fname
-
-        field_dict = pyart.config.get_metadata(field_name)
-        param_name = get_field_name(field_dict, field_name)
-        param_name_unit = param_name+' ['+field_dict['units']+']'
-
-        write_alarm_msg(
-            prdcfg['RadarName'][0], param_name_unit, start_time, ref_value,
-            tol_abs, np_trend, value_trend, tol_trend, nevents_min, np_last,
-            value_last, alarm_fname)
-
-        print('----- saved monitoring alarm to '+alarm_fname)
-
-        subject = ('NO REPLY: '+param_name+' monitoring alarm for radar ' +
-                   prdcfg['RadarName'][0]+' on day ' +
-                   start_time.strftime('%d-%m-%Y'))
-        send_msg(sender, receiver_list, subject, alarm_fname)
-
-        return alarm_fname
+        return send_monitoring_alarm(
+            date, np_t_vec, cquant_vec, start_time, field_name, savedir,
+            ref_value, np_min, prdcfg)
 
     if prdcfg['type'] == 'SAVEVOL':
         field_name = get_fieldname_pyart(prdcfg['voltype'])
@@ -769,7 +590,9 @@ def generate_monitoring_products(dataset, prdcfg):
                 prdcfg['type'])
             return None
 
-        new_dataset = deepcopy(hist_obj)
+        # a shallow copy shares the coordinates with the original object.
+        # Only the fields dictionary is replaced
+        new_dataset = copy(hist_obj)
         new_dataset.fields = dict()
         new_dataset.add_field(field_name, hist_obj.fields[field_name])
 
@@ -781,7 +604,7 @@ def generate_monitoring_products(dataset, prdcfg):
             'savevol', prdcfg['dstype'], prdcfg['voltype'], ['nc'],
             timeinfo=dataset['timeinfo'])[0]
 
-        fname = savedir+fname
+        fname = os.path.join(savedir, fname)
 
         pyart.io.cfradial.write_cfradial(fname, new_dataset)
         print('saved file: '+fname)
@@ -790,3 +613,187 @@ def generate_monitoring_products(dataset, prdcfg):
 
     warn(' Unsupported product type: ' + prdcfg['type'])
     return None
+
+
+def _hist_sum(values):
+    """
+    Sums the histogram of each ray. The reduction is performed on the raw
+    data and a bin is masked only if it is masked in all rays. If no data
+    is masked the data is summed directly without filling it
+
+    Parameters
+    ----------
+    values : 2D masked array
+        the histogram of each ray
+
+    Returns
+    -------
+    hist : 1D masked array
+        the histogram of all rays
+
+    """
+    mask = np.ma.getmask(values)
+    if mask is np.ma.nomask or not mask.any():
+        return np.ma.asarray(np.add.reduce(np.ma.getdata(values), axis=0))
+
+    hist = np.add.reduce(np.ma.filled(values, 0), axis=0)
+    mask = np.logical_and.reduce(mask, axis=0)
+
+    return np.ma.masked_where(mask, hist, copy=False)
+
+
+def _monitoring_trend(np_t_vec, cquant_vec, np_min, nevents_min):
+    """
+    Computes the trend of a monitoring time series as the average of the
+    last valid events prior to the current one weighted by their number of
+    points
+
+    Parameters
+    ----------
+    np_t_vec : array of ints
+        the number of points of each event
+    cquant_vec : masked array of floats
+        the central quantile of each event
+    np_min : int
+        minimum number of points for an event to be valid
+    nevents_min : int
+        number of valid events used to compute the trend
+
+    Returns
+    -------
+    np_trend : int
+        the total number of points used to compute the trend. 0 if there
+        are not enough valid events
+    value_trend : float
+        the trend value. Masked if there are not enough valid events
+
+    """
+    valid = ~np.ma.getmaskarray(cquant_vec) & (np_t_vec >= np_min)
+    ind = np.flatnonzero(valid)
+    if ind.size <= nevents_min:
+        warn('Not enough points to compute reliable trend')
+        return 0, np.ma.masked
+
+    ind = ind[-(nevents_min+1):-1]
+    np_trend_vec = np_t_vec[ind]
+
+    return (
+        np.sum(np_trend_vec),
+        np.ma.average(cquant_vec[ind], weights=np_trend_vec))
+
+
+def send_monitoring_alarm(date, np_t_vec, cquant_vec, start_time,
+                          field_name, savedir, ref_value, np_min, prdcfg):
+    """
+    Checks whether the last value of a monitoring time series exceeds the
+    tolerance around the reference value or around the trend and, if so,
+    writes and sends an alarm
+
+    Parameters
+    ----------
+    date : array of datetime objects
+        the date of each event
+    np_t_vec : array of ints
+        the number of points of each event
+    cquant_vec : masked array of floats
+        the central quantile of each event
+    start_time : datetime object
+        the time of the current event
+    field_name : str
+        name of the monitored field
+    savedir : str
+        the product directory. The alarm is stored in its alarms
+        subdirectory
+    ref_value : float
+        the reference value
+    np_min : int
+        minimum number of points for an event to be valid
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+
+    Returns
+    -------
+    alarm_fname : str
+        the name of the alarm file created. None otherwise
+
+    """
+    if 'tol_abs' not in prdcfg:
+        warn('unable to send alarm. Missing tolerance on target')
+        return None
+
+    if 'tol_trend' not in prdcfg:
+        warn('unable to send alarm. Missing tolerance in trend')
+        return None
+
+    if 'nevents_min' not in prdcfg:
+        warn('unable to send alarm. ' +
+             'Missing minimum number of events to compute trend')
+        return None
+
+    if 'sender' not in prdcfg:
+        warn('unable to send alarm. Missing email sender')
+        return None
+    if 'receiver_list' not in prdcfg:
+        warn('unable to send alarm. Missing email receivers')
+        return None
+
+    tol_abs = prdcfg['tol_abs']
+    tol_trend = prdcfg['tol_trend']
+    nevents_min = prdcfg['nevents_min']
+    sender = prdcfg['sender']
+    receiver_list = prdcfg['receiver_list']
+
+    np_last = np_t_vec[-1]
+    value_last = cquant_vec[-1]
+
+    if np_last < np_min:
+        warn('No valid data on day '+date[-1].strftime('%d-%m-%Y'))
+        return None
+
+    # check if absolute value exceeded
+    abs_exceeded = False
+    if ((value_last > ref_value+tol_abs) or
+            (value_last < ref_value-tol_abs)):
+        warn('Value '+str(value_last)+' exceeds target '+str(ref_value) +
+             ' +/- '+str(tol_abs))
+        abs_exceeded = True
+
+    # compute trend and check if last value exceeds it
+    np_trend, value_trend = _monitoring_trend(
+        np_t_vec, cquant_vec, np_min, nevents_min)
+
+    trend_exceeded = False
+    if np_trend > 0:
+        if ((value_last > value_trend+tol_trend) or
+                (value_last < value_trend-tol_trend)):
+            warn('Value '+str(value_last)+'exceeds trend ' +
+                 str(value_trend)+' +/- '+str(tol_trend))
+            trend_exceeded = True
+
+    if abs_exceeded is False and trend_exceeded is False:
+        return None
+
+    alarm_dir = os.path.join(savedir, 'alarms')
+    os.makedirs(alarm_dir, exist_ok=True)
+    alarm_fname = make_filename(
+        'alarm', prdcfg['dstype'], prdcfg['voltype'], ['txt'],
+        timeinfo=start_time, timeformat='%Y%m%d')[0]
+    alarm_fname = os.path.join(alarm_dir, alarm_fname)
+
+    field_dict = get_field_metadata(field_name)
+    param_name = get_field_name(field_dict, field_name)
+    param_name_unit = param_name+' ['+field_dict['units']+']'
+
+    write_alarm_msg(
+        prdcfg['RadarName'][0], param_name_unit, start_time, ref_value,
+        tol_abs, np_trend, value_trend, tol_trend, nevents_min, np_last,
+        value_last, alarm_fname)
+
+    print('----- saved monitoring alarm to '+alarm_fname)
+
+    subject = ('NO REPLY: '+param_name+' monitoring alarm for radar ' +
+               prdcfg['RadarName'][0]+' on day ' +
+               start_time.strftime('%d-%m-%Y'))
+    send_msg(sender, receiver_list, subject, alarm_fname)
+
+    return alarm_fname
@@ -13,11 +13,18 @@ Functions for obtaining Pyrad products from the datasets
     generate_sun_hits_products
     generate_qvp_products
     generate_ml_products
+    _generate_write_sun_hits
+    _generate_plot_sun_hits
+    _generate_write_sun_retrieval
+    _generate_plot_sun_retrieval
+    _generate_plot_sun_retrieval_ts
+    _read_sun_retrieval_cached
 
 """
 
-from copy import deepcopy
+from copy import copy
 from warnings import warn
+from functools import lru_cache
 import os
 
 import numpy as np
@@ -27,7 +34,8 @@ import pyart
 from .process_vol_products import generate_vol_products
 
 from ..io.io_aux import get_fieldname_pyart
-from ..io.io_aux import get_save_dir, make_filename
+from ..io.io_aux import get_product_save_dir, make_filename
+from ..io.io_aux import make_single_filename
 
 from ..io.read_data_sun import read_sun_retrieval
 from ..io.read_data_other import read_ml_ts
@@ -68,9 +76,7 @@ def generate_occurrence_products(dataset, prdcfg):
         the name of the file created. None otherwise
 
     """
-    instant = False
-    if 'instant' in prdcfg:
-        instant = prdcfg['instant']
+    instant = prdcfg.get('instant', False)
 
     if not instant and not dataset['occu_final']:
         return None
@@ -87,22 +93,17 @@ def generate_occurrence_products(dataset, prdcfg):
                  'Missing data')
             return None
 
-        dssavedir = prdcfg['dsname']
-        if 'dssavename' in prdcfg:
-            dssavedir = prdcfg['dssavename']
+        quant_min = prdcfg.get('quant_min', 95.)
 
-        quant_min = 95.
-        if 'quant_min' in prdcfg:
-            quant_min = prdcfg['quant_min']
-
-        # get index of gates exceeding quantile
+        # get gates exceeding quantile. Masked gates never exceed it
         freq_occu = radar.fields['frequency_of_occurrence'][
             'data']
-        ind_ray, ind_rng = np.where(freq_occu > quant_min)
-        if ind_ray.size == 0:
+        excess_mask = np.ma.filled(freq_occu, -np.inf) > quant_min
+        if not excess_mask.any():
             warn('No data exceeds the frequency of occurrence ' +
                  str(quant_min)+' %')
             return None
+        ind_ray, ind_rng = np.nonzero(excess_mask)
 
         excess_dict = {
             'starttime': dataset['starttime'],
@@ -110,25 +111,23 @@ def generate_occurrence_products(dataset, prdcfg):
             'quant_min': quant_min,
             'ray_ind': ind_ray,
             'rng_ind': ind_rng,
-            'ele': radar.elevation['data'][ind_ray],
-            'azi': radar.azimuth['data'][ind_ray],
-            'rng': radar.range['data'][ind_rng],
+            'ele': radar.elevation['data'].take(ind_ray),
+            'azi': radar.azimuth['data'].take(ind_ray),
+            'rng': radar.range['data'].take(ind_rng),
             'nsamples': (
-                radar.fields['number_of_samples']['data'][ind_ray, ind_rng]),
+                radar.fields['number_of_samples']['data'][excess_mask]),
             'occurrence': (
-                radar.fields['occurrence']['data'][ind_ray, ind_rng]),
-            'freq_occu': freq_occu[ind_ray, ind_rng]
+                radar.fields['occurrence']['data'][excess_mask]),
+            'freq_occu': freq_occu[excess_mask]
         }
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=dataset['endtime'])
+        savedir = get_product_save_dir(prdcfg, dataset['endtime'])
 
-        fname = make_filename(
-            'excess_gates', prdcfg['dstype'], prdcfg['prdname'], ['csv'],
-            prdcfginfo='quant'+'{:.1f}'.format(quant_min),
+        fname = make_single_filename(
+            'excess_gates', prdcfg['dstype'], prdcfg['prdname'], 'csv',
+            prdcfginfo=f'quant{quant_min:.1f}',
             timeinfo=dataset['endtime'])
 
-        fname = savedir+fname[0]
+        fname = os.path.join(savedir, fname)
 
         fname = write_excess_gates(excess_dict, fname)
 
@@ -199,26 +198,29 @@ def generate_cosmo_coord_products(dataset, prdcfg):
         compression = prdcfg.get('compression', 'gzip')
         compression_opts = prdcfg.get('compression_opts', 6)
 
-        new_dataset = deepcopy(radar_obj)
-        new_dataset.fields = dict()
-        new_dataset.add_field(field_name, radar_obj.fields[field_name])
+        # shallow copy: the coordinates and the field data are shared with
+        # the original radar object, only the fields dictionary is new
+        new_dataset = copy(radar_obj)
+        new_dataset.fields = {field_name: radar_obj.fields[field_name]}
 
         savedir = prdcfg['cosmopath'][ind_rad]+'rad2cosmo/'
-        fname = 'rad2cosmo_'+prdcfg['voltype']+'_'+prdcfg['procname']+'.nc'
+        fname = os.path.join(
+            savedir,
+            'rad2cosmo_'+prdcfg['voltype']+'_'+prdcfg['procname']+'.nc')
 
         if file_type == 'nc':
             pyart.io.cfradial.write_cfradial(
-                savedir+fname, new_dataset, physical=physical)
+                fname, new_dataset, physical=physical)
         elif file_type == 'h5':
             pyart.aux_io.write_odim_h5(
-                savedir+fname, new_dataset, physical=physical,
+                fname, new_dataset, physical=physical,
                 compression=compression, compression_opts=compression_opts)
         else:
             warn('Data could not be saved. ' +
                  'Unknown saving file type '+file_type)
             return None
 
-        print('saved file: '+savedir+fname)
+        print('saved file: '+fname)
 
         return fname
 
@@ -288,9 +290,10 @@ def generate_cosmo_to_radar_products(dataset, prdcfg):
         compression = prdcfg.get('compression', 'gzip')
         compression_opts = prdcfg.get('compression_opts', 6)
 
-        new_dataset = deepcopy(radar_obj)
-        new_dataset.fields = dict()
-        new_dataset.add_field(field_name, radar_obj.fields[field_name])
+        # shallow copy: the coordinates and the field data are shared with
+        # the original radar object, only the fields dictionary is new
+        new_dataset = copy(radar_obj)
+        new_dataset.fields = {field_name: radar_obj.fields[field_name]}
 
         savedir = (
             prdcfg['cosmopath'][ind_rad]+prdcfg['voltype']+'/radar/' +
@@ -299,23 +302,24 @@ def generate_cosmo_to_radar_products(dataset, prdcfg):
             prdcfg['voltype']+'_RUN' +
             prdcfg['timeinfo'].strftime('%Y%m%d%H%M%S')+'_' +
             radar_dataset['dtcosmo'].strftime('%Y%m%d%H%M%S')+'.nc')
+        fname = os.path.join(savedir, fname)
 
         if not os.path.isdir(savedir):
             os.makedirs(savedir)
 
         if file_type == 'nc':
             pyart.io.cfradial.write_cfradial(
-                savedir+fname, new_dataset, physical=physical)
+                fname, new_dataset, physical=physical)
         elif file_type == 'h5':
             pyart.aux_io.write_odim_h5(
-                savedir+fname, new_dataset, physical=physical,
+                fname, new_dataset, physical=physical,
                 compression=compression, compression_opts=compression_opts)
         else:
             warn('Data could not be saved. ' +
                  'Unknown saving file type '+file_type)
             return None
 
-        print('saved file: '+savedir+fname)
+        print('saved file: '+fname)
 
         return fname
 
@@ -360,212 +364,12 @@ def generate_sun_hits_products(dataset, prdcfg):
         the name of the file created. None otherwise
 
     """
-
-    dssavedir = prdcfg['dsname']
-    if 'dssavename' in prdcfg:
-        dssavedir = prdcfg['dssavename']
-
-    prdcfg['timeinfo'] = dataset['timeinfo']
-
-    if prdcfg['type'] == 'WRITE_SUN_HITS':
-        if 'sun_hits' not in dataset:
-            return None
-
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=dataset['timeinfo'])
-
-        fname = make_filename(
-            'info', prdcfg['dstype'], 'detected', ['csv'],
-            timeinfo=dataset['timeinfo'], timeformat='%Y%m%d')[0]
-
-        fname = savedir+fname
-
-        write_sun_hits(dataset['sun_hits'], fname)
-
-        print('saved sun hits file: '+fname)
-
-        return fname[0]
-
-    if prdcfg['type'] == 'PLOT_SUN_HITS':
-        if 'sun_hits_final' not in dataset:
-            return None
-
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-
-        if prdcfg['voltype'] not in dataset['sun_hits_final']:
-            warn(
-                ' Field type ' + prdcfg['voltype'] +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
-
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=dataset['timeinfo'])
-
-        fname_list = make_filename(
-            'detected', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'], timeinfo=dataset['timeinfo'],
-            timeformat='%Y%m%d')
-
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
-
-        field = create_sun_hits_field(
-            dataset['sun_hits_final']['rad_el'],
-            dataset['sun_hits_final']['rad_az'],
-            dataset['sun_hits_final']['sun_el'],
-            dataset['sun_hits_final']['sun_az'],
-            dataset['sun_hits_final'][prdcfg['voltype']],
-            prdcfg['sunhitsImageConfig'])
-
-        if field is None:
-            warn(
-                'Unable to create field '+prdcfg['voltype'] +
-                ' Skipping product ' + prdcfg['type'])
-            return None
-
-        plot_sun_hits(field, field_name, fname_list, prdcfg)
-
-        print('----- save to '+' '.join(fname_list))
-
-        return fname_list
-
-    if prdcfg['type'] == 'WRITE_SUN_RETRIEVAL':
-        if 'sun_retrieval' not in dataset:
-            return None
-
-        timeinfo = None
-        timeformat = None
-        if prdcfg.get('add_date_in_fname', False):
-            timeinfo = dataset['timeinfo']
-            timeformat = '%Y'
-
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=None)
-
-        fname = make_filename(
-            'info', prdcfg['dstype'], 'retrieval', ['csv'], timeinfo=timeinfo,
-            timeformat=timeformat, runinfo=prdcfg['runinfo'])[0]
-
-        fname = savedir+fname
-
-        write_sun_retrieval(dataset['sun_retrieval'], fname)
-
-        print('saved sun retrieval file: '+fname)
-
-        return fname
-
-    if prdcfg['type'] == 'PLOT_SUN_RETRIEVAL':
-        if 'sun_retrieval' not in dataset:
-            return None
-
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        par = None
-        if field_name == 'sun_est_power_h':
-            par = 'par_h'
-        elif field_name == 'sun_est_power_v':
-            par = 'par_v'
-        elif field_name == 'sun_est_differential_reflectivity':
-            par = 'par_zdr'
-
-        if par not in dataset['sun_retrieval']:
-            warn(
-                ' Field type ' + prdcfg['voltype'] +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=dataset['timeinfo'])
-
-        fname_list = make_filename(
-            'retrieval', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'], timeinfo=dataset['timeinfo'],
-            timeformat='%Y%m%d')
-
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
-
-        if dataset['sun_retrieval'][par] is None:
-            warn(
-                ' Invalid retrieval parameters. Skipping product ' +
-                prdcfg['type'])
-            return None
-
-        field = create_sun_retrieval_field(
-            dataset['sun_retrieval'][par], field_name,
-            prdcfg['sunhitsImageConfig'],
-            lant=dataset['sun_retrieval']['lant'])
-
-        if field is not None:
-            plot_sun_hits(field, field_name, fname_list, prdcfg)
-
-        print('----- save to '+' '.join(fname_list))
-
-        return fname_list
-
-    if prdcfg['type'] == 'PLOT_SUN_RETRIEVAL_TS':
-        if 'sun_retrieval' not in dataset:
-            return None
-
-        dpi = prdcfg.get('dpi', 72)
-        timeinfo = None
-        timeformat = None
-        if prdcfg.get('add_date_in_fname', False):
-            timeinfo = dataset['timeinfo']
-            timeformat = '%Y'
-
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdid'], timeinfo=None)
-
-        fname = make_filename(
-            'info', prdcfg['dstype'], 'retrieval', ['csv'], timeinfo=timeinfo,
-            timeformat=timeformat, runinfo=prdcfg['runinfo'])
-
-        fname = savedir + fname[0]
-
-        sun_retrieval = read_sun_retrieval(fname)
-
-        if sun_retrieval[0] is None:
-            warn(
-                'Unable to read sun retrieval file '+fname)
-            return None
-
-        if len(sun_retrieval[0]) < 2:
-            warn(
-                'Unable to plot sun retrieval time series. ' +
-                'Not enough data points.')
-            return None
-
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=None)
-
-        fname_list = make_filename(
-            'retrieval_ts', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'], timeinfo=timeinfo,
-            timeformat=timeformat, runinfo=prdcfg['runinfo'])
-
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
-
-        titl = (prdcfg['runinfo']+' Sun Retrieval ' +
-                sun_retrieval[1][0].strftime('%Y%m%d')+'-' +
-                sun_retrieval[1][-1].strftime('%Y%m%d'))
-        figfname = plot_sun_retrieval_ts(
-            sun_retrieval, prdcfg['voltype'], fname_list, titl=titl, dpi=dpi)
-
-        if figfname is None:
-            return None
-
-        print('----- save to '+' '.join(fname_list))
-        return fname_list
+    handler = _SUN_HITS_HANDLERS.get(prdcfg['type'])
+    if handler is not None:
+        return handler(dataset, prdcfg)
 
     if 'radar_out' in dataset:
+        prdcfg['timeinfo'] = dataset['timeinfo']
         return generate_vol_products(dataset, prdcfg)
 
     return None
@@ -596,9 +400,7 @@ def generate_qvp_products(dataset, prdcfg):
         the name of the file created. None otherwise
 
     """
-    qvp_type = 'final'
-    if 'qvp_type' in prdcfg:
-        qvp_type = prdcfg['qvp_type']
+    qvp_type = prdcfg.get('qvp_type', 'final')
 
     if qvp_type == 'final' and dataset['radar_type'] != 'final':
         return None
@@ -637,22 +439,16 @@ def generate_ml_products(dataset, prdcfg):
 
     """
 
-    dssavedir = prdcfg['dsname']
-    if 'dssavename' in prdcfg:
-        dssavedir = prdcfg['dssavename']
-
     if prdcfg['type'] == 'ML_TS':
         dpi = prdcfg.get('dpi', 72)
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=prdcfg['timeinfo'])
+        savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
 
-        csvfname = make_filename(
-            'ts', prdcfg['dstype'], 'ml', ['csv'],
-            timeinfo=prdcfg['timeinfo'], timeformat='%Y%m%d')[0]
+        csvfname = make_single_filename(
+            'ts', prdcfg['dstype'], 'ml', 'csv',
+            timeinfo=prdcfg['timeinfo'], timeformat='%Y%m%d')
 
-        csvfname = savedir+csvfname
+        csvfname = os.path.join(savedir, csvfname)
 
         ml_bottom = dataset['ml_obj'].fields['melting_layer_height']['data'][:, 0]
         ml_top = dataset['ml_obj'].fields['melting_layer_height']['data'][:, 1]
@@ -662,7 +458,7 @@ def generate_ml_products(dataset, prdcfg):
         thick = ml_top-ml_bottom
         thick_avg = np.ma.asarray(np.ma.mean(thick))
         thick_std = np.ma.asarray(np.ma.std(thick))
-        nrays_valid = thick.compressed().size
+        nrays_valid = np.ma.count(thick)
         nrays_total = thick.size
 
         write_ts_ml(
@@ -684,8 +480,8 @@ def generate_ml_products(dataset, prdcfg):
             'ts', prdcfg['dstype'], 'ml', prdcfg['imgformat'],
             timeinfo=dt_ml_arr[0], timeformat='%Y%m%d')
 
-        for i, figfname in enumerate(figfname_list):
-            figfname_list[i] = savedir+figfname
+        figfname_list = [
+            os.path.join(savedir, figfname) for figfname in figfname_list]
 
         titl = dt_ml_arr[0].strftime('%Y-%m-%d')+' melting layer time series'
 
@@ -698,18 +494,342 @@ def generate_ml_products(dataset, prdcfg):
         return figfname_list
 
     if prdcfg['type'] == 'SAVE_ML':
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=prdcfg['timeinfo'])
+        savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
 
-        fname = make_filename(
-            'saveml', prdcfg['dstype'], 'ml_h', ['nc'],
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])[0]
+        fname = make_single_filename(
+            'saveml', prdcfg['dstype'], 'ml_h', 'nc',
+            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
 
-        fname = savedir+fname
+        fname = os.path.join(savedir, fname)
         pyart.io.cfradial.write_cfradial(fname, dataset['ml_obj'])
         print('saved file: '+fname)
 
         return fname
 
     return generate_vol_products(dataset, prdcfg)
+
+
+def _generate_write_sun_hits(dataset, prdcfg):
+    """
+    Writes the information of the detected sun hits. The user defined
+    parameters are documented in generate_sun_hits_products
+
+    Parameters
+    ----------
+    dataset : tuple
+        radar object and sun hits dictionary
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
+
+    """
+
+    if 'sun_hits' not in dataset:
+        return None
+
+    savedir = get_product_save_dir(prdcfg, dataset['timeinfo'])
+
+    fname = make_single_filename(
+        'info', prdcfg['dstype'], 'detected', 'csv',
+        timeinfo=dataset['timeinfo'], timeformat='%Y%m%d')
+
+    fname = os.path.join(savedir, fname)
+
+    write_sun_hits(dataset['sun_hits'], fname)
+
+    print('saved sun hits file: '+fname)
+
+    return fname
+
+
+def _generate_plot_sun_hits(dataset, prdcfg):
+    """
+    Plots the detected sun hits. The user defined parameters are documented in
+    generate_sun_hits_products
+
+    Parameters
+    ----------
+    dataset : tuple
+        radar object and sun hits dictionary
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
+
+    """
+
+    if 'sun_hits_final' not in dataset:
+        return None
+
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+
+    if prdcfg['voltype'] not in dataset['sun_hits_final']:
+        warn(
+            ' Field type ' + prdcfg['voltype'] +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
+
+    field = create_sun_hits_field(
+        dataset['sun_hits_final']['rad_el'],
+        dataset['sun_hits_final']['rad_az'],
+        dataset['sun_hits_final']['sun_el'],
+        dataset['sun_hits_final']['sun_az'],
+        dataset['sun_hits_final'][prdcfg['voltype']],
+        prdcfg['sunhitsImageConfig'])
+
+    if field is None:
+        warn(
+            'Unable to create field '+prdcfg['voltype'] +
+            ' Skipping product ' + prdcfg['type'])
+        return None
+
+    savedir = get_product_save_dir(prdcfg, dataset['timeinfo'])
+
+    fname_list = make_filename(
+        'detected', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'], timeinfo=dataset['timeinfo'],
+        timeformat='%Y%m%d')
+
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
+
+    prdcfg['timeinfo'] = dataset['timeinfo']
+    plot_sun_hits(field, field_name, fname_list, prdcfg)
+
+    print('----- save to '+' '.join(fname_list))
+
+    return fname_list
+
+
+def _generate_write_sun_retrieval(dataset, prdcfg):
+    """
+    Writes the retrieved sun parameters. The user defined parameters are
+    documented in generate_sun_hits_products
+
+    Parameters
+    ----------
+    dataset : tuple
+        radar object and sun hits dictionary
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
+
+    """
+
+    if 'sun_retrieval' not in dataset:
+        return None
+
+    timeinfo = None
+    timeformat = None
+    if prdcfg.get('add_date_in_fname', False):
+        timeinfo = dataset['timeinfo']
+        timeformat = '%Y'
+
+    savedir = get_product_save_dir(prdcfg, None)
+
+    fname = make_single_filename(
+        'info', prdcfg['dstype'], 'retrieval', 'csv', timeinfo=timeinfo,
+        timeformat=timeformat, runinfo=prdcfg['runinfo'])
+
+    fname = os.path.join(savedir, fname)
+
+    write_sun_retrieval(dataset['sun_retrieval'], fname)
+
+    print('saved sun retrieval file: '+fname)
+
+    return fname
+
+
+def _generate_plot_sun_retrieval(dataset, prdcfg):
+    """
+    Plots a field of the retrieved sun parameters. The user defined parameters
+    are documented in generate_sun_hits_products
+
+    Parameters
+    ----------
+    dataset : tuple
+        radar object and sun hits dictionary
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
+
+    """
+
+    if 'sun_retrieval' not in dataset:
+        return None
+
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    par = None
+    if field_name == 'sun_est_power_h':
+        par = 'par_h'
+    elif field_name == 'sun_est_power_v':
+        par = 'par_v'
+    elif field_name == 'sun_est_differential_reflectivity':
+        par = 'par_zdr'
+
+    if par not in dataset['sun_retrieval']:
+        warn(
+            ' Field type ' + prdcfg['voltype'] +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
+
+    if dataset['sun_retrieval'][par] is None:
+        warn(
+            ' Invalid retrieval parameters. Skipping product ' +
+            prdcfg['type'])
+        return None
+
+    savedir = get_product_save_dir(prdcfg, dataset['timeinfo'])
+
+    fname_list = make_filename(
+        'retrieval', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'], timeinfo=dataset['timeinfo'],
+        timeformat='%Y%m%d')
+
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
+
+    field = create_sun_retrieval_field(
+        dataset['sun_retrieval'][par], field_name,
+        prdcfg['sunhitsImageConfig'],
+        lant=dataset['sun_retrieval']['lant'])
+
+    if field is not None:
+        prdcfg['timeinfo'] = dataset['timeinfo']
+        plot_sun_hits(field, field_name, fname_list, prdcfg)
+
+    print('----- save to '+' '.join(fname_list))
+
+    return fname_list
+
+
+def _generate_plot_sun_retrieval_ts(dataset, prdcfg):
+    """
+    Plots a time series of the retrieved sun parameters. The user defined
+    parameters are documented in generate_sun_hits_products
+
+    Parameters
+    ----------
+    dataset : tuple
+        radar object and sun hits dictionary
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
+
+    """
+
+    if 'sun_retrieval' not in dataset:
+        return None
+
+    dpi = prdcfg.get('dpi', 72)
+    timeinfo = None
+    timeformat = None
+    if prdcfg.get('add_date_in_fname', False):
+        timeinfo = dataset['timeinfo']
+        timeformat = '%Y'
+
+    savedir = get_product_save_dir(prdcfg, None, prdsavedir=prdcfg['prdid'])
+
+    fname = make_single_filename(
+        'info', prdcfg['dstype'], 'retrieval', 'csv', timeinfo=timeinfo,
+        timeformat=timeformat, runinfo=prdcfg['runinfo'])
+
+    fname = os.path.join(savedir, fname)
+
+    try:
+        fstat = os.stat(fname)
+    except OSError:
+        warn(
+            'Unable to read sun retrieval file '+fname)
+        return None
+
+    sun_retrieval = _read_sun_retrieval_cached(
+        fname, fstat.st_mtime_ns, fstat.st_size)
+
+    if sun_retrieval[0] is None:
+        warn(
+            'Unable to read sun retrieval file '+fname)
+        return None
+
+    if len(sun_retrieval[0]) < 2:
+        warn(
+            'Unable to plot sun retrieval time series. ' +
+            'Not enough data points.')
+        return None
+
+    savedir = get_product_save_dir(prdcfg, None)
+
+    fname_list = make_filename(
+        'retrieval_ts', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'], timeinfo=timeinfo,
+        timeformat=timeformat, runinfo=prdcfg['runinfo'])
+
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
+
+    titl = (prdcfg['runinfo']+' Sun Retrieval ' +
+            sun_retrieval[1][0].strftime('%Y%m%d')+'-' +
+            sun_retrieval[1][-1].strftime('%Y%m%d'))
+    figfname = plot_sun_retrieval_ts(
+        sun_retrieval, prdcfg['voltype'], fname_list, titl=titl, dpi=dpi)
+
+    if figfname is None:
+        return None
+
+    print('----- save to '+' '.join(fname_list))
+    return fname_list
+
+
+@lru_cache(maxsize=32)
+def _read_sun_retrieval_cached(fname, mtime, size):
+    """
+    Reads sun retrieval data contained in a csv file. The read data is cached
+    so that the file is only parsed again if it has been modified
+
+    Parameters
+    ----------
+    fname : str
+        path of time series file
+    mtime : int
+        modification time of the file [ns]. Part of the cache key
+    size : int
+        size of the file [bytes]. Part of the cache key
+
+    Returns
+    -------
+    sun_retrieval : tupple
+        The sun retrieval time series as returned by read_sun_retrieval
+
+    """
+    return read_sun_retrieval(fname)
+
+
+_SUN_HITS_HANDLERS = {
+    'WRITE_SUN_HITS': _generate_write_sun_hits,
+    'PLOT_SUN_HITS': _generate_plot_sun_hits,
+    'WRITE_SUN_RETRIEVAL': _generate_write_sun_retrieval,
+    'PLOT_SUN_RETRIEVAL': _generate_plot_sun_retrieval,
+    'PLOT_SUN_RETRIEVAL_TS': _generate_plot_sun_retrieval_ts}
@@ -8,9 +8,24 @@ Functions for obtaining Pyrad products from spectra datasets
     :toctree: generated/
 
     generate_spectra_products
+    _generate_range_doppler
+    _generate_angle_doppler
+    _generate_time_doppler
+    _generate_doppler
+    _generate_complex_range_doppler
+    _generate_complex_angle_doppler
+    _generate_complex_time_doppler
+    _generate_complex_doppler
+    _generate_amplitude_phase_doppler
+    _generate_amplitude_phase_range_doppler
+    _generate_amplitude_phase_angle_doppler
+    _generate_amplitude_phase_time_doppler
+    _generate_savevol
+    _generate_saveall
 
 """
 
+import os
 from warnings import warn
 from copy import deepcopy
 
@@ -20,7 +35,7 @@ import pyart
 from pyart.util import datetime_from_radar
 
 from ..io.io_aux import get_fieldname_pyart
-from ..io.io_aux import get_save_dir, make_filename
+from ..io.io_aux import get_product_save_dir, make_filename
 
 from ..graph.plots_spectra import plot_range_Doppler, plot_Doppler
 from ..graph.plots_spectra import plot_complex_range_Doppler
@@ -264,897 +279,1141 @@ def generate_spectra_products(dataset, prdcfg):
     None or name of generated files
 
     """
-    dssavedir = prdcfg['dsname']
-    if 'dssavename' in prdcfg:
-        dssavedir = prdcfg['dssavename']
-
-    if prdcfg['type'] == 'RANGE_DOPPLER':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
-
-        # user defined values
-        azi = prdcfg.get('azi', None)
-        ele = prdcfg.get('ele', None)
-        azi_tol = prdcfg.get('azi_tol', 1.)
-        ele_tol = prdcfg.get('ele_tol', 1.)
-
-        if azi is None or ele is None:
-            ind_ray = prdcfg.get('ind_ray', 0)
-            azi = dataset['radar_out'].azimuth['data'][ind_ray]
-            ele = dataset['radar_out'].elevation['data'][ind_ray]
-        else:
-            ind_ray = find_ray_index(
-                dataset['radar_out'].elevation['data'],
-                dataset['radar_out'].azimuth['data'], ele, azi,
-                ele_tol=ele_tol, azi_tol=azi_tol)
-
-        if ind_ray is None:
-            warn('Ray azi='+str(azi)+', ele='+str(ele) +
-                 ' out of radar coverage')
-            return None
-
-        gateinfo = 'az'+'{:.1f}'.format(azi)+'el'+'{:.1f}'.format(ele)
-
-        xaxis_info = prdcfg.get('xaxis_info', 'Doppler_velocity')
-        vmin = prdcfg.get('vmin', None)
-        vmax = prdcfg.get('vmax', None)
-
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=prdcfg['timeinfo'])
-
-        fname_list = make_filename(
-            'range_Doppler', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'], prdcfginfo=gateinfo,
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
-
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
-
-        if dataset['radar_out'].ngates == 1:
-            plot_Doppler(
-                dataset['radar_out'], field_name, ind_ray, 0, prdcfg,
-                fname_list, xaxis_info=xaxis_info, vmin=vmin, vmax=vmax)
-        else:
-            plot_range_Doppler(
-                dataset['radar_out'], field_name, ind_ray, prdcfg, fname_list,
-                xaxis_info=xaxis_info, vmin=vmin, vmax=vmax)
-
-        print('----- save to '+' '.join(fname_list))
-
-        return fname_list
-
-    if prdcfg['type'] == 'ANGLE_DOPPLER':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
-
-        # user defined values
-        along_azi = prdcfg.get('along_azi', True)
-        ang = prdcfg.get('ang', 0)
-        rng = prdcfg.get('rng', 0)
-        ang_tol = prdcfg.get('ang_tol', 1.)
-        rng_tol = prdcfg.get('rng_tol', 50.)
+    handler = _SPECTRA_HANDLERS.get(prdcfg['type'])
+    if handler is not None:
+        return handler(dataset, prdcfg)
 
-        ind_rng = find_rng_index(
-            dataset['radar_out'].range['data'], rng, rng_tol=rng_tol)
+    warn(' Unsupported product type: ' + prdcfg['type'])
+    return None
+
+
+def _generate_range_doppler(dataset, prdcfg):
+    """
+    Makes a range-Doppler plot of spectral or IQ data. The user defined
+    parameters are documented in generate_spectra_products
+
+    Parameters
+    ----------
+    dataset : spectra
+        spectra object
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
 
-        if ind_rng is None:
-            warn('No data at rng='+str(rng))
-            return None
-
-        if along_azi:
-            ind_rays = np.where(np.logical_and(
-                dataset['radar_out'].elevation['data'] <= ang+ang_tol,
-                dataset['radar_out'].elevation['data'] >= ang-ang_tol))[0]
-        else:
-            ind_rays = np.where(np.logical_and(
-                dataset['radar_out'].azimuth['data'] <= ang+ang_tol,
-                dataset['radar_out'].azimuth['data'] >= ang-ang_tol))[0]
-
-        if ind_rays.size == 0:
-            warn('No data for angle '+str(ang))
-            return None
-
-        # sort angles
-        if along_azi:
-            ang_selected = dataset['radar_out'].azimuth['data'][ind_rays]
-
-        else:
-            ang_selected = dataset['radar_out'].elevation['data'][ind_rays]
-        ind_rays = ind_rays[np.argsort(ang_selected)]
-
-        if along_azi:
-            gateinfo = 'azi'+'{:.1f}'.format(ang)+'rng'+'{:.1f}'.format(rng)
-        else:
-            gateinfo = 'ele'+'{:.1f}'.format(ang)+'rng'+'{:.1f}'.format(rng)
-
-        xaxis_info = prdcfg.get('xaxis_info', 'Doppler_velocity')
-        vmin = prdcfg.get('vmin', None)
-        vmax = prdcfg.get('vmax', None)
-
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=prdcfg['timeinfo'])
-
-        fname_list = make_filename(
-            'range_Doppler', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'], prdcfginfo=gateinfo,
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
-
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
-
-        if ind_rays.size == 1:
-            plot_Doppler(
-                dataset['radar_out'], field_name, ind_rays, ind_rng, prdcfg,
-                fname_list, xaxis_info=xaxis_info, vmin=vmin, vmax=vmax)
-        else:
-            plot_angle_Doppler(
-                dataset['radar_out'], field_name, ang, ind_rays, ind_rng,
-                prdcfg, fname_list, xaxis_info=xaxis_info,
-                along_azi=along_azi, vmin=vmin, vmax=vmax)
-
-        print('----- save to '+' '.join(fname_list))
-
-        return fname_list
-
-    if prdcfg['type'] == 'TIME_DOPPLER':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
-
-        # user defined values
-        xaxis_info = prdcfg.get('xaxis_info', 'Doppler_velocity')
-        vmin = prdcfg.get('vmin', None)
-        vmax = prdcfg.get('vmax', None)
-        xmin = prdcfg.get('xmin', None)
-        xmax = prdcfg.get('xmax', None)
-        ymin = prdcfg.get('ymin', None)
-        ymax = prdcfg.get('ymax', None)
-        plot_type = prdcfg.get('plot_type', 'final')
-
-        if plot_type == 'final' and not dataset['final']:
-            return None
-
-        if 'antenna_coordinates_az_el_r' in dataset:
-            az = '{:.1f}'.format(dataset['antenna_coordinates_az_el_r'][0])
-            el = '{:.1f}'.format(dataset['antenna_coordinates_az_el_r'][1])
-            r = '{:.1f}'.format(dataset['antenna_coordinates_az_el_r'][2])
-            gateinfo = ('az'+az+'r'+r+'el'+el)
-        else:
-            lon = '{:.3f}'.format(
-                dataset['point_coordinates_WGS84_lon_lat_alt'][0])
-            lat = '{:.3f}'.format(
-                dataset['point_coordinates_WGS84_lon_lat_alt'][1])
-            alt = '{:.1f}'.format(
-                dataset['point_coordinates_WGS84_lon_lat_alt'][2])
-            gateinfo = ('lon'+lon+'lat'+lat+'alt'+alt)
-
-        time_info = datetime_from_radar(dataset['radar_out'])
-
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=time_info)
-
-        fname_list = make_filename(
-            'time_Doppler', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'], prdcfginfo=gateinfo,
-            timeinfo=time_info, runinfo=prdcfg['runinfo'])
-
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
-
-        if dataset['radar_out'].nrays == 1:
-            plot_Doppler(
-                dataset['radar_out'], field_name, 0, 0, prdcfg, fname_list,
-                xaxis_info=xaxis_info, vmin=vmin, vmax=vmax)
-        else:
-            plot_time_Doppler(
-                dataset['radar_out'], field_name, prdcfg, fname_list,
-                xaxis_info=xaxis_info, vmin=vmin, vmax=vmax, xmin=xmin,
-                xmax=xmax, ymin=ymin, ymax=ymax)
-
-        print('----- save to '+' '.join(fname_list))
-
-        return fname_list
-
-    if prdcfg['type'] == 'DOPPLER':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
-
-        # user defined values
-        azi = prdcfg.get('azi', None)
-        ele = prdcfg.get('ele', None)
-        rng = prdcfg.get('rng', None)
-        azi_tol = prdcfg.get('azi_tol', 1.)
-        ele_tol = prdcfg.get('ele_tol', 1.)
-        rng_tol = prdcfg.get('rng_tol', 50.)
-
-        if azi is None or ele is None or rng is None:
-            ind_ray = prdcfg.get('ind_ray', 0)
-            ind_rng = prdcfg.get('ind_rng', 0)
-            azi = dataset['radar_out'].azimuth['data'][ind_ray]
-            ele = dataset['radar_out'].elevation['data'][ind_ray]
-            rng = dataset['radar_out'].range['data'][ind_rng]
-        else:
-            ind_ray = find_ray_index(
-                dataset['radar_out'].elevation['data'],
-                dataset['radar_out'].azimuth['data'], ele, azi,
-                ele_tol=ele_tol, azi_tol=azi_tol)
-            ind_rng = find_rng_index(
-                dataset['radar_out'].range['data'], rng, rng_tol=rng_tol)
-
-        if ind_rng is None or ind_ray is None:
-            warn('Point azi='+str(azi)+', ele='+str(ele)+', rng='+str(rng) +
-                 ' out of radar coverage')
-            return None
-
-        gateinfo = (
-            'az'+'{:.1f}'.format(azi)+'el'+'{:.1f}'.format(ele) +
-            'r'+'{:.1f}'.format(rng))
-
-        xaxis_info = prdcfg.get('xaxis_info', 'Doppler_velocity')
-        vmin = prdcfg.get('vmin', None)
-        vmax = prdcfg.get('vmax', None)
-
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=prdcfg['timeinfo'])
-
-        fname_list = make_filename(
-            'Doppler', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'], prdcfginfo=gateinfo,
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
-
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
 
+    """
+
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
+
+    # user defined values
+    azi = prdcfg.get('azi', None)
+    ele = prdcfg.get('ele', None)
+    azi_tol = prdcfg.get('azi_tol', 1.)
+    ele_tol = prdcfg.get('ele_tol', 1.)
+
+    if azi is None or ele is None:
+        ind_ray = prdcfg.get('ind_ray', 0)
+        azi = dataset['radar_out'].azimuth['data'][ind_ray]
+        ele = dataset['radar_out'].elevation['data'][ind_ray]
+    else:
+        ind_ray = find_ray_index(
+            dataset['radar_out'].elevation['data'],
+            dataset['radar_out'].azimuth['data'], ele, azi,
+            ele_tol=ele_tol, azi_tol=azi_tol)
+
+    if ind_ray is None:
+        warn('Ray azi='+str(azi)+', ele='+str(ele) +
+             ' out of radar coverage')
+        return None
+
+    gateinfo = f'az{azi:.1f}el{ele:.1f}'
+
+    xaxis_info = prdcfg.get('xaxis_info', 'Doppler_velocity')
+    vmin = prdcfg.get('vmin', None)
+    vmax = prdcfg.get('vmax', None)
+
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
+
+    fname_list = make_filename(
+        'range_Doppler', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'], prdcfginfo=gateinfo,
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
+
+    if dataset['radar_out'].ngates == 1:
         plot_Doppler(
-            dataset['radar_out'], field_name, ind_ray, ind_rng, prdcfg,
+            dataset['radar_out'], field_name, ind_ray, 0, prdcfg,
             fname_list, xaxis_info=xaxis_info, vmin=vmin, vmax=vmax)
+    else:
+        plot_range_Doppler(
+            dataset['radar_out'], field_name, ind_ray, prdcfg, fname_list,
+            xaxis_info=xaxis_info, vmin=vmin, vmax=vmax)
+
+    print('----- save to '+' '.join(fname_list))
 
-        print('----- save to '+' '.join(fname_list))
-
-        return fname_list
-
-    if prdcfg['type'] == 'COMPLEX_RANGE_DOPPLER':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
-
-        # user defined values
-        azi = prdcfg.get('azi', None)
-        ele = prdcfg.get('ele', None)
-        azi_tol = prdcfg.get('azi_tol', 1.)
-        ele_tol = prdcfg.get('ele_tol', 1.)
-
-        if azi is None or ele is None:
-            ind_ray = prdcfg.get('ind_ray', 0)
-            azi = dataset['radar_out'].azimuth['data'][ind_ray]
-            ele = dataset['radar_out'].elevation['data'][ind_ray]
-        else:
-            ind_ray = find_ray_index(
-                dataset['radar_out'].elevation['data'],
-                dataset['radar_out'].azimuth['data'], ele, azi,
-                ele_tol=ele_tol, azi_tol=azi_tol)
-
-        if ind_ray is None:
-            warn('Ray azi='+str(azi)+', ele='+str(ele) +
-                 ' out of radar coverage')
-            return None
-
-        gateinfo = 'az'+'{:.1f}'.format(azi)+'el'+'{:.1f}'.format(ele)
-
-        xaxis_info = prdcfg.get('xaxis_info', 'Doppler_velocity')
-        vmin = prdcfg.get('vmin', None)
-        vmax = prdcfg.get('vmax', None)
-
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=prdcfg['timeinfo'])
-
-        fname_list = make_filename(
-            'c_range_Doppler', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'], prdcfginfo=gateinfo,
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
-
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
-
-        if dataset['radar_out'].ngates == 1:
-            plot_complex_Doppler(
-                dataset['radar_out'], field_name, ind_ray, 0, prdcfg,
-                fname_list, xaxis_info=xaxis_info, vmin=vmin, vmax=vmax)
-        else:
-            plot_complex_range_Doppler(
-                dataset['radar_out'], field_name, ind_ray, prdcfg, fname_list,
-                xaxis_info=xaxis_info, vmin=vmin, vmax=vmax)
-
-        print('----- save to '+' '.join(fname_list))
-
-        return fname_list
-
-    if prdcfg['type'] == 'COMPLEX_ANGLE_DOPPLER':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
-
-        # user defined values
-        along_azi = prdcfg.get('along_azi', True)
-        ang = prdcfg.get('ang', 0)
-        rng = prdcfg.get('rng', 0)
-        ang_tol = prdcfg.get('ang_tol', 1.)
-        rng_tol = prdcfg.get('rng_tol', 50.)
+    return fname_list
+
+
+def _generate_angle_doppler(dataset, prdcfg):
+    """
+    Makes an angle Doppler plot. The user defined parameters are documented in
+    generate_spectra_products
+
+    Parameters
+    ----------
+    dataset : spectra
+        spectra object
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
+
+    """
+
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
+
+    # user defined values
+    along_azi = prdcfg.get('along_azi', True)
+    ang = prdcfg.get('ang', 0)
+    rng = prdcfg.get('rng', 0)
+    ang_tol = prdcfg.get('ang_tol', 1.)
+    rng_tol = prdcfg.get('rng_tol', 50.)
+
+    ind_rng = find_rng_index(
+        dataset['radar_out'].range['data'], rng, rng_tol=rng_tol)
+
+    if ind_rng is None:
+        warn('No data at rng='+str(rng))
+        return None
+
+    if along_azi:
+        ind_rays = np.where(np.logical_and(
+            dataset['radar_out'].elevation['data'] <= ang+ang_tol,
+            dataset['radar_out'].elevation['data'] >= ang-ang_tol))[0]
+    else:
+        ind_rays = np.where(np.logical_and(
+            dataset['radar_out'].azimuth['data'] <= ang+ang_tol,
+            dataset['radar_out'].azimuth['data'] >= ang-ang_tol))[0]
+
+    if ind_rays.size == 0:
+        warn('No data for angle '+str(ang))
+        return None
+
+    # sort angles
+    if along_azi:
+        ang_selected = dataset['radar_out'].azimuth['data'][ind_rays]
+
+    else:
+        ang_selected = dataset['radar_out'].elevation['data'][ind_rays]
+    ind_rays = ind_rays[np.argsort(ang_selected)]
+
+    if along_azi:
+        gateinfo = f'azi{ang:.1f}rng{rng:.1f}'
+    else:
+        gateinfo = f'ele{ang:.1f}rng{rng:.1f}'
+
+    xaxis_info = prdcfg.get('xaxis_info', 'Doppler_velocity')
+    vmin = prdcfg.get('vmin', None)
+    vmax = prdcfg.get('vmax', None)
+
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
+
+    fname_list = make_filename(
+        'range_Doppler', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'], prdcfginfo=gateinfo,
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
+
+    if ind_rays.size == 1:
+        plot_Doppler(
+            dataset['radar_out'], field_name, ind_rays, ind_rng, prdcfg,
+            fname_list, xaxis_info=xaxis_info, vmin=vmin, vmax=vmax)
+    else:
+        plot_angle_Doppler(
+            dataset['radar_out'], field_name, ang, ind_rays, ind_rng,
+            prdcfg, fname_list, xaxis_info=xaxis_info,
+            along_azi=along_azi, vmin=vmin, vmax=vmax)
 
+    print('----- save to '+' '.join(fname_list))
+
+    return fname_list
+
+
+def _generate_time_doppler(dataset, prdcfg):
+    """
+    Makes a time-Doppler plot of spectral or IQ data. The user defined
+    parameters are documented in generate_spectra_products
+
+    Parameters
+    ----------
+    dataset : spectra
+        spectra object
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
+
+    """
+
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
+
+    # user defined values
+    xaxis_info = prdcfg.get('xaxis_info', 'Doppler_velocity')
+    vmin = prdcfg.get('vmin', None)
+    vmax = prdcfg.get('vmax', None)
+    xmin = prdcfg.get('xmin', None)
+    xmax = prdcfg.get('xmax', None)
+    ymin = prdcfg.get('ymin', None)
+    ymax = prdcfg.get('ymax', None)
+    plot_type = prdcfg.get('plot_type', 'final')
+
+    if plot_type == 'final' and not dataset['final']:
+        return None
+
+    if 'antenna_coordinates_az_el_r' in dataset:
+        az = f"{dataset['antenna_coordinates_az_el_r'][0]:.1f}"
+        el = f"{dataset['antenna_coordinates_az_el_r'][1]:.1f}"
+        r = f"{dataset['antenna_coordinates_az_el_r'][2]:.1f}"
+        gateinfo = f'az{az}r{r}el{el}'
+    else:
+        lon = f"{dataset['point_coordinates_WGS84_lon_lat_alt'][0]:.3f}"
+        lat = f"{dataset['point_coordinates_WGS84_lon_lat_alt'][1]:.3f}"
+        alt = f"{dataset['point_coordinates_WGS84_lon_lat_alt'][2]:.1f}"
+        gateinfo = f'lon{lon}lat{lat}alt{alt}'
+
+    time_info = datetime_from_radar(dataset['radar_out'])
+
+    savedir = get_product_save_dir(prdcfg, time_info)
+
+    fname_list = make_filename(
+        'time_Doppler', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'], prdcfginfo=gateinfo,
+        timeinfo=time_info, runinfo=prdcfg['runinfo'])
+
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
+
+    if dataset['radar_out'].nrays == 1:
+        plot_Doppler(
+            dataset['radar_out'], field_name, 0, 0, prdcfg, fname_list,
+            xaxis_info=xaxis_info, vmin=vmin, vmax=vmax)
+    else:
+        plot_time_Doppler(
+            dataset['radar_out'], field_name, prdcfg, fname_list,
+            xaxis_info=xaxis_info, vmin=vmin, vmax=vmax, xmin=xmin,
+            xmax=xmax, ymin=ymin, ymax=ymax)
+
+    print('----- save to '+' '.join(fname_list))
+
+    return fname_list
+
+
+def _generate_doppler(dataset, prdcfg):
+    """
+    Plots a Doppler spectrum variable or IQ data variable. The user defined
+    parameters are documented in generate_spectra_products
+
+    Parameters
+    ----------
+    dataset : spectra
+        spectra object
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
+
+    """
+
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
+
+    # user defined values
+    azi = prdcfg.get('azi', None)
+    ele = prdcfg.get('ele', None)
+    rng = prdcfg.get('rng', None)
+    azi_tol = prdcfg.get('azi_tol', 1.)
+    ele_tol = prdcfg.get('ele_tol', 1.)
+    rng_tol = prdcfg.get('rng_tol', 50.)
+
+    if azi is None or ele is None or rng is None:
+        ind_ray = prdcfg.get('ind_ray', 0)
+        ind_rng = prdcfg.get('ind_rng', 0)
+        azi = dataset['radar_out'].azimuth['data'][ind_ray]
+        ele = dataset['radar_out'].elevation['data'][ind_ray]
+        rng = dataset['radar_out'].range['data'][ind_rng]
+    else:
+        ind_ray = find_ray_index(
+            dataset['radar_out'].elevation['data'],
+            dataset['radar_out'].azimuth['data'], ele, azi,
+            ele_tol=ele_tol, azi_tol=azi_tol)
         ind_rng = find_rng_index(
             dataset['radar_out'].range['data'], rng, rng_tol=rng_tol)
 
-        if ind_rng is None:
-            warn('No data at rng='+str(rng))
-            return None
-
-        if along_azi:
-            ind_rays = np.where(np.logical_and(
-                dataset['radar_out'].elevation['data'] <= ang+ang_tol,
-                dataset['radar_out'].elevation['data'] >= ang-ang_tol))[0]
-        else:
-            ind_rays = np.where(np.logical_and(
-                dataset['radar_out'].azimuth['data'] <= ang+ang_tol,
-                dataset['radar_out'].azimuth['data'] >= ang-ang_tol))[0]
-
-        if ind_rays.size == 0:
-            warn('No data for angle '+str(ang))
-            return None
-
-        # sort angles
-        if along_azi:
-            ang_selected = dataset['radar_out'].azimuth['data'][ind_rays]
-
-        else:
-            ang_selected = dataset['radar_out'].elevation['data'][ind_rays]
-        ind_rays = ind_rays[np.argsort(ang_selected)]
-
-        if along_azi:
-            gateinfo = 'azi'+'{:.1f}'.format(ang)+'rng'+'{:.1f}'.format(rng)
-        else:
-            gateinfo = 'ele'+'{:.1f}'.format(ang)+'rng'+'{:.1f}'.format(rng)
-
-        xaxis_info = prdcfg.get('xaxis_info', 'Doppler_velocity')
-        vmin = prdcfg.get('vmin', None)
-        vmax = prdcfg.get('vmax', None)
-
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=prdcfg['timeinfo'])
-
-        fname_list = make_filename(
-            'range_Doppler', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'], prdcfginfo=gateinfo,
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
-
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
-
-        if ind_rays.size == 1:
-            plot_complex_Doppler(
-                dataset['radar_out'], field_name, ind_rays, ind_rng, prdcfg,
-                fname_list, xaxis_info=xaxis_info, vmin=vmin, vmax=vmax)
-        else:
-            plot_complex_angle_Doppler(
-                dataset['radar_out'], field_name, ang, ind_rays, ind_rng,
-                prdcfg, fname_list, xaxis_info=xaxis_info,
-                along_azi=along_azi, vmin=vmin, vmax=vmax)
-
-        print('----- save to '+' '.join(fname_list))
-
-        return fname_list
-
-    if prdcfg['type'] == 'COMPLEX_TIME_DOPPLER':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
-
-        # user defined values
-        xaxis_info = prdcfg.get('xaxis_info', 'Doppler_velocity')
-        vmin = prdcfg.get('vmin', None)
-        vmax = prdcfg.get('vmax', None)
-        plot_type = prdcfg.get('plot_type', 'final')
-
-        if plot_type == 'final' and not dataset['final']:
-            return None
-
-        if 'antenna_coordinates_az_el_r' in dataset:
-            az = '{:.1f}'.format(dataset['antenna_coordinates_az_el_r'][0])
-            el = '{:.1f}'.format(dataset['antenna_coordinates_az_el_r'][1])
-            r = '{:.1f}'.format(dataset['antenna_coordinates_az_el_r'][2])
-            gateinfo = ('az'+az+'r'+r+'el'+el)
-        else:
-            lon = '{:.3f}'.format(
-                dataset['point_coordinates_WGS84_lon_lat_alt'][0])
-            lat = '{:.3f}'.format(
-                dataset['point_coordinates_WGS84_lon_lat_alt'][1])
-            alt = '{:.1f}'.format(
-                dataset['point_coordinates_WGS84_lon_lat_alt'][2])
-            gateinfo = ('lon'+lon+'lat'+lat+'alt'+alt)
-
-        time_info = datetime_from_radar(dataset['radar_out'])
-
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=time_info)
-
-        fname_list = make_filename(
-            'c_time_Doppler', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'], prdcfginfo=gateinfo,
-            timeinfo=time_info, runinfo=prdcfg['runinfo'])
-
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
-
-        if dataset['radar_out'].nrays == 1:
-            plot_complex_Doppler(
-                dataset['radar_out'], field_name, 0, 0, prdcfg, fname_list,
-                xaxis_info=xaxis_info, vmin=vmin, vmax=vmax)
-        else:
-            plot_complex_time_Doppler(
-                dataset['radar_out'], field_name, prdcfg, fname_list,
-                xaxis_info=xaxis_info, vmin=vmin, vmax=vmax)
-
-        print('----- save to '+' '.join(fname_list))
-
-        return fname_list
-
-    if prdcfg['type'] == 'COMPLEX_DOPPLER':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
-
-        # user defined values
-        azi = prdcfg.get('azi', None)
-        ele = prdcfg.get('ele', None)
-        rng = prdcfg.get('rng', None)
-        azi_tol = prdcfg.get('azi_tol', 1.)
-        ele_tol = prdcfg.get('ele_tol', 1.)
-        rng_tol = prdcfg.get('rng_tol', 50.)
-
-        if azi is None or ele is None or rng is None:
-            ind_ray = prdcfg.get('ind_ray', 0)
-            ind_rng = prdcfg.get('ind_rng', 0)
-            azi = dataset['radar_out'].azimuth['data'][ind_ray]
-            ele = dataset['radar_out'].elevation['data'][ind_ray]
-            rng = dataset['radar_out'].range['data'][ind_rng]
-        else:
-            ind_ray = find_ray_index(
-                dataset['radar_out'].elevation['data'],
-                dataset['radar_out'].azimuth['data'], ele, azi,
-                ele_tol=ele_tol, azi_tol=azi_tol)
-            ind_rng = find_rng_index(
-                dataset['radar_out'].range['data'], rng, rng_tol=rng_tol)
-
-        if ind_rng is None or ind_ray is None:
-            warn('Point azi='+str(azi)+', ele='+str(ele)+', rng='+str(rng) +
-                 ' out of radar coverage')
-            return None
-
-        gateinfo = (
-            'az'+'{:.1f}'.format(azi)+'el'+'{:.1f}'.format(ele) +
-            'r'+'{:.1f}'.format(rng))
-
-        xaxis_info = prdcfg.get('xaxis_info', 'Doppler_velocity')
-        vmin = prdcfg.get('vmin', None)
-        vmax = prdcfg.get('vmax', None)
-
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=prdcfg['timeinfo'])
-
-        fname_list = make_filename(
-            'c_Doppler', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'], prdcfginfo=gateinfo,
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
-
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+    if ind_rng is None or ind_ray is None:
+        warn('Point azi='+str(azi)+', ele='+str(ele)+', rng='+str(rng) +
+             ' out of radar coverage')
+        return None
+
+    gateinfo = f'az{azi:.1f}el{ele:.1f}r{rng:.1f}'
 
+    xaxis_info = prdcfg.get('xaxis_info', 'Doppler_velocity')
+    vmin = prdcfg.get('vmin', None)
+    vmax = prdcfg.get('vmax', None)
+
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
+
+    fname_list = make_filename(
+        'Doppler', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'], prdcfginfo=gateinfo,
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
+
+    plot_Doppler(
+        dataset['radar_out'], field_name, ind_ray, ind_rng, prdcfg,
+        fname_list, xaxis_info=xaxis_info, vmin=vmin, vmax=vmax)
+
+    print('----- save to '+' '.join(fname_list))
+
+    return fname_list
+
+
+def _generate_complex_range_doppler(dataset, prdcfg):
+    """
+    Plots the complex spectra or IQ data range-Doppler. The user defined
+    parameters are documented in generate_spectra_products
+
+    Parameters
+    ----------
+    dataset : spectra
+        spectra object
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
+
+    """
+
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
+
+    # user defined values
+    azi = prdcfg.get('azi', None)
+    ele = prdcfg.get('ele', None)
+    azi_tol = prdcfg.get('azi_tol', 1.)
+    ele_tol = prdcfg.get('ele_tol', 1.)
+
+    if azi is None or ele is None:
+        ind_ray = prdcfg.get('ind_ray', 0)
+        azi = dataset['radar_out'].azimuth['data'][ind_ray]
+        ele = dataset['radar_out'].elevation['data'][ind_ray]
+    else:
+        ind_ray = find_ray_index(
+            dataset['radar_out'].elevation['data'],
+            dataset['radar_out'].azimuth['data'], ele, azi,
+            ele_tol=ele_tol, azi_tol=azi_tol)
+
+    if ind_ray is None:
+        warn('Ray azi='+str(azi)+', ele='+str(ele) +
+             ' out of radar coverage')
+        return None
+
+    gateinfo = f'az{azi:.1f}el{ele:.1f}'
+
+    xaxis_info = prdcfg.get('xaxis_info', 'Doppler_velocity')
+    vmin = prdcfg.get('vmin', None)
+    vmax = prdcfg.get('vmax', None)
+
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
+
+    fname_list = make_filename(
+        'c_range_Doppler', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'], prdcfginfo=gateinfo,
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
+
+    if dataset['radar_out'].ngates == 1:
+        plot_complex_Doppler(
+            dataset['radar_out'], field_name, ind_ray, 0, prdcfg,
+            fname_list, xaxis_info=xaxis_info, vmin=vmin, vmax=vmax)
+    else:
+        plot_complex_range_Doppler(
+            dataset['radar_out'], field_name, ind_ray, prdcfg, fname_list,
+            xaxis_info=xaxis_info, vmin=vmin, vmax=vmax)
+
+    print('----- save to '+' '.join(fname_list))
+
+    return fname_list
+
+
+def _generate_complex_angle_doppler(dataset, prdcfg):
+    """
+    Makes an angle Doppler plot of complex spectra or IQ data. The user defined
+    parameters are documented in generate_spectra_products
+
+    Parameters
+    ----------
+    dataset : spectra
+        spectra object
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
+
+    """
+
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
+
+    # user defined values
+    along_azi = prdcfg.get('along_azi', True)
+    ang = prdcfg.get('ang', 0)
+    rng = prdcfg.get('rng', 0)
+    ang_tol = prdcfg.get('ang_tol', 1.)
+    rng_tol = prdcfg.get('rng_tol', 50.)
+
+    ind_rng = find_rng_index(
+        dataset['radar_out'].range['data'], rng, rng_tol=rng_tol)
+
+    if ind_rng is None:
+        warn('No data at rng='+str(rng))
+        return None
+
+    if along_azi:
+        ind_rays = np.where(np.logical_and(
+            dataset['radar_out'].elevation['data'] <= ang+ang_tol,
+            dataset['radar_out'].elevation['data'] >= ang-ang_tol))[0]
+    else:
+        ind_rays = np.where(np.logical_and(
+            dataset['radar_out'].azimuth['data'] <= ang+ang_tol,
+            dataset['radar_out'].azimuth['data'] >= ang-ang_tol))[0]
+
+    if ind_rays.size == 0:
+        warn('No data for angle '+str(ang))
+        return None
+
+    # sort angles
+    if along_azi:
+        ang_selected = dataset['radar_out'].azimuth['data'][ind_rays]
+
+    else:
+        ang_selected = dataset['radar_out'].elevation['data'][ind_rays]
+    ind_rays = ind_rays[np.argsort(ang_selected)]
+
+    if along_azi:
+        gateinfo = f'azi{ang:.1f}rng{rng:.1f}'
+    else:
+        gateinfo = f'ele{ang:.1f}rng{rng:.1f}'
+
+    xaxis_info = prdcfg.get('xaxis_info', 'Doppler_velocity')
+    vmin = prdcfg.get('vmin', None)
+    vmax = prdcfg.get('vmax', None)
+
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
+
+    fname_list = make_filename(
+        'range_Doppler', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'], prdcfginfo=gateinfo,
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
+
+    if ind_rays.size == 1:
         plot_complex_Doppler(
-            dataset['radar_out'], field_name, ind_ray, ind_rng, prdcfg,
+            dataset['radar_out'], field_name, ind_rays, ind_rng, prdcfg,
             fname_list, xaxis_info=xaxis_info, vmin=vmin, vmax=vmax)
+    else:
+        plot_complex_angle_Doppler(
+            dataset['radar_out'], field_name, ang, ind_rays, ind_rng,
+            prdcfg, fname_list, xaxis_info=xaxis_info,
+            along_azi=along_azi, vmin=vmin, vmax=vmax)
+
+    print('----- save to '+' '.join(fname_list))
+
+    return fname_list
+
+
+def _generate_complex_time_doppler(dataset, prdcfg):
+    """
+    Plots the complex spectra or IQ data time-Doppler. The user defined
+    parameters are documented in generate_spectra_products
 
-        print('----- save to '+' '.join(fname_list))
-
-        return fname_list
-
-    if prdcfg['type'] == 'AMPLITUDE_PHASE_DOPPLER':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
-
-        # user defined values
-        azi = prdcfg.get('azi', None)
-        ele = prdcfg.get('ele', None)
-        rng = prdcfg.get('rng', None)
-        azi_tol = prdcfg.get('azi_tol', 1.)
-        ele_tol = prdcfg.get('ele_tol', 1.)
-        rng_tol = prdcfg.get('rng_tol', 50.)
-
-        if azi is None or ele is None or rng is None:
-            ind_ray = prdcfg.get('ind_ray', 0)
-            ind_rng = prdcfg.get('ind_rng', 0)
-            azi = dataset['radar_out'].azimuth['data'][ind_ray]
-            ele = dataset['radar_out'].elevation['data'][ind_ray]
-            rng = dataset['radar_out'].range['data'][ind_rng]
-        else:
-            ind_ray = find_ray_index(
-                dataset['radar_out'].elevation['data'],
-                dataset['radar_out'].azimuth['data'], ele, azi,
-                ele_tol=ele_tol, azi_tol=azi_tol)
-            ind_rng = find_rng_index(
-                dataset['radar_out'].range['data'], rng, rng_tol=rng_tol)
-
-        if ind_rng is None or ind_ray is None:
-            warn('Point azi='+str(azi)+', ele='+str(ele)+', rng='+str(rng) +
-                 ' out of radar coverage')
-            return None
-
-        gateinfo = (
-            'az'+'{:.1f}'.format(azi)+'el'+'{:.1f}'.format(ele) +
-            'r'+'{:.1f}'.format(rng))
-
-        xaxis_info = prdcfg.get('xaxis_info', 'Doppler_velocity')
-        ampli_vmin = prdcfg.get('ampli_vmin', None)
-        ampli_vmax = prdcfg.get('ampli_vmax', None)
-        phase_vmin = prdcfg.get('phase_vmin', None)
-        phase_vmax = prdcfg.get('phase_vmax', None)
-
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=prdcfg['timeinfo'])
-
-        fname_list = make_filename(
-            'ap_Doppler', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'], prdcfginfo=gateinfo,
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
-
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+    Parameters
+    ----------
+    dataset : spectra
+        spectra object
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
 
+    """
+
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
+
+    # user defined values
+    xaxis_info = prdcfg.get('xaxis_info', 'Doppler_velocity')
+    vmin = prdcfg.get('vmin', None)
+    vmax = prdcfg.get('vmax', None)
+    plot_type = prdcfg.get('plot_type', 'final')
+
+    if plot_type == 'final' and not dataset['final']:
+        return None
+
+    if 'antenna_coordinates_az_el_r' in dataset:
+        az = f"{dataset['antenna_coordinates_az_el_r'][0]:.1f}"
+        el = f"{dataset['antenna_coordinates_az_el_r'][1]:.1f}"
+        r = f"{dataset['antenna_coordinates_az_el_r'][2]:.1f}"
+        gateinfo = f'az{az}r{r}el{el}'
+    else:
+        lon = f"{dataset['point_coordinates_WGS84_lon_lat_alt'][0]:.3f}"
+        lat = f"{dataset['point_coordinates_WGS84_lon_lat_alt'][1]:.3f}"
+        alt = f"{dataset['point_coordinates_WGS84_lon_lat_alt'][2]:.1f}"
+        gateinfo = f'lon{lon}lat{lat}alt{alt}'
+
+    time_info = datetime_from_radar(dataset['radar_out'])
+
+    savedir = get_product_save_dir(prdcfg, time_info)
+
+    fname_list = make_filename(
+        'c_time_Doppler', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'], prdcfginfo=gateinfo,
+        timeinfo=time_info, runinfo=prdcfg['runinfo'])
+
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
+
+    if dataset['radar_out'].nrays == 1:
+        plot_complex_Doppler(
+            dataset['radar_out'], field_name, 0, 0, prdcfg, fname_list,
+            xaxis_info=xaxis_info, vmin=vmin, vmax=vmax)
+    else:
+        plot_complex_time_Doppler(
+            dataset['radar_out'], field_name, prdcfg, fname_list,
+            xaxis_info=xaxis_info, vmin=vmin, vmax=vmax)
+
+    print('----- save to '+' '.join(fname_list))
+
+    return fname_list
+
+
+def _generate_complex_doppler(dataset, prdcfg):
+    """
+    Plots a complex Doppler spectrum or IQ data. The user defined parameters
+    are documented in generate_spectra_products
+
+    Parameters
+    ----------
+    dataset : spectra
+        spectra object
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
+
+    """
+
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
+
+    # user defined values
+    azi = prdcfg.get('azi', None)
+    ele = prdcfg.get('ele', None)
+    rng = prdcfg.get('rng', None)
+    azi_tol = prdcfg.get('azi_tol', 1.)
+    ele_tol = prdcfg.get('ele_tol', 1.)
+    rng_tol = prdcfg.get('rng_tol', 50.)
+
+    if azi is None or ele is None or rng is None:
+        ind_ray = prdcfg.get('ind_ray', 0)
+        ind_rng = prdcfg.get('ind_rng', 0)
+        azi = dataset['radar_out'].azimuth['data'][ind_ray]
+        ele = dataset['radar_out'].elevation['data'][ind_ray]
+        rng = dataset['radar_out'].range['data'][ind_rng]
+    else:
+        ind_ray = find_ray_index(
+            dataset['radar_out'].elevation['data'],
+            dataset['radar_out'].azimuth['data'], ele, azi,
+            ele_tol=ele_tol, azi_tol=azi_tol)
+        ind_rng = find_rng_index(
+            dataset['radar_out'].range['data'], rng, rng_tol=rng_tol)
+
+    if ind_rng is None or ind_ray is None:
+        warn('Point azi='+str(azi)+', ele='+str(ele)+', rng='+str(rng) +
+             ' out of radar coverage')
+        return None
+
+    gateinfo = f'az{azi:.1f}el{ele:.1f}r{rng:.1f}'
+
+    xaxis_info = prdcfg.get('xaxis_info', 'Doppler_velocity')
+    vmin = prdcfg.get('vmin', None)
+    vmax = prdcfg.get('vmax', None)
+
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
+
+    fname_list = make_filename(
+        'c_Doppler', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'], prdcfginfo=gateinfo,
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
+
+    plot_complex_Doppler(
+        dataset['radar_out'], field_name, ind_ray, ind_rng, prdcfg,
+        fname_list, xaxis_info=xaxis_info, vmin=vmin, vmax=vmax)
+
+    print('----- save to '+' '.join(fname_list))
+
+    return fname_list
+
+
+def _generate_amplitude_phase_doppler(dataset, prdcfg):
+    """
+    Plots the module and phase of a complex Doppler spectrum or IQ data. The
+    user defined parameters are documented in generate_spectra_products
+
+    Parameters
+    ----------
+    dataset : spectra
+        spectra object
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
+
+    """
+
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
+
+    # user defined values
+    azi = prdcfg.get('azi', None)
+    ele = prdcfg.get('ele', None)
+    rng = prdcfg.get('rng', None)
+    azi_tol = prdcfg.get('azi_tol', 1.)
+    ele_tol = prdcfg.get('ele_tol', 1.)
+    rng_tol = prdcfg.get('rng_tol', 50.)
+
+    if azi is None or ele is None or rng is None:
+        ind_ray = prdcfg.get('ind_ray', 0)
+        ind_rng = prdcfg.get('ind_rng', 0)
+        azi = dataset['radar_out'].azimuth['data'][ind_ray]
+        ele = dataset['radar_out'].elevation['data'][ind_ray]
+        rng = dataset['radar_out'].range['data'][ind_rng]
+    else:
+        ind_ray = find_ray_index(
+            dataset['radar_out'].elevation['data'],
+            dataset['radar_out'].azimuth['data'], ele, azi,
+            ele_tol=ele_tol, azi_tol=azi_tol)
+        ind_rng = find_rng_index(
+            dataset['radar_out'].range['data'], rng, rng_tol=rng_tol)
+
+    if ind_rng is None or ind_ray is None:
+        warn('Point azi='+str(azi)+', ele='+str(ele)+', rng='+str(rng) +
+             ' out of radar coverage')
+        return None
+
+    gateinfo = f'az{azi:.1f}el{ele:.1f}r{rng:.1f}'
+
+    xaxis_info = prdcfg.get('xaxis_info', 'Doppler_velocity')
+    ampli_vmin = prdcfg.get('ampli_vmin', None)
+    ampli_vmax = prdcfg.get('ampli_vmax', None)
+    phase_vmin = prdcfg.get('phase_vmin', None)
+    phase_vmax = prdcfg.get('phase_vmax', None)
+
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
+
+    fname_list = make_filename(
+        'ap_Doppler', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'], prdcfginfo=gateinfo,
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
+
+    plot_amp_phase_Doppler(
+        dataset['radar_out'], field_name, ind_ray, ind_rng, prdcfg,
+        fname_list, xaxis_info=xaxis_info, ampli_vmin=ampli_vmin,
+        ampli_vmax=ampli_vmax, phase_vmin=phase_vmin,
+        phase_vmax=phase_vmax)
+
+    print('----- save to '+' '.join(fname_list))
+
+    return fname_list
+
+
+def _generate_amplitude_phase_range_doppler(dataset, prdcfg):
+    """
+    Plots the module and phase of complex spectra or IQ data range-Doppler. The
+    user defined parameters are documented in generate_spectra_products
+
+    Parameters
+    ----------
+    dataset : spectra
+        spectra object
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
+
+    """
+
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
+
+    # user defined values
+    azi = prdcfg.get('azi', None)
+    ele = prdcfg.get('ele', None)
+    azi_tol = prdcfg.get('azi_tol', 1.)
+    ele_tol = prdcfg.get('ele_tol', 1.)
+
+    if azi is None or ele is None:
+        ind_ray = prdcfg.get('ind_ray', 0)
+        azi = dataset['radar_out'].azimuth['data'][ind_ray]
+        ele = dataset['radar_out'].elevation['data'][ind_ray]
+    else:
+        ind_ray = find_ray_index(
+            dataset['radar_out'].elevation['data'],
+            dataset['radar_out'].azimuth['data'], ele, azi,
+            ele_tol=ele_tol, azi_tol=azi_tol)
+
+    if ind_ray is None:
+        warn('Ray azi='+str(azi)+', ele='+str(ele) +
+             ' out of radar coverage')
+        return None
+
+    gateinfo = f'az{azi:.1f}el{ele:.1f}'
+
+    xaxis_info = prdcfg.get('xaxis_info', 'Doppler_velocity')
+    ampli_vmin = prdcfg.get('ampli_vmin', None)
+    ampli_vmax = prdcfg.get('ampli_vmax', None)
+    phase_vmin = prdcfg.get('phase_vmin', None)
+    phase_vmax = prdcfg.get('phase_vmax', None)
+
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
+
+    fname_list = make_filename(
+        'ap_range_Doppler', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'], prdcfginfo=gateinfo,
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
+
+    if dataset['radar_out'].ngates == 1:
         plot_amp_phase_Doppler(
-            dataset['radar_out'], field_name, ind_ray, ind_rng, prdcfg,
+            dataset['radar_out'], field_name, ind_ray, 0, prdcfg,
             fname_list, xaxis_info=xaxis_info, ampli_vmin=ampli_vmin,
             ampli_vmax=ampli_vmax, phase_vmin=phase_vmin,
             phase_vmax=phase_vmax)
+    else:
+        plot_amp_phase_range_Doppler(
+            dataset['radar_out'], field_name, ind_ray, prdcfg, fname_list,
+            xaxis_info=xaxis_info, ampli_vmin=ampli_vmin,
+            ampli_vmax=ampli_vmax, phase_vmin=phase_vmin,
+            phase_vmax=phase_vmax)
 
-        print('----- save to '+' '.join(fname_list))
-
-        return fname_list
-
-    if prdcfg['type'] == 'AMPLITUDE_PHASE_RANGE_DOPPLER':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
-
-        # user defined values
-        azi = prdcfg.get('azi', None)
-        ele = prdcfg.get('ele', None)
-        azi_tol = prdcfg.get('azi_tol', 1.)
-        ele_tol = prdcfg.get('ele_tol', 1.)
-
-        if azi is None or ele is None:
-            ind_ray = prdcfg.get('ind_ray', 0)
-            azi = dataset['radar_out'].azimuth['data'][ind_ray]
-            ele = dataset['radar_out'].elevation['data'][ind_ray]
-        else:
-            ind_ray = find_ray_index(
-                dataset['radar_out'].elevation['data'],
-                dataset['radar_out'].azimuth['data'], ele, azi,
-                ele_tol=ele_tol, azi_tol=azi_tol)
-
-        if ind_ray is None:
-            warn('Ray azi='+str(azi)+', ele='+str(ele) +
-                 ' out of radar coverage')
-            return None
-
-        gateinfo = 'az'+'{:.1f}'.format(azi)+'el'+'{:.1f}'.format(ele)
-
-        xaxis_info = prdcfg.get('xaxis_info', 'Doppler_velocity')
-        ampli_vmin = prdcfg.get('ampli_vmin', None)
-        ampli_vmax = prdcfg.get('ampli_vmax', None)
-        phase_vmin = prdcfg.get('phase_vmin', None)
-        phase_vmax = prdcfg.get('phase_vmax', None)
-
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=prdcfg['timeinfo'])
-
-        fname_list = make_filename(
-            'ap_range_Doppler', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'], prdcfginfo=gateinfo,
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
-
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
-
-        if dataset['radar_out'].ngates == 1:
-            plot_amp_phase_Doppler(
-                dataset['radar_out'], field_name, ind_ray, 0, prdcfg,
-                fname_list, xaxis_info=xaxis_info, ampli_vmin=ampli_vmin,
-                ampli_vmax=ampli_vmax, phase_vmin=phase_vmin,
-                phase_vmax=phase_vmax)
-        else:
-            plot_amp_phase_range_Doppler(
-                dataset['radar_out'], field_name, ind_ray, prdcfg, fname_list,
-                xaxis_info=xaxis_info, ampli_vmin=ampli_vmin,
-                ampli_vmax=ampli_vmax, phase_vmin=phase_vmin,
-                phase_vmax=phase_vmax)
-
-        print('----- save to '+' '.join(fname_list))
-
-        return fname_list
-
-    if prdcfg['type'] == 'AMPLITUDE_PHASE_ANGLE_DOPPLER':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
-
-        # user defined values
-        along_azi = prdcfg.get('along_azi', True)
-        ang = prdcfg.get('ang', 0)
-        rng = prdcfg.get('rng', 0)
-        ang_tol = prdcfg.get('ang_tol', 1.)
-        rng_tol = prdcfg.get('rng_tol', 50.)
+    print('----- save to '+' '.join(fname_list))
 
-        ind_rng = find_rng_index(
-            dataset['radar_out'].range['data'], rng, rng_tol=rng_tol)
+    return fname_list
 
-        if ind_rng is None:
-            warn('No data at rng='+str(rng))
-            return None
-
-        if along_azi:
-            ind_rays = np.where(np.logical_and(
-                dataset['radar_out'].elevation['data'] <= ang+ang_tol,
-                dataset['radar_out'].elevation['data'] >= ang-ang_tol))[0]
-        else:
-            ind_rays = np.where(np.logical_and(
-                dataset['radar_out'].azimuth['data'] <= ang+ang_tol,
-                dataset['radar_out'].azimuth['data'] >= ang-ang_tol))[0]
-
-        if ind_rays.size == 0:
-            warn('No data for angle '+str(ang))
-            return None
-
-        # sort angles
-        if along_azi:
-            ang_selected = dataset['radar_out'].azimuth['data'][ind_rays]
-
-        else:
-            ang_selected = dataset['radar_out'].elevation['data'][ind_rays]
-        ind_rays = ind_rays[np.argsort(ang_selected)]
-
-        if along_azi:
-            gateinfo = 'azi'+'{:.1f}'.format(ang)+'rng'+'{:.1f}'.format(rng)
-        else:
-            gateinfo = 'ele'+'{:.1f}'.format(ang)+'rng'+'{:.1f}'.format(rng)
-
-        xaxis_info = prdcfg.get('xaxis_info', 'Doppler_velocity')
-        ampli_vmin = prdcfg.get('ampli_vmin', None)
-        ampli_vmax = prdcfg.get('ampli_vmax', None)
-        phase_vmin = prdcfg.get('phase_vmin', None)
-        phase_vmax = prdcfg.get('phase_vmax', None)
-
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=prdcfg['timeinfo'])
-
-        fname_list = make_filename(
-            'range_Doppler', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'], prdcfginfo=gateinfo,
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
-
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
-
-        if ind_rays.size == 1:
-            plot_amp_phase_Doppler(
-                dataset['radar_out'], field_name, ind_rays, ind_rng, prdcfg,
-                fname_list, xaxis_info=xaxis_info, ampli_vmin=ampli_vmin,
-                ampli_vmax=ampli_vmax, phase_vmin=phase_vmin,
-                phase_vmax=phase_vmax)
-        else:
-            plot_amp_phase_angle_Doppler(
-                dataset['radar_out'], field_name, ang, ind_rays, ind_rng,
-                prdcfg, fname_list, xaxis_info=xaxis_info,
-                along_azi=along_azi, ampli_vmin=ampli_vmin,
-                ampli_vmax=ampli_vmax, phase_vmin=phase_vmin,
-                phase_vmax=phase_vmax)
-
-        print('----- save to '+' '.join(fname_list))
-
-        return fname_list
-
-    if prdcfg['type'] == 'AMPLITUDE_PHASE_TIME_DOPPLER':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
-
-        # user defined values
-        xaxis_info = prdcfg.get('xaxis_info', 'Doppler_velocity')
-        ampli_vmin = prdcfg.get('ampli_vmin', None)
-        ampli_vmax = prdcfg.get('ampli_vmax', None)
-        phase_vmin = prdcfg.get('phase_vmin', None)
-        phase_vmax = prdcfg.get('phase_vmax', None)
-        plot_type = prdcfg.get('plot_type', 'final')
-
-        if plot_type == 'final' and not dataset['final']:
-            return None
-
-        if 'antenna_coordinates_az_el_r' in dataset:
-            az = '{:.1f}'.format(dataset['antenna_coordinates_az_el_r'][0])
-            el = '{:.1f}'.format(dataset['antenna_coordinates_az_el_r'][1])
-            r = '{:.1f}'.format(dataset['antenna_coordinates_az_el_r'][2])
-            gateinfo = ('az'+az+'r'+r+'el'+el)
-        else:
-            lon = '{:.3f}'.format(
-                dataset['point_coordinates_WGS84_lon_lat_alt'][0])
-            lat = '{:.3f}'.format(
-                dataset['point_coordinates_WGS84_lon_lat_alt'][1])
-            alt = '{:.1f}'.format(
-                dataset['point_coordinates_WGS84_lon_lat_alt'][2])
-            gateinfo = ('lon'+lon+'lat'+lat+'alt'+alt)
-
-        time_info = datetime_from_radar(dataset['radar_out'])
-
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=time_info)
-
-        fname_list = make_filename(
-            'ap_time_Doppler', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'], prdcfginfo=gateinfo,
-            timeinfo=time_info, runinfo=prdcfg['runinfo'])
-
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
-
-        if dataset['radar_out'].nrays == 1:
-            plot_amp_phase_Doppler(
-                dataset['radar_out'], field_name, 0, 0, prdcfg, fname_list,
-                xaxis_info=xaxis_info, ampli_vmin=ampli_vmin,
-                ampli_vmax=ampli_vmax, phase_vmin=phase_vmin,
-                phase_vmax=phase_vmax)
-        else:
-            plot_amp_phase_time_Doppler(
-                dataset['radar_out'], field_name, prdcfg, fname_list,
-                xaxis_info=xaxis_info, ampli_vmin=ampli_vmin,
-                ampli_vmax=ampli_vmax, phase_vmin=phase_vmin,
-                phase_vmax=phase_vmax)
-
-        print('----- save to '+' '.join(fname_list))
-
-        return fname_list
-
-    if prdcfg['type'] == 'SAVEVOL':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
-
-        file_type = prdcfg.get('file_type', 'nc')
-        physical = prdcfg.get('physical', True)
-
-        new_dataset = deepcopy(dataset['radar_out'])
-        new_dataset.fields = dict()
-        new_dataset.add_field(
-            field_name, dataset['radar_out'].fields[field_name])
-
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=prdcfg['timeinfo'])
-
-        fname = make_filename(
-            'savevol', prdcfg['dstype'], prdcfg['voltype'], [file_type],
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])[0]
-
-        fname = savedir+fname
-
-        pyart.aux_io.write_spectra(fname, new_dataset, physical=physical)
-
-        print('saved file: '+fname)
-
-        return fname
-
-    if prdcfg['type'] == 'SAVEALL':
-        file_type = prdcfg.get('file_type', 'nc')
-        datatypes = prdcfg.get('datatypes', None)
-        physical = prdcfg.get('physical', True)
-
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=prdcfg['timeinfo'])
-
-        fname = make_filename(
-            'savevol', prdcfg['dstype'], 'all_fields', [file_type],
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])[0]
-
-        fname = savedir+fname
-
-        field_names = None
-        if datatypes is not None:
-            field_names = []
-            for datatype in datatypes:
-                field_names.append(get_fieldname_pyart(datatype))
-
-        if field_names is not None:
-            radar_aux = deepcopy(dataset['radar_out'])
-            radar_aux.fields = dict()
-            for field_name in field_names:
-                if field_name not in dataset['radar_out'].fields:
-                    warn(field_name+' not in radar object')
-                else:
-                    radar_aux.add_field(
-                        field_name,
-                        dataset['radar_out'].fields[field_name])
-        else:
-            radar_aux = dataset['radar_out']
-        pyart.aux_io.write_spectra(fname, radar_aux, physical=physical)
-
-        print('saved file: '+fname)
-
-        return fname
 
-    warn(' Unsupported product type: ' + prdcfg['type'])
-    return None
+def _generate_amplitude_phase_angle_doppler(dataset, prdcfg):
+    """
+    Makes an angle Doppler plot of the module and phase of complex spectra or
+    IQ data. The user defined parameters are documented in
+    generate_spectra_products
+
+    Parameters
+    ----------
+    dataset : spectra
+        spectra object
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
+
+    """
+
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
+
+    # user defined values
+    along_azi = prdcfg.get('along_azi', True)
+    ang = prdcfg.get('ang', 0)
+    rng = prdcfg.get('rng', 0)
+    ang_tol = prdcfg.get('ang_tol', 1.)
+    rng_tol = prdcfg.get('rng_tol', 50.)
+
+    ind_rng = find_rng_index(
+        dataset['radar_out'].range['data'], rng, rng_tol=rng_tol)
+
+    if ind_rng is None:
+        warn('No data at rng='+str(rng))
+        return None
+
+    if along_azi:
+        ind_rays = np.where(np.logical_and(
+            dataset['radar_out'].elevation['data'] <= ang+ang_tol,
+            dataset['radar_out'].elevation['data'] >= ang-ang_tol))[0]
+    else:
+        ind_rays = np.where(np.logical_and(
+            dataset['radar_out'].azimuth['data'] <= ang+ang_tol,
+            dataset['radar_out'].azimuth['data'] >= ang-ang_tol))[0]
+
+    if ind_rays.size == 0:
+        warn('No data for angle '+str(ang))
+        return None
+
+    # sort angles
+    if along_azi:
+        ang_selected = dataset['radar_out'].azimuth['data'][ind_rays]
+
+    else:
+        ang_selected = dataset['radar_out'].elevation['data'][ind_rays]
+    ind_rays = ind_rays[np.argsort(ang_selected)]
+
+    if along_azi:
+        gateinfo = f'azi{ang:.1f}rng{rng:.1f}'
+    else:
+        gateinfo = f'ele{ang:.1f}rng{rng:.1f}'
+
+    xaxis_info = prdcfg.get('xaxis_info', 'Doppler_velocity')
+    ampli_vmin = prdcfg.get('ampli_vmin', None)
+    ampli_vmax = prdcfg.get('ampli_vmax', None)
+    phase_vmin = prdcfg.get('phase_vmin', None)
+    phase_vmax = prdcfg.get('phase_vmax', None)
+
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
+
+    fname_list = make_filename(
+        'range_Doppler', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'], prdcfginfo=gateinfo,
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
+
+    if ind_rays.size == 1:
+        plot_amp_phase_Doppler(
+            dataset['radar_out'], field_name, ind_rays, ind_rng, prdcfg,
+            fname_list, xaxis_info=xaxis_info, ampli_vmin=ampli_vmin,
+            ampli_vmax=ampli_vmax, phase_vmin=phase_vmin,
+            phase_vmax=phase_vmax)
+    else:
+        plot_amp_phase_angle_Doppler(
+            dataset['radar_out'], field_name, ang, ind_rays, ind_rng,
+            prdcfg, fname_list, xaxis_info=xaxis_info,
+            along_azi=along_azi, ampli_vmin=ampli_vmin,
+            ampli_vmax=ampli_vmax, phase_vmin=phase_vmin,
+            phase_vmax=phase_vmax)
+
+    print('----- save to '+' '.join(fname_list))
+
+    return fname_list
+
+
+def _generate_amplitude_phase_time_doppler(dataset, prdcfg):
+    """
+    Plots the module and phase of complex spectra or IQ data time-Doppler. The
+    user defined parameters are documented in generate_spectra_products
+
+    Parameters
+    ----------
+    dataset : spectra
+        spectra object
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
+
+    """
+
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
+
+    # user defined values
+    xaxis_info = prdcfg.get('xaxis_info', 'Doppler_velocity')
+    ampli_vmin = prdcfg.get('ampli_vmin', None)
+    ampli_vmax = prdcfg.get('ampli_vmax', None)
+    phase_vmin = prdcfg.get('phase_vmin', None)
+    phase_vmax = prdcfg.get('phase_vmax', None)
+    plot_type = prdcfg.get('plot_type', 'final')
+
+    if plot_type == 'final' and not dataset['final']:
+        return None
+
+    if 'antenna_coordinates_az_el_r' in dataset:
+        az = f"{dataset['antenna_coordinates_az_el_r'][0]:.1f}"
+        el = f"{dataset['antenna_coordinates_az_el_r'][1]:.1f}"
+        r = f"{dataset['antenna_coordinates_az_el_r'][2]:.1f}"
+        gateinfo = f'az{az}r{r}el{el}'
+    else:
+        lon = f"{dataset['point_coordinates_WGS84_lon_lat_alt'][0]:.3f}"
+        lat = f"{dataset['point_coordinates_WGS84_lon_lat_alt'][1]:.3f}"
+        alt = f"{dataset['point_coordinates_WGS84_lon_lat_alt'][2]:.1f}"
+        gateinfo = f'lon{lon}lat{lat}alt{alt}'
+
+    time_info = datetime_from_radar(dataset['radar_out'])
+
+    savedir = get_product_save_dir(prdcfg, time_info)
+
+    fname_list = make_filename(
+        'ap_time_Doppler', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'], prdcfginfo=gateinfo,
+        timeinfo=time_info, runinfo=prdcfg['runinfo'])
+
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
+
+    if dataset['radar_out'].nrays == 1:
+        plot_amp_phase_Doppler(
+            dataset['radar_out'], field_name, 0, 0, prdcfg, fname_list,
+            xaxis_info=xaxis_info, ampli_vmin=ampli_vmin,
+            ampli_vmax=ampli_vmax, phase_vmin=phase_vmin,
+            phase_vmax=phase_vmax)
+    else:
+        plot_amp_phase_time_Doppler(
+            dataset['radar_out'], field_name, prdcfg, fname_list,
+            xaxis_info=xaxis_info, ampli_vmin=ampli_vmin,
+            ampli_vmax=ampli_vmax, phase_vmin=phase_vmin,
+            phase_vmax=phase_vmax)
+
+    print('----- save to '+' '.join(fname_list))
+
+    return fname_list
+
+
+def _generate_savevol(dataset, prdcfg):
+    """
+    Saves one field of a radar spectra or IQ volume data in a netcdf file. The
+    user defined parameters are documented in generate_spectra_products
+
+    Parameters
+    ----------
+    dataset : spectra
+        spectra object
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
+
+    """
+
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
+
+    file_type = prdcfg.get('file_type', 'nc')
+    physical = prdcfg.get('physical', True)
+
+    new_dataset = deepcopy(dataset['radar_out'])
+    new_dataset.fields = dict()
+    new_dataset.add_field(
+        field_name, dataset['radar_out'].fields[field_name])
+
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
+
+    fname = make_filename(
+        'savevol', prdcfg['dstype'], prdcfg['voltype'], [file_type],
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])[0]
+
+    fname = os.path.join(savedir, fname)
+
+    pyart.aux_io.write_spectra(fname, new_dataset, physical=physical)
+
+    print('saved file: '+fname)
+
+    return fname
+
+
+def _generate_saveall(dataset, prdcfg):
+    """
+    Saves radar spectra or IQ volume data in a netcdf file. The user defined
+    parameters are documented in generate_spectra_products
+
+    Parameters
+    ----------
+    dataset : spectra
+        spectra object
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
+
+    """
+
+    file_type = prdcfg.get('file_type', 'nc')
+    datatypes = prdcfg.get('datatypes', None)
+    physical = prdcfg.get('physical', True)
+
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
+
+    fname = make_filename(
+        'savevol', prdcfg['dstype'], 'all_fields', [file_type],
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])[0]
+
+    fname = os.path.join(savedir, fname)
+
+    field_names = None
+    if datatypes is not None:
+        field_names = []
+        for datatype in datatypes:
+            field_names.append(get_fieldname_pyart(datatype))
+
+    if field_names is not None:
+        radar_aux = deepcopy(dataset['radar_out'])
+        radar_aux.fields = dict()
+        for field_name in field_names:
+            if field_name not in dataset['radar_out'].fields:
+                warn(field_name+' not in radar object')
+            else:
+                radar_aux.add_field(
+                    field_name,
+                    dataset['radar_out'].fields[field_name])
+    else:
+        radar_aux = dataset['radar_out']
+    pyart.aux_io.write_spectra(fname, radar_aux, physical=physical)
+
+    print('saved file: '+fname)
+
+    return fname
+
+
+_SPECTRA_HANDLERS = {
+    'RANGE_DOPPLER': _generate_range_doppler,
+    'ANGLE_DOPPLER': _generate_angle_doppler,
+    'TIME_DOPPLER': _generate_time_doppler,
+    'DOPPLER': _generate_doppler,
+    'COMPLEX_RANGE_DOPPLER': _generate_complex_range_doppler,
+    'COMPLEX_ANGLE_DOPPLER': _generate_complex_angle_doppler,
+    'COMPLEX_TIME_DOPPLER': _generate_complex_time_doppler,
+    'COMPLEX_DOPPLER': _generate_complex_doppler,
+    'AMPLITUDE_PHASE_DOPPLER': _generate_amplitude_phase_doppler,
+    'AMPLITUDE_PHASE_RANGE_DOPPLER': _generate_amplitude_phase_range_doppler,
+    'AMPLITUDE_PHASE_ANGLE_DOPPLER': _generate_amplitude_phase_angle_doppler,
+    'AMPLITUDE_PHASE_TIME_DOPPLER': _generate_amplitude_phase_time_doppler,
+    'SAVEVOL': _generate_savevol,
+    'SAVEALL': _generate_saveall}
+
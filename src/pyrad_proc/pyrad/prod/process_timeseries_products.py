@@ -12,6 +12,7 @@ Functions for obtaining Pyrad products from a time series datasets
 """
 
 from copy import deepcopy
+import os
 from warnings import warn
 
 import numpy as np
@@ -177,20 +178,15 @@ def generate_timeseries_products(dataset, prdcfg):
     if prdcfg['type'] == 'PLOT_AND_WRITE_POINT':
         set_time_info = prdcfg.get('set_time_info', True)
         if 'antenna_coordinates_az_el_r' in dataset:
-            az = '{:.1f}'.format(
-                dataset['antenna_coordinates_az_el_r'][0])
-            el = '{:.1f}'.format(
-                dataset['antenna_coordinates_az_el_r'][1])
-            r = '{:.1f}'.format(dataset['antenna_coordinates_az_el_r'][2])
-            gateinfo = ('az'+az+'r'+r+'el'+el)
+            az = f"{dataset['antenna_coordinates_az_el_r'][0]:.1f}"
+            el = f"{dataset['antenna_coordinates_az_el_r'][1]:.1f}"
+            r = f"{dataset['antenna_coordinates_az_el_r'][2]:.1f}"
+            gateinfo = f'az{az}r{r}el{el}'
         else:
-            lon = '{:.3f}'.format(
-                dataset['point_coordinates_WGS84_lon_lat_alt'][0])
-            lat = '{:.3f}'.format(
-                dataset['point_coordinates_WGS84_lon_lat_alt'][1])
-            alt = '{:.1f}'.format(
-                dataset['point_coordinates_WGS84_lon_lat_alt'][2])
-            gateinfo = ('lon'+lon+'lat'+lat+'alt'+alt)
+            lon = f"{dataset['point_coordinates_WGS84_lon_lat_alt'][0]:.3f}"
+            lat = f"{dataset['point_coordinates_WGS84_lon_lat_alt'][1]:.3f}"
+            alt = f"{dataset['point_coordinates_WGS84_lon_lat_alt'][2]:.1f}"
+            gateinfo = f'lon{lon}lat{lat}alt{alt}'
 
         timeformat = None
         timeinfo = None
@@ -207,7 +203,7 @@ def generate_timeseries_products(dataset, prdcfg):
             prdcfginfo=gateinfo, timeinfo=timeinfo,
             timeformat=timeformat)[0]
 
-        csvfname = savedir+csvfname
+        csvfname = os.path.join(savedir, csvfname)
 
         if not dataset['final']:
             if 'antenna_coordinates_az_el_r' in dataset:
@@ -241,13 +237,13 @@ def generate_timeseries_products(dataset, prdcfg):
             prdcfg['imgformat'], prdcfginfo=gateinfo,
             timeinfo=timeinfo_fig, timeformat=timeformat)
 
-        for i, figfname in enumerate(figfname_list):
-            figfname_list[i] = savedir+figfname
+        figfname_list = [
+            os.path.join(savedir, figfname) for figfname in figfname_list]
 
         if 'antenna_coordinates_az_el_r' in dataset:
-            label1 = 'Radar (az, el, r): ('+az+', '+el+', '+r+')'
+            label1 = f'Radar (az, el, r): ({az}, {el}, {r})'
         else:
-            label1 = 'Grid (lon, lat, alt): ('+lon+', '+lat+', '+alt+')'
+            label1 = f'Grid (lon, lat, alt): ({lon}, {lat}, {alt})'
         titl = ('Time Series '+date[0].strftime('%Y-%m-%d'))
 
         labely = generate_field_name_str(dataset['datatype'])
@@ -273,18 +269,15 @@ def generate_timeseries_products(dataset, prdcfg):
             return None
 
         if 'antenna_coordinates_az_el_r' in dataset:
-            az = '{:.1f}'.format(dataset['antenna_coordinates_az_el_r'][0])
-            el = '{:.1f}'.format(dataset['antenna_coordinates_az_el_r'][1])
-            r = '{:.1f}'.format(dataset['antenna_coordinates_az_el_r'][2])
-            gateinfo = ('az'+az+'r'+r+'el'+el)
+            az = f"{dataset['antenna_coordinates_az_el_r'][0]:.1f}"
+            el = f"{dataset['antenna_coordinates_az_el_r'][1]:.1f}"
+            r = f"{dataset['antenna_coordinates_az_el_r'][2]:.1f}"
+            gateinfo = f'az{az}r{r}el{el}'
         else:
-            lon = '{:.3f}'.format(
-                dataset['point_coordinates_WGS84_lon_lat_alt'][0])
-            lat = '{:.3f}'.format(
-                dataset['point_coordinates_WGS84_lon_lat_alt'][1])
-            alt = '{:.1f}'.format(
-                dataset['point_coordinates_WGS84_lon_lat_alt'][2])
-            gateinfo = ('lon'+lon+'lat'+lat+'alt'+alt)
+            lon = f"{dataset['point_coordinates_WGS84_lon_lat_alt'][0]:.3f}"
+            lat = f"{dataset['point_coordinates_WGS84_lon_lat_alt'][1]:.3f}"
+            alt = f"{dataset['point_coordinates_WGS84_lon_lat_alt'][2]:.1f}"
+            gateinfo = f'lon{lon}lat{lat}alt{alt}'
 
         timeformat = None
         timeinfo = None
@@ -301,7 +294,7 @@ def generate_timeseries_products(dataset, prdcfg):
             prdcfginfo=gateinfo, timeinfo=timeinfo,
             timeformat=timeformat)[0]
 
-        csvfname = savedir+csvfname
+        csvfname = os.path.join(savedir, csvfname)
 
         date, value = read_timeseries(csvfname)
 
@@ -319,13 +312,13 @@ def generate_timeseries_products(dataset, prdcfg):
             prdcfg['imgformat'], prdcfginfo=gateinfo,
             timeinfo=timeinfo_fig, timeformat=timeformat)
 
-        for i, figfname in enumerate(figfname_list):
-            figfname_list[i] = savedir+figfname
+        figfname_list = [
+            os.path.join(savedir, figfname) for figfname in figfname_list]
 
         if 'antenna_coordinates_az_el_r' in dataset:
-            label1 = 'Radar (az, el, r): ('+az+', '+el+', '+r+')'
+            label1 = f'Radar (az, el, r): ({az}, {el}, {r})'
         else:
-            label1 = 'Grid (lon, lat, alt): ('+lon+', '+lat+', '+alt+')'
+            label1 = f'Grid (lon, lat, alt): ({lon}, {lat}, {alt})'
         titl = ('Time Series Acc. '+date[0].strftime('%Y-%m-%d'))
 
         labely = 'Radar estimated rainfall accumulation (mm)'
@@ -352,18 +345,15 @@ def generate_timeseries_products(dataset, prdcfg):
             return None
 
         if 'antenna_coordinates_az_el_r' in dataset:
-            az = '{:.1f}'.format(dataset['antenna_coordinates_az_el_r'][0])
-            el = '{:.1f}'.format(dataset['antenna_coordinates_az_el_r'][1])
-            r = '{:.1f}'.format(dataset['antenna_coordinates_az_el_r'][2])
-            gateinfo = ('az'+az+'r'+r+'el'+el)
+            az = f"{dataset['antenna_coordinates_az_el_r'][0]:.1f}"
+            el = f"{dataset['antenna_coordinates_az_el_r'][1]:.1f}"
+            r = f"{dataset['antenna_coordinates_az_el_r'][2]:.1f}"
+            gateinfo = f'az{az}r{r}el{el}'
         else:
-            lon = '{:.3f}'.format(
-                dataset['point_coordinates_WGS84_lon_lat_alt'][0])
-            lat = '{:.3f}'.format(
-                dataset['point_coordinates_WGS84_lon_lat_alt'][1])
-            alt = '{:.1f}'.format(
-                dataset['point_coordinates_WGS84_lon_lat_alt'][2])
-            gateinfo = ('lon'+lon+'lat'+lat+'alt'+alt)
+            lon = f"{dataset['point_coordinates_WGS84_lon_lat_alt'][0]:.3f}"
+            lat = f"{dataset['point_coordinates_WGS84_lon_lat_alt'][1]:.3f}"
+            alt = f"{dataset['point_coordinates_WGS84_lon_lat_alt'][2]:.1f}"
+            gateinfo = f'lon{lon}lat{lat}alt{alt}'
 
         timeformat = None
         timeinfo = None
@@ -410,13 +400,13 @@ def generate_timeseries_products(dataset, prdcfg):
             prdcfg['imgformat'], prdcfginfo=gateinfo,
             timeinfo=timeinfo_fig, timeformat=timeformat)
 
-        for i, figfname in enumerate(figfname_list):
-            figfname_list[i] = savedir+figfname
+        figfname_list = [
+            os.path.join(savedir, figfname) for figfname in figfname_list]
 
         if 'antenna_coordinates_az_el_r' in dataset:
-            label1 = 'Radar (az, el, r): ('+az+', '+el+', '+r+')'
+            label1 = f'Radar (az, el, r): ({az}, {el}, {r})'
         else:
-            label1 = 'Grid (lon, lat, alt): ('+lon+', '+lat+', '+alt+')'
+            label1 = f'Grid (lon, lat, alt): ({lon}, {lat}, {alt})'
         label2 = sensortype+' '+prdcfg['sensorid']
         titl = 'Time Series Comp. '+radardate[0].strftime('%Y-%m-%d')
         labely = generate_field_name_str(dataset['datatype'])
@@ -442,18 +432,15 @@ def generate_timeseries_products(dataset, prdcfg):
             return None
 
         if 'antenna_coordinates_az_el_r' in dataset:
-            az = '{:.1f}'.format(dataset['antenna_coordinates_az_el_r'][0])
-            el = '{:.1f}'.format(dataset['antenna_coordinates_az_el_r'][1])
-            r = '{:.1f}'.format(dataset['antenna_coordinates_az_el_r'][2])
-            gateinfo = ('az'+az+'r'+r+'el'+el)
+            az = f"{dataset['antenna_coordinates_az_el_r'][0]:.1f}"
+            el = f"{dataset['antenna_coordinates_az_el_r'][1]:.1f}"
+            r = f"{dataset['antenna_coordinates_az_el_r'][2]:.1f}"
+            gateinfo = f'az{az}r{r}el{el}'
         else:
-            lon = '{:.3f}'.format(
-                dataset['point_coordinates_WGS84_lon_lat_alt'][0])
-            lat = '{:.3f}'.format(
-                dataset['point_coordinates_WGS84_lon_lat_alt'][1])
-            alt = '{:.1f}'.format(
-                dataset['point_coordinates_WGS84_lon_lat_alt'][2])
-            gateinfo = ('lon'+lon+'lat'+lat+'alt'+alt)
+            lon = f"{dataset['point_coordinates_WGS84_lon_lat_alt'][0]:.3f}"
+            lat = f"{dataset['point_coordinates_WGS84_lon_lat_alt'][1]:.3f}"
+            alt = f"{dataset['point_coordinates_WGS84_lon_lat_alt'][2]:.1f}"
+            gateinfo = f'lon{lon}lat{lat}alt{alt}'
 
         timeformat = None
         timeinfo = None
@@ -500,13 +487,13 @@ def generate_timeseries_products(dataset, prdcfg):
             prdcfg['imgformat'], prdcfginfo=gateinfo,
             timeinfo=timeinfo_fig, timeformat=timeformat)
 
-        for i, figfname in enumerate(figfname_list):
-            figfname_list[i] = savedir+figfname
+        figfname_list = [
+            os.path.join(savedir, figfname) for figfname in figfname_list]
 
         if 'antenna_coordinates_az_el_r' in dataset:
-            label1 = 'Radar (az, el, r): ('+az+', '+el+', '+r+')'
+            label1 = f'Radar (az, el, r): ({az}, {el}, {r})'
         else:
-            label1 = 'Grid (lon, lat, alt): ('+lon+', '+lat+', '+alt+')'
+            label1 = f'Grid (lon, lat, alt): ({lon}, {lat}, {alt})'
         label2 = sensortype+' '+prdcfg['sensorid']
         titl = ('Time Series Acc. Comp. ' +
                 radardate[0].strftime('%Y-%m-%d'))
@@ -531,10 +518,10 @@ def generate_timeseries_products(dataset, prdcfg):
         if not plot_only_final and dataset['final']:
             return None
 
-        az = '{:.1f}'.format(dataset['antenna_coordinates_az_el_r'][0])
-        el = '{:.1f}'.format(dataset['antenna_coordinates_az_el_r'][1])
-        r = '{:.1f}'.format(dataset['antenna_coordinates_az_el_r'][2])
-        gateinfo = ('az'+az+'r'+r+'el'+el)
+        az = f"{dataset['antenna_coordinates_az_el_r'][0]:.1f}"
+        el = f"{dataset['antenna_coordinates_az_el_r'][1]:.1f}"
+        r = f"{dataset['antenna_coordinates_az_el_r'][2]:.1f}"
+        gateinfo = f'az{az}r{r}el{el}'
 
         savedir_ts = get_save_dir(
             prdcfg['basepath'], prdcfg['procname'], dssavedir,
@@ -571,17 +558,19 @@ def generate_timeseries_products(dataset, prdcfg):
             radardate, radarvalue, cum_time=cum_time, base_time=base_time,
             dropnan=False)
 
-        # find common time stamps
-        ind = np.where(np.in1d(radardate_cum, sensordate_cum))[0]
-        if ind.size == 0:
+        # find common time stamps. The accumulation periods are unique and
+        # sorted so both index vectors are obtained in a single pass
+        _, ind_radar, ind_sensor = np.intersect1d(
+            radardate_cum, sensordate_cum, assume_unique=True,
+            return_indices=True)
+        if ind_radar.size == 0:
             warn('No sensor data for radar data time stamps')
-        radardate_cum2 = radardate_cum[ind]
-        radarvalue_cum2 = radarvalue_cum[ind]
-        np_radar_cum2 = np_radar_cum[ind]
+        radardate_cum2 = radardate_cum[ind_radar]
+        radarvalue_cum2 = radarvalue_cum[ind_radar]
+        np_radar_cum2 = np_radar_cum[ind_radar]
 
-        ind = np.where(np.in1d(sensordate_cum, radardate_cum2))[0]
-        sensorvalue_cum2 = sensorvalue_cum[ind]
-        np_sensor_cum2 = np_sensor_cum[ind]
+        sensorvalue_cum2 = sensorvalue_cum[ind_sensor]
+        np_sensor_cum2 = np_sensor_cum[ind_sensor]
 
         savedir = get_save_dir(
             prdcfg['basepath'], prdcfg['procname'], dssavedir,
@@ -592,7 +581,7 @@ def generate_timeseries_products(dataset, prdcfg):
             dataset['datatype'], ['csv'], prdcfginfo=gateinfo,
             timeinfo=radardate[0], timeformat='%Y%m%d')[0]
 
-        fname = savedir+fname
+        fname = os.path.join(savedir, fname)
 
         new_dataset = deepcopy(dataset)
         new_dataset.update({
@@ -613,11 +602,11 @@ def generate_timeseries_products(dataset, prdcfg):
             dataset['datatype'], prdcfg['imgformat'], prdcfginfo=gateinfo,
             timeinfo=radardate[0], timeformat='%Y%m%d')
 
-        for i, figfname in enumerate(figfname_list):
-            figfname_list[i] = savedir+figfname
+        figfname_list = [
+            os.path.join(savedir, figfname) for figfname in figfname_list]
 
         labelx = sensortype+' '+prdcfg['sensorid']+' (mm)'
-        labely = 'Radar (az, el, r): ('+az+', '+el+', '+r+') (mm)'
+        labely = f'Radar (az, el, r): ({az}, {el}, {r}) (mm)'
         titl = (str(cum_time)+'s Acc. Comp. ' +
                 radardate_cum[0].strftime('%Y-%m-%d'))
 
@@ -656,7 +645,7 @@ def generate_timeseries_products(dataset, prdcfg):
                               timeformat='%Y%m%d%H%M%S',
                               runinfo=prdcfg['runinfo'])
 
-        ts.write(savedir + fname[0])
+        ts.write(os.path.join(savedir, fname[0]))
 
         fname = make_filename('ts', dstype_str, ts.datatype,
                               prdcfg['imgformat'],
@@ -667,7 +656,7 @@ def generate_timeseries_products(dataset, prdcfg):
         ymin = prdcfg.get('ymin', None)
         ymax = prdcfg.get('ymax', None)
 
-        ts.plot(savedir + fname[0], ymin=ymin, ymax=ymax)
+        ts.plot(os.path.join(savedir, fname[0]), ymin=ymin, ymax=ymax)
 
         return None
 
@@ -700,7 +689,7 @@ def generate_timeseries_products(dataset, prdcfg):
 
         step = prdcfg.get('step', None)
 
-        ts.plot_hist(savedir + fname[0], step=step)
+        ts.plot_hist(os.path.join(savedir, fname[0]), step=step)
 
         return None
 
@@ -733,11 +722,10 @@ def generate_timeseries_products(dataset, prdcfg):
         fname_list = make_filename(
             prdtype, prdcfg['dstype'], prdcfg['voltype'],
             prdcfg['imgformat'],
-            prdcfginfo='alt'+'{:.1f}'.format(prdcfg['altitude']),
+            prdcfginfo=f"alt{prdcfg['altitude']:.1f}",
             timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+        fname_list = [os.path.join(savedir, fname) for fname in fname_list]
 
         fig, ax = plot_cappi(
             dataset['radar'], field_name, prdcfg['altitude'], prdcfg,
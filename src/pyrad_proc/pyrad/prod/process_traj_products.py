@@ -11,6 +11,7 @@ Functions for obtaining Pyrad products from the datasets
 
 """
 
+import os
 from warnings import warn
 
 from ..io.io_aux import get_save_dir, make_filename
@@ -43,18 +44,18 @@ def generate_traj_product(traj, prdcfg):
 
     """
 
-    dssavedir = prdcfg['dsname']
-    if 'dssavename' in prdcfg:
-        dssavedir = prdcfg['dssavename']
-
-    if prdcfg['type'] == 'TRAJ_PLOT':
-
-        timeinfo = traj.time_vector[0]
+    if prdcfg['type'] not in ('TRAJ_PLOT', 'TRAJ_TEXT', 'TRAJ_MAP'):
+        warn(' Unsupported product type: ' + prdcfg['type'])
+        return None
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=timeinfo)
+    # all the products are stored in the same directory
+    dssavedir = prdcfg.get('dssavename', prdcfg['dsname'])
+    timeinfo = traj.time_vector[0]
+    savedir = get_save_dir(
+        prdcfg['basepath'], prdcfg['procname'], dssavedir,
+        prdcfg['prdname'], timeinfo=timeinfo)
 
+    if prdcfg['type'] == 'TRAJ_PLOT':
         ts = TimeSeries("", traj.time_vector,
                         timeformat="%Y-%m-%d %H:%M:%S.%f")
 
@@ -67,7 +68,7 @@ def generate_traj_product(traj, prdcfg):
             ts.add_dataseries(
                 "Elevation", "Elevation", "deg",
                 traj.radar_list[0].elevation_vec)
-            ts.plot(savedir + fname[0])
+            ts.plot(os.path.join(savedir, fname[0]))
 
         elif prdcfg['datatype'] == 'AZ':
             fname = make_filename(
@@ -77,7 +78,7 @@ def generate_traj_product(traj, prdcfg):
 
             ts.add_dataseries(
                 "Azimuth", "Azimuth", "deg", traj.radar_list[0].azimuth_vec)
-            ts.plot(savedir + fname[0])
+            ts.plot(os.path.join(savedir, fname[0]))
 
         elif prdcfg['datatype'] == 'RANGE':
             fname = make_filename(
@@ -87,7 +88,7 @@ def generate_traj_product(traj, prdcfg):
 
             ts.add_dataseries(
                 "Range", "Range", "m", traj.radar_list[0].range_vec)
-            ts.plot(savedir + fname[0])
+            ts.plot(os.path.join(savedir, fname[0]))
 
         else:
             raise Exception("ERROR: Unknown datatype '%s' (dataset: '%s')" %
@@ -96,13 +97,6 @@ def generate_traj_product(traj, prdcfg):
         return None
 
     if prdcfg['type'] == 'TRAJ_TEXT':
-
-        timeinfo = traj.time_vector[0]
-
-        savedir = get_save_dir(prdcfg['basepath'], prdcfg['procname'],
-                               dssavedir, prdcfg['prdname'],
-                               timeinfo=timeinfo)
-
         fname = make_filename('ts', prdcfg['dstype'], 'TRAJ', ['csv'],
                               prdcfginfo=None, timeinfo=timeinfo,
                               timeformat='%Y%m%d%H%M%S',
@@ -129,16 +123,11 @@ def generate_traj_product(traj, prdcfg):
         ts.add_dataseries("Azimuth Speed", "Azimuth Speed", "deg/s",
                           traj.radar_list[0].v_az)
 
-        ts.write(savedir + fname[0])
+        ts.write(os.path.join(savedir, fname[0]))
 
         return None
 
-    if prdcfg['type'] == 'TRAJ_MAP': #Trajectory on a map
-        timeinfo = traj.time_vector[0]
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=timeinfo)
-
+    if prdcfg['type'] == 'TRAJ_MAP':  # Trajectory on a map
         fname = make_filename(
             'ts', prdcfg['dstype'], 'TRAJ', prdcfg['imgformat'],
             prdcfginfo="MAP", timeinfo=timeinfo, timeformat='%Y%m%d%H%M%S',
@@ -148,8 +137,7 @@ def generate_traj_product(traj, prdcfg):
                 traj.time_vector[0].strftime("%Y-%m-%d")
 
         fname_list = fname
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+        fname_list = [os.path.join(savedir, fname) for fname in fname_list]
 
         # Get traj
         lat = traj.wgs84_lat_deg
@@ -161,6 +149,3 @@ def generate_traj_product(traj, prdcfg):
             save_fig=True)
 
         return None
-
-    warn(' Unsupported product type: ' + prdcfg['type'])
-    return None
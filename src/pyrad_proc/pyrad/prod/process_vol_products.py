@@ -8,23 +8,65 @@ Functions for obtaining Pyrad products from a radar volume dataset
     :toctree: generated/
 
     generate_vol_products
+    _generate_ppi_image
+    _generate_pseudoppi_image
+    _generate_ppi_map
+    _generate_ppi_contour_overplot
+    _generate_ppimap_roi_overplot
+    _generate_pseudoppi_contour_overplot
+    _generate_ppi_contour
+    _generate_pseudoppi_contour
+    _generate_rhi_image
+    _generate_pseudorhi_image
+    _generate_rhi_contour_overplot
+    _generate_pseudorhi_contour_overplot
+    _generate_rhi_contour
+    _generate_pseudorhi_contour
+    _generate_rhi_profile
+    _generate_profile_stats
+    _generate_wind_profile
+    _generate_pseudoppi_map
+    _generate_cappi_image
+    _generate_fixed_rng_image
+    _generate_fixed_rng_span_image
+    _generate_plot_along_coord
+    _generate_bscope_image
+    _generate_time_range
+    _generate_histogram
+    _generate_samples_histogram
+    _generate_quantiles
+    _generate_field_coverage
+    _generate_cdf
+    _generate_selfconsistency
+    _generate_selfconsistency2
+    _generate_vol_ts
+    _generate_savevol
+    _generate_saveall
+    _generate_savestate
+    _generate_save_fixed_angle
+    _angle_index
+    _height_levels
 
 """
 
-from copy import deepcopy
+from copy import copy, deepcopy
 from warnings import warn
+import os
 
 import numpy as np
 import pyart
 from netCDF4 import num2date
 
-from ..io.io_aux import get_save_dir, make_filename, get_fieldname_pyart
+from .process_monitoring_products import send_monitoring_alarm
+
+from ..io.io_aux import get_product_save_dir, make_filename
+from ..io.io_aux import get_fieldname_pyart
 from ..io.io_aux import generate_field_name_str
+from ..io.io_aux import make_single_filename
 
 from ..io.write_data import write_cdf, write_rhi_profile, write_field_coverage
 from ..io.write_data import write_last_state, write_histogram, write_quantiles
 from ..io.write_data import write_fixed_angle, write_monitoring_ts
-from ..io.write_data import write_alarm_msg, send_msg
 
 from ..io.read_data_other import read_monitoring_ts
 
@@ -42,10 +84,18 @@ from ..graph.plots_timeseries import plot_monitoring_ts
 
 from ..util.radar_utils import get_ROI, compute_profile_stats
 from ..util.radar_utils import compute_histogram, compute_quantiles
+from ..util.radar_utils import compute_histogram_counts
 from ..util.radar_utils import get_data_along_rng, get_data_along_azi
 from ..util.radar_utils import get_data_along_ele
+from ..util.radar_utils import get_fixed_angle_order, get_field_metadata
 from ..util.stat_utils import quantiles_weighted
 
+# time formats used in the names and titles of the products
+_FMT_DAY = '%Y%m%d'
+_FMT_SEC = '%Y%m%d%H%M%S'
+_FMT_YEAR = '%Y'
+_FMT_ISO_DAY = '%Y-%m-%d'
+
 
 def generate_vol_products(dataset, prdcfg):
     """
@@ -609,2524 +659,3061 @@ def generate_vol_products(dataset, prdcfg):
     The list of created fields or None
 
     """
+    handler = _VOL_HANDLERS.get(prdcfg['type'])
+    if handler is not None:
+        return handler(dataset, prdcfg)
 
-    dssavedir = prdcfg['dsname']
-    if 'dssavename' in prdcfg:
-        dssavedir = prdcfg['dssavename']
+    warn(' Unsupported product type: ' + prdcfg['type'])
+    return None
 
-    prdsavedir = prdcfg['prdname']
-    if 'prdsavedir' in prdcfg:
-        prdsavedir = prdcfg['prdsavedir']
 
-    if prdcfg['type'] == 'PPI_IMAGE':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+def _generate_ppi_image(dataset, prdcfg):
+    """
+    Plots a PPI image. The user defined parameters are documented in
+    generate_vol_products
 
-        el_vec = np.sort(dataset['radar_out'].fixed_angle['data'])
-        el = el_vec[prdcfg['anglenr']]
-        ind_el = np.where(dataset['radar_out'].fixed_angle['data'] == el)[0][0]
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a radar object
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdsavedir, timeinfo=prdcfg['timeinfo'])
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
 
-        fname_list = make_filename(
-            'ppi', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'], prdcfginfo='el'+'{:.1f}'.format(el),
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+    """
 
-        step = prdcfg.get('step', None)
-        quantiles = prdcfg.get('quantiles', None)
-        plot_type = prdcfg.get('plot_type', 'PPI')
-        vmin = prdcfg.get('vmin', None)
-        vmax = prdcfg.get('vmax', None)
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
 
-        fname_list = plot_ppi(
-            dataset['radar_out'], field_name, ind_el, prdcfg, fname_list,
-            plot_type=plot_type, vmin=vmin, vmax=vmax, step=step,
-            quantiles=quantiles)
+    ind_el, el = _angle_index(dataset['radar_out'], prdcfg['anglenr'])
 
-        print('----- save to '+' '.join(fname_list))
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
 
-        return fname_list
+    fname_list = make_filename(
+        'ppi', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'], prdcfginfo=f'el{el:.1f}',
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
 
-    if prdcfg['type'] == 'PSEUDOPPI_IMAGE':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
 
-        plot_type = prdcfg.get('plot_type', 'PPI')
-        step = prdcfg.get('step', None)
-        quantiles = prdcfg.get('quantiles', None)
-        ele_tol = prdcfg.get('EleTol', 1.)
-        vmin = prdcfg.get('vmin', None)
-        vmax = prdcfg.get('vmax', None)
+    step = prdcfg.get('step', None)
+    quantiles = prdcfg.get('quantiles', None)
+    plot_type = prdcfg.get('plot_type', 'PPI')
+    vmin = prdcfg.get('vmin', None)
+    vmax = prdcfg.get('vmax', None)
 
-        try:
-            xsect = pyart.util.cross_section_rhi(
-                dataset['radar_out'], [prdcfg['angle']], el_tol=ele_tol)
+    fname_list = plot_ppi(
+        dataset['radar_out'], field_name, ind_el, prdcfg, fname_list,
+        plot_type=plot_type, vmin=vmin, vmax=vmax, step=step,
+        quantiles=quantiles)
 
-            savedir = get_save_dir(
-                prdcfg['basepath'], prdcfg['procname'], dssavedir,
-                prdsavedir, timeinfo=prdcfg['timeinfo'])
+    print('----- save to '+' '.join(fname_list))
 
-            fname_list = make_filename(
-                'ppi', prdcfg['dstype'], prdcfg['voltype'],
-                prdcfg['imgformat'],
-                prdcfginfo='el'+'{:.1f}'.format(prdcfg['angle']),
-                timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+    return fname_list
 
-            for i, fname in enumerate(fname_list):
-                fname_list[i] = savedir+fname
 
-            plot_ppi(
-                xsect, field_name, 0, prdcfg, fname_list, plot_type=plot_type,
-                vmin=vmin, vmax=vmax, step=step, quantiles=quantiles)
+def _generate_pseudoppi_image(dataset, prdcfg):
+    """
+    Plots a pseudo-PPI image. The user defined parameters are documented in
+    generate_vol_products
 
-            print('----- save to '+' '.join(fname_list))
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a radar object
 
-            return fname_list
-        except EnvironmentError:
-            warn(
-                'No data found at elevation ' + str(prdcfg['angle']) +
-                '. Skipping product ' + prdcfg['type'])
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
 
-            return None
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
 
-    if prdcfg['type'] == 'PPI_MAP':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+    """
 
-        el_vec = np.sort(dataset['radar_out'].fixed_angle['data'])
-        el = el_vec[prdcfg['anglenr']]
-        ind_el = np.where(
-            dataset['radar_out'].fixed_angle['data'] == el)[0][0]
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdsavedir, timeinfo=prdcfg['timeinfo'])
+    plot_type = prdcfg.get('plot_type', 'PPI')
+    step = prdcfg.get('step', None)
+    quantiles = prdcfg.get('quantiles', None)
+    ele_tol = prdcfg.get('EleTol', 1.)
+    vmin = prdcfg.get('vmin', None)
+    vmax = prdcfg.get('vmax', None)
+
+    try:
+        xsect = pyart.util.cross_section_rhi(
+            dataset['radar_out'], [prdcfg['angle']], el_tol=ele_tol)
+
+        savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
 
         fname_list = make_filename(
-            'ppi_map', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'], prdcfginfo='el'+'{:.1f}'.format(el),
+            'ppi', prdcfg['dstype'], prdcfg['voltype'],
+            prdcfg['imgformat'],
+            prdcfginfo=f"el{prdcfg['angle']:.1f}",
             timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+        fname_list = [
+            os.path.join(savedir, fname) for fname in fname_list]
 
-        plot_ppi_map(
-            dataset['radar_out'], field_name, ind_el, prdcfg, fname_list)
+        plot_ppi(
+            xsect, field_name, 0, prdcfg, fname_list, plot_type=plot_type,
+            vmin=vmin, vmax=vmax, step=step, quantiles=quantiles)
 
         print('----- save to '+' '.join(fname_list))
 
         return fname_list
+    except EnvironmentError:
+        warn(
+            'No data found at elevation ' + str(prdcfg['angle']) +
+            '. Skipping product ' + prdcfg['type'])
 
-    if prdcfg['type'] == 'PPI_CONTOUR_OVERPLOT':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+        return None
 
-        contour_name = get_fieldname_pyart(prdcfg['contourtype'])
-        if contour_name not in dataset['radar_out'].fields:
-            warn(
-                'Contour type ' + contour_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
 
-        contour_values = prdcfg.get('contour_values', None)
+def _generate_ppi_map(dataset, prdcfg):
+    """
+    Plots a PPI image over a map. The user defined parameters are documented in
+    generate_vol_products
 
-        el_vec = np.sort(dataset['radar_out'].fixed_angle['data'])
-        el = el_vec[prdcfg['anglenr']]
-        ind_el = np.where(
-            dataset['radar_out'].fixed_angle['data'] == el)[0][0]
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a radar object
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdsavedir, timeinfo=prdcfg['timeinfo'])
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
 
-        fname_list = make_filename(
-            'ppi', prdcfg['dstype'],
-            prdcfg['voltype']+'-'+prdcfg['contourtype'],
-            prdcfg['imgformat'], prdcfginfo='el'+'{:.1f}'.format(el),
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+    """
 
-        titl = (
-            pyart.graph.common.generate_title(
-                dataset['radar_out'], field_name, ind_el) +
-            ' - ' +
-            pyart.graph.common.generate_field_name(
-                dataset['radar_out'], contour_name))
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
 
-        fig, ax = plot_ppi(
-            dataset['radar_out'], field_name, ind_el, prdcfg, fname_list,
-            titl=titl, save_fig=False)
+    ind_el, el = _angle_index(dataset['radar_out'], prdcfg['anglenr'])
 
-        fname_list = plot_ppi_contour(
-            dataset['radar_out'], contour_name, ind_el, prdcfg, fname_list,
-            contour_values=contour_values, ax=ax, fig=fig, save_fig=True)
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
 
-        print('----- save to '+' '.join(fname_list))
+    fname_list = make_filename(
+        'ppi_map', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'], prdcfginfo=f'el{el:.1f}',
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
 
-        return fname_list
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
 
-    if prdcfg['type'] == 'PPIMAP_ROI_OVERPLOT':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+    plot_ppi_map(
+        dataset['radar_out'], field_name, ind_el, prdcfg, fname_list)
 
-        el_vec = np.sort(dataset['radar_out'].fixed_angle['data'])
-        el = el_vec[prdcfg['anglenr']]
-        ind_el = np.where(
-            dataset['radar_out'].fixed_angle['data'] == el)[0][0]
+    print('----- save to '+' '.join(fname_list))
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdsavedir, timeinfo=prdcfg['timeinfo'])
+    return fname_list
 
-        fname_list = make_filename(
-            'ppi_map', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'], prdcfginfo='el'+'{:.1f}'.format(el),
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+def _generate_ppi_contour_overplot(dataset, prdcfg):
+    """
+    Plots a PPI image with contours of another field. The user defined
+    parameters are documented in generate_vol_products
 
-        fig, ax, _ = plot_ppi_map(
-            dataset['radar_out'], field_name, ind_el, prdcfg, fname_list,
-            save_fig=False)
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a radar object
 
-        fname_list = plot_roi_contour(
-            dataset['roi_dict'], prdcfg, fname_list, ax=ax, fig=fig,
-            save_fig=True)
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
 
-        print('----- save to '+' '.join(fname_list))
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
 
-        return fname_list
+    """
 
-    if prdcfg['type'] == 'PSEUDOPPI_CONTOUR_OVERPLOT':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
 
-        contour_name = get_fieldname_pyart(prdcfg['contourtype'])
-        if contour_name not in dataset['radar_out'].fields:
-            warn(
-                'Contour type ' + contour_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+    contour_name = get_fieldname_pyart(prdcfg['contourtype'])
+    if contour_name not in dataset['radar_out'].fields:
+        warn(
+            'Contour type ' + contour_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
 
-        contour_values = prdcfg.get('contour_values', None)
+    contour_values = prdcfg.get('contour_values', None)
 
-        try:
-            xsect = pyart.util.cross_section_rhi(
-                dataset['radar_out'], [prdcfg['angle']],
-                el_tol=prdcfg['EleTol'])
+    ind_el, el = _angle_index(dataset['radar_out'], prdcfg['anglenr'])
 
-            savedir = get_save_dir(
-                prdcfg['basepath'], prdcfg['procname'], dssavedir,
-                prdsavedir, timeinfo=prdcfg['timeinfo'])
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
 
-            fname_list = make_filename(
-                'ppi', prdcfg['dstype'],
-                prdcfg['voltype']+'-'+prdcfg['contourtype'],
-                prdcfg['imgformat'],
-                prdcfginfo='el'+'{:.1f}'.format(prdcfg['angle']),
-                timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+    fname_list = make_filename(
+        'ppi', prdcfg['dstype'],
+        prdcfg['voltype']+'-'+prdcfg['contourtype'],
+        prdcfg['imgformat'], prdcfginfo=f'el{el:.1f}',
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
 
-            for i, fname in enumerate(fname_list):
-                fname_list[i] = savedir+fname
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
 
-            titl = (
-                pyart.graph.common.generate_title(xsect, field_name, 0) +
-                ' - ' +
-                pyart.graph.common.generate_field_name(xsect, contour_name))
+    titl = (
+        pyart.graph.common.generate_title(
+            dataset['radar_out'], field_name, ind_el) +
+        ' - ' +
+        pyart.graph.common.generate_field_name(
+            dataset['radar_out'], contour_name))
 
-            fig, ax = plot_ppi(xsect, field_name, 0, prdcfg, fname_list,
-                               titl=titl, save_fig=False)
+    fig, ax = plot_ppi(
+        dataset['radar_out'], field_name, ind_el, prdcfg, fname_list,
+        titl=titl, save_fig=False)
 
-            fname_list = plot_ppi_contour(
-                xsect, contour_name, 0, prdcfg, fname_list,
-                contour_values=contour_values, ax=ax, fig=fig, save_fig=True)
+    fname_list = plot_ppi_contour(
+        dataset['radar_out'], contour_name, ind_el, prdcfg, fname_list,
+        contour_values=contour_values, ax=ax, fig=fig, save_fig=True)
 
-            print('----- save to '+' '.join(fname_list))
+    print('----- save to '+' '.join(fname_list))
 
-            return fname_list
-        except EnvironmentError:
-            warn(
-                'No data found at elevation ' + str(prdcfg['angle']) +
-                '. Skipping product ' + prdcfg['type'])
+    return fname_list
 
-            return None
 
-    if prdcfg['type'] == 'PPI_CONTOUR':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+def _generate_ppimap_roi_overplot(dataset, prdcfg):
+    """
+    Plots a PPI image over a map with the region of interest. The user defined
+    parameters are documented in generate_vol_products
 
-        contour_values = prdcfg.get('contour_values', None)
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a radar object
 
-        el_vec = np.sort(dataset['radar_out'].fixed_angle['data'])
-        el = el_vec[prdcfg['anglenr']]
-        ind_el = np.where(dataset['radar_out'].fixed_angle['data'] == el)[0][0]
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdsavedir, timeinfo=prdcfg['timeinfo'])
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
 
-        fname_list = make_filename(
-            'ppi', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'], prdcfginfo='el'+'{:.1f}'.format(el),
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+    """
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
 
-        fname_list = plot_ppi_contour(
-            dataset['radar_out'], field_name, ind_el, prdcfg, fname_list,
-            contour_values=contour_values)
+    ind_el, el = _angle_index(dataset['radar_out'], prdcfg['anglenr'])
 
-        print('----- save to '+' '.join(fname_list))
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
 
-        return fname_list
+    fname_list = make_filename(
+        'ppi_map', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'], prdcfginfo=f'el{el:.1f}',
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
 
-    if prdcfg['type'] == 'PSEUDOPPI_CONTOUR':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
 
-        contour_values = prdcfg.get('contour_values', None)
+    fig, ax, _ = plot_ppi_map(
+        dataset['radar_out'], field_name, ind_el, prdcfg, fname_list,
+        save_fig=False)
 
-        try:
-            xsect = pyart.util.cross_section_rhi(
-                dataset['radar_out'], [prdcfg['angle']],
-                el_tol=prdcfg['EleTol'])
+    fname_list = plot_roi_contour(
+        dataset['roi_dict'], prdcfg, fname_list, ax=ax, fig=fig,
+        save_fig=True)
 
-            savedir = get_save_dir(
-                prdcfg['basepath'], prdcfg['procname'], dssavedir,
-                prdsavedir, timeinfo=prdcfg['timeinfo'])
+    print('----- save to '+' '.join(fname_list))
 
-            fname_list = make_filename(
-                'ppi', prdcfg['dstype'], prdcfg['voltype'],
-                prdcfg['imgformat'],
-                prdcfginfo='el'+'{:.1f}'.format(prdcfg['angle']),
-                timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+    return fname_list
 
-            for i, fname in enumerate(fname_list):
-                fname_list[i] = savedir+fname
 
-            fname_list = plot_ppi_contour(
-                xsect, field_name, 0, prdcfg, fname_list,
-                contour_values=contour_values)
+def _generate_pseudoppi_contour_overplot(dataset, prdcfg):
+    """
+    Plots a pseudo-PPI image with contours of another field. The user defined
+    parameters are documented in generate_vol_products
 
-            print('----- save to '+' '.join(fname_list))
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a radar object
 
-            return fname_list
-        except EnvironmentError:
-            warn(
-                'No data found at elevation ' + str(prdcfg['angle']) +
-                '. Skipping product ' + prdcfg['type'])
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
 
-            return None
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
 
-    if prdcfg['type'] == 'RHI_IMAGE':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+    """
 
-        az_vec = np.sort(dataset['radar_out'].fixed_angle['data'])
-        az = az_vec[prdcfg['anglenr']]
-        ind_az = np.where(dataset['radar_out'].fixed_angle['data'] == az)[0][0]
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdsavedir, timeinfo=prdcfg['timeinfo'])
+    contour_name = get_fieldname_pyart(prdcfg['contourtype'])
+    if contour_name not in dataset['radar_out'].fields:
+        warn(
+            'Contour type ' + contour_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
 
-        fname_list = make_filename(
-            'rhi', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'], prdcfginfo='az'+'{:.1f}'.format(az),
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+    contour_values = prdcfg.get('contour_values', None)
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+    try:
+        xsect = pyart.util.cross_section_rhi(
+            dataset['radar_out'], [prdcfg['angle']],
+            el_tol=prdcfg['EleTol'])
 
-        step = prdcfg.get('step', None)
-        quantiles = prdcfg.get('quantiles', None)
-        plot_type = prdcfg.get('plot_type', 'RHI')
-        vmin = prdcfg.get('vmin', None)
-        vmax = prdcfg.get('vmax', None)
+        savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
 
-        plot_rhi(
-            dataset['radar_out'], field_name, ind_az, prdcfg, fname_list,
-            plot_type=plot_type, step=step, vmin=vmin, vmax=vmax,
-            quantiles=quantiles)
+        fname_list = make_filename(
+            'ppi', prdcfg['dstype'],
+            prdcfg['voltype']+'-'+prdcfg['contourtype'],
+            prdcfg['imgformat'],
+            prdcfginfo=f"el{prdcfg['angle']:.1f}",
+            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
 
-        print('----- save to '+' '.join(fname_list))
+        fname_list = [
+            os.path.join(savedir, fname) for fname in fname_list]
 
-        return fname_list
+        titl = (
+            pyart.graph.common.generate_title(xsect, field_name, 0) +
+            ' - ' +
+            pyart.graph.common.generate_field_name(xsect, contour_name))
 
-    if prdcfg['type'] == 'PSEUDORHI_IMAGE':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+        fig, ax = plot_ppi(xsect, field_name, 0, prdcfg, fname_list,
+                           titl=titl, save_fig=False)
 
-        plot_type = prdcfg.get('plot_type', 'RHI')
-        step = prdcfg.get('step', None)
-        quantiles = prdcfg.get('quantiles', None)
-        azi_tol = prdcfg.get('AziTol', 1.)
-        vmin = prdcfg.get('vmin', None)
-        vmax = prdcfg.get('vmax', None)
-
-        try:
-            xsect = pyart.util.cross_section_ppi(
-                dataset['radar_out'], [prdcfg['angle']], az_tol=azi_tol)
-
-            savedir = get_save_dir(
-                prdcfg['basepath'], prdcfg['procname'], dssavedir,
-                prdsavedir, timeinfo=prdcfg['timeinfo'])
-
-            fname_list = make_filename(
-                'rhi', prdcfg['dstype'], prdcfg['voltype'],
-                prdcfg['imgformat'],
-                prdcfginfo='az'+'{:.1f}'.format(prdcfg['angle']),
-                timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
-
-            for i, fname in enumerate(fname_list):
-                fname_list[i] = savedir+fname
-
-            plot_rhi(
-                xsect, field_name, 0, prdcfg, fname_list, vmin=vmin,
-                vmax=vmax, plot_type=plot_type, step=step,
-                quantiles=quantiles)
-
-            print('----- save to '+' '.join(fname_list))
-
-            return fname_list
-        except EnvironmentError:
-            warn(
-                ' No data found at azimuth ' +
-                str(prdcfg['angle'])+'. Skipping product ' +
-                prdcfg['type'])
-            return None
+        fname_list = plot_ppi_contour(
+            xsect, contour_name, 0, prdcfg, fname_list,
+            contour_values=contour_values, ax=ax, fig=fig, save_fig=True)
 
-    if prdcfg['type'] == 'RHI_CONTOUR_OVERPLOT':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+        print('----- save to '+' '.join(fname_list))
 
-        contour_name = get_fieldname_pyart(prdcfg['contourtype'])
-        if contour_name not in dataset['radar_out'].fields:
-            warn(
-                'Contour type ' + contour_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+        return fname_list
+    except EnvironmentError:
+        warn(
+            'No data found at elevation ' + str(prdcfg['angle']) +
+            '. Skipping product ' + prdcfg['type'])
 
-        contour_values = prdcfg.get('contour_values', None)
+        return None
 
-        az_vec = np.sort(dataset['radar_out'].fixed_angle['data'])
-        az = az_vec[prdcfg['anglenr']]
-        ind_az = np.where(dataset['radar_out'].fixed_angle['data'] == az)[0][0]
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdsavedir, timeinfo=prdcfg['timeinfo'])
+def _generate_ppi_contour(dataset, prdcfg):
+    """
+    Plots a PPI contour plot. The user defined parameters are documented in
+    generate_vol_products
 
-        fname_list = make_filename(
-            'rhi', prdcfg['dstype'],
-            prdcfg['voltype']+'-'+prdcfg['contourtype'],
-            prdcfg['imgformat'], prdcfginfo='az'+'{:.1f}'.format(az),
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a radar object
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
 
-        titl = (
-            pyart.graph.common.generate_title(dataset['radar_out'],
-                                              field_name, ind_az)+' - ' +
-            pyart.graph.common.generate_field_name(dataset['radar_out'],
-                                                   contour_name))
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
 
-        fig, ax = plot_rhi(
-            dataset['radar_out'], field_name, ind_az, prdcfg, fname_list,
-            titl=titl, save_fig=False)
+    """
 
-        fname_list = plot_rhi_contour(
-            dataset['radar_out'], contour_name, ind_az, prdcfg, fname_list,
-            contour_values=contour_values, ax=ax, fig=fig, save_fig=True)
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
 
-        print('----- save to '+' '.join(fname_list))
+    contour_values = prdcfg.get('contour_values', None)
 
-        return fname_list
+    ind_el, el = _angle_index(dataset['radar_out'], prdcfg['anglenr'])
 
-    if prdcfg['type'] == 'PSEUDORHI_CONTOUR_OVERPLOT':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
 
-        contour_name = get_fieldname_pyart(prdcfg['contourtype'])
-        if contour_name not in dataset['radar_out'].fields:
-            warn(
-                'Contour type ' + contour_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+    fname_list = make_filename(
+        'ppi', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'], prdcfginfo=f'el{el:.1f}',
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
 
-        contour_values = prdcfg.get('contour_values', None)
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
 
-        try:
-            xsect = pyart.util.cross_section_ppi(
-                dataset['radar_out'], [prdcfg['angle']],
-                az_tol=prdcfg['AziTol'])
+    fname_list = plot_ppi_contour(
+        dataset['radar_out'], field_name, ind_el, prdcfg, fname_list,
+        contour_values=contour_values)
 
-            savedir = get_save_dir(
-                prdcfg['basepath'], prdcfg['procname'], dssavedir,
-                prdsavedir, timeinfo=prdcfg['timeinfo'])
+    print('----- save to '+' '.join(fname_list))
 
-            fname_list = make_filename(
-                'rhi', prdcfg['dstype'],
-                prdcfg['voltype']+'-'+prdcfg['contourtype'],
-                prdcfg['imgformat'],
-                prdcfginfo='az'+'{:.1f}'.format(prdcfg['angle']),
-                timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+    return fname_list
 
-            for i, fname in enumerate(fname_list):
-                fname_list[i] = savedir+fname
 
-            titl = (
-                pyart.graph.common.generate_title(xsect, field_name, 0) +
-                ' - ' +
-                pyart.graph.common.generate_field_name(xsect, contour_name))
+def _generate_pseudoppi_contour(dataset, prdcfg):
+    """
+    Plots a pseudo-PPI contour plot. The user defined parameters are documented
+    in generate_vol_products
 
-            fig, ax = plot_rhi(xsect, field_name, 0, prdcfg, fname_list,
-                               titl=titl, save_fig=False)
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a radar object
 
-            fname_list = plot_rhi_contour(
-                xsect, contour_name, 0, prdcfg, fname_list,
-                contour_values=contour_values, ax=ax, fig=fig, save_fig=True)
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
 
-            print('----- save to '+' '.join(fname_list))
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
 
-            return fname_list
-        except EnvironmentError:
-            warn(
-                ' No data found at azimuth ' +
-                str(prdcfg['angle'])+'. Skipping product ' +
-                prdcfg['type'])
-            return None
+    """
 
-    if prdcfg['type'] == 'RHI_CONTOUR':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
 
-        contour_values = prdcfg.get('contour_values', None)
+    contour_values = prdcfg.get('contour_values', None)
 
-        az_vec = np.sort(dataset['radar_out'].fixed_angle['data'])
-        az = az_vec[prdcfg['anglenr']]
-        ind_az = np.where(
-            dataset['radar_out'].fixed_angle['data'] == az)[0][0]
+    try:
+        xsect = pyart.util.cross_section_rhi(
+            dataset['radar_out'], [prdcfg['angle']],
+            el_tol=prdcfg['EleTol'])
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdsavedir, timeinfo=prdcfg['timeinfo'])
+        savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
 
         fname_list = make_filename(
-            'rhi', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'], prdcfginfo='az'+'{:.1f}'.format(az),
+            'ppi', prdcfg['dstype'], prdcfg['voltype'],
+            prdcfg['imgformat'],
+            prdcfginfo=f"el{prdcfg['angle']:.1f}",
             timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+        fname_list = [
+            os.path.join(savedir, fname) for fname in fname_list]
 
-        fname_list = plot_rhi_contour(
-            dataset['radar_out'], field_name, ind_az, prdcfg, fname_list,
+        fname_list = plot_ppi_contour(
+            xsect, field_name, 0, prdcfg, fname_list,
             contour_values=contour_values)
 
         print('----- save to '+' '.join(fname_list))
 
         return fname_list
+    except EnvironmentError:
+        warn(
+            'No data found at elevation ' + str(prdcfg['angle']) +
+            '. Skipping product ' + prdcfg['type'])
 
-    if prdcfg['type'] == 'PSEUDORHI_CONTOUR':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+        return None
 
-        contour_values = prdcfg.get('contour_values', None)
 
-        try:
-            xsect = pyart.util.cross_section_ppi(
-                dataset['radar_out'], [prdcfg['angle']],
-                az_tol=prdcfg['AziTol'])
+def _generate_rhi_image(dataset, prdcfg):
+    """
+    Plots an RHI image. The user defined parameters are documented in
+    generate_vol_products
 
-            savedir = get_save_dir(
-                prdcfg['basepath'], prdcfg['procname'], dssavedir,
-                prdsavedir, timeinfo=prdcfg['timeinfo'])
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a radar object
 
-            fname_list = make_filename(
-                'rhi', prdcfg['dstype'], prdcfg['voltype'],
-                prdcfg['imgformat'],
-                prdcfginfo='az'+'{:.1f}'.format(prdcfg['angle']),
-                timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
 
-            for i, fname in enumerate(fname_list):
-                fname_list[i] = savedir+fname
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
 
-            fname_list = plot_rhi_contour(
-                xsect, field_name, 0, prdcfg, fname_list,
-                contour_values=contour_values)
+    """
 
-            print('----- save to '+' '.join(fname_list))
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
 
-            return fname_list
-        except EnvironmentError:
-            warn(
-                ' No data found at azimuth ' +
-                str(prdcfg['angle'])+'. Skipping product ' +
-                prdcfg['type'])
-            return None
+    ind_az, az = _angle_index(dataset['radar_out'], prdcfg['anglenr'])
 
-    if prdcfg['type'] == 'RHI_PROFILE':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
 
-        # user defined parameters
-        rangeStart = prdcfg.get('rangeStart', 0.)
-        rangeStop = prdcfg.get('rangeStop', 25000.)
-        heightResolution = prdcfg.get('heightResolution', 500.)
-        hmin_user = prdcfg.get('heightMin', None)
-        hmax_user = prdcfg.get('heightMax', None)
-        quantity = prdcfg.get('quantity', 'quantiles')
-        quantiles = prdcfg.get('quantiles', np.array([25., 50., 75.]))
-        nvalid_min = prdcfg.get('nvalid_min', 4)
-        make_linear = prdcfg.get('make_linear', 0)
-        include_nans = prdcfg.get('include_nans', 0)
-
-        fixed_span = prdcfg.get('fixed_span', 1)
-        vmin = None
-        vmax = None
-        if fixed_span:
-            vmin, vmax = pyart.config.get_field_limits(field_name)
-            if 'vmin' in prdcfg:
-                vmin = prdcfg['vmin']
-            if 'vmax' in prdcfg:
-                vmax = prdcfg['vmax']
-
-        # create new radar object with only data for the given rhi and range
-        az_vec = np.sort(dataset['radar_out'].fixed_angle['data'])
-        az = az_vec[prdcfg['anglenr']]
-        ind_az = np.where(dataset['radar_out'].fixed_angle['data'] == az)[0][0]
-
-        new_dataset = dataset['radar_out'].extract_sweeps([ind_az])
-        field = new_dataset.fields[field_name]
-        rng_mask = np.logical_and(new_dataset.range['data'] >= rangeStart,
-                                  new_dataset.range['data'] <= rangeStop)
-        field['data'] = field['data'][:, rng_mask]
-        new_dataset.range['data'] = new_dataset.range['data'][rng_mask]
-        new_dataset.ngates = len(new_dataset.range['data'])
-        new_dataset.init_gate_x_y_z()
-        new_dataset.init_gate_longitude_latitude()
-        new_dataset.init_gate_altitude()
-
-        new_dataset.fields = dict()
-        new_dataset.add_field(field_name, field)
-
-        # compute quantities
-        if hmin_user is None:
-            minheight = (
-                round(np.min(dataset['radar_out'].gate_altitude['data']) /
-                      heightResolution)*heightResolution-heightResolution)
-        else:
-            minheight = hmin_user
-        if hmax_user is None:
-            maxheight = (
-                round(np.max(dataset['radar_out'].gate_altitude['data']) /
-                      heightResolution)*heightResolution+heightResolution)
-        else:
-            maxheight = hmax_user
-        nlevels = int((maxheight-minheight)/heightResolution)
-
-        h_vec = (
-            minheight+np.arange(nlevels)*heightResolution+heightResolution/2.)
-        vals, val_valid = compute_profile_stats(
-            field['data'], new_dataset.gate_altitude['data'], h_vec,
-            heightResolution, quantity=quantity, quantiles=quantiles/100.,
-            nvalid_min=nvalid_min, make_linear=make_linear,
-            include_nans=include_nans)
-
-        # plot data
-        if quantity == 'mean':
-            data = [vals[:, 0], vals[:, 1], vals[:, 2]]
-            labels = ['Mean', 'Min', 'Max']
-            colors = ['b', 'k', 'k']
-            linestyles = ['-', '--', '--']
-        elif quantity == 'mode':
-            data = [vals[:, 0], vals[:, 2], vals[:, 4]]
-            labels = ['Mode', '2nd most common', '3rd most common']
-            colors = ['b', 'k', 'r']
-            linestyles = ['-', '--', '--']
-        else:
-            data = [vals[:, 1], vals[:, 0], vals[:, 2]]
-            labels = [
-                str(quantiles[1])+'-percentile',
-                str(quantiles[0])+'-percentile',
-                str(quantiles[2])+'-percentile']
-            colors = ['b', 'k', 'k']
-            linestyles = ['-', '--', '--']
-
-        labelx = get_colobar_label(
-            dataset['radar_out'].fields[field_name], field_name)
-        titl = (
-            pyart.graph.common.generate_radar_time_begin(
-                dataset['radar_out']).isoformat() + 'Z' + '\n' +
-            get_field_name(dataset['radar_out'].fields[field_name],
-                           field_name))
+    fname_list = make_filename(
+        'rhi', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'], prdcfginfo=f'az{az:.1f}',
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdsavedir, timeinfo=prdcfg['timeinfo'])
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
 
-        prdcfginfo = 'az'+'{:.1f}'.format(az)+'hres'+str(int(heightResolution))
-        fname_list = make_filename(
-            'rhi_profile', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'], prdcfginfo=prdcfginfo,
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+    step = prdcfg.get('step', None)
+    quantiles = prdcfg.get('quantiles', None)
+    plot_type = prdcfg.get('plot_type', 'RHI')
+    vmin = prdcfg.get('vmin', None)
+    vmax = prdcfg.get('vmax', None)
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+    plot_rhi(
+        dataset['radar_out'], field_name, ind_az, prdcfg, fname_list,
+        plot_type=plot_type, step=step, vmin=vmin, vmax=vmax,
+        quantiles=quantiles)
 
-        plot_rhi_profile(
-            data, h_vec, fname_list, labelx=labelx, labely='Height (m MSL)',
-            labels=labels, title=titl, colors=colors,
-            linestyles=linestyles)
+    print('----- save to '+' '.join(fname_list))
 
-        print('----- save to '+' '.join(fname_list))
+    return fname_list
 
-        fname = make_filename(
-            'rhi_profile', prdcfg['dstype'], prdcfg['voltype'],
-            ['csv'], prdcfginfo=prdcfginfo,
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])[0]
-
-        fname = savedir+fname
-
-        if quantity == 'mode':
-            data.append(vals[:, 1])
-            labels.append('% points mode')
-            data.append(vals[:, 3])
-            labels.append('% points 2nd most common')
-            data.append(vals[:, 5])
-            labels.append('% points 3rd most common')
-
-        sector = {
-            'rmin': rangeStart,
-            'rmax': rangeStop,
-            'az': az
-        }
-        write_rhi_profile(
-            h_vec, data, val_valid, labels, fname, datatype=labelx,
-            timeinfo=prdcfg['timeinfo'], sector=sector)
 
-        print('----- save to '+fname)
+def _generate_pseudorhi_image(dataset, prdcfg):
+    """
+    Plots a pseudo-RHI image. The user defined parameters are documented in
+    generate_vol_products
 
-        # TODO: add Cartesian interpolation option
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a radar object
 
-        return fname
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
 
-    if prdcfg['type'] == 'PROFILE_STATS':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
 
-        # mask unclassified data
-        field = deepcopy(dataset['radar_out'].fields[field_name]['data'])
-        if prdcfg['voltype'] in ('hydro', 'hydroc'):
-            field = np.ma.masked_equal(field, 1)
-
-        # user defined parameters
-        heightResolution = prdcfg.get('heightResolution', 100.)
-        hmin_user = prdcfg.get('heightMin', None)
-        hmax_user = prdcfg.get('heightMax', None)
-        quantity = prdcfg.get('quantity', 'quantiles')
-        quantiles = prdcfg.get('quantiles', np.array([25., 50., 75.]))
-        nvalid_min = prdcfg.get('nvalid_min', 4)
-        make_linear = prdcfg.get('make_linear', 0)
-        include_nans = prdcfg.get('include_nans', 0)
-
-        fixed_span = prdcfg.get('fixed_span', 1)
-        vmin = None
-        vmax = None
-        if fixed_span:
-            vmin, vmax = pyart.config.get_field_limits(field_name)
-            if 'vmin' in prdcfg:
-                vmin = prdcfg['vmin']
-            if 'vmax' in prdcfg:
-                vmax = prdcfg['vmax']
-
-        # compute quantities
-        if hmin_user is None:
-            minheight = (round(
-                np.min(dataset['radar_out'].gate_altitude['data']) /
-                heightResolution)*heightResolution-heightResolution)
-        else:
-            minheight = hmin_user
-        if hmax_user is None:
-            maxheight = (round(
-                np.max(dataset['radar_out'].gate_altitude['data']) /
-                heightResolution)*heightResolution+heightResolution)
-        else:
-            maxheight = hmax_user
-        nlevels = int((maxheight-minheight)/heightResolution)
-
-        h_vec = (
-            minheight+np.arange(nlevels)*heightResolution+heightResolution/2.)
-        vals, val_valid = compute_profile_stats(
-            field, dataset['radar_out'].gate_altitude['data'], h_vec,
-            heightResolution, quantity=quantity, quantiles=quantiles/100.,
-            nvalid_min=nvalid_min, make_linear=make_linear,
-            include_nans=include_nans)
-
-        # plot data
-        if quantity == 'mean':
-            data = [vals[:, 0], vals[:, 1], vals[:, 2]]
-            labels = ['Mean', 'Min', 'Max']
-            colors = ['b', 'k', 'k']
-            linestyles = ['-', '--', '--']
-        elif quantity == 'mode':
-            data = [vals[:, 0], vals[:, 2], vals[:, 4]]
-            labels = ['Mode', '2nd most common', '3rd most common']
-            colors = ['b', 'k', 'r']
-            linestyles = ['-', '--', '--']
-        else:
-            data = [vals[:, 1], vals[:, 0], vals[:, 2]]
-            labels = [
-                str(quantiles[1])+'-percentile',
-                str(quantiles[0])+'-percentile',
-                str(quantiles[2])+'-percentile']
-            colors = ['b', 'k', 'k']
-            linestyles = ['-', '--', '--']
-
-        labelx = get_colobar_label(
-            dataset['radar_out'].fields[field_name], field_name)
-        titl = (
-            pyart.graph.common.generate_radar_time_begin(
-                dataset['radar_out']).isoformat() + 'Z' + '\n' +
-            get_field_name(dataset['radar_out'].fields[field_name],
-                           field_name))
+    """
+
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
+
+    plot_type = prdcfg.get('plot_type', 'RHI')
+    step = prdcfg.get('step', None)
+    quantiles = prdcfg.get('quantiles', None)
+    azi_tol = prdcfg.get('AziTol', 1.)
+    vmin = prdcfg.get('vmin', None)
+    vmax = prdcfg.get('vmax', None)
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdsavedir, timeinfo=prdcfg['timeinfo'])
+    try:
+        xsect = pyart.util.cross_section_ppi(
+            dataset['radar_out'], [prdcfg['angle']], az_tol=azi_tol)
+
+        savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
 
-        prdcfginfo = 'hres'+str(int(heightResolution))
         fname_list = make_filename(
-            'rhi_profile', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'], prdcfginfo=prdcfginfo,
+            'rhi', prdcfg['dstype'], prdcfg['voltype'],
+            prdcfg['imgformat'],
+            prdcfginfo=f"az{prdcfg['angle']:.1f}",
             timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+        fname_list = [
+            os.path.join(savedir, fname) for fname in fname_list]
 
-        plot_rhi_profile(
-            data, h_vec, fname_list, labelx=labelx, labely='Height (m MSL)',
-            labels=labels, title=titl, colors=colors,
-            linestyles=linestyles, vmin=vmin, vmax=vmax,
-            hmin=minheight, hmax=maxheight)
+        plot_rhi(
+            xsect, field_name, 0, prdcfg, fname_list, vmin=vmin,
+            vmax=vmax, plot_type=plot_type, step=step,
+            quantiles=quantiles)
 
         print('----- save to '+' '.join(fname_list))
 
-        fname = make_filename(
-            'rhi_profile', prdcfg['dstype'], prdcfg['voltype'],
-            ['csv'], prdcfginfo=prdcfginfo,
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])[0]
-
-        fname = savedir+fname
+        return fname_list
+    except EnvironmentError:
+        warn(
+            ' No data found at azimuth ' +
+            str(prdcfg['angle'])+'. Skipping product ' +
+            prdcfg['type'])
+        return None
 
-        if quantity == 'mode':
-            data.append(vals[:, 1])
-            labels.append('% points mode')
-            data.append(vals[:, 3])
-            labels.append('% points 2nd most common')
-            data.append(vals[:, 5])
-            labels.append('% points 3rd most common')
 
-        write_rhi_profile(
-            h_vec, data, val_valid, labels, fname, datatype=labelx,
-            timeinfo=prdcfg['timeinfo'])
+def _generate_rhi_contour_overplot(dataset, prdcfg):
+    """
+    Plots an RHI image with contours of another field. The user defined
+    parameters are documented in generate_vol_products
 
-        print('----- save to '+fname)
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a radar object
 
-        # TODO: add Cartesian interpolation option
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
 
-        return fname
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
 
-    if prdcfg['type'] == 'WIND_PROFILE':
-        # user defined parameters
-        heightResolution = prdcfg.get('heightResolution', 100.)
-        hmin_user = prdcfg.get('heightMin', None)
-        hmax_user = prdcfg.get('heightMax', None)
-        min_ele = prdcfg.get('min_ele', 5.)
-        max_ele = prdcfg.get('max_ele', 85.)
-
-        fixed_span = prdcfg.get('fixed_span', 1)
-        vmin = None
-        vmax = None
-        if fixed_span:
-            vmin, vmax = pyart.config.get_field_limits(
-                'eastward_wind_component')
-            if 'vmin' in prdcfg:
-                vmin = prdcfg['vmin']
-            if 'vmax' in prdcfg:
-                vmax = prdcfg['vmax']
-
-        u_vel = deepcopy(
-            dataset['radar_out'].fields['eastward_wind_component']['data'])
-        v_vel = deepcopy(
-            dataset['radar_out'].fields['northward_wind_component']['data'])
-        w_vel = deepcopy(
-            dataset['radar_out'].fields['vertical_wind_component']['data'])
-        std_vel = deepcopy(
-            dataset['radar_out'].fields['retrieved_velocity_std']['data'])
-        diff_vel = deepcopy(
-            dataset['radar_out'].fields['velocity_difference']['data'])
-
-        # remove azimuth information
-        u_vel_aux = np.ma.masked_all(
-            (dataset['radar_out'].nsweeps, dataset['radar_out'].ngates),
-            dtype=float)
-        v_vel_aux = np.ma.masked_all(
-            (dataset['radar_out'].nsweeps, dataset['radar_out'].ngates),
-            dtype=float)
-        w_vel_aux = np.ma.masked_all(
-            (dataset['radar_out'].nsweeps, dataset['radar_out'].ngates),
-            dtype=float)
-        std_vel_aux = np.ma.masked_all(
-            (dataset['radar_out'].nsweeps, dataset['radar_out'].ngates),
-            dtype=float)
-        ngates_aux = np.zeros(
-            (dataset['radar_out'].nsweeps, dataset['radar_out'].ngates),
-            dtype=int)
-        gate_altitude_aux = np.empty(
-            (dataset['radar_out'].nsweeps, dataset['radar_out'].ngates),
-            dtype=float)
-        for ind_sweep in range(dataset['radar_out'].nsweeps):
-            ind_start = (
-                dataset['radar_out'].sweep_start_ray_index['data'][ind_sweep])
-            ind_end = (
-                dataset['radar_out'].sweep_end_ray_index['data'][ind_sweep])
-            for ind_rng in range(dataset['radar_out'].ngates):
-                u_vel_aux[ind_sweep, ind_rng] = u_vel[ind_start, ind_rng]
-                v_vel_aux[ind_sweep, ind_rng] = v_vel[ind_start, ind_rng]
-                w_vel_aux[ind_sweep, ind_rng] = w_vel[ind_start, ind_rng]
-                std_vel_aux[ind_sweep, ind_rng] = std_vel[ind_start, ind_rng]
-                gate_altitude_aux[ind_sweep, ind_rng] = (
-                    dataset['radar_out'].gate_altitude['data'][
-                        ind_start, ind_rng])
-                ngates_aux[ind_sweep, ind_rng] = (
-                    diff_vel[ind_start:ind_end, ind_rng].compressed().size)
-
-        # exclude low elevations in the computation of vertical velocities
-        std_w_vel_aux = deepcopy(std_vel_aux)
-        ngates_w_aux = deepcopy(ngates_aux)
-        ind = np.where(dataset['radar_out'].fixed_angle['data'] < min_ele)[0]
-        if ind.size > 0:
-            w_vel_aux[ind, :] = np.ma.masked
-            std_w_vel_aux[ind, :] = np.ma.masked
-            ngates_w_aux[ind, :] = 0
-
-        # exclude hig elevations in the computation of horizontal velocities
-        ind = np.where(dataset['radar_out'].fixed_angle['data'] > max_ele)[0]
-        if ind.size > 0:
-            u_vel_aux[ind, :] = np.ma.masked
-            v_vel_aux[ind, :] = np.ma.masked
-            std_vel_aux[ind, :] = np.ma.masked
-            ngates_aux[ind, :] = 0
-
-        # compute quantities
-        if hmin_user is None:
-            minheight = (round(
-                np.min(dataset['radar_out'].gate_altitude['data']) /
-                heightResolution)*heightResolution-heightResolution)
-        else:
-            minheight = hmin_user
-        if hmax_user is None:
-            maxheight = (round(
-                np.max(dataset['radar_out'].gate_altitude['data']) /
-                heightResolution)*heightResolution+heightResolution)
-        else:
-            maxheight = hmax_user
-        nlevels = int((maxheight-minheight)/heightResolution)
-
-        h_vec = (
-            minheight+np.arange(nlevels)*heightResolution+heightResolution/2.)
-
-        u_vals, val_valid = compute_profile_stats(
-            u_vel_aux, gate_altitude_aux, h_vec, heightResolution,
-            quantity='regression_mean', std_field=std_vel_aux,
-            np_field=ngates_aux)
-        v_vals, val_valid = compute_profile_stats(
-            v_vel_aux, gate_altitude_aux, h_vec, heightResolution,
-            quantity='regression_mean', std_field=std_vel_aux,
-            np_field=ngates_aux)
-        w_vals, w_val_valid = compute_profile_stats(
-            w_vel_aux, gate_altitude_aux, h_vec, heightResolution,
-            quantity='regression_mean', std_field=std_w_vel_aux,
-            np_field=ngates_w_aux)
-
-        # plot u wind data
-        u_data = [u_vals[:, 0], u_vals[:, 0]+u_vals[:, 1],
-                  u_vals[:, 0]-u_vals[:, 1]]
-        labels = ['Regression mean', '+std', '-std']
-        colors = ['b', 'k', 'k']
-        linestyles = ['-', '--', '--']
+    """
 
-        labelx = get_colobar_label(
-            dataset['radar_out'].fields['eastward_wind_component'],
-            'eastward_wind_component')
-        titl = (
-            pyart.graph.common.generate_radar_time_begin(
-                dataset['radar_out']).isoformat() + 'Z' + '\n' +
-            get_field_name(
-                dataset['radar_out'].fields['eastward_wind_component'],
-                'eastward_wind_component'))
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdsavedir, timeinfo=prdcfg['timeinfo'])
+    contour_name = get_fieldname_pyart(prdcfg['contourtype'])
+    if contour_name not in dataset['radar_out'].fields:
+        warn(
+            'Contour type ' + contour_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
 
-        prdcfginfo = 'hres'+str(int(heightResolution))
-        fname_list = make_filename(
-            'wind_profile', prdcfg['dstype'], 'wind_vel_h_u',
-            prdcfg['imgformat'], prdcfginfo=prdcfginfo,
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+    contour_values = prdcfg.get('contour_values', None)
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+    ind_az, az = _angle_index(dataset['radar_out'], prdcfg['anglenr'])
 
-        plot_rhi_profile(
-            u_data, h_vec, fname_list, labelx=labelx, labely='Height (m MSL)',
-            labels=labels, title=titl, colors=colors,
-            linestyles=linestyles, vmin=vmin, vmax=vmax,
-            hmin=minheight, hmax=maxheight)
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
 
-        print('----- save to '+' '.join(fname_list))
+    fname_list = make_filename(
+        'rhi', prdcfg['dstype'],
+        prdcfg['voltype']+'-'+prdcfg['contourtype'],
+        prdcfg['imgformat'], prdcfginfo=f'az{az:.1f}',
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
 
-        # plot v wind data
-        v_data = [v_vals[:, 0], v_vals[:, 0]+v_vals[:, 1],
-                  v_vals[:, 0]-v_vals[:, 1]]
-        labels = ['Regression mean', '+std', '-std']
-        colors = ['b', 'k', 'k']
-        linestyles = ['-', '--', '--']
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
 
-        labelx = get_colobar_label(
-            dataset['radar_out'].fields['northward_wind_component'],
-            'northward_wind_component')
-        titl = (
-            pyart.graph.common.generate_radar_time_begin(
-                dataset['radar_out']).isoformat() + 'Z' + '\n' +
-            get_field_name(
-                dataset['radar_out'].fields['northward_wind_component'],
-                'northward_wind_component'))
+    titl = (
+        pyart.graph.common.generate_title(dataset['radar_out'],
+                                          field_name, ind_az)+' - ' +
+        pyart.graph.common.generate_field_name(dataset['radar_out'],
+                                               contour_name))
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdsavedir, timeinfo=prdcfg['timeinfo'])
+    fig, ax = plot_rhi(
+        dataset['radar_out'], field_name, ind_az, prdcfg, fname_list,
+        titl=titl, save_fig=False)
 
-        prdcfginfo = 'hres'+str(int(heightResolution))
-        fname_list = make_filename(
-            'wind_profile', prdcfg['dstype'], 'wind_vel_h_v',
-            prdcfg['imgformat'], prdcfginfo=prdcfginfo,
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+    fname_list = plot_rhi_contour(
+        dataset['radar_out'], contour_name, ind_az, prdcfg, fname_list,
+        contour_values=contour_values, ax=ax, fig=fig, save_fig=True)
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+    print('----- save to '+' '.join(fname_list))
 
-        plot_rhi_profile(
-            v_data, h_vec, fname_list, labelx=labelx, labely='Height (m MSL)',
-            labels=labels, title=titl, colors=colors,
-            linestyles=linestyles, vmin=vmin, vmax=vmax,
-            hmin=minheight, hmax=maxheight)
+    return fname_list
 
-        print('----- save to '+' '.join(fname_list))
 
-        # plot vertical wind data
-        w_data = [w_vals[:, 0], w_vals[:, 0]+w_vals[:, 1],
-                  w_vals[:, 0]-w_vals[:, 1]]
-        labels = ['Regression mean', '+std', '-std']
-        colors = ['b', 'k', 'k']
-        linestyles = ['-', '--', '--']
+def _generate_pseudorhi_contour_overplot(dataset, prdcfg):
+    """
+    Plots a pseudo-RHI image with contours of another field. The user defined
+    parameters are documented in generate_vol_products
 
-        labelx = get_colobar_label(
-            dataset['radar_out'].fields['vertical_wind_component'],
-            'vertical_wind_component')
-        titl = (
-            pyart.graph.common.generate_radar_time_begin(
-                dataset['radar_out']).isoformat() + 'Z' + '\n' +
-            get_field_name(
-                dataset['radar_out'].fields['vertical_wind_component'],
-                'vertical_wind_component'))
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a radar object
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdsavedir, timeinfo=prdcfg['timeinfo'])
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
 
-        prdcfginfo = 'hres'+str(int(heightResolution))
-        fname_list = make_filename(
-            'wind_profile', prdcfg['dstype'], 'wind_vel_v',
-            prdcfg['imgformat'], prdcfginfo=prdcfginfo,
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+    """
 
-        plot_rhi_profile(
-            w_data, h_vec, fname_list, labelx=labelx, labely='Height (m MSL)',
-            labels=labels, title=titl, colors=colors,
-            linestyles=linestyles, vmin=vmin, vmax=vmax,
-            hmin=minheight, hmax=maxheight)
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
 
-        print('----- save to '+' '.join(fname_list))
+    contour_name = get_fieldname_pyart(prdcfg['contourtype'])
+    if contour_name not in dataset['radar_out'].fields:
+        warn(
+            'Contour type ' + contour_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
 
-        # plot horizontal wind magnitude
-        mag = np.ma.sqrt(
-            np.ma.power(u_vals[:, 0], 2.)+np.ma.power(v_vals[:, 0], 2.))
-        mag_data = [mag]
-        labels = ['Regression mean']
-        colors = ['b']
-        linestyles = ['-']
+    contour_values = prdcfg.get('contour_values', None)
 
-        field_dict = pyart.config.get_metadata('wind_speed')
-        labelx = get_colobar_label(field_dict, 'wind_speed')
-        titl = (
-            pyart.graph.common.generate_radar_time_begin(
-                dataset['radar_out']).isoformat() + 'Z' + '\n' +
-            get_field_name(field_dict, 'wind_speed'))
+    try:
+        xsect = pyart.util.cross_section_ppi(
+            dataset['radar_out'], [prdcfg['angle']],
+            az_tol=prdcfg['AziTol'])
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdsavedir, timeinfo=prdcfg['timeinfo'])
+        savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
 
-        prdcfginfo = 'hres'+str(int(heightResolution))
         fname_list = make_filename(
-            'wind_profile', prdcfg['dstype'], 'WIND_SPEED',
-            prdcfg['imgformat'], prdcfginfo=prdcfginfo,
+            'rhi', prdcfg['dstype'],
+            prdcfg['voltype']+'-'+prdcfg['contourtype'],
+            prdcfg['imgformat'],
+            prdcfginfo=f"az{prdcfg['angle']:.1f}",
             timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+        fname_list = [
+            os.path.join(savedir, fname) for fname in fname_list]
+
+        titl = (
+            pyart.graph.common.generate_title(xsect, field_name, 0) +
+            ' - ' +
+            pyart.graph.common.generate_field_name(xsect, contour_name))
+
+        fig, ax = plot_rhi(xsect, field_name, 0, prdcfg, fname_list,
+                           titl=titl, save_fig=False)
 
-        plot_rhi_profile(
-            mag_data, h_vec, fname_list, labelx=labelx,
-            labely='Height (m MSL)', labels=labels, title=titl, colors=colors,
-            linestyles=linestyles, vmin=vmin, vmax=vmax, hmin=minheight,
-            hmax=maxheight)
+        fname_list = plot_rhi_contour(
+            xsect, contour_name, 0, prdcfg, fname_list,
+            contour_values=contour_values, ax=ax, fig=fig, save_fig=True)
 
         print('----- save to '+' '.join(fname_list))
 
-        # plot horizontal wind direction
-        wind_dir = (
-            90.-np.ma.arctan2(u_vals[:, 0]/mag, v_vals[:, 0]/mag)*180. /
-            np.pi+180.)
-        wind_dir[wind_dir >= 360.] = wind_dir[wind_dir >= 360.]-360.
-        dir_data = [wind_dir]
-        labels = ['Regression mean']
-        colors = ['b']
-        linestyles = ['-']
-
-        field_dict = pyart.config.get_metadata('wind_direction')
-        labelx = get_colobar_label(field_dict, 'wind_direction')
-        titl = (
-            pyart.graph.common.generate_radar_time_begin(
-                dataset['radar_out']).isoformat() + 'Z' + '\n' +
-            get_field_name(field_dict, 'wind_direction'))
+        return fname_list
+    except EnvironmentError:
+        warn(
+            ' No data found at azimuth ' +
+            str(prdcfg['angle'])+'. Skipping product ' +
+            prdcfg['type'])
+        return None
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdsavedir, timeinfo=prdcfg['timeinfo'])
 
-        prdcfginfo = 'hres'+str(int(heightResolution))
-        fname_list = make_filename(
-            'wind_profile', prdcfg['dstype'], 'WIND_DIRECTION',
-            prdcfg['imgformat'], prdcfginfo=prdcfginfo,
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+def _generate_rhi_contour(dataset, prdcfg):
+    """
+    Plots an RHI contour plot. The user defined parameters are documented in
+    generate_vol_products
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a radar object
 
-        plot_rhi_profile(
-            dir_data, h_vec, fname_list, labelx=labelx,
-            labely='Height (m MSL)', labels=labels, title=titl, colors=colors,
-            linestyles=linestyles, vmin=0., vmax=360.,
-            hmin=minheight, hmax=maxheight)
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
 
-        print('----- save to '+' '.join(fname_list))
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
 
-        fname = make_filename(
-            'wind_profile', prdcfg['dstype'], 'WIND',
-            ['csv'], prdcfginfo=prdcfginfo,
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])[0]
+    """
 
-        fname = savedir+fname
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
 
-        data = [
-            u_vals[:, 0], u_vals[:, 1], np.ma.asarray(val_valid),
-            v_vals[:, 0], v_vals[:, 1], np.ma.asarray(val_valid),
-            w_vals[:, 0], w_vals[:, 1], np.ma.asarray(w_val_valid),
-            mag, wind_dir]
-        labels = [
-            'u_wind', 'std_u_wind', 'np_u_wind',
-            'v_wind', 'std_v_wind', 'np_v_wind',
-            'w_wind', 'std_w_wind', 'np_w_wind',
-            'mag_h_wind', 'dir_h_wind']
+    contour_values = prdcfg.get('contour_values', None)
 
-        write_rhi_profile(
-            h_vec, data, val_valid, labels, fname, datatype=None,
-            timeinfo=prdcfg['timeinfo'])
+    ind_az, az = _angle_index(dataset['radar_out'], prdcfg['anglenr'])
 
-        print('----- save to '+fname)
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
 
-        return fname
+    fname_list = make_filename(
+        'rhi', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'], prdcfginfo=f'az{az:.1f}',
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
 
-    if prdcfg['type'] == 'PSEUDOPPI_MAP':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
 
-        try:
-            xsect = pyart.util.cross_section_rhi(
-                dataset['radar_out'], [prdcfg['angle']],
-                el_tol=prdcfg['EleTol'])
+    fname_list = plot_rhi_contour(
+        dataset['radar_out'], field_name, ind_az, prdcfg, fname_list,
+        contour_values=contour_values)
 
-            savedir = get_save_dir(
-                prdcfg['basepath'], prdcfg['procname'], dssavedir,
-                prdsavedir, timeinfo=prdcfg['timeinfo'])
+    print('----- save to '+' '.join(fname_list))
 
-            fname_list = make_filename(
-                'ppi', prdcfg['dstype'], prdcfg['voltype'],
-                prdcfg['imgformat'],
-                prdcfginfo='el'+'{:.1f}'.format(prdcfg['angle']),
-                timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+    return fname_list
 
-            for i, fname in enumerate(fname_list):
-                fname_list[i] = savedir+fname
 
-            plot_ppi_map(xsect, field_name, 0, prdcfg, fname_list)
+def _generate_pseudorhi_contour(dataset, prdcfg):
+    """
+    Plots a pseudo-RHI contour plot. The user defined parameters are documented
+    in generate_vol_products
 
-            print('----- save to '+' '.join(fname_list))
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a radar object
 
-            return fname_list
-        except EnvironmentError:
-            warn(
-                'No data found at elevation ' + str(prdcfg['angle']) +
-                '. Skipping product ' + prdcfg['type'])
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
 
-            return None
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
 
-    if prdcfg['type'] == 'CAPPI_IMAGE':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+    """
+
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
+
+    contour_values = prdcfg.get('contour_values', None)
+
+    try:
+        xsect = pyart.util.cross_section_ppi(
+            dataset['radar_out'], [prdcfg['angle']],
+            az_tol=prdcfg['AziTol'])
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdsavedir, timeinfo=prdcfg['timeinfo'])
+        savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
 
         fname_list = make_filename(
-            'cappi', prdcfg['dstype'], prdcfg['voltype'],
+            'rhi', prdcfg['dstype'], prdcfg['voltype'],
             prdcfg['imgformat'],
-            prdcfginfo='alt'+'{:.1f}'.format(prdcfg['altitude']),
+            prdcfginfo=f"az{prdcfg['angle']:.1f}",
             timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+        fname_list = [
+            os.path.join(savedir, fname) for fname in fname_list]
+
+        fname_list = plot_rhi_contour(
+            xsect, field_name, 0, prdcfg, fname_list,
+            contour_values=contour_values)
 
-        plot_cappi(
-            dataset['radar_out'], field_name, prdcfg['altitude'], prdcfg,
-            fname_list)
         print('----- save to '+' '.join(fname_list))
 
         return fname_list
+    except EnvironmentError:
+        warn(
+            ' No data found at azimuth ' +
+            str(prdcfg['angle'])+'. Skipping product ' +
+            prdcfg['type'])
+        return None
 
-    if prdcfg['type'] == 'FIXED_RNG_IMAGE':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
 
-        # user defined parameters
-        ang_tol = prdcfg.get('AngTol', 1.)
-        azi_res = prdcfg.get('azi_res', None)
-        ele_res = prdcfg.get('ele_res', None)
-        vmin = prdcfg.get('vmin', None)
-        vmax = prdcfg.get('vmax', None)
+def _generate_rhi_profile(dataset, prdcfg):
+    """
+    Plots and writes a vertical profile of statistics of an RHI. The user
+    defined parameters are documented in generate_vol_products
+
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a radar object
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
+
+    """
+
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
+
+    # user defined parameters
+    rangeStart = prdcfg.get('rangeStart', 0.)
+    rangeStop = prdcfg.get('rangeStop', 25000.)
+    heightResolution = prdcfg.get('heightResolution', 500.)
+    hmin_user = prdcfg.get('heightMin', None)
+    hmax_user = prdcfg.get('heightMax', None)
+    quantity = prdcfg.get('quantity', 'quantiles')
+    quantiles = prdcfg.get('quantiles', np.array([25., 50., 75.]))
+    nvalid_min = prdcfg.get('nvalid_min', 4)
+    make_linear = prdcfg.get('make_linear', 0)
+    include_nans = prdcfg.get('include_nans', 0)
+
+    fixed_span = prdcfg.get('fixed_span', 1)
+    vmin = None
+    vmax = None
+    if fixed_span:
+        vmin, vmax = pyart.config.get_field_limits(field_name)
+        vmin = prdcfg.get('vmin', vmin)
+        vmax = prdcfg.get('vmax', vmax)
+
+    # create new radar object with only data for the given rhi and range
+    ind_az, az = _angle_index(dataset['radar_out'], prdcfg['anglenr'])
+
+    new_dataset = dataset['radar_out'].extract_sweeps([ind_az])
+    field = new_dataset.fields[field_name]
+    # the range gates are sorted: the selected gates form a slice
+    rng_slice = slice(
+        np.searchsorted(new_dataset.range['data'], rangeStart, side='left'),
+        np.searchsorted(new_dataset.range['data'], rangeStop, side='right'))
+    field['data'] = field['data'][:, rng_slice]
+    new_dataset.range['data'] = new_dataset.range['data'][rng_slice]
+    new_dataset.ngates = len(new_dataset.range['data'])
+
+    # only the gate altitude is used. It is derived from gate_z so the
+    # Cartesian coordinates have to be reset to the new range as well
+    new_dataset.init_gate_x_y_z()
+    new_dataset.init_gate_altitude()
+
+    new_dataset.fields = dict()
+    new_dataset.add_field(field_name, field)
+
+    # compute quantities
+    minheight, maxheight, h_vec = _height_levels(
+        dataset['radar_out'].gate_altitude['data'], heightResolution,
+        hmin=hmin_user, hmax=hmax_user)
+    vals, val_valid = compute_profile_stats(
+        field['data'], new_dataset.gate_altitude['data'], h_vec,
+        heightResolution, quantity=quantity, quantiles=quantiles/100.,
+        nvalid_min=nvalid_min, make_linear=make_linear,
+        include_nans=include_nans)
+
+    # plot data
+    if quantity == 'mean':
+        data = [vals[:, 0], vals[:, 1], vals[:, 2]]
+        labels = ['Mean', 'Min', 'Max']
+        colors = ['b', 'k', 'k']
+        linestyles = ['-', '--', '--']
+    elif quantity == 'mode':
+        data = [vals[:, 0], vals[:, 2], vals[:, 4]]
+        labels = ['Mode', '2nd most common', '3rd most common']
+        colors = ['b', 'k', 'r']
+        linestyles = ['-', '--', '--']
+    else:
+        data = [vals[:, 1], vals[:, 0], vals[:, 2]]
+        labels = [
+            str(quantiles[1])+'-percentile',
+            str(quantiles[0])+'-percentile',
+            str(quantiles[2])+'-percentile']
+        colors = ['b', 'k', 'k']
+        linestyles = ['-', '--', '--']
+
+    labelx = get_colobar_label(
+        dataset['radar_out'].fields[field_name], field_name)
+    titl = (
+        pyart.graph.common.generate_radar_time_begin(
+            dataset['radar_out']).isoformat() + 'Z' + '\n' +
+        get_field_name(dataset['radar_out'].fields[field_name],
+                       field_name))
+
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
+
+    prdcfginfo = f'az{az:.1f}hres{int(heightResolution)}'
+    fname_list = make_filename(
+        'rhi_profile', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'],
+        prdcfginfo=prdcfginfo, timeinfo=prdcfg['timeinfo'],
+        runinfo=prdcfg['runinfo'])
+
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
+
+    plot_rhi_profile(
+        data, h_vec, fname_list, labelx=labelx, labely='Height (m MSL)',
+        labels=labels, title=titl, colors=colors,
+        linestyles=linestyles)
+
+    print('----- save to '+' '.join(fname_list))
+
+    fname = make_single_filename(
+        'rhi_profile', prdcfg['dstype'], prdcfg['voltype'], 'csv',
+        prdcfginfo=prdcfginfo, timeinfo=prdcfg['timeinfo'],
+        runinfo=prdcfg['runinfo'])
+    fname = os.path.join(savedir, fname)
+
+    if quantity == 'mode':
+        data.append(vals[:, 1])
+        labels.append('% points mode')
+        data.append(vals[:, 3])
+        labels.append('% points 2nd most common')
+        data.append(vals[:, 5])
+        labels.append('% points 3rd most common')
+
+    sector = {
+        'rmin': rangeStart,
+        'rmax': rangeStop,
+        'az': az
+    }
+    write_rhi_profile(
+        h_vec, data, val_valid, labels, fname, datatype=labelx,
+        timeinfo=prdcfg['timeinfo'], sector=sector)
+
+    print('----- save to '+fname)
+
+    # TODO: add Cartesian interpolation option
+
+    return fname
+
+
+def _generate_profile_stats(dataset, prdcfg):
+    """
+    Plots and writes a vertical profile of statistics. The user defined
+    parameters are documented in generate_vol_products
+
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a radar object
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
+
+    """
+
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
+
+    # mask unclassified data
+    field = deepcopy(dataset['radar_out'].fields[field_name]['data'])
+    if prdcfg['voltype'] in ('hydro', 'hydroc'):
+        field = np.ma.masked_equal(field, 1)
+
+    # user defined parameters
+    heightResolution = prdcfg.get('heightResolution', 100.)
+    hmin_user = prdcfg.get('heightMin', None)
+    hmax_user = prdcfg.get('heightMax', None)
+    quantity = prdcfg.get('quantity', 'quantiles')
+    quantiles = prdcfg.get('quantiles', np.array([25., 50., 75.]))
+    nvalid_min = prdcfg.get('nvalid_min', 4)
+    make_linear = prdcfg.get('make_linear', 0)
+    include_nans = prdcfg.get('include_nans', 0)
+
+    fixed_span = prdcfg.get('fixed_span', 1)
+    vmin = None
+    vmax = None
+    if fixed_span:
+        vmin, vmax = pyart.config.get_field_limits(field_name)
+        vmin = prdcfg.get('vmin', vmin)
+        vmax = prdcfg.get('vmax', vmax)
+
+    # compute quantities
+    minheight, maxheight, h_vec = _height_levels(
+        dataset['radar_out'].gate_altitude['data'], heightResolution,
+        hmin=hmin_user, hmax=hmax_user)
+    vals, val_valid = compute_profile_stats(
+        field, dataset['radar_out'].gate_altitude['data'], h_vec,
+        heightResolution, quantity=quantity, quantiles=quantiles/100.,
+        nvalid_min=nvalid_min, make_linear=make_linear,
+        include_nans=include_nans)
+
+    # plot data
+    if quantity == 'mean':
+        data = [vals[:, 0], vals[:, 1], vals[:, 2]]
+        labels = ['Mean', 'Min', 'Max']
+        colors = ['b', 'k', 'k']
+        linestyles = ['-', '--', '--']
+    elif quantity == 'mode':
+        data = [vals[:, 0], vals[:, 2], vals[:, 4]]
+        labels = ['Mode', '2nd most common', '3rd most common']
+        colors = ['b', 'k', 'r']
+        linestyles = ['-', '--', '--']
+    else:
+        data = [vals[:, 1], vals[:, 0], vals[:, 2]]
+        labels = [
+            str(quantiles[1])+'-percentile',
+            str(quantiles[0])+'-percentile',
+            str(quantiles[2])+'-percentile']
+        colors = ['b', 'k', 'k']
+        linestyles = ['-', '--', '--']
+
+    labelx = get_colobar_label(
+        dataset['radar_out'].fields[field_name], field_name)
+    titl = (
+        pyart.graph.common.generate_radar_time_begin(
+            dataset['radar_out']).isoformat() + 'Z' + '\n' +
+        get_field_name(dataset['radar_out'].fields[field_name],
+                       field_name))
+
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
+
+    prdcfginfo = f'hres{int(heightResolution)}'
+    fname_list = make_filename(
+        'rhi_profile', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'],
+        prdcfginfo=prdcfginfo, timeinfo=prdcfg['timeinfo'],
+        runinfo=prdcfg['runinfo'])
+
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
+
+    plot_rhi_profile(
+        data, h_vec, fname_list, labelx=labelx, labely='Height (m MSL)',
+        labels=labels, title=titl, colors=colors,
+        linestyles=linestyles, vmin=vmin, vmax=vmax,
+        hmin=minheight, hmax=maxheight)
+
+    print('----- save to '+' '.join(fname_list))
+
+    fname = make_single_filename(
+        'rhi_profile', prdcfg['dstype'], prdcfg['voltype'], 'csv',
+        prdcfginfo=prdcfginfo, timeinfo=prdcfg['timeinfo'],
+        runinfo=prdcfg['runinfo'])
+    fname = os.path.join(savedir, fname)
+
+    if quantity == 'mode':
+        data.append(vals[:, 1])
+        labels.append('% points mode')
+        data.append(vals[:, 3])
+        labels.append('% points 2nd most common')
+        data.append(vals[:, 5])
+        labels.append('% points 3rd most common')
+
+    write_rhi_profile(
+        h_vec, data, val_valid, labels, fname, datatype=labelx,
+        timeinfo=prdcfg['timeinfo'])
+
+    print('----- save to '+fname)
+
+    # TODO: add Cartesian interpolation option
+
+    return fname
+
+
+def _generate_wind_profile(dataset, prdcfg):
+    """
+    Plots and writes a vertical wind profile. The user defined parameters are
+    documented in generate_vol_products
+
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a radar object
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
+
+    """
+
+    # user defined parameters
+    heightResolution = prdcfg.get('heightResolution', 100.)
+    hmin_user = prdcfg.get('heightMin', None)
+    hmax_user = prdcfg.get('heightMax', None)
+    min_ele = prdcfg.get('min_ele', 5.)
+    max_ele = prdcfg.get('max_ele', 85.)
+
+    fixed_span = prdcfg.get('fixed_span', 1)
+    vmin = None
+    vmax = None
+    if fixed_span:
+        vmin, vmax = pyart.config.get_field_limits(
+            'eastward_wind_component')
+        vmin = prdcfg.get('vmin', vmin)
+        vmax = prdcfg.get('vmax', vmax)
+
+    u_vel = deepcopy(
+        dataset['radar_out'].fields['eastward_wind_component']['data'])
+    v_vel = deepcopy(
+        dataset['radar_out'].fields['northward_wind_component']['data'])
+    w_vel = deepcopy(
+        dataset['radar_out'].fields['vertical_wind_component']['data'])
+    std_vel = deepcopy(
+        dataset['radar_out'].fields['retrieved_velocity_std']['data'])
+    diff_vel = deepcopy(
+        dataset['radar_out'].fields['velocity_difference']['data'])
+
+    # remove azimuth information
+    u_vel_aux = np.ma.masked_all(
+        (dataset['radar_out'].nsweeps, dataset['radar_out'].ngates),
+        dtype=float)
+    v_vel_aux = np.ma.masked_all(
+        (dataset['radar_out'].nsweeps, dataset['radar_out'].ngates),
+        dtype=float)
+    w_vel_aux = np.ma.masked_all(
+        (dataset['radar_out'].nsweeps, dataset['radar_out'].ngates),
+        dtype=float)
+    std_vel_aux = np.ma.masked_all(
+        (dataset['radar_out'].nsweeps, dataset['radar_out'].ngates),
+        dtype=float)
+    ngates_aux = np.zeros(
+        (dataset['radar_out'].nsweeps, dataset['radar_out'].ngates),
+        dtype=int)
+    gate_altitude_aux = np.empty(
+        (dataset['radar_out'].nsweeps, dataset['radar_out'].ngates),
+        dtype=float)
+    for ind_sweep in range(dataset['radar_out'].nsweeps):
+        ind_start = (
+            dataset['radar_out'].sweep_start_ray_index['data'][ind_sweep])
+        ind_end = (
+            dataset['radar_out'].sweep_end_ray_index['data'][ind_sweep])
+        for ind_rng in range(dataset['radar_out'].ngates):
+            u_vel_aux[ind_sweep, ind_rng] = u_vel[ind_start, ind_rng]
+            v_vel_aux[ind_sweep, ind_rng] = v_vel[ind_start, ind_rng]
+            w_vel_aux[ind_sweep, ind_rng] = w_vel[ind_start, ind_rng]
+            std_vel_aux[ind_sweep, ind_rng] = std_vel[ind_start, ind_rng]
+            gate_altitude_aux[ind_sweep, ind_rng] = (
+                dataset['radar_out'].gate_altitude['data'][
+                    ind_start, ind_rng])
+            ngates_aux[ind_sweep, ind_rng] = np.ma.count(
+                diff_vel[ind_start:ind_end, ind_rng])
+
+    # exclude low elevations in the computation of vertical velocities
+    std_w_vel_aux = deepcopy(std_vel_aux)
+    ngates_w_aux = deepcopy(ngates_aux)
+    ind = np.where(dataset['radar_out'].fixed_angle['data'] < min_ele)[0]
+    if ind.size > 0:
+        w_vel_aux[ind, :] = np.ma.masked
+        std_w_vel_aux[ind, :] = np.ma.masked
+        ngates_w_aux[ind, :] = 0
+
+    # exclude hig elevations in the computation of horizontal velocities
+    ind = np.where(dataset['radar_out'].fixed_angle['data'] > max_ele)[0]
+    if ind.size > 0:
+        u_vel_aux[ind, :] = np.ma.masked
+        v_vel_aux[ind, :] = np.ma.masked
+        std_vel_aux[ind, :] = np.ma.masked
+        ngates_aux[ind, :] = 0
+
+    # compute quantities
+    minheight, maxheight, h_vec = _height_levels(
+        dataset['radar_out'].gate_altitude['data'], heightResolution,
+        hmin=hmin_user, hmax=hmax_user)
+
+    u_vals, val_valid = compute_profile_stats(
+        u_vel_aux, gate_altitude_aux, h_vec, heightResolution,
+        quantity='regression_mean', std_field=std_vel_aux,
+        np_field=ngates_aux)
+    v_vals, val_valid = compute_profile_stats(
+        v_vel_aux, gate_altitude_aux, h_vec, heightResolution,
+        quantity='regression_mean', std_field=std_vel_aux,
+        np_field=ngates_aux)
+    w_vals, w_val_valid = compute_profile_stats(
+        w_vel_aux, gate_altitude_aux, h_vec, heightResolution,
+        quantity='regression_mean', std_field=std_w_vel_aux,
+        np_field=ngates_w_aux)
+
+    # the title time, directory and file info are shared by all the plots
+    time_str = pyart.graph.common.generate_radar_time_begin(
+        dataset['radar_out']).isoformat() + 'Z'
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
+    prdcfginfo = f'hres{int(heightResolution)}'
+
+    # plot u wind data
+    u_data = [u_vals[:, 0], u_vals[:, 0]+u_vals[:, 1],
+              u_vals[:, 0]-u_vals[:, 1]]
+    labels = ['Regression mean', '+std', '-std']
+    colors = ['b', 'k', 'k']
+    linestyles = ['-', '--', '--']
+
+    labelx = get_colobar_label(
+        dataset['radar_out'].fields['eastward_wind_component'],
+        'eastward_wind_component')
+    titl = (
+        time_str + '\n' +
+        get_field_name(
+            dataset['radar_out'].fields['eastward_wind_component'],
+            'eastward_wind_component'))
+
+    fname_list = make_filename(
+        'wind_profile', prdcfg['dstype'], 'wind_vel_h_u',
+        prdcfg['imgformat'], prdcfginfo=prdcfginfo,
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
+
+    plot_rhi_profile(
+        u_data, h_vec, fname_list, labelx=labelx, labely='Height (m MSL)',
+        labels=labels, title=titl, colors=colors,
+        linestyles=linestyles, vmin=vmin, vmax=vmax,
+        hmin=minheight, hmax=maxheight)
+
+    print('----- save to '+' '.join(fname_list))
+
+    # plot v wind data
+    v_data = [v_vals[:, 0], v_vals[:, 0]+v_vals[:, 1],
+              v_vals[:, 0]-v_vals[:, 1]]
+    labels = ['Regression mean', '+std', '-std']
+    colors = ['b', 'k', 'k']
+    linestyles = ['-', '--', '--']
+
+    labelx = get_colobar_label(
+        dataset['radar_out'].fields['northward_wind_component'],
+        'northward_wind_component')
+    titl = (
+        time_str + '\n' +
+        get_field_name(
+            dataset['radar_out'].fields['northward_wind_component'],
+            'northward_wind_component'))
+
+    fname_list = make_filename(
+        'wind_profile', prdcfg['dstype'], 'wind_vel_h_v',
+        prdcfg['imgformat'], prdcfginfo=prdcfginfo,
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
+
+    plot_rhi_profile(
+        v_data, h_vec, fname_list, labelx=labelx, labely='Height (m MSL)',
+        labels=labels, title=titl, colors=colors,
+        linestyles=linestyles, vmin=vmin, vmax=vmax,
+        hmin=minheight, hmax=maxheight)
+
+    print('----- save to '+' '.join(fname_list))
+
+    # plot vertical wind data
+    w_data = [w_vals[:, 0], w_vals[:, 0]+w_vals[:, 1],
+              w_vals[:, 0]-w_vals[:, 1]]
+    labels = ['Regression mean', '+std', '-std']
+    colors = ['b', 'k', 'k']
+    linestyles = ['-', '--', '--']
+
+    labelx = get_colobar_label(
+        dataset['radar_out'].fields['vertical_wind_component'],
+        'vertical_wind_component')
+    titl = (
+        time_str + '\n' +
+        get_field_name(
+            dataset['radar_out'].fields['vertical_wind_component'],
+            'vertical_wind_component'))
+
+    fname_list = make_filename(
+        'wind_profile', prdcfg['dstype'], 'wind_vel_v',
+        prdcfg['imgformat'], prdcfginfo=prdcfginfo,
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
+
+    plot_rhi_profile(
+        w_data, h_vec, fname_list, labelx=labelx, labely='Height (m MSL)',
+        labels=labels, title=titl, colors=colors,
+        linestyles=linestyles, vmin=vmin, vmax=vmax,
+        hmin=minheight, hmax=maxheight)
+
+    print('----- save to '+' '.join(fname_list))
+
+    # plot horizontal wind magnitude
+    mag = np.ma.sqrt(
+        np.ma.power(u_vals[:, 0], 2.)+np.ma.power(v_vals[:, 0], 2.))
+    mag_data = [mag]
+    labels = ['Regression mean']
+    colors = ['b']
+    linestyles = ['-']
+
+    field_dict = get_field_metadata('wind_speed')
+    labelx = get_colobar_label(field_dict, 'wind_speed')
+    titl = (
+        time_str + '\n' +
+        get_field_name(field_dict, 'wind_speed'))
+
+    fname_list = make_filename(
+        'wind_profile', prdcfg['dstype'], 'WIND_SPEED',
+        prdcfg['imgformat'], prdcfginfo=prdcfginfo,
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
+
+    plot_rhi_profile(
+        mag_data, h_vec, fname_list, labelx=labelx,
+        labely='Height (m MSL)', labels=labels, title=titl, colors=colors,
+        linestyles=linestyles, vmin=vmin, vmax=vmax, hmin=minheight,
+        hmax=maxheight)
+
+    print('----- save to '+' '.join(fname_list))
+
+    # plot horizontal wind direction
+    wind_dir = (
+        90.-np.ma.arctan2(u_vals[:, 0]/mag, v_vals[:, 0]/mag)*180. /
+        np.pi+180.)
+    wind_dir[wind_dir >= 360.] = wind_dir[wind_dir >= 360.]-360.
+    dir_data = [wind_dir]
+    labels = ['Regression mean']
+    colors = ['b']
+    linestyles = ['-']
+
+    field_dict = get_field_metadata('wind_direction')
+    labelx = get_colobar_label(field_dict, 'wind_direction')
+    titl = (
+        time_str + '\n' +
+        get_field_name(field_dict, 'wind_direction'))
+
+    fname_list = make_filename(
+        'wind_profile', prdcfg['dstype'], 'WIND_DIRECTION',
+        prdcfg['imgformat'], prdcfginfo=prdcfginfo,
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
+
+    plot_rhi_profile(
+        dir_data, h_vec, fname_list, labelx=labelx,
+        labely='Height (m MSL)', labels=labels, title=titl, colors=colors,
+        linestyles=linestyles, vmin=0., vmax=360.,
+        hmin=minheight, hmax=maxheight)
+
+    print('----- save to '+' '.join(fname_list))
+
+    fname = make_single_filename(
+        'wind_profile', prdcfg['dstype'], 'WIND',
+        'csv', prdcfginfo=prdcfginfo,
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+
+    fname = os.path.join(savedir, fname)
+
+    data = [
+        u_vals[:, 0], u_vals[:, 1], np.ma.asarray(val_valid),
+        v_vals[:, 0], v_vals[:, 1], np.ma.asarray(val_valid),
+        w_vals[:, 0], w_vals[:, 1], np.ma.asarray(w_val_valid),
+        mag, wind_dir]
+    labels = [
+        'u_wind', 'std_u_wind', 'np_u_wind',
+        'v_wind', 'std_v_wind', 'np_v_wind',
+        'w_wind', 'std_w_wind', 'np_w_wind',
+        'mag_h_wind', 'dir_h_wind']
+
+    write_rhi_profile(
+        h_vec, data, val_valid, labels, fname, datatype=None,
+        timeinfo=prdcfg['timeinfo'])
+
+    print('----- save to '+fname)
+
+    return fname
+
+
+def _generate_pseudoppi_map(dataset, prdcfg):
+    """
+    Plots a pseudo-PPI image over a map. The user defined parameters are
+    documented in generate_vol_products
+
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a radar object
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
+
+    """
+
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
+
+    try:
+        xsect = pyart.util.cross_section_rhi(
+            dataset['radar_out'], [prdcfg['angle']],
+            el_tol=prdcfg['EleTol'])
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdsavedir, timeinfo=prdcfg['timeinfo'])
+        savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
 
         fname_list = make_filename(
-            'fixed_rng', prdcfg['dstype'], prdcfg['voltype'],
+            'ppi', prdcfg['dstype'], prdcfg['voltype'],
             prdcfg['imgformat'],
-            prdcfginfo='rng'+'{:.1f}'.format(
-                dataset['radar_out'].range['data'][0]),
+            prdcfginfo=f"el{prdcfg['angle']:.1f}",
             timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+        fname_list = [
+            os.path.join(savedir, fname) for fname in fname_list]
 
-        plot_fixed_rng(
-            dataset['radar_out'], field_name, prdcfg, fname_list,
-            azi_res=azi_res, ele_res=ele_res, ang_tol=ang_tol, vmin=vmin,
-            vmax=vmax)
+        plot_ppi_map(xsect, field_name, 0, prdcfg, fname_list)
 
         print('----- save to '+' '.join(fname_list))
 
         return fname_list
+    except EnvironmentError:
+        warn(
+            'No data found at elevation ' + str(prdcfg['angle']) +
+            '. Skipping product ' + prdcfg['type'])
+
+        return None
+
+
+def _generate_cappi_image(dataset, prdcfg):
+    """
+    Plots a CAPPI image. The user defined parameters are documented in
+    generate_vol_products
+
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a radar object
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
+
+    """
+
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
+
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
+
+    fname_list = make_filename(
+        'cappi', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'],
+        prdcfginfo=f"alt{prdcfg['altitude']:.1f}",
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
+
+    plot_cappi(
+        dataset['radar_out'], field_name, prdcfg['altitude'], prdcfg,
+        fname_list)
+    print('----- save to '+' '.join(fname_list))
+
+    return fname_list
+
+
+def _generate_fixed_rng_image(dataset, prdcfg):
+    """
+    Plots a fixed range image. The user defined parameters are documented in
+    generate_vol_products
+
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a radar object
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
+
+    """
+
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
+
+    # user defined parameters
+    ang_tol = prdcfg.get('AngTol', 1.)
+    azi_res = prdcfg.get('azi_res', None)
+    ele_res = prdcfg.get('ele_res', None)
+    vmin = prdcfg.get('vmin', None)
+    vmax = prdcfg.get('vmax', None)
+
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
+
+    fname_list = make_filename(
+        'fixed_rng', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'],
+        prdcfginfo=f"rng{dataset['radar_out'].range['data'][0]:.1f}",
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
+
+    plot_fixed_rng(
+        dataset['radar_out'], field_name, prdcfg, fname_list,
+        azi_res=azi_res, ele_res=ele_res, ang_tol=ang_tol, vmin=vmin,
+        vmax=vmax)
+
+    print('----- save to '+' '.join(fname_list))
+
+    return fname_list
+
+
+def _generate_fixed_rng_span_image(dataset, prdcfg):
+    """
+    Plots statistics of a span of fixed ranges. The user defined parameters are
+    documented in generate_vol_products
+
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a radar object
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
+
+    """
+
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
+
+    # user defined parameters
+    ang_tol = prdcfg.get('AngTol', 1.)
+    azi_res = prdcfg.get('azi_res', None)
+    ele_res = prdcfg.get('ele_res', None)
+    stat = prdcfg.get('stat', 'max')
+
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
+
+    fname_list = make_filename(
+        stat, prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'],
+        prdcfginfo=(
+            f"rng{dataset['radar_out'].range['data'][0]:.1f}-"
+            f"{dataset['radar_out'].range['data'][-1]:.1f}"),
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
+
+    plot_fixed_rng_span(
+        dataset['radar_out'], field_name, prdcfg, fname_list,
+        azi_res=azi_res, ele_res=ele_res, ang_tol=ang_tol, stat=stat)
+
+    print('----- save to '+' '.join(fname_list))
+
+    return fname_list
+
+
+def _generate_plot_along_coord(dataset, prdcfg):
+    """
+    Plots the data along a coordinate. The user defined parameters are
+    documented in generate_vol_products
+
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a radar object
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
 
-    if prdcfg['type'] == 'FIXED_RNG_SPAN_IMAGE':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
+
+    """
+
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
+
+    if ((dataset['radar_out'].scan_type != 'ppi') and
+            (dataset['radar_out'].scan_type != 'rhi')):
+        warn('This product is only available for PPI or RHI volumes')
+        return None
+
+    colors = prdcfg.get('colors', None)
+    if prdcfg['mode'] == 'ALONG_RNG':
+        value_start = prdcfg.get('value_start', 0.)
+        value_stop = prdcfg.get(
+            'value_stop', np.max(dataset['radar_out'].range['data']))
+        ang_tol = prdcfg.get('AngTol', 1.)
+
+        xvals, yvals, valid_azi, valid_ele = get_data_along_rng(
+            dataset['radar_out'], field_name, prdcfg['fix_elevations'],
+            prdcfg['fix_azimuths'], ang_tol=ang_tol, rmin=value_start,
+            rmax=value_stop)
+
+        if not yvals:
+            warn('No data found')
             return None
 
-        # user defined parameters
+        labelx = 'Range (m)'
+
+        labels = list()
+        for ele, azi in zip(valid_ele, valid_azi):
+            labels.append(
+                f'azi {azi:.1f} ele {ele:.1f}')
+
+    elif prdcfg['mode'] == 'ALONG_AZI':
+        value_start = prdcfg.get(
+            'value_start', np.min(dataset['radar_out'].azimuth['data']))
+        value_stop = prdcfg.get(
+            'value_stop', np.max(dataset['radar_out'].azimuth['data']))
         ang_tol = prdcfg.get('AngTol', 1.)
-        azi_res = prdcfg.get('azi_res', None)
-        ele_res = prdcfg.get('ele_res', None)
-        stat = prdcfg.get('stat', 'max')
+        rng_tol = prdcfg.get('RngTol', 50.)
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdsavedir, timeinfo=prdcfg['timeinfo'])
+        xvals, yvals, valid_rng, valid_ele = get_data_along_azi(
+            dataset['radar_out'], field_name, prdcfg['fix_ranges'],
+            prdcfg['fix_elevations'], rng_tol=rng_tol, ang_tol=ang_tol,
+            azi_start=value_start, azi_stop=value_stop)
 
-        fname_list = make_filename(
-            stat, prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'],
-            prdcfginfo='rng' +
-            '{:.1f}'.format(dataset['radar_out'].range['data'][0])+'-' +
-            '{:.1f}'.format(dataset['radar_out'].range['data'][-1]),
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+        if not yvals:
+            warn('No data found')
+            return None
+
+        labelx = 'Azimuth Angle (deg)'
+
+        labels = list()
+        for ele, rng in zip(valid_ele, valid_rng):
+            labels.append(
+                f'rng {rng:.1f} ele {ele:.1f}')
+
+    elif prdcfg['mode'] == 'ALONG_ELE':
+        value_start = prdcfg.get(
+            'value_start', np.min(dataset['radar_out'].elevation['data']))
+        value_stop = prdcfg.get(
+            'value_stop', np.max(dataset['radar_out'].elevation['data']))
+        ang_tol = prdcfg.get('AngTol', 1.)
+        rng_tol = prdcfg.get('RngTol', 50.)
+
+        xvals, yvals, valid_rng, valid_azi = get_data_along_ele(
+            dataset['radar_out'], field_name, prdcfg['fix_ranges'],
+            prdcfg['fix_azimuths'], rng_tol=rng_tol, ang_tol=ang_tol,
+            ele_min=value_start, ele_max=value_stop)
+
+        if not yvals:
+            warn('No data found')
+            return None
+
+        labelx = 'Elevation Angle (deg)'
+
+        labels = list()
+        for azi, rng in zip(valid_azi, valid_rng):
+            labels.append(
+                f'rng {rng:.1f} azi {azi:.1f}')
+    else:
+        warn('Unknown plotting mode '+prdcfg['mode'])
+        return None
+
+    labely = get_colobar_label(
+        dataset['radar_out'].fields[field_name], field_name)
+    titl = (
+        pyart.graph.common.generate_radar_time_begin(
+            dataset['radar_out']).isoformat() + 'Z' + '\n' +
+        get_field_name(
+            dataset['radar_out'].fields[field_name], field_name))
+
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
+
+    fname_list = make_filename(
+        prdcfg['mode'], prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'], timeinfo=prdcfg['timeinfo'],
+        runinfo=prdcfg['runinfo'])
+
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
+
+    plot_along_coord(
+        xvals, yvals, fname_list, labelx=labelx, labely=labely,
+        labels=labels, title=titl, colors=colors)
+
+    print('----- save to '+' '.join(fname_list))
+
+    return fname_list
+
+
+def _generate_bscope_image(dataset, prdcfg):
+    """
+    Plots a B-scope image. The user defined parameters are documented in
+    generate_vol_products
+
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a radar object
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
+
+    """
+
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
+
+    ray_dim = prdcfg.get('ray_dim', 'ang')
+    xaxis_rng = prdcfg.get('xaxis_rng', True)
+    vmin = prdcfg.get('vmin', None)
+    vmax = prdcfg.get('vmax', None)
+
+    ind_ang, ang = _angle_index(dataset['radar_out'], prdcfg['anglenr'])
+
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
+
+    fname_list = make_filename(
+        'b-scope', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'],
+        prdcfginfo=f'ang{ang:.1f}',
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
+
+    if dataset['radar_out'].rays_per_sweep['data'][ind_ang] > 1:
+        plot_bscope(
+            dataset['radar_out'], field_name, ind_ang, prdcfg, fname_list,
+            vmin=vmin, vmax=vmax, ray_dim=ray_dim, xaxis_rng=xaxis_rng)
+    else:
+        plot_ray(
+            dataset['radar_out'].extract_sweeps([ind_ang]), field_name, 0,
+            prdcfg, fname_list)
+    print('----- save to '+' '.join(fname_list))
+
+    return fname_list
+
+
+def _generate_time_range(dataset, prdcfg):
+    """
+    Plots a time-range image. The user defined parameters are documented in
+    generate_vol_products
+
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a radar object
+
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
+
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
+
+    """
+
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
+
+    vmin = prdcfg.get('vmin', None)
+    vmax = prdcfg.get('vmax', None)
+
+    ind_ang, ang = _angle_index(dataset['radar_out'], prdcfg['anglenr'])
+
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
+
+    fname_list = make_filename(
+        'time-range', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'],
+        prdcfginfo=f'ang{ang:.1f}',
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
 
-        plot_fixed_rng_span(
-            dataset['radar_out'], field_name, prdcfg, fname_list,
-            azi_res=azi_res, ele_res=ele_res, ang_tol=ang_tol, stat=stat)
+    if dataset['radar_out'].scan_type == 'ALONG_AZI':
+        ylabel = 'azimuth (deg)'
+    elif dataset['radar_out'].scan_type == 'ALONG_RNG':
+        ylabel = 'range (km)'
+    elif dataset['radar_out'].scan_type == 'ALONG_ELE':
+        ylabel = 'elevation (deg)'
+    else:
+        ylabel = 'range (km)'
 
-        print('----- save to '+' '.join(fname_list))
+    plot_time_range(
+        dataset['radar_out'], field_name, ind_ang, prdcfg, fname_list,
+        vmin=vmin, vmax=vmax, ylabel=ylabel)
+    print('----- save to '+' '.join(fname_list))
 
-        return fname_list
+    return fname_list
 
-    if prdcfg['type'] == 'PLOT_ALONG_COORD':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
 
-        if ((dataset['radar_out'].scan_type != 'ppi') and
-                (dataset['radar_out'].scan_type != 'rhi')):
-            warn('This product is only available for PPI or RHI volumes')
-            return None
+def _generate_histogram(dataset, prdcfg):
+    """
+    Plots and writes a histogram of the data. The user defined parameters are
+    documented in generate_vol_products
 
-        colors = prdcfg.get('colors', None)
-        if prdcfg['mode'] == 'ALONG_RNG':
-            value_start = prdcfg.get('value_start', 0.)
-            value_stop = prdcfg.get(
-                'value_stop', np.max(dataset['radar_out'].range['data']))
-            ang_tol = prdcfg.get('AngTol', 1.)
-
-            xvals, yvals, valid_azi, valid_ele = get_data_along_rng(
-                dataset['radar_out'], field_name, prdcfg['fix_elevations'],
-                prdcfg['fix_azimuths'], ang_tol=ang_tol, rmin=value_start,
-                rmax=value_stop)
-
-            if not yvals:
-                warn('No data found')
-                return None
-
-            labelx = 'Range (m)'
-
-            labels = list()
-            for ele, azi in zip(valid_ele, valid_azi):
-                labels.append(
-                    'azi '+'{:.1f}'.format(azi)+' ele '+'{:.1f}'.format(ele))
-
-        elif prdcfg['mode'] == 'ALONG_AZI':
-            value_start = prdcfg.get(
-                'value_start', np.min(dataset['radar_out'].azimuth['data']))
-            value_stop = prdcfg.get(
-                'value_stop', np.max(dataset['radar_out'].azimuth['data']))
-            ang_tol = prdcfg.get('AngTol', 1.)
-            rng_tol = prdcfg.get('RngTol', 50.)
-
-            xvals, yvals, valid_rng, valid_ele = get_data_along_azi(
-                dataset['radar_out'], field_name, prdcfg['fix_ranges'],
-                prdcfg['fix_elevations'], rng_tol=rng_tol, ang_tol=ang_tol,
-                azi_start=value_start, azi_stop=value_stop)
-
-            if not yvals:
-                warn('No data found')
-                return None
-
-            labelx = 'Azimuth Angle (deg)'
-
-            labels = list()
-            for ele, rng in zip(valid_ele, valid_rng):
-                labels.append(
-                    'rng '+'{:.1f}'.format(rng)+' ele '+'{:.1f}'.format(ele))
-
-        elif prdcfg['mode'] == 'ALONG_ELE':
-            value_start = prdcfg.get(
-                'value_start', np.min(dataset['radar_out'].elevation['data']))
-            value_stop = prdcfg.get(
-                'value_stop', np.max(dataset['radar_out'].elevation['data']))
-            ang_tol = prdcfg.get('AngTol', 1.)
-            rng_tol = prdcfg.get('RngTol', 50.)
-
-            xvals, yvals, valid_rng, valid_azi = get_data_along_ele(
-                dataset['radar_out'], field_name, prdcfg['fix_ranges'],
-                prdcfg['fix_azimuths'], rng_tol=rng_tol, ang_tol=ang_tol,
-                ele_min=value_start, ele_max=value_stop)
-
-            if not yvals:
-                warn('No data found')
-                return None
-
-            labelx = 'Elevation Angle (deg)'
-
-            labels = list()
-            for azi, rng in zip(valid_azi, valid_rng):
-                labels.append(
-                    'rng '+'{:.1f}'.format(rng)+' azi '+'{:.1f}'.format(azi))
-        else:
-            warn('Unknown plotting mode '+prdcfg['mode'])
-            return None
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a radar object
 
-        labely = get_colobar_label(
-            dataset['radar_out'].fields[field_name], field_name)
-        titl = (
-            pyart.graph.common.generate_radar_time_begin(
-                dataset['radar_out']).isoformat() + 'Z' + '\n' +
-            get_field_name(
-                dataset['radar_out'].fields[field_name], field_name))
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdsavedir, timeinfo=prdcfg['timeinfo'])
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
 
-        fname_list = make_filename(
-            prdcfg['mode'], prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'], timeinfo=prdcfg['timeinfo'],
-            runinfo=prdcfg['runinfo'])
+    """
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
 
-        plot_along_coord(
-            xvals, yvals, fname_list, labelx=labelx, labely=labely,
-            labels=labels, title=titl, colors=colors)
+    step = prdcfg.get('step', None)
+    write_data = prdcfg.get('write_data', 0)
 
-        print('----- save to '+' '.join(fname_list))
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
 
-        return fname_list
+    fname_list = make_filename(
+        'histogram', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'],
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
 
-    if prdcfg['type'] == 'BSCOPE_IMAGE':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
 
-        ray_dim = prdcfg.get('ray_dim', 'ang')
-        xaxis_rng = prdcfg.get('xaxis_rng', True)
-        vmin = prdcfg.get('vmin', None)
-        vmax = prdcfg.get('vmax', None)
+    bin_edges, values = compute_histogram(
+        dataset['radar_out'].fields[field_name]['data'], field_name,
+        step=step)
 
-        ang_vec = np.sort(dataset['radar_out'].fixed_angle['data'])
-        ang = ang_vec[prdcfg['anglenr']]
-        ind_ang = np.where(
-            dataset['radar_out'].fixed_angle['data'] == ang)[0][0]
+    titl = (
+        pyart.graph.common.generate_radar_time_begin(
+            dataset['radar_out']).isoformat() + 'Z' + '\n' +
+        get_field_name(
+            dataset['radar_out'].fields[field_name], field_name))
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdsavedir, timeinfo=prdcfg['timeinfo'])
+    labelx = get_colobar_label(
+        dataset['radar_out'].fields[field_name], field_name)
 
-        fname_list = make_filename(
-            'b-scope', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'],
-            prdcfginfo='ang'+'{:.1f}'.format(ang),
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+    plot_histogram(bin_edges, values, fname_list, labelx=labelx,
+                   labely='Number of Samples', titl=titl)
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+    print('----- save to '+' '.join(fname_list))
 
-        if dataset['radar_out'].rays_per_sweep['data'][ind_ang] > 1:
-            plot_bscope(
-                dataset['radar_out'], field_name, ind_ang, prdcfg, fname_list,
-                vmin=vmin, vmax=vmax, ray_dim=ray_dim, xaxis_rng=xaxis_rng)
-        else:
-            plot_ray(
-                dataset['radar_out'].extract_sweeps([ind_ang]), field_name, 0,
-                prdcfg, fname_list)
-        print('----- save to '+' '.join(fname_list))
+    if write_data:
+        fname = make_single_filename(
+            'histogram', prdcfg['dstype'], prdcfg['voltype'], 'csv',
+            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+        fname = os.path.join(savedir, fname)
 
-        return fname_list
+        hist = compute_histogram_counts(values, bin_edges)
+        write_histogram(
+            bin_edges, hist, fname, datatype=prdcfg['voltype'], step=step)
+        print('----- save to '+fname)
 
-    if prdcfg['type'] == 'TIME_RANGE':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+        return fname
 
-        vmin = prdcfg.get('vmin', None)
-        vmax = prdcfg.get('vmax', None)
+    return fname_list
 
-        ang_vec = np.sort(dataset['radar_out'].fixed_angle['data'])
-        ang = ang_vec[prdcfg['anglenr']]
-        ind_ang = np.where(
-            dataset['radar_out'].fixed_angle['data'] == ang)[0][0]
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdsavedir, timeinfo=prdcfg['timeinfo'])
+def _generate_samples_histogram(dataset, prdcfg):
+    """
+    Plots and writes a histogram of the data samples. The user defined
+    parameters are documented in generate_vol_products
 
-        fname_list = make_filename(
-            'time-range', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'],
-            prdcfginfo='ang'+'{:.1f}'.format(ang),
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a radar object
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
 
-        if dataset['radar_out'].scan_type == 'ALONG_AZI':
-            ylabel = 'azimuth (deg)'
-        elif dataset['radar_out'].scan_type == 'ALONG_RNG':
-            ylabel = 'range (km)'
-        elif dataset['radar_out'].scan_type == 'ALONG_ELE':
-            ylabel = 'elevation (deg)'
-        else:
-            ylabel = 'range (km)'
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
 
-        plot_time_range(
-            dataset['radar_out'], field_name, ind_ang, prdcfg, fname_list,
-            vmin=vmin, vmax=vmax, ylabel=ylabel)
-        print('----- save to '+' '.join(fname_list))
+    """
 
-        return fname_list
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
 
-    if prdcfg['type'] == 'HISTOGRAM':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+    if 'samples' not in dataset[field_name]:
+        warn('Unable to compute histogram. No samples')
+        return None
 
-        step = prdcfg.get('step', None)
-        write_data = prdcfg.get('write_data', 0)
+    step = prdcfg.get('step', None)
+    write_data = prdcfg.get('write_data', 0)
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdsavedir, timeinfo=prdcfg['timeinfo'])
+    timeformat = _FMT_DAY
+    if dataset[field_name]['bias_type'] == 'instant':
+        timeformat = _FMT_SEC
+    field_metadata = get_field_metadata(field_name)
+    titl = (
+        dataset[field_name]['timeinfo'].strftime(timeformat) + '\n' +
+        get_field_name(field_metadata, field_name))
 
-        fname_list = make_filename(
-            'histogram', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'],
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+    savedir = get_product_save_dir(prdcfg, dataset[field_name]['timeinfo'])
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+    fname_list = make_filename(
+        'histogram', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'], timeinfo=dataset[field_name]['timeinfo'],
+        runinfo=prdcfg['runinfo'])
 
-        bin_edges, values = compute_histogram(
-            dataset['radar_out'].fields[field_name]['data'], field_name,
-            step=step)
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
 
-        titl = (
-            pyart.graph.common.generate_radar_time_begin(
-                dataset['radar_out']).isoformat() + 'Z' + '\n' +
-            get_field_name(
-                dataset['radar_out'].fields[field_name], field_name))
+    bin_edges, values = compute_histogram(
+        dataset[field_name]['samples'], field_name, step=step)
 
-        labelx = get_colobar_label(
-            dataset['radar_out'].fields[field_name], field_name)
+    labelx = get_colobar_label(field_metadata, field_name)
 
-        plot_histogram(bin_edges, values, fname_list, labelx=labelx,
-                       labely='Number of Samples', titl=titl)
+    plot_histogram(bin_edges, values, fname_list, labelx=labelx,
+                   labely='Number of Samples', titl=titl)
 
-        print('----- save to '+' '.join(fname_list))
+    print('----- save to '+' '.join(fname_list))
 
-        if write_data:
-            fname = savedir+make_filename(
-                'histogram', prdcfg['dstype'], prdcfg['voltype'],
-                ['csv'], timeinfo=prdcfg['timeinfo'],
-                runinfo=prdcfg['runinfo'])[0]
+    if write_data:
+        fname = make_single_filename(
+            'histogram', prdcfg['dstype'], prdcfg['voltype'],
+            'csv', timeinfo=prdcfg['timeinfo'],
+            runinfo=prdcfg['runinfo'])
+        fname = os.path.join(savedir, fname)
 
-            hist, _ = np.histogram(values, bins=bin_edges)
-            write_histogram(
-                bin_edges, hist, fname, datatype=prdcfg['voltype'], step=step)
-            print('----- save to '+fname)
+        hist = compute_histogram_counts(values, bin_edges)
+        write_histogram(
+            bin_edges, hist, fname, datatype=prdcfg['voltype'], step=step)
+        print('----- save to '+fname)
 
-            return fname
+        return fname
 
-        return fname_list
+    return fname_list
 
-    if prdcfg['type'] == 'SAMPLES_HISTOGRAM':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
 
-        if 'samples' not in dataset[field_name]:
-            warn('Unable to compute histogram. No samples')
-            return None
+def _generate_quantiles(dataset, prdcfg):
+    """
+    Plots and writes the quantiles of the data. The user defined parameters are
+    documented in generate_vol_products
 
-        step = prdcfg.get('step', None)
-        write_data = prdcfg.get('write_data', 0)
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a radar object
 
-        timeformat = '%Y%m%d'
-        if dataset[field_name]['bias_type'] == 'instant':
-            timeformat = '%Y%m%d%H%M%S'
-        field_metadata = pyart.config.get_metadata(field_name)
-        titl = (
-            dataset[field_name]['timeinfo'].strftime(timeformat) + '\n' +
-            get_field_name(field_metadata, field_name))
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdsavedir, timeinfo=dataset[field_name]['timeinfo'])
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
 
-        fname_list = make_filename(
-            'histogram', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'], timeinfo=dataset[field_name]['timeinfo'],
-            runinfo=prdcfg['runinfo'])
+    """
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
 
-        bin_edges, values = compute_histogram(
-            dataset[field_name]['samples'], field_name, step=step)
+    # mask unclassified data
+    field = deepcopy(dataset['radar_out'].fields[field_name]['data'])
+    if prdcfg['voltype'] in ('hydro', 'hydroc'):
+        field = np.ma.masked_equal(field, 1)
 
-        labelx = get_colobar_label(field_metadata, field_name)
+    # user defined variables
+    quantiles = prdcfg.get('quantiles', None)
+    write_data = prdcfg.get('write_data', 0)
 
-        plot_histogram(bin_edges, values, fname_list, labelx=labelx,
-                       labely='Number of Samples', titl=titl)
+    fixed_span = prdcfg.get('fixed_span', 1)
+    vmin = None
+    vmax = None
+    if fixed_span:
+        vmin, vmax = pyart.config.get_field_limits(field_name)
+        vmin = prdcfg.get('vmin', vmin)
+        vmax = prdcfg.get('vmax', vmax)
 
-        print('----- save to '+' '.join(fname_list))
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
 
-        if write_data:
-            fname = savedir+make_filename(
-                'histogram', prdcfg['dstype'], prdcfg['voltype'],
-                ['csv'], timeinfo=prdcfg['timeinfo'],
-                runinfo=prdcfg['runinfo'])[0]
+    fname_list = make_filename(
+        'quantiles', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'],
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
 
-            hist, _ = np.histogram(values, bins=bin_edges)
-            write_histogram(
-                bin_edges, hist, fname, datatype=prdcfg['voltype'], step=step)
-            print('----- save to '+fname)
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
 
-            return fname
+    quantiles, values = compute_quantiles(field, quantiles=quantiles)
 
-        return fname_list
+    titl = (
+        pyart.graph.common.generate_radar_time_begin(
+            dataset['radar_out']).isoformat() + 'Z' + '\n' +
+        get_field_name(
+            dataset['radar_out'].fields[field_name], field_name))
 
-    if prdcfg['type'] == 'QUANTILES':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+    labely = get_colobar_label(
+        dataset['radar_out'].fields[field_name], field_name)
 
-        # mask unclassified data
-        field = deepcopy(dataset['radar_out'].fields[field_name]['data'])
-        if prdcfg['voltype'] in ('hydro', 'hydroc'):
-            field = np.ma.masked_equal(field, 1)
-
-        # user defined variables
-        quantiles = prdcfg.get('quantiles', None)
-        write_data = prdcfg.get('write_data', 0)
-
-        fixed_span = prdcfg.get('fixed_span', 1)
-        vmin = None
-        vmax = None
-        if fixed_span:
-            vmin, vmax = pyart.config.get_field_limits(field_name)
-            if 'vmin' in prdcfg:
-                vmin = prdcfg['vmin']
-            if 'vmax' in prdcfg:
-                vmax = prdcfg['vmax']
-
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdsavedir, timeinfo=prdcfg['timeinfo'])
+    plot_quantiles(quantiles, values, fname_list, labelx='quantile',
+                   labely=labely, titl=titl, vmin=vmin, vmax=vmax)
 
-        fname_list = make_filename(
-            'quantiles', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'],
+    print('----- save to '+' '.join(fname_list))
+
+    if write_data:
+        fname = make_single_filename(
+            'quantiles', prdcfg['dstype'], prdcfg['voltype'], 'csv',
             timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+        fname = os.path.join(savedir, fname)
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+        write_quantiles(
+            quantiles, values, fname, datatype=prdcfg['voltype'])
+        print('----- save to '+fname)
 
-        quantiles, values = compute_quantiles(field, quantiles=quantiles)
+        return fname
 
-        titl = (
-            pyart.graph.common.generate_radar_time_begin(
-                dataset['radar_out']).isoformat() + 'Z' + '\n' +
-            get_field_name(
-                dataset['radar_out'].fields[field_name], field_name))
+    return fname_list
 
-        labely = get_colobar_label(
-            dataset['radar_out'].fields[field_name], field_name)
 
-        plot_quantiles(quantiles, values, fname_list, labelx='quantile',
-                       labely=labely, titl=titl, vmin=vmin, vmax=vmax)
+def _generate_field_coverage(dataset, prdcfg):
+    """
+    Plots and writes the coverage of a field. The user defined parameters are
+    documented in generate_vol_products
 
-        print('----- save to '+' '.join(fname_list))
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a radar object
 
-        if write_data:
-            fname = savedir+make_filename(
-                'quantiles', prdcfg['dstype'], prdcfg['voltype'],
-                ['csv'], timeinfo=prdcfg['timeinfo'],
-                runinfo=prdcfg['runinfo'])[0]
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
 
-            write_quantiles(
-                quantiles, values, fname, datatype=prdcfg['voltype'])
-            print('----- save to '+fname)
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
 
-            return fname
+    """
 
-        return fname_list
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
+
+    threshold = prdcfg.get('threshold', None)
+    nvalid_min = prdcfg.get('nvalid_min', 5.)
+    ele_res = prdcfg.get('ele_res', 1.)
+    azi_res = prdcfg.get('azi_res', 2.)
+    ele_min = prdcfg.get('ele_min', 0.)
+    ele_max = prdcfg.get('ele_max', 30.)
+    ele_step = prdcfg.get('ele_step', 5.)
+    ele_sect_start = prdcfg.get('ele_sect_start', None)
+    ele_sect_stop = prdcfg.get('ele_sect_stop', None)
+    quantiles = prdcfg.get(
+        'quantiles',
+        np.array([10., 20., 30., 40., 50., 60., 70., 80., 90.]))
+
+    radar = dataset['radar_out']
+    rng = radar.range['data']
+    azimuth = radar.azimuth['data']
+    elevation = radar.elevation['data']
+
+    # get coverage per ray: distance between first and last valid gate
+    field = radar.fields[field_name]['data']
+    valid = ~np.ma.getmaskarray(field)
+    if threshold is not None:
+        valid &= np.ma.filled(field >= threshold, False)
+    ind_first = np.argmax(valid, axis=1)
+    ind_last = valid.shape[1]-1-np.argmax(valid[:, ::-1], axis=1)
+    field_coverage = np.ma.masked_where(
+        np.count_nonzero(valid, axis=1) <= nvalid_min,
+        rng[ind_last]-rng[ind_first])
+
+    # group coverage per elevation sectors
+    nsteps = int((ele_max-ele_min)/ele_step)  # number of steps
+    nele = int(ele_step/ele_res)  # number of elev per step
+    ele_steps_vec = np.arange(nsteps)*ele_step+ele_min
+
+    # the rays are sorted by elevation once so that the rays within the
+    # angle tolerance of each target elevation are a contiguous span
+    ele_targets = (
+        ele_steps_vec[:-1, np.newaxis]+np.arange(nele)*ele_res).reshape(-1)
+    ind_sort = np.argsort(elevation, kind='stable')
+    ele_sorted = elevation[ind_sort]
+    ind_start = np.searchsorted(
+        ele_sorted, ele_targets-prdcfg['AngTol'], side='right')
+    nrays_target = np.maximum(np.searchsorted(
+        ele_sorted, ele_targets+prdcfg['AngTol'], side='left')-ind_start, 0)
+
+    # gather the rays of all targets in the order of the targets
+    ind_bounds = np.append(0, np.cumsum(nrays_target))
+    ind_ray = ind_sort[
+        np.arange(ind_bounds[-1]) +
+        np.repeat(ind_start-ind_bounds[:-1], nrays_target)]
+
+    yval = []
+    xval = []
+    labels = []
+    for i in range(nsteps-1):
+        ind_sector = ind_ray[ind_bounds[i*nele]:ind_bounds[(i+1)*nele]]
+        yval.append(field_coverage[ind_sector])
+        xval.append(azimuth[ind_sector])
+        labels.append(
+            f'ele {ele_steps_vec[i]:.1f}-{ele_steps_vec[i+1]:.1f} deg')
+
+    # get mean value per azimuth for a specified elevation sector
+    xmeanval = None
+    ymeanval = None
+    quantval = None
+    labelmeanval = None
+    if ele_sect_start is not None and ele_sect_stop is not None:
+        ele_mask = np.logical_and(
+            elevation >= ele_sect_start, elevation <= ele_sect_stop)
+        field_coverage_sector = field_coverage[ele_mask]
+        azi_sector = azimuth[ele_mask]
+        azi_min = np.min(azimuth)
+        nazi = int((np.max(azimuth)-azi_min)/azi_res+1)
+
+        xmeanval = np.arange(nazi)*azi_res+azi_min
+
+        # mean coverage of the valid rays within the angle tolerance of
+        # each azimuth. The valid rays are sorted by azimuth so that the
+        # rays of each azimuth are a contiguous span of cumulative sums
+        is_valid = ~np.ma.getmaskarray(field_coverage_sector)
+        azi_valid = azi_sector[is_valid]
+        ind_sort = np.argsort(azi_valid, kind='stable')
+        azi_valid = azi_valid[ind_sort]
+        coverage_cumsum = np.append(0., np.cumsum(
+            np.ma.getdata(field_coverage_sector)[is_valid][ind_sort]))
+        ind_start = np.searchsorted(
+            azi_valid, xmeanval-prdcfg['AngTol'], side='right')
+        ind_end = np.searchsorted(
+            azi_valid, xmeanval+prdcfg['AngTol'], side='left')
+        nrays_azi = ind_end-ind_start
+        ymeanval = np.ma.masked_where(
+            nrays_azi == 0,
+            (coverage_cumsum[ind_end]-coverage_cumsum[ind_start]) /
+            np.maximum(nrays_azi, 1))
+        labelmeanval = (
+            f'ele {ele_sect_start:.1f}-{ele_sect_stop:.1f} deg mean val')
+
+        _, quantval, _ = quantiles_weighted(
+            field_coverage_sector, quantiles=quantiles/100.)
+
+    # plot field coverage
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
+
+    fname_list = make_filename(
+        'coverage', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'],
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
+
+    titl = (
+        pyart.graph.common.generate_radar_time_begin(
+            dataset['radar_out']).isoformat() + 'Z' + '\n' +
+        get_field_name(
+            dataset['radar_out'].fields[field_name], field_name))
+
+    plot_field_coverage(
+        xval, yval, fname_list, labels=labels, title=titl, ymin=0.,
+        ymax=np.max(rng)+60000.,
+        xmeanval=xmeanval, ymeanval=ymeanval, labelmeanval=labelmeanval)
+
+    print('----- save to '+' '.join(fname_list))
+
+    fname = make_single_filename(
+        'coverage', prdcfg['dstype'], prdcfg['voltype'], 'csv',
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+    fname = os.path.join(savedir, fname)
+
+    if quantval is not None:
+        data_type = get_colobar_label(
+            dataset['radar_out'].fields[field_name], field_name)
+        write_field_coverage(
+            quantiles, quantval, ele_sect_start, ele_sect_stop,
+            np.min(xmeanval), np.max(xmeanval), threshold, nvalid_min,
+            data_type, prdcfg['timeinfo'], fname)
 
-    if prdcfg['type'] == 'FIELD_COVERAGE':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+        print('----- save to '+fname)
 
-        threshold = prdcfg.get('threshold', None)
-        nvalid_min = prdcfg.get('nvalid_min', 5.)
-        ele_res = prdcfg.get('ele_res', 1.)
-        azi_res = prdcfg.get('azi_res', 2.)
-        ele_min = prdcfg.get('ele_min', 0.)
-        ele_max = prdcfg.get('ele_max', 30.)
-        ele_step = prdcfg.get('ele_step', 5.)
-        ele_sect_start = prdcfg.get('ele_sect_start', None)
-        ele_sect_stop = prdcfg.get('ele_sect_stop', None)
-        quantiles = prdcfg.get(
-            'quantiles',
-            np.array([10., 20., 30., 40., 50., 60., 70., 80., 90.]))
-
-        # get coverage per ray
-        field_coverage = np.ma.masked_all(dataset['radar_out'].nrays)
-
-        for i in range(dataset['radar_out'].nrays):
-            mask = np.ma.getmaskarray(
-                dataset['radar_out'].fields[field_name]['data'][i, :])
-            if threshold is not None:
-                ind = np.where(np.logical_and(
-                    ~mask,
-                    dataset['radar_out'].fields[field_name]['data'][i, :] >=
-                    threshold))[0]
-            else:
-                ind = np.where(~mask)[0]
-            if len(ind) > nvalid_min:
-                field_coverage[i] = (
-                    dataset['radar_out'].range['data'][ind[-1]] -
-                    dataset['radar_out'].range['data'][ind[0]])
-
-        # group coverage per elevation sectors
-        nsteps = int((ele_max-ele_min)/ele_step)  # number of steps
-        nele = int(ele_step/ele_res)  # number of elev per step
-        ele_steps_vec = np.arange(nsteps)*ele_step+ele_min
-
-        yval = []
-        xval = []
-        labels = []
-        for i in range(nsteps-1):
-            yval_aux = np.ma.array([])
-            xval_aux = np.array([])
-            for j in range(nele):
-                ele_target = ele_steps_vec[i]+j*ele_res
-                d_ele = np.abs(
-                    dataset['radar_out'].elevation['data']-ele_target)
-                ind_ele = np.where(d_ele < prdcfg['AngTol'])[0]
-                if ind_ele.size == 0:
-                    continue
-                yval_aux = np.ma.concatenate(
-                    [yval_aux, field_coverage[ind_ele]])
-                xval_aux = np.concatenate(
-                    [xval_aux, dataset['radar_out'].azimuth['data'][ind_ele]])
-            yval.append(yval_aux)
-            xval.append(xval_aux)
-            labels.append('ele '+'{:.1f}'.format(ele_steps_vec[i])+'-' +
-                          '{:.1f}'.format(ele_steps_vec[i+1])+' deg')
-
-        # get mean value per azimuth for a specified elevation sector
-        xmeanval = None
-        ymeanval = None
-        quantval = None
-        labelmeanval = None
-        if ele_sect_start is not None and ele_sect_stop is not None:
-            ind_ele = np.where(np.logical_and(
-                dataset['radar_out'].elevation['data'] >= ele_sect_start,
-                dataset['radar_out'].elevation['data'] <= ele_sect_stop))
-            field_coverage_sector = field_coverage[ind_ele]
-            azi_sector = dataset['radar_out'].azimuth['data'][ind_ele]
-            nazi = int((np.max(dataset['radar_out'].azimuth['data']) -
-                        np.min(dataset['radar_out'].azimuth['data'])) /
-                       azi_res+1)
-
-            xmeanval = np.arange(nazi)*azi_res+np.min(
-                dataset['radar_out'].azimuth['data'])
-            ymeanval = np.ma.masked_all(nazi)
-            for i in range(nazi):
-                d_azi = np.abs(azi_sector-xmeanval[i])
-                ind_azi = np.where(d_azi < prdcfg['AngTol'])[0]
-                if ind_azi.size == 0:
-                    continue
-                ymeanval[i] = np.ma.mean(field_coverage_sector[ind_azi])
-            labelmeanval = ('ele '+'{:.1f}'.format(ele_sect_start)+'-' +
-                            '{:.1f}'.format(ele_sect_stop)+' deg mean val')
-
-            _, quantval, _ = quantiles_weighted(
-                field_coverage_sector, quantiles=quantiles/100.)
-
-        # plot field coverage
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdsavedir, timeinfo=prdcfg['timeinfo'])
+    return fname
 
-        fname_list = make_filename(
-            'coverage', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'],
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+def _generate_cdf(dataset, prdcfg):
+    """
+    Plots and writes the cumulative density function of the data. The user
+    defined parameters are documented in generate_vol_products
 
-        titl = (
-            pyart.graph.common.generate_radar_time_begin(
-                dataset['radar_out']).isoformat() + 'Z' + '\n' +
-            get_field_name(
-                dataset['radar_out'].fields[field_name], field_name))
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a radar object
 
-        plot_field_coverage(
-            xval, yval, fname_list, labels=labels, title=titl, ymin=0.,
-            ymax=np.max(dataset['radar_out'].range['data'])+60000.,
-            xmeanval=xmeanval, ymeanval=ymeanval, labelmeanval=labelmeanval)
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
 
-        print('----- save to '+' '.join(fname_list))
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
 
-        fname = make_filename(
-            'coverage', prdcfg['dstype'], prdcfg['voltype'],
-            ['csv'], timeinfo=prdcfg['timeinfo'],
-            runinfo=prdcfg['runinfo'])[0]
+    """
 
-        fname = savedir+fname
+    radar = dataset['radar_out']
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in radar.fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
+
+    quantiles = prdcfg.get('quantiles', None)
+    sector_cfg = prdcfg.get('sector', dict())
+    sector = {
+        'rmin': sector_cfg.get('rmin', None),
+        'rmax': sector_cfg.get('rmax', None),
+        'azmin': sector_cfg.get('azmin', None),
+        'azmax': sector_cfg.get('azmax', None),
+        'elmin': sector_cfg.get('elmin', None),
+        'elmax': sector_cfg.get('elmax', None),
+        'hmin': sector_cfg.get('hmin', None),
+        'hmax': sector_cfg.get('hmax', None)}
+
+    vismin = prdcfg.get('vismin', None)
+    absolute = prdcfg.get('absolute', False)
+    use_nans = prdcfg.get('use_nans', False)
+    nan_value = prdcfg.get('nan_value', 0.)
+    filterclt = prdcfg.get('filterclt', False)
+    filterprec = prdcfg.get('filterprec', np.array([], dtype=int))
+
+    # define region of interest. Boolean indexing returns a copy of the
+    # gates in the region so the field of the dataset is not modified
+    roi_mask = get_ROI(radar, field_name, sector) == 1
+    data = radar.fields[field_name]['data'][roi_mask]
+
+    ntot = np.count_nonzero(roi_mask)
+
+    if ntot == 0:
+        warn('No radar gates found in sector')
+        return None
+
+    # get number of gates with clutter and mask them
+    nclut = -1
+    if filterclt:
+        echoID_field = get_fieldname_pyart('echoID')
+        if echoID_field in radar.fields:
+            is_clut = radar.fields[echoID_field]['data'][roi_mask] == 2
+            nclut = np.count_nonzero(is_clut)
+            data[is_clut] = np.ma.masked
+
+    # get number of blocked gates and filter according to visibility
+    nblocked = -1
+    if vismin is not None:
+        vis_field = get_fieldname_pyart('VIS')
+        if vis_field in radar.fields:
+            is_blocked = radar.fields[vis_field]['data'][roi_mask] < vismin
+            nblocked = np.count_nonzero(is_blocked)
+            data[is_blocked] = np.ma.masked
+
+    # filter according to precip type
+    nprec_filter = -1
+    if filterprec.size > 0:
+        hydro_field = get_fieldname_pyart('hydro')
+        if hydro_field in radar.fields:
+            is_prec = np.isin(
+                radar.fields[hydro_field]['data'][roi_mask], filterprec)
+            nprec_filter = np.count_nonzero(is_prec)
+            data[is_prec] = np.ma.masked
+
+    # data is a copy of the region of interest so it can be modified in
+    # place. The mask is not affected
+    if absolute:
+        np.abs(np.ma.getdata(data), out=np.ma.getdata(data))
+
+    # no mask array is allocated when no gate is masked
+    mask = np.ma.getmask(data)
+    nnan = 0 if mask is np.ma.nomask else np.count_nonzero(mask)
+
+    if nnan == ntot:
+        warn('No valid radar gates found in sector')
+        return None
+
+    if use_nans and nnan > 0:
+        data[mask] = nan_value
+
+    # count and filter outliers
+    _, values_lim = compute_quantiles(data, quantiles=[0.2, 99.8])
+    if values_lim.mask[0] or values_lim.mask[1]:
+        warn('No valid radar gates found in sector')
+        return None
+
+    data = data.compressed()
+    is_outlier = data < values_lim[0]
+    is_large = data > values_lim[1]
+    nsmall = np.count_nonzero(is_outlier)
+    nlarge = np.count_nonzero(is_large)
+    noutliers = nlarge+nsmall
+
+    # combine the masks in place to avoid further temporaries
+    is_outlier |= is_large
+    data = np.ma.asarray(data[np.logical_not(is_outlier, out=is_outlier)])
+
+    # number of values used for cdf computation
+    ncdf = data.size
+
+    quantiles, values = compute_quantiles(data, quantiles=quantiles)
+
+    # plot CDF
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
+
+    fname_list = make_filename(
+        'cdf', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'],
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
+
+    titl = (
+        pyart.graph.common.generate_radar_time_begin(radar).isoformat() +
+        'Z' + '\n' + get_field_name(radar.fields[field_name], field_name))
+
+    labelx = get_colobar_label(radar.fields[field_name], field_name)
+
+    plot_quantiles(values, quantiles/100., fname_list, labelx=labelx,
+                   labely='Cumulative probability', titl=titl)
+
+    print('----- save to '+' '.join(fname_list))
+
+    # store cdf values
+    fname = make_single_filename(
+        'cdf', prdcfg['dstype'], prdcfg['voltype'], 'txt',
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+    fname = os.path.join(savedir, fname)
+
+    write_cdf(
+        quantiles, values, ntot, nnan, nclut, nblocked, nprec_filter,
+        noutliers, ncdf, fname, use_nans=use_nans, nan_value=nan_value,
+        filterprec=filterprec, vismin=vismin, sector=sector,
+        datatype=labelx, timeinfo=prdcfg['timeinfo'])
+
+    print('----- save to '+fname)
+
+    return fname
+
+
+def _generate_selfconsistency(dataset, prdcfg):
+    """
+    Plots the ZDR-KDP/Zh self-consistency relation. The user defined parameters
+    are documented in generate_vol_products
 
-        if quantval is not None:
-            data_type = get_colobar_label(
-                dataset['radar_out'].fields[field_name], field_name)
-            write_field_coverage(
-                quantiles, quantval, ele_sect_start, ele_sect_stop,
-                np.min(xmeanval), np.max(xmeanval), threshold, nvalid_min,
-                data_type, prdcfg['timeinfo'], fname)
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a radar object
 
-            print('----- save to '+fname)
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
 
-        return fname
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
 
-    if prdcfg['type'] == 'CDF':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+    """
 
-        quantiles = prdcfg.get('quantiles', None)
-        sector = {
-            'rmin': None,
-            'rmax': None,
-            'azmin': None,
-            'azmax': None,
-            'elmin': None,
-            'elmax': None,
-            'hmin': None,
-            'hmax': None}
-
-        if 'sector' in prdcfg:
-            if 'rmin' in prdcfg['sector']:
-                sector['rmin'] = prdcfg['sector']['rmin']
-            if 'rmax' in prdcfg['sector']:
-                sector['rmax'] = prdcfg['sector']['rmax']
-            if 'azmin' in prdcfg['sector']:
-                sector['azmin'] = prdcfg['sector']['azmin']
-            if 'azmax' in prdcfg['sector']:
-                sector['azmax'] = prdcfg['sector']['azmax']
-            if 'elmin' in prdcfg['sector']:
-                sector['elmin'] = prdcfg['sector']['elmin']
-            if 'elmax' in prdcfg['sector']:
-                sector['elmax'] = prdcfg['sector']['elmax']
-            if 'hmin' in prdcfg['sector']:
-                sector['hmin'] = prdcfg['sector']['hmin']
-            if 'hmax' in prdcfg['sector']:
-                sector['hmax'] = prdcfg['sector']['hmax']
-
-        vismin = prdcfg.get('vismin', None)
-        absolute = prdcfg.get('absolute', False)
-        use_nans = prdcfg.get('use_nans', False)
-        nan_value = prdcfg.get('nan_value', 0.)
-        filterclt = prdcfg.get('filterclt', False)
-        filterprec = prdcfg.get('filterprec', np.array([], dtype=int))
-
-        data = deepcopy(dataset['radar_out'].fields[field_name]['data'])
-
-        # define region of interest
-        roi_flag = get_ROI(dataset['radar_out'], field_name, sector)
-        data = data[roi_flag == 1]
-
-        ntot = np.size(roi_flag[roi_flag == 1])
-
-        if ntot == 0:
-            warn('No radar gates found in sector')
-            return None
+    if 'selfconsistency_points' not in dataset:
+        return None
 
-        # get number of gates with clutter and mask them
-        nclut = -1
-        if filterclt:
-            echoID_field = get_fieldname_pyart('echoID')
-            if echoID_field in dataset['radar_out'].fields:
-                echoID_ROI = (
-                    dataset['radar_out'].fields[echoID_field]['data'][
-                        roi_flag == 1])
-                nclut = len(echoID_ROI[echoID_ROI == 2])
-                data[echoID_ROI == 2] = np.ma.masked
-
-        # get number of blocked gates and filter according to visibility
-        nblocked = -1
-        if vismin is not None:
-            vis_field = get_fieldname_pyart('VIS')
-            if vis_field in dataset['radar_out'].fields:
-                vis_ROI = (
-                    dataset['radar_out'].fields[vis_field]['data'][
-                        roi_flag == 1])
-                nblocked = len(vis_ROI[vis_ROI < vismin])
-                data[vis_ROI < vismin] = np.ma.masked
-
-        # filter according to precip type
-        nprec_filter = -1
-        if filterprec.size > 0:
-            hydro_field = get_fieldname_pyart('hydro')
-            if hydro_field in dataset['radar_out'].fields:
-                hydro_ROI = (
-                    dataset['radar_out'].fields[hydro_field]['data'][
-                        roi_flag == 1])
-                nprec_filter = 0
-                for ind_hydro in filterprec:
-                    nprec_filter += len(hydro_ROI[hydro_ROI == ind_hydro])
-                    data[hydro_ROI == ind_hydro] = np.ma.masked
-
-        if absolute:
-            data = np.ma.abs(data)
-
-        mask = np.ma.getmaskarray(data)
-        nnan = np.count_nonzero(mask)
-
-        if nnan == ntot:
-            warn('No valid radar gates found in sector')
-            return None
+    retrieve_relation = prdcfg.get('retrieve_relation', True)
+    plot_theoretical = prdcfg.get('plot_theoretical', True)
+    normalize = prdcfg.get('normalize', True)
 
-        if use_nans:
-            data[mask] = nan_value
+    timeinfo = dataset['selfconsistency_points']['timeinfo']
+    savedir = get_product_save_dir(prdcfg, timeinfo)
 
-        # count and filter outliers
-        _, values_lim = compute_quantiles(data, quantiles=[0.2, 99.8])
-        if values_lim.mask[0] or values_lim.mask[1]:
-            warn('No valid radar gates found in sector')
-            return None
+    fname_list = make_filename(
+        'selfconsistency', prdcfg['dstype'], 'selfconsistency',
+        prdcfg['imgformat'], timeinfo=timeinfo, runinfo=prdcfg['runinfo'],
+        timeformat=_FMT_DAY)
 
-        nsmall = np.count_nonzero(data.compressed() < values_lim[0])
-        nlarge = np.count_nonzero(data.compressed() > values_lim[1])
-        noutliers = nlarge+nsmall
-        data = data[np.logical_and(
-            data >= values_lim[0], data <= values_lim[1])]
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
 
-        # number of values used for cdf computation
-        ncdf = np.size(data.compressed())
+    fname_list = plot_selfconsistency_instrument(
+        np.array(dataset['selfconsistency_points']['zdr']),
+        np.array(dataset['selfconsistency_points']['kdp']),
+        np.array(dataset['selfconsistency_points']['zh']), fname_list,
+        parametrization=dataset['selfconsistency_points']['parametrization'],
+        zdr_kdpzh_dict=dataset['selfconsistency_points']['zdr_kdpzh_dict'],
+        normalize=normalize, retrieve_relation=retrieve_relation,
+        plot_theoretical=plot_theoretical)
 
-        quantiles, values = compute_quantiles(data, quantiles=quantiles)
+    print('----- save to '+' '.join(fname_list))
 
-        # plot CDF
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdsavedir, timeinfo=prdcfg['timeinfo'])
+    return fname_list
 
-        fname_list = make_filename(
-            'cdf', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'],
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
 
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
+def _generate_selfconsistency2(dataset, prdcfg):
+    """
+    Plots the ZDR-KDP/Zh self-consistency relation against the theoretical one.
+    The user defined parameters are documented in generate_vol_products
 
-        titl = (
-            pyart.graph.common.generate_radar_time_begin(
-                dataset['radar_out']).isoformat() + 'Z' + '\n' +
-            get_field_name(
-                dataset['radar_out'].fields[field_name], field_name))
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a radar object
 
-        labelx = get_colobar_label(
-            dataset['radar_out'].fields[field_name], field_name)
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
 
-        plot_quantiles(values, quantiles/100., fname_list, labelx=labelx,
-                       labely='Cumulative probability', titl=titl)
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
 
-        print('----- save to '+' '.join(fname_list))
+    """
 
-        # store cdf values
-        fname = make_filename(
-            'cdf', prdcfg['dstype'], prdcfg['voltype'],
-            ['txt'], timeinfo=prdcfg['timeinfo'],
-            runinfo=prdcfg['runinfo'])[0]
+    if 'selfconsistency_points' not in dataset:
+        return None
 
-        fname = savedir+fname
+    normalize = prdcfg.get('normalize', True)
 
-        write_cdf(
-            quantiles, values, ntot, nnan, nclut, nblocked, nprec_filter,
-            noutliers, ncdf, fname, use_nans=use_nans, nan_value=nan_value,
-            filterprec=filterprec, vismin=vismin, sector=sector,
-            datatype=labelx, timeinfo=prdcfg['timeinfo'])
+    timeinfo = dataset['selfconsistency_points']['timeinfo']
+    savedir = get_product_save_dir(prdcfg, timeinfo)
 
-        print('----- save to '+fname)
+    fname_list = make_filename(
+        'selfconsistency2', prdcfg['dstype'], 'selfconsistency2',
+        prdcfg['imgformat'], timeinfo=timeinfo, runinfo=prdcfg['runinfo'],
+        timeformat=_FMT_DAY)
 
-        return fname
+    fname_list = [os.path.join(savedir, fname) for fname in fname_list]
 
-    if prdcfg['type'] == 'SELFCONSISTENCY':
-        if 'selfconsistency_points' not in dataset:
-            return None
+    fname_list = plot_selfconsistency_instrument2(
+        np.array(dataset['selfconsistency_points']['zdr']),
+        np.array(dataset['selfconsistency_points']['kdp']),
+        10.*np.ma.log10(np.array(dataset['selfconsistency_points']['zh'])),
+        fname_list,
+        parametrization=dataset['selfconsistency_points']['parametrization'],
+        zdr_kdpzh_dict=dataset['selfconsistency_points']['zdr_kdpzh_dict'],
+        normalize=normalize)
 
-        retrieve_relation = prdcfg.get('retrieve_relation', True)
-        plot_theoretical = prdcfg.get('plot_theoretical', True)
-        normalize = prdcfg.get('normalize', True)
+    print('----- save to '+' '.join(fname_list))
 
-        timeinfo = dataset['selfconsistency_points']['timeinfo']
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdsavedir, timeinfo=timeinfo)
+    return fname_list
 
-        fname_list = make_filename(
-            'selfconsistency', prdcfg['dstype'], 'selfconsistency',
-            prdcfg['imgformat'], timeinfo=timeinfo, runinfo=prdcfg['runinfo'],
-            timeformat='%Y%m%d')
-
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
-
-        fname_list = plot_selfconsistency_instrument(
-            np.array(dataset['selfconsistency_points']['zdr']),
-            np.array(dataset['selfconsistency_points']['kdp']),
-            np.array(dataset['selfconsistency_points']['zh']), fname_list,
-            parametrization=dataset['selfconsistency_points']['parametrization'],
-            zdr_kdpzh_dict=dataset['selfconsistency_points']['zdr_kdpzh_dict'],
-            normalize=normalize, retrieve_relation=retrieve_relation,
-            plot_theoretical=plot_theoretical)
 
-        print('----- save to '+' '.join(fname_list))
+def _generate_vol_ts(dataset, prdcfg):
+    """
+    Writes and plots a monitoring time series of the data. The user defined
+    parameters are documented in generate_vol_products
 
-        return fname_list
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a radar object
 
-    if prdcfg['type'] == 'SELFCONSISTENCY2':
-        if 'selfconsistency_points' not in dataset:
-            return None
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
 
-        normalize = prdcfg.get('normalize', True)
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
 
-        timeinfo = dataset['selfconsistency_points']['timeinfo']
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdsavedir, timeinfo=timeinfo)
+    """
 
-        fname_list = make_filename(
-            'selfconsistency2', prdcfg['dstype'], 'selfconsistency2',
-            prdcfg['imgformat'], timeinfo=timeinfo, runinfo=prdcfg['runinfo'],
-            timeformat='%Y%m%d')
-
-        for i, fname in enumerate(fname_list):
-            fname_list[i] = savedir+fname
-
-        fname_list = plot_selfconsistency_instrument2(
-            np.array(dataset['selfconsistency_points']['zdr']),
-            np.array(dataset['selfconsistency_points']['kdp']),
-            10.*np.ma.log10(np.array(dataset['selfconsistency_points']['zh'])),
-            fname_list,
-            parametrization=dataset['selfconsistency_points']['parametrization'],
-            zdr_kdpzh_dict=dataset['selfconsistency_points']['zdr_kdpzh_dict'],
-            normalize=normalize)
+    # Time series of a value
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
+
+    # check the type of dataset required
+    bias_type = prdcfg.get('bias_type', 'cumulative')
+    if dataset[field_name]['bias_type'] != bias_type:
+        return None
+
+    # put time info in file path and name
+    csvtimeinfo_path = None
+    csvtimeinfo_file = None
+    timeformat = None
+    if bias_type == 'instant':
+        csvtimeinfo_path = dataset[field_name]['timeinfo']
+        csvtimeinfo_file = dataset[field_name]['timeinfo']
+        timeformat = _FMT_DAY
+    if prdcfg.get('add_date_in_fname', False):
+        csvtimeinfo_file = dataset[field_name]['timeinfo']
+        timeformat = _FMT_YEAR
+
+    quantiles = prdcfg.get('quantiles', np.array([25., 75.]))
+    ref_value = prdcfg.get('ref_value', 0.)
+    sort_by_date = prdcfg.get('sort_by_date', False)
+    rewrite = prdcfg.get('rewrite', False)
+
+    savedir = get_product_save_dir(
+        prdcfg, csvtimeinfo_path, prdsavedir=prdcfg['prdname'])
+
+    csvfname = make_single_filename(
+        'ts', prdcfg['dstype'], prdcfg['voltype'], 'csv',
+        timeinfo=csvtimeinfo_file, timeformat=timeformat,
+        runinfo=prdcfg['runinfo'])
+
+    csvfname = os.path.join(savedir, csvfname)
+
+    start_time = dataset[field_name]['timeinfo']
+
+    values = np.ma.masked_all(3)
+    values[1] = dataset[field_name]['value']
+    if 'samples' in dataset[field_name]:
+        values[0], values[2] = np.percentile(
+            dataset[field_name]['samples'].compressed(), quantiles[:2])
+
+    write_monitoring_ts(
+        start_time, dataset[field_name]['npoints'], values,
+        [quantiles[0], 'value', quantiles[1]],
+        prdcfg['voltype'], csvfname)
+    print('saved CSV file: '+csvfname)
+
+    date, np_t_vec, cquant_vec, lquant_vec, hquant_vec = (
+        read_monitoring_ts(csvfname, sort_by_date=sort_by_date))
+
+    if date is None:
+        warn(
+            'Unable to plot time series. No valid data')
+        return None
+
+    if rewrite:
+        val_vec = np.ma.asarray(
+            [lquant_vec, cquant_vec, hquant_vec]).T
+        write_monitoring_ts(
+            date, np_t_vec, val_vec, quantiles, prdcfg['voltype'],
+            csvfname, rewrite=True)
+
+    figtimeinfo = None
+    titldate = ''
+    if bias_type == 'instant':
+        figtimeinfo = date[0]
+        titldate = date[0].strftime(_FMT_ISO_DAY)
+    else:
+        titldate = (date[0].strftime(_FMT_DAY)+'-' +
+                    date[-1].strftime(_FMT_DAY))
+        if prdcfg.get('add_date_in_fname', False):
+            figtimeinfo = date[0]
+            timeformat = _FMT_YEAR
 
-        print('----- save to '+' '.join(fname_list))
+    figfname_list = make_filename(
+        'ts', prdcfg['dstype'], prdcfg['voltype'],
+        prdcfg['imgformat'],
+        timeinfo=figtimeinfo, timeformat=timeformat,
+        runinfo=prdcfg['runinfo'])
 
-        return fname_list
+    figfname_list = [
+        os.path.join(savedir, figfname) for figfname in figfname_list]
 
-    if prdcfg['type'] == 'VOL_TS':
-        # Time series of a value
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+    titl = (prdcfg['runinfo']+' Monitoring '+titldate)
 
-        # check the type of dataset required
-        bias_type = prdcfg.get('bias_type', 'cumulative')
-        if dataset[field_name]['bias_type'] != bias_type:
-            return None
+    labely = generate_field_name_str(prdcfg['voltype'])
 
-        # put time info in file path and name
-        csvtimeinfo_path = None
-        csvtimeinfo_file = None
-        timeformat = None
-        if bias_type == 'instant':
-            csvtimeinfo_path = dataset[field_name]['timeinfo']
-            csvtimeinfo_file = dataset[field_name]['timeinfo']
-            timeformat = '%Y%m%d'
-        if prdcfg.get('add_date_in_fname', False):
-            csvtimeinfo_file = dataset[field_name]['timeinfo']
-            timeformat = '%Y'
+    np_min = prdcfg.get('npoints_min', 0)
+    vmin = prdcfg.get('vmin', None)
+    vmax = prdcfg.get('vmax', None)
 
-        quantiles = prdcfg.get('quantiles', np.array([25., 75.]))
-        ref_value = prdcfg.get('ref_value', 0.)
-        sort_by_date = prdcfg.get('sort_by_date', False)
-        rewrite = prdcfg.get('rewrite', False)
+    plot_monitoring_ts(
+        date, np_t_vec, cquant_vec, lquant_vec, hquant_vec, field_name,
+        figfname_list, ref_value=ref_value, vmin=vmin, vmax=vmax,
+        np_min=np_min, labelx='Time UTC', labely=labely, titl=titl)
+    print('----- save to '+' '.join(figfname_list))
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdcfg['prdname'], timeinfo=csvtimeinfo_path)
+    # generate alarms if needed
+    alarm = prdcfg.get('alarm', False)
+    if not alarm:
+        return figfname_list
 
-        csvfname = make_filename(
-            'ts', prdcfg['dstype'], prdcfg['voltype'], ['csv'],
-            timeinfo=csvtimeinfo_file, timeformat=timeformat,
-            runinfo=prdcfg['runinfo'])[0]
+    return send_monitoring_alarm(
+        date, np_t_vec, cquant_vec, start_time, field_name, savedir,
+        ref_value, np_min, prdcfg)
 
-        csvfname = savedir+csvfname
 
-        start_time = dataset[field_name]['timeinfo']
+def _generate_savevol(dataset, prdcfg):
+    """
+    Saves the field in a radar volume file. The user defined parameters are
+    documented in generate_vol_products
 
-        values = np.ma.masked_all(3)
-        values[1] = dataset[field_name]['value']
-        if 'samples' in dataset[field_name]:
-            values[0] = np.percentile(
-                dataset[field_name]['samples'].compressed(), quantiles[0])
-            values[2] = np.percentile(
-                dataset[field_name]['samples'].compressed(), quantiles[1])
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a radar object
 
-        write_monitoring_ts(
-            start_time, dataset[field_name]['npoints'], values,
-            [quantiles[0], 'value', quantiles[1]],
-            prdcfg['voltype'], csvfname)
-        print('saved CSV file: '+csvfname)
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
 
-        date, np_t_vec, cquant_vec, lquant_vec, hquant_vec = (
-            read_monitoring_ts(csvfname, sort_by_date=sort_by_date))
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
 
-        if date is None:
-            warn(
-                'Unable to plot time series. No valid data')
-            return None
+    """
 
-        if rewrite:
-            val_vec = np.ma.asarray(
-                [lquant_vec, cquant_vec, hquant_vec]).T
-            write_monitoring_ts(
-                date, np_t_vec, val_vec, quantiles, prdcfg['voltype'],
-                csvfname, rewrite=True)
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
 
-        figtimeinfo = None
-        titldate = ''
-        if bias_type == 'instant':
-            figtimeinfo = date[0]
-            titldate = date[0].strftime('%Y-%m-%d')
-        else:
-            titldate = (date[0].strftime('%Y%m%d')+'-' +
-                        date[-1].strftime('%Y%m%d'))
-            if prdcfg.get('add_date_in_fname', False):
-                figtimeinfo = date[0]
-                timeformat = '%Y'
-
-        figfname_list = make_filename(
-            'ts', prdcfg['dstype'], prdcfg['voltype'],
-            prdcfg['imgformat'],
-            timeinfo=figtimeinfo, timeformat=timeformat,
-            runinfo=prdcfg['runinfo'])
+    file_type = prdcfg.get('file_type', 'nc')
+    if file_type not in ('nc', 'h5'):
+        warn('Data could not be saved. ' +
+             'Unknown saving file type '+file_type)
+        return None
 
-        for i, figfname in enumerate(figfname_list):
-            figfname_list[i] = savedir+figfname
+    physical = prdcfg.get('physical', True)
+    compression = prdcfg.get('compression', 'gzip')
+    compression_opts = prdcfg.get('compression_opts', 6)
 
-        titl = (prdcfg['runinfo']+' Monitoring '+titldate)
+    # a shallow copy shares the coordinates with the original radar object.
+    # Only the fields dictionary is replaced
+    new_dataset = copy(dataset['radar_out'])
+    new_dataset.fields = dict()
+    new_dataset.add_field(
+        field_name, dataset['radar_out'].fields[field_name])
 
-        labely = generate_field_name_str(prdcfg['voltype'])
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
 
-        np_min = prdcfg.get('npoints_min', 0)
-        vmin = prdcfg.get('vmin', None)
-        vmax = prdcfg.get('vmax', None)
+    fname = make_single_filename(
+        'savevol', prdcfg['dstype'], prdcfg['voltype'], file_type,
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
 
-        plot_monitoring_ts(
-            date, np_t_vec, cquant_vec, lquant_vec, hquant_vec, field_name,
-            figfname_list, ref_value=ref_value, vmin=vmin, vmax=vmax,
-            np_min=np_min, labelx='Time UTC', labely=labely, titl=titl)
-        print('----- save to '+' '.join(figfname_list))
+    fname = os.path.join(savedir, fname)
 
-        # generate alarms if needed
-        alarm = prdcfg.get('alarm', False)
-        if not alarm:
-            return figfname_list
+    if file_type == 'nc':
+        pyart.io.write_cfradial(fname, new_dataset, physical=physical)
+    else:
+        pyart.aux_io.write_odim_h5(
+            fname, new_dataset, physical=physical,
+            compression=compression, compression_opts=compression_opts)
 
-        if 'tol_abs' not in prdcfg:
-            warn('unable to send alarm. Missing tolerance on target')
-            return None
+    print('saved file: '+fname)
 
-        if 'tol_trend' not in prdcfg:
-            warn('unable to send alarm. Missing tolerance in trend')
-            return None
+    return fname
 
-        if 'nevents_min' not in prdcfg:
-            warn('unable to send alarm. ' +
-                 'Missing minimum number of events to compute trend')
-            return None
 
-        if 'sender' not in prdcfg:
-            warn('unable to send alarm. Missing email sender')
-            return None
-        if 'receiver_list' not in prdcfg:
-            warn('unable to send alarm. Missing email receivers')
-            return None
+def _generate_saveall(dataset, prdcfg):
+    """
+    Saves all fields in a radar volume file. The user defined parameters are
+    documented in generate_vol_products
+
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a radar object
 
-        tol_abs = prdcfg['tol_abs']
-        tol_trend = prdcfg['tol_trend']
-        nevents_min = prdcfg['nevents_min']
-        sender = prdcfg['sender']
-        receiver_list = prdcfg['receiver_list']
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
 
-        np_last = np_t_vec[-1]
-        value_last = cquant_vec[-1]
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
 
-        if np_last < np_min:
-            warn('No valid data on day '+date[-1].strftime('%d-%m-%Y'))
-            return None
+    """
 
-        # check if absolute value exceeded
-        abs_exceeded = False
-        if ((value_last > ref_value+tol_abs) or
-                (value_last < ref_value-tol_abs)):
-            warn('Value '+str(value_last)+' exceeds target '+str(ref_value) +
-                 ' +/- '+str(tol_abs))
-            abs_exceeded = True
-
-        # compute trend and check if last value exceeds it
-        mask = np.ma.getmaskarray(cquant_vec)
-        ind = np.where(np.logical_and(
-            np.logical_not(mask), np_t_vec >= np_min))[0]
-        nvalid = len(ind)
-        if nvalid <= nevents_min:
-            warn('Not enough points to compute reliable trend')
-            np_trend = 0
-            value_trend = np.ma.masked
+    file_type = prdcfg.get('file_type', 'nc')
+    if file_type not in ('nc', 'h5'):
+        warn('Data could not be saved. ' +
+             'Unknown saving file type '+file_type)
+        return None
+
+    datatypes = prdcfg.get('datatypes', None)
+    physical = prdcfg.get('physical', True)
+    compression = prdcfg.get('compression', 'gzip')
+    compression_opts = prdcfg.get('compression_opts', 6)
+
+    savedir = get_product_save_dir(prdcfg, prdcfg['timeinfo'])
+
+    fname = make_single_filename(
+        'savevol', prdcfg['dstype'], 'all_fields', file_type,
+        timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])
+
+    fname = os.path.join(savedir, fname)
+
+    field_names = None
+    if datatypes is not None:
+        field_names = []
+        for datatype in datatypes:
+            field_names.append(get_fieldname_pyart(datatype))
+
+    if file_type == 'nc':
+        if field_names is not None:
+            radar_aux = copy(dataset['radar_out'])
+            radar_aux.fields = dict()
+            for field_name in field_names:
+                if field_name not in dataset['radar_out'].fields:
+                    warn(field_name+' not in radar object')
+                else:
+                    radar_aux.add_field(
+                        field_name,
+                        dataset['radar_out'].fields[field_name])
         else:
-            np_trend_vec = np_t_vec[ind][-(nevents_min+1):-1]
-            data_trend_vec = cquant_vec[ind][-(nevents_min+1):-1]
+            radar_aux = dataset['radar_out']
+        pyart.io.write_cfradial(fname, radar_aux, physical=physical)
+    else:
+        pyart.aux_io.write_odim_h5(
+            fname, dataset['radar_out'], field_names=field_names,
+            physical=physical, compression=compression,
+            compression_opts=compression_opts)
 
-            np_trend = np.sum(np_trend_vec)
-            value_trend = np.sum(data_trend_vec*np_trend_vec)/np_trend
+    print('saved file: '+fname)
 
-        trend_exceeded = False
-        if np_trend > 0:
-            if ((value_last > value_trend+tol_trend) or
-                    (value_last < value_trend-tol_trend)):
-                warn('Value '+str(value_last)+'exceeds trend ' +
-                     str(value_trend)+' +/- '+str(tol_trend))
-                trend_exceeded = True
+    return fname
 
-        if abs_exceeded is False and trend_exceeded is False:
-            return None
 
-        alarm_dir = savedir+'/alarms/'
-        if not os.path.isdir(alarm_dir):
-            os.makedirs(alarm_dir)
-        alarm_fname = make_filename(
-            'alarm', prdcfg['dstype'], prdcfg['voltype'], ['txt'],
-            timeinfo=start_time, timeformat='%Y%m%d')[0]
-        alarm_fname = alarm_dir+alarm_fname
-
-        field_dict = pyart.config.get_metadata(field_name)
-        param_name = get_field_name(field_dict, field_name)
-        param_name_unit = param_name+' ['+field_dict['units']+']'
-
-        write_alarm_msg(
-            prdcfg['RadarName'][0], param_name_unit, start_time, ref_value,
-            tol_abs, np_trend, value_trend, tol_trend, nevents_min, np_last,
-            value_last, alarm_fname)
-
-        print('----- saved monitoring alarm to '+alarm_fname)
-
-        subject = ('NO REPLY: '+param_name+' monitoring alarm for radar ' +
-                   prdcfg['RadarName'][0]+' on day ' +
-                   start_time.strftime('%d-%m-%Y'))
-        send_msg(sender, receiver_list, subject, alarm_fname)
-
-        return alarm_fname
-
-    if prdcfg['type'] == 'SAVEVOL':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+def _generate_savestate(dataset, prdcfg):
+    """
+    Saves the last processed state. The user defined parameters are documented
+    in generate_vol_products
 
-        file_type = prdcfg.get('file_type', 'nc')
-        physical = prdcfg.get('physical', True)
-        compression = prdcfg.get('compression', 'gzip')
-        compression_opts = prdcfg.get('compression_opts', 6)
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a radar object
 
-        new_dataset = deepcopy(dataset['radar_out'])
-        new_dataset.fields = dict()
-        new_dataset.add_field(
-            field_name, dataset['radar_out'].fields[field_name])
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdsavedir, timeinfo=prdcfg['timeinfo'])
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
 
-        fname = make_filename(
-            'savevol', prdcfg['dstype'], prdcfg['voltype'], [file_type],
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])[0]
+    """
 
-        fname = savedir+fname
+    if prdcfg['lastStateFile'] is None:
+        warn('Unable to save last state file. File name not specified')
+        return None
 
-        if file_type == 'nc':
-            pyart.io.write_cfradial(fname, new_dataset, physical=physical)
-        elif file_type == 'h5':
-            pyart.aux_io.write_odim_h5(
-                fname, new_dataset, physical=physical,
-                compression=compression, compression_opts=compression_opts)
-        else:
-            warn('Data could not be saved. ' +
-                 'Unknown saving file type '+file_type)
-            return None
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
 
-        print('saved file: '+fname)
+    max_time = np.max(dataset['radar_out'].time['data'])
+    units = dataset['radar_out'].time['units']
+    calendar = dataset['radar_out'].time['calendar']
+    last_date = num2date(max_time, units, calendar)
 
-        return fname
+    write_last_state(last_date, prdcfg['lastStateFile'])
+    print('saved file: '+prdcfg['lastStateFile'])
 
-    if prdcfg['type'] == 'SAVEALL':
-        file_type = prdcfg.get('file_type', 'nc')
-        datatypes = prdcfg.get('datatypes', None)
-        physical = prdcfg.get('physical', True)
-        compression = prdcfg.get('compression', 'gzip')
-        compression_opts = prdcfg.get('compression_opts', 6)
-
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdsavedir, timeinfo=prdcfg['timeinfo'])
-
-        fname = make_filename(
-            'savevol', prdcfg['dstype'], 'all_fields', [file_type],
-            timeinfo=prdcfg['timeinfo'], runinfo=prdcfg['runinfo'])[0]
-
-        fname = savedir+fname
-
-        field_names = None
-        if datatypes is not None:
-            field_names = []
-            for datatype in datatypes:
-                field_names.append(get_fieldname_pyart(datatype))
-
-        if file_type == 'nc':
-            if field_names is not None:
-                radar_aux = deepcopy(dataset['radar_out'])
-                radar_aux.fields = dict()
-                for field_name in field_names:
-                    if field_name not in dataset['radar_out'].fields:
-                        warn(field_name+' not in radar object')
-                    else:
-                        radar_aux.add_field(
-                            field_name,
-                            dataset['radar_out'].fields[field_name])
-            else:
-                radar_aux = dataset['radar_out']
-            pyart.io.write_cfradial(fname, radar_aux, physical=physical)
-        elif file_type == 'h5':
-            pyart.aux_io.write_odim_h5(
-                fname, dataset['radar_out'], field_names=field_names,
-                physical=physical, compression=compression,
-                compression_opts=compression_opts)
-        else:
-            warn('Data could not be saved. ' +
-                 'Unknown saving file type '+file_type)
+    return prdcfg['lastStateFile']
 
-        print('saved file: '+fname)
 
-        return fname
+def _generate_save_fixed_angle(dataset, prdcfg):
+    """
+    Saves the fixed angle of the last processed volume. The user defined
+    parameters are documented in generate_vol_products
 
-    if prdcfg['type'] == 'SAVESTATE':
-        if prdcfg['lastStateFile'] is None:
-            warn('Unable to save last state file. File name not specified')
-            return None
+    Parameters
+    ----------
+    dataset : dict
+        dictionary with key radar_out containing a radar object
 
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+    prdcfg : dictionary of dictionaries
+        product configuration dictionary of dictionaries
 
-        max_time = np.max(dataset['radar_out'].time['data'])
-        units = dataset['radar_out'].time['units']
-        calendar = dataset['radar_out'].time['calendar']
-        last_date = num2date(max_time, units, calendar)
+    Returns
+    -------
+    filename : str or list of str
+        the name of the file(s) created. None otherwise
 
-        write_last_state(last_date, prdcfg['lastStateFile'])
-        print('saved file: '+prdcfg['lastStateFile'])
+    """
 
-        return prdcfg['lastStateFile']
+    field_name = get_fieldname_pyart(prdcfg['voltype'])
+    if field_name not in dataset['radar_out'].fields:
+        warn(
+            ' Field type ' + field_name +
+            ' not available in data set. Skipping product ' +
+            prdcfg['type'])
+        return None
+
+    savedir = get_product_save_dir(prdcfg, None)
+
+    fname = make_single_filename(
+        'ts', prdcfg['dstype'], 'fixed_angle', 'csv',
+        timeinfo=None, runinfo=prdcfg['runinfo'])
+
+    fname = os.path.join(savedir, fname)
+
+    write_fixed_angle(
+        prdcfg['timeinfo'], dataset['radar_out'].fixed_angle['data'][0],
+        dataset['radar_out'].latitude['data'][0],
+        dataset['radar_out'].longitude['data'][0],
+        dataset['radar_out'].altitude['data'][0],
+        fname)
+    print('saved file: '+fname)
+
+    return fname
+
+
+_VOL_HANDLERS = {
+    'PPI_IMAGE': _generate_ppi_image,
+    'PSEUDOPPI_IMAGE': _generate_pseudoppi_image,
+    'PPI_MAP': _generate_ppi_map,
+    'PPI_CONTOUR_OVERPLOT': _generate_ppi_contour_overplot,
+    'PPIMAP_ROI_OVERPLOT': _generate_ppimap_roi_overplot,
+    'PSEUDOPPI_CONTOUR_OVERPLOT': _generate_pseudoppi_contour_overplot,
+    'PPI_CONTOUR': _generate_ppi_contour,
+    'PSEUDOPPI_CONTOUR': _generate_pseudoppi_contour,
+    'RHI_IMAGE': _generate_rhi_image,
+    'PSEUDORHI_IMAGE': _generate_pseudorhi_image,
+    'RHI_CONTOUR_OVERPLOT': _generate_rhi_contour_overplot,
+    'PSEUDORHI_CONTOUR_OVERPLOT': _generate_pseudorhi_contour_overplot,
+    'RHI_CONTOUR': _generate_rhi_contour,
+    'PSEUDORHI_CONTOUR': _generate_pseudorhi_contour,
+    'RHI_PROFILE': _generate_rhi_profile,
+    'PROFILE_STATS': _generate_profile_stats,
+    'WIND_PROFILE': _generate_wind_profile,
+    'PSEUDOPPI_MAP': _generate_pseudoppi_map,
+    'CAPPI_IMAGE': _generate_cappi_image,
+    'FIXED_RNG_IMAGE': _generate_fixed_rng_image,
+    'FIXED_RNG_SPAN_IMAGE': _generate_fixed_rng_span_image,
+    'PLOT_ALONG_COORD': _generate_plot_along_coord,
+    'BSCOPE_IMAGE': _generate_bscope_image,
+    'TIME_RANGE': _generate_time_range,
+    'HISTOGRAM': _generate_histogram,
+    'SAMPLES_HISTOGRAM': _generate_samples_histogram,
+    'QUANTILES': _generate_quantiles,
+    'FIELD_COVERAGE': _generate_field_coverage,
+    'CDF': _generate_cdf,
+    'SELFCONSISTENCY': _generate_selfconsistency,
+    'SELFCONSISTENCY2': _generate_selfconsistency2,
+    'VOL_TS': _generate_vol_ts,
+    'SAVEVOL': _generate_savevol,
+    'SAVEALL': _generate_saveall,
+    'SAVESTATE': _generate_savestate,
+    'SAVE_FIXED_ANGLE': _generate_save_fixed_angle}
+
+
+def _angle_index(radar, anglenr):
+    """
+    Get the index of the sweep with the anglenr-th smallest fixed angle
 
-    if prdcfg['type'] == 'SAVE_FIXED_ANGLE':
-        field_name = get_fieldname_pyart(prdcfg['voltype'])
-        if field_name not in dataset['radar_out'].fields:
-            warn(
-                ' Field type ' + field_name +
-                ' not available in data set. Skipping product ' +
-                prdcfg['type'])
-            return None
+    Parameters
+    ----------
+    radar : radar object
+        The radar object
+    anglenr : int
+        The position of the angle in the list of sorted fixed angles
 
-        savedir = get_save_dir(
-            prdcfg['basepath'], prdcfg['procname'], dssavedir,
-            prdsavedir, timeinfo=None)
+    Returns
+    -------
+    ind_ang : int
+        The sweep index
+    ang : float
+        The fixed angle of the sweep [deg]
 
-        fname = make_filename(
-            'ts', prdcfg['dstype'], 'fixed_angle', ['csv'],
-            timeinfo=None, runinfo=prdcfg['runinfo'])[0]
+    """
+    ind_ang = get_fixed_angle_order(radar)[anglenr]
 
-        fname = savedir+fname
+    return ind_ang, radar.fixed_angle['data'][ind_ang]
 
-        write_fixed_angle(
-            prdcfg['timeinfo'], dataset['radar_out'].fixed_angle['data'][0],
-            dataset['radar_out'].latitude['data'][0],
-            dataset['radar_out'].longitude['data'][0],
-            dataset['radar_out'].altitude['data'][0],
-            fname)
-        print('saved file: '+fname)
 
-        return fname
+def _height_levels(gate_altitude, height_resolution, hmin=None, hmax=None):
+    """
+    Get the limits and the centers of the height levels of a vertical
+    profile. The limits that are not user defined are the data limits
+    rounded to the height resolution plus a margin of one level
 
-    warn(' Unsupported product type: ' + prdcfg['type'])
-    return None
+    Parameters
+    ----------
+    gate_altitude : float array
+        The altitude of the radar gates [m MSL]
+    height_resolution : float
+        The height resolution of the profile [m]
+    hmin, hmax : float or None
+        The user defined minimum and maximum height [m MSL]. If None they
+        are obtained from the data
+
+    Returns
+    -------
+    minheight, maxheight : float
+        The limits of the profile [m MSL]
+    h_vec : float array
+        The height at the center of each level [m MSL]
+
+    """
+    # the limits obtained from the data are kept as an integer number of
+    # levels so that the number of levels does not depend on rounding
+    if hmin is None:
+        ind_min = int(round(np.min(gate_altitude)/height_resolution))-1
+        minheight = ind_min*height_resolution
+    else:
+        minheight = hmin
+    if hmax is None:
+        ind_max = int(round(np.max(gate_altitude)/height_resolution))+1
+        maxheight = ind_max*height_resolution
+    else:
+        maxheight = hmax
+
+    if hmin is None and hmax is None:
+        nlevels = ind_max-ind_min
+    else:
+        nlevels = int((maxheight-minheight)/height_resolution)
+
+    h_vec = minheight+(np.arange(nlevels)+0.5)*height_resolution
+
+    return minheight, maxheight, h_vec
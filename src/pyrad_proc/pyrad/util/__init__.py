@@ -24,11 +24,14 @@ Radar Utilities
     get_range_bins_to_avg
     find_ray_index
     find_rng_index
+    find_rng_limits
     find_nearest_gate
     find_neighbour_gates
     find_colocated_indexes
     get_target_elevations
     get_fixed_rng_data
+    get_fixed_angle_order
+    get_field_metadata
     time_avg_range
     get_closest_solar_flux
     create_sun_hits_field
@@ -41,6 +44,7 @@ Radar Utilities
     compute_2d_stats
     compute_histogram
     compute_histogram_sweep
+    compute_histogram_counts
     belongs_roi_indices
     compute_profile_stats
     compute_directional_stats
@@ -53,9 +57,11 @@ Radar Utilities
 from .radar_utils import time_avg_range, get_closest_solar_flux
 from .radar_utils import create_sun_hits_field, create_sun_retrieval_field
 from .radar_utils import compute_histogram, compute_histogram_sweep
+from .radar_utils import compute_histogram_counts
 from .radar_utils import compute_quantiles, compute_quantiles_sweep
 from .radar_utils import compute_quantiles_from_hist, get_range_bins_to_avg
 from .radar_utils import find_ray_index, find_rng_index, find_nearest_gate
+from .radar_utils import find_rng_limits
 from .radar_utils import find_colocated_indexes, find_contiguous_times
 from .radar_utils import compute_2d_hist, compute_1d_stats, compute_2d_stats
 from .radar_utils import time_series_statistics, join_time_series
@@ -65,6 +71,7 @@ from .radar_utils import project_to_vertical, find_neighbour_gates
 from .radar_utils import get_target_elevations, get_data_along_rng
 from .radar_utils import get_data_along_azi, get_data_along_ele
 from .radar_utils import get_fixed_rng_data
+from .radar_utils import get_fixed_angle_order, get_field_metadata
 
 from .stat_utils import quantiles_weighted, ratio_bootstrapping
 
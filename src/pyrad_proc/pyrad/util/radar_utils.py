@@ -19,6 +19,7 @@ Miscellaneous functions dealing with radar data
     belongs_roi_indices
     find_ray_index
     find_rng_index
+    find_rng_limits
     find_ang_index
     find_nearest_gate
     find_neighbour_gates
@@ -34,6 +35,7 @@ Miscellaneous functions dealing with radar data
     compute_quantiles_sweep
     compute_histogram
     compute_histogram_sweep
+    compute_histogram_counts
     get_histogram_bins
     compute_2d_stats
     compute_1d_stats
@@ -42,9 +44,15 @@ Miscellaneous functions dealing with radar data
     compute_profile_stats
     compute_directional_stats
     project_to_vertical
+    get_fixed_angle_order
+    get_field_metadata
+    _find_rng_indices
+    _find_ang_indices
 
 """
 from warnings import warn
+from functools import lru_cache
+from types import MappingProxyType
 from copy import deepcopy
 import datetime
 
@@ -67,7 +75,7 @@ except ImportError:
 
 import pyart
 
-from .stat_utils import quantiles_weighted
+from .stat_utils import _sorted_quantiles
 
 
 def get_data_along_rng(radar, field_name, fix_elevations, fix_azimuths,
@@ -103,23 +111,29 @@ def get_data_along_rng(radar, field_name, fix_elevations, fix_azimuths,
     if rmax is None:
         rmax = np.max(radar.range['data'])
 
-    rng_mask = np.logical_and(
-        radar.range['data'] >= rmin, radar.range['data'] <= rmax)
+    # the range gates are sorted: the selected gates form a slice
+    rng_slice = slice(
+        np.searchsorted(radar.range['data'], rmin, side='left'),
+        np.searchsorted(radar.range['data'], rmax, side='right'))
 
-    x = radar.range['data'][rng_mask]
+    x = radar.range['data'][rng_slice]
 
     xvals = []
     yvals = []
     valid_azi = []
     valid_ele = []
+    sweeps = dict()  # sweeps already extracted, by sweep index
     if radar.scan_type == 'ppi':
-        for ele, azi in zip(fix_elevations, fix_azimuths):
-            ind_sweep = find_ang_index(
-                radar.fixed_angle['data'], ele, ang_tol=ang_tol)
-            if ind_sweep is None:
+        ind_sweeps = _find_ang_indices(
+            radar.fixed_angle['data'], fix_elevations, ang_tol=ang_tol)
+        for ele, azi, ind_sweep in zip(
+                fix_elevations, fix_azimuths, ind_sweeps):
+            if ind_sweep < 0:
                 warn('No elevation angle found for fix_elevation '+str(ele))
                 continue
-            new_dataset = radar.extract_sweeps([ind_sweep])
+            if ind_sweep not in sweeps:
+                sweeps[ind_sweep] = radar.extract_sweeps([ind_sweep])
+            new_dataset = sweeps[ind_sweep]
 
             try:
                 dataset_line = pyart.util.cross_section_ppi(
@@ -128,18 +142,21 @@ def get_data_along_rng(radar, field_name, fix_elevations, fix_azimuths,
                 warn(' No data found at azimuth '+str(azi) +
                      ' and elevation '+str(ele))
                 continue
-            yvals.append(dataset_line.fields[field_name]['data'][0, rng_mask])
+            yvals.append(dataset_line.fields[field_name]['data'][0, rng_slice])
             xvals.append(x)
             valid_azi.append(dataset_line.azimuth['data'][0])
             valid_ele.append(dataset_line.elevation['data'][0])
     else:
-        for ele, azi in zip(fix_elevations, fix_azimuths):
-            ind_sweep = find_ang_index(
-                radar.fixed_angle['data'], azi, ang_tol=ang_tol)
-            if ind_sweep is None:
+        ind_sweeps = _find_ang_indices(
+            radar.fixed_angle['data'], fix_azimuths, ang_tol=ang_tol)
+        for ele, azi, ind_sweep in zip(
+                fix_elevations, fix_azimuths, ind_sweeps):
+            if ind_sweep < 0:
                 warn('No azimuth angle found for fix_azimuth '+str(azi))
                 continue
-            new_dataset = radar.extract_sweeps([ind_sweep])
+            if ind_sweep not in sweeps:
+                sweeps[ind_sweep] = radar.extract_sweeps([ind_sweep])
+            new_dataset = sweeps[ind_sweep]
 
             try:
                 dataset_line = pyart.util.cross_section_rhi(
@@ -149,7 +166,7 @@ def get_data_along_rng(radar, field_name, fix_elevations, fix_azimuths,
                      ' and elevation '+str(ele))
                 continue
             yvals.append(
-                dataset_line.fields[field_name]['data'][0, rng_mask])
+                dataset_line.fields[field_name]['data'][0, rng_slice])
             xvals.append(x)
             valid_azi.append(dataset_line.azimuth['data'][0])
             valid_ele.append(dataset_line.elevation['data'][0])
@@ -197,20 +214,28 @@ def get_data_along_azi(radar, field_name, fix_ranges, fix_elevations,
     xvals = []
     valid_rng = []
     valid_ele = []
-    for rng, ele in zip(fix_ranges, fix_elevations):
-        ind_rng = find_rng_index(radar.range['data'], rng, rng_tol=rng_tol)
-        if ind_rng is None:
+    sweeps = dict()  # sweeps already extracted, by sweep index
+    ind_rngs = _find_rng_indices(
+        radar.range['data'], fix_ranges, rng_tol=rng_tol)
+    if radar.scan_type == 'ppi':
+        ind_sweeps = _find_ang_indices(
+            radar.fixed_angle['data'], fix_elevations, ang_tol=ang_tol)
+    else:
+        ind_sweeps = np.zeros(len(fix_ranges), dtype=int)
+    for rng, ele, ind_rng, ind_sweep in zip(
+            fix_ranges, fix_elevations, ind_rngs, ind_sweeps):
+        if ind_rng < 0:
             warn('No range gate found for fix_range '+str(rng))
             continue
 
         if radar.scan_type == 'ppi':
-            ind_sweep = find_ang_index(
-                radar.fixed_angle['data'], ele, ang_tol=ang_tol)
-            if ind_sweep is None:
+            if ind_sweep < 0:
                 warn('No elevation angle found for fix_elevation ' +
                      str(ele))
                 continue
-            new_dataset = radar.extract_sweeps([ind_sweep])
+            if ind_sweep not in sweeps:
+                sweeps[ind_sweep] = radar.extract_sweeps([ind_sweep])
+            new_dataset = sweeps[ind_sweep]
         else:
             try:
                 new_dataset = pyart.util.cross_section_rhi(
@@ -220,14 +245,11 @@ def get_data_along_azi(radar, field_name, fix_ranges, fix_elevations,
                     ' No data found at range '+str(rng) +
                     ' and elevation '+str(ele))
                 continue
+        azi_mask = new_dataset.azimuth['data'] >= azi_start
         if azi_start < azi_stop:
-            azi_mask = np.logical_and(
-                new_dataset.azimuth['data'] >= azi_start,
-                new_dataset.azimuth['data'] <= azi_stop)
+            azi_mask &= new_dataset.azimuth['data'] <= azi_stop
         else:
-            azi_mask = np.logical_or(
-                new_dataset.azimuth['data'] >= azi_start,
-                new_dataset.azimuth['data'] <= azi_stop)
+            azi_mask |= new_dataset.azimuth['data'] <= azi_stop
         yvals.append(
             new_dataset.fields[field_name]['data'][azi_mask, ind_rng])
         xvals.append(new_dataset.azimuth['data'][azi_mask])
@@ -277,9 +299,17 @@ def get_data_along_ele(radar, field_name, fix_ranges, fix_azimuths,
     xvals = []
     valid_rng = []
     valid_azi = []
-    for rng, azi in zip(fix_ranges, fix_azimuths):
-        ind_rng = find_rng_index(radar.range['data'], rng, rng_tol=rng_tol)
-        if ind_rng is None:
+    sweeps = dict()  # sweeps already extracted, by sweep index
+    ind_rngs = _find_rng_indices(
+        radar.range['data'], fix_ranges, rng_tol=rng_tol)
+    if radar.scan_type == 'ppi':
+        ind_sweeps = np.zeros(len(fix_ranges), dtype=int)
+    else:
+        ind_sweeps = _find_ang_indices(
+            radar.fixed_angle['data'], fix_azimuths, ang_tol=ang_tol)
+    for rng, azi, ind_rng, ind_sweep in zip(
+            fix_ranges, fix_azimuths, ind_rngs, ind_sweeps):
+        if ind_rng < 0:
             warn('No range gate found for fix_range '+str(rng))
             continue
 
@@ -293,16 +323,15 @@ def get_data_along_ele(radar, field_name, fix_ranges, fix_azimuths,
                     ' and elevation '+str(azi))
                 continue
         else:
-            ind_sweep = find_ang_index(
-                radar.fixed_angle['data'], azi, ang_tol=ang_tol)
-            if ind_sweep is None:
+            if ind_sweep < 0:
                 warn('No azimuth angle found for fix_azimuth '+str(azi))
                 continue
-            new_dataset = radar.extract_sweeps([ind_sweep])
+            if ind_sweep not in sweeps:
+                sweeps[ind_sweep] = radar.extract_sweeps([ind_sweep])
+            new_dataset = sweeps[ind_sweep]
 
-        ele_mask = np.logical_and(
-            new_dataset.elevation['data'] >= ele_min,
-            new_dataset.elevation['data'] <= ele_max)
+        ele_mask = new_dataset.elevation['data'] >= ele_min
+        ele_mask &= new_dataset.elevation['data'] <= ele_max
         yvals.append(
             new_dataset.fields[field_name]['data'][ele_mask, ind_rng])
         xvals.append(new_dataset.elevation['data'][ele_mask])
@@ -500,12 +529,11 @@ def find_contiguous_times(times, step=600):
 
     print('number of consecutive periods: '+str(len(periods)))
 
-    start_times = np.array([], dtype=datetime.datetime)
-    end_times = np.array([], dtype=datetime.datetime)
-    for period in periods:
-        start_times = np.append(
-            start_times, period[0]-datetime.timedelta(seconds=step))
-        end_times = np.append(end_times, period[-1])
+    start_times = np.empty(len(periods), dtype=datetime.datetime)
+    end_times = np.empty(len(periods), dtype=datetime.datetime)
+    for i, period in enumerate(periods):
+        start_times[i] = period[0]-datetime.timedelta(seconds=step)
+        end_times[i] = period[-1]
 
     return start_times, end_times
 
@@ -729,6 +757,33 @@ def find_rng_index(rng_vec, rng, rng_tol=0.):
     return ind_rng
 
 
+def find_rng_limits(rng_vec, rmin, rmax):
+    """
+    Find the indices of the first range gate beyond rmin and of the last
+    range gate before rmax. The range gates are assumed to be sorted
+
+    Parameters
+    ----------
+    rng_vec : float array
+        The range data array where to look for
+    rmin, rmax : float
+        The range limits [m]
+
+    Returns
+    -------
+    ind_rmin, ind_rmax : int
+        The indices of the range limits. None if there are no range gates
+        between the limits
+
+    """
+    ind_rmin = np.searchsorted(rng_vec, rmin, side='right')
+    ind_rmax = np.searchsorted(rng_vec, rmax, side='left')-1
+    if ind_rmin >= rng_vec.size or ind_rmax < ind_rmin:
+        return None, None
+
+    return ind_rmin, ind_rmax
+
+
 def find_ang_index(ang_vec, ang, ang_tol=0.):
     """
     Find the angle index corresponding to a particular fixed angle
@@ -1081,20 +1136,17 @@ def get_fixed_rng_data(radar, field_names, fixed_rng, rng_tol=50.,
             azi_max = np.max(radar_aux.fixed_angle['data'])
 
     if radar_aux.scan_type == 'ppi':
-        # Get radar elevation angles within limits
-        ele_vec = np.sort(radar_aux.fixed_angle['data'])
-        ele_vec = ele_vec[
-            np.logical_and(ele_vec >= ele_min, ele_vec <= ele_max)]
-        if ele_vec is None:
+        # get sweeps with elevation angles within limits sorted by angle
+        ele_order = np.argsort(radar_aux.fixed_angle['data'], kind='stable')
+        ele_vec = radar_aux.fixed_angle['data'][ele_order]
+        ind_sweeps = ele_order[
+            np.searchsorted(ele_vec, ele_min, side='left'):
+            np.searchsorted(ele_vec, ele_max, side='right')]
+        if ind_sweeps.size == 0:
             warn('No elevation angles between '+str(ele_min)+' and ' +
                  str(ele_max))
             return None, None, None
 
-        # get sweeps corresponding to the desired elevation angles
-        ind_sweeps = []
-        for ele in ele_vec:
-            ind_sweeps.append(
-                np.where(radar_aux.fixed_angle['data'] == ele)[0][0])
         radar_aux = radar_aux.extract_sweeps(ind_sweeps)
 
         # Get indices of rays within limits
@@ -1108,27 +1160,22 @@ def get_fixed_rng_data(radar, field_names, fixed_rng, rng_tol=50.,
                 radar_aux.azimuth['data'] <= azi_max))[0]
 
     else:
-        # Get radar azimuth angles within limits
-        azi_vec = radar_aux.fixed_angle['data']
+        # get sweeps with azimuth angles within limits sorted by angle
+        azi_order = np.argsort(radar_aux.fixed_angle['data'], kind='stable')
+        azi_vec = radar_aux.fixed_angle['data'][azi_order]
+        ind_min = np.searchsorted(azi_vec, azi_min, side='left')
+        ind_max = np.searchsorted(azi_vec, azi_max, side='right')
         if azi_min < azi_max:
-            azi_vec = np.sort(azi_vec[
-                np.logical_and(azi_vec >= azi_min, azi_vec <= azi_max)])
+            ind_sweeps = azi_order[ind_min:ind_max]
         else:
-            azi_vec = azi_vec[
-                np.logical_or(azi_vec >= azi_min, azi_vec <= azi_max)]
-            azi_vec = np.append(
-                np.sort(azi_vec[azi_vec >= azi_min]),
-                np.sort(azi_vec[azi_vec < azi_min]))
-        if azi_vec is None:
+            # sector crossing the north: angles above azi_min go first
+            ind_sweeps = np.append(
+                azi_order[ind_min:], azi_order[:min(ind_min, ind_max)])
+        if ind_sweeps.size == 0:
             warn('No azimuth angles between '+str(azi_min)+' and ' +
                  str(azi_max))
             return None, None, None
 
-        # get sweeps corresponding to the desired azimuth angles
-        ind_sweeps = []
-        for azi in azi_vec:
-            ind_sweeps.append(
-                np.where(radar_aux.fixed_angle['data'] == azi)[0][0])
         radar_aux = radar_aux.extract_sweeps(ind_sweeps)
 
         # Get indices of rays within limits
@@ -1200,7 +1247,7 @@ def create_sun_hits_field(rad_el, rad_az, sun_el, sun_az, data, imgcfg):
         the sun hit field
 
     """
-    if data.compressed().size == 0:
+    if np.ma.count(data) == 0:
         warn('No valid sun hits to plot.')
         return None
 
@@ -1483,6 +1530,38 @@ def compute_histogram_sweep(field, ray_start, ray_end, field_name, step=None):
     return bin_edges, values
 
 
+def compute_histogram_counts(values, bin_edges):
+    """
+    counts the number of values in each histogram bin. If the bins have a
+    uniform width the bin of each value is obtained arithmetically instead
+    of searching the bin edges
+
+    Parameters
+    ----------
+    values : array
+        the values. Masked values are not counted
+    bin_edges : float array
+        the bin edges
+
+    Returns
+    -------
+    hist : int array
+        number of values in each bin
+
+    """
+    values = np.ma.compressed(values)
+    bin_edges = np.asarray(bin_edges)
+    bin_widths = np.diff(bin_edges)
+    if np.allclose(bin_widths, bin_widths[0]):
+        hist, _ = np.histogram(
+            values, bins=bin_widths.size,
+            range=(bin_edges[0], bin_edges[-1]))
+    else:
+        hist, _ = np.histogram(values, bins=bin_edges)
+
+    return hist
+
+
 def get_histogram_bins(field_name, step=None):
     """
     gets the histogram bins using the range limits of the field as defined
@@ -1565,8 +1644,8 @@ def compute_2d_stats(field1, field2, field_name1, field_name2, step1=None,
         np.ma.mean(np.ma.power(10., 0.1*field2)) /
         np.ma.mean(np.ma.power(10., 0.1*field1)))
     medianbias = np.ma.median(field2-field1)
-    quant25bias = np.percentile((field2-field1).compressed(), 25.)
-    quant75bias = np.percentile((field2-field1).compressed(), 75.)
+    quant25bias, quant75bias = np.percentile(
+        (field2-field1).compressed(), [25., 75.])
     ind_max_val1, ind_max_val2 = np.where(hist_2d == np.ma.amax(hist_2d))
     modebias = bin_centers2[ind_max_val2[0]]-bin_centers1[ind_max_val1[0]]
     slope, intercep, corr, _, _ = scipy.stats.linregress(
@@ -1720,7 +1799,8 @@ def compute_profile_stats(field, gate_altitude, h_vec, h_res,
     gate_altitude: ndarray
         the altitude at each radar gate [m MSL]
     h_vec : 1D ndarray
-        height vector [m MSL]
+        height vector [m MSL]. The levels are assumed to be regularly
+        spaced by h_res
     h_res : float
         heigh resolution [m]
     quantity : str
@@ -1752,101 +1832,121 @@ def compute_profile_stats(field, gate_altitude, h_vec, h_res,
     nh = h_vec.size
 
     if quantity == 'mean':
-        vals = np.ma.empty((nh, 3), dtype=float)
-        vals[:] = np.ma.masked
+        vals = np.ma.masked_all((nh, 3), dtype=float)
     elif quantity == 'mode':
-        vals = np.ma.empty((nh, 6), dtype=float)
-        vals[:, 0] = np.ma.masked
-        vals[:, 2] = np.ma.masked
-        vals[:, 4] = np.ma.masked
-        vals[:, 1] = 0
-        vals[:, 3] = 0
-        vals[:, 5] = 0
+        # the modes are masked and their frequencies set to 0
+        vals = np.ma.masked_all((nh, 6), dtype=float)
+        vals[:, 1::2] = 0
     elif quantity == 'regression_mean':
+        if std_field is None or np_field is None:
+            warn('Unable to compute regression mean')
+            return None, None
         vals = np.ma.masked_all((nh, 2), dtype=float)
     else:
         vals = np.ma.masked_all((nh, quantiles.size), dtype=float)
 
     val_valid = np.zeros(nh, dtype=int)
-    for i, h in enumerate(h_vec):
-        data = field[np.logical_and(
-            gate_altitude >= h-h_res/2., gate_altitude < h+h_res/2.)]
-        if include_nans:
-            data[np.ma.getmaskarray(data)] = 0.
-        if data.size == 0:
-            continue
-        if quantity == 'mean':
-            mask = np.ma.getmaskarray(data)
-            nvalid = np.count_nonzero(np.logical_not(mask))
-            if nvalid >= nvalid_min:
-                if make_linear:
-                    data = np.ma.power(10., 0.1*data)
-                    vals[i, 0] = 10.*np.ma.log10(np.ma.mean(data))
-                    vals[i, 1] = 10.*np.ma.log10(np.ma.min(data))
-                    vals[i, 2] = 10.*np.ma.log10(np.ma.max(data))
-                else:
-                    vals[i, 0] = np.ma.mean(data)
-                    vals[i, 1] = np.ma.min(data)
-                    vals[i, 2] = np.ma.max(data)
-                val_valid[i] = nvalid
-
-        elif quantity == 'mode':
-            mask = np.ma.getmaskarray(data)
-            nvalid = np.count_nonzero(np.logical_not(mask))
-            if nvalid >= nvalid_min:
-                val_valid[i] = nvalid
-
-                # get mode
-                data = data.compressed()
-                if data.size == 0:
-                    continue
-                mode, count = scipy.stats.mode(
-                    data, axis=None, nan_policy='omit')
-                vals[i, 0] = mode
-                vals[i, 1] = count/nvalid*100.
-
-                # get second most common
-                data = np.ma.masked_where(data == mode, data).compressed()
-                if data.size == 0:
-                    continue
-                mode, count = scipy.stats.mode(
-                    data, axis=None, nan_policy='omit')
-                vals[i, 2] = mode
-                vals[i, 3] = count/nvalid*100.
-
-                # get third most common
-                data = np.ma.masked_where(data == mode, data).compressed()
-                if data.size == 0:
-                    continue
-                mode, count = scipy.stats.mode(
-                    data, axis=None, nan_policy='omit')
-                vals[i, 4] = mode
-                vals[i, 5] = count/nvalid*100.
-        elif quantity == 'regression_mean':
-            if std_field is None or np_field is None:
-                warn('Unable to compute regression mean')
-                return None, None
-            data_std = std_field[np.logical_and(
-                gate_altitude >= h-h_res/2., gate_altitude < h+h_res/2.)]
-            data_np = np_field[np.logical_and(
-                gate_altitude >= h-h_res/2., gate_altitude < h+h_res/2.)]
+
+    # assign each gate to its height level in a single pass. The levels are
+    # regularly spaced so the level index is obtained arithmetically,
+    # working in place on a single float copy of the altitudes
+    ind_h = np.array(gate_altitude, dtype=float).reshape(-1)
+    ind_h -= h_vec[0]-h_res/2.
+    ind_h *= 1./h_res
+    ind_h = np.floor(ind_h, out=ind_h).astype(int)
+    in_profile = np.logical_and(ind_h >= 0, ind_h < nh)
+
+    # work with plain arrays of values and validity flags
+    values = np.ma.getdata(field).reshape(-1)
+    is_valid = np.logical_not(np.ma.getmaskarray(field).reshape(-1))
+    if include_nans:
+        values = np.where(is_valid, values, 0.)
+        is_valid[:] = True
+
+    if quantity == 'regression_mean':
+        std_field = np.ma.asarray(std_field).reshape(-1)
+        np_field = np.ma.asarray(np_field).reshape(-1)
+        ind_gates = np.where(in_profile)[0]
+        ind_gates = ind_gates[np.argsort(ind_h[ind_gates], kind='stable')]
+        ngates = np.bincount(ind_h[in_profile], minlength=nh)
+        starts = np.cumsum(ngates)-ngates
+        for i in np.where(ngates > 0)[0]:
+            ind = ind_gates[starts[i]:starts[i]+ngates[i]]
+            data = np.ma.masked_where(~is_valid[ind], values[ind])
+            data_np = np_field[ind]
 
             val_valid[i] = np.sum(data_np)
             if val_valid[i] == 0.:
                 continue
 
-            data_var = np.ma.power(data_std, 2.)
+            data_var = np.ma.power(std_field[ind], 2.)
             weights = (data_np-1)/(data_var+0.01)
             vals[i, 0] = np.ma.sum(weights*data)/np.ma.sum(weights)
             vals[i, 1] = np.ma.sqrt(
                 np.ma.sum((data_np-1)*data_var)/np.ma.sum(data_np-1))
+        return vals, val_valid
+
+    # valid data sorted by height level and then by value
+    is_valid &= in_profile
+    data = values[is_valid]
+    ind_h = ind_h[is_valid]
+    order = np.lexsort((data, ind_h))
+    data = data[order]
+    ind_h = ind_h[order]
+    nvalid = np.bincount(ind_h, minlength=nh)
+    starts = np.cumsum(nvalid)-nvalid
+
+    if quantity == 'mean':
+        ind_lev = np.where(nvalid >= max(nvalid_min, 1))[0]
+        nvalid_lev = nvalid[ind_lev]
+        if make_linear:
+            lin_sum = np.bincount(
+                ind_h, weights=np.power(10., 0.1*data), minlength=nh)
+            mean = 10.*np.log10(lin_sum[ind_lev]/nvalid_lev)
         else:
-            _, quants, nvalid = quantiles_weighted(
-                data, quantiles=quantiles)
-            if nvalid is not None:
-                if nvalid >= nvalid_min:
-                    vals[i, :] = quants
-                    val_valid[i] = nvalid
+            val_sum = np.bincount(ind_h, weights=data, minlength=nh)
+            mean = val_sum[ind_lev]/nvalid_lev
+
+        # mean, min and max of all levels stored in a single write
+        vals[ind_lev] = np.stack(
+            (mean, data[starts[ind_lev]],
+             data[starts[ind_lev]+nvalid_lev-1]), axis=-1)
+        val_valid[ind_lev] = nvalid_lev
+
+    elif quantity == 'mode':
+        for i in np.where(nvalid >= max(nvalid_min, 1))[0]:
+            val_valid[i] = nvalid[i]
+            data_lev = data[starts[i]:starts[i]+nvalid[i]]
+
+            # get mode
+            mode, count = scipy.stats.mode(
+                data_lev, axis=None, nan_policy='omit')
+            vals[i, 0] = mode
+            vals[i, 1] = count/nvalid[i]*100.
+
+            # get second most common
+            data_lev = data_lev[data_lev != mode]
+            if data_lev.size == 0:
+                continue
+            mode, count = scipy.stats.mode(
+                data_lev, axis=None, nan_policy='omit')
+            vals[i, 2] = mode
+            vals[i, 3] = count/nvalid[i]*100.
+
+            # get third most common
+            data_lev = data_lev[data_lev != mode]
+            if data_lev.size == 0:
+                continue
+            mode, count = scipy.stats.mode(
+                data_lev, axis=None, nan_policy='omit')
+            vals[i, 4] = mode
+            vals[i, 5] = count/nvalid[i]*100.
+    else:
+        # quantiles_weighted requires at least 3 valid points
+        ind_lev = np.where(nvalid >= max(nvalid_min, 3))[0]
+        vals[ind_lev, :] = _sorted_quantiles(
+            data, quantiles, starts[ind_lev], nvalid[ind_lev])
+        val_valid[ind_lev] = nvalid[ind_lev]
 
     return vals, val_valid
 
@@ -1939,3 +2039,116 @@ def project_to_vertical(data_in, data_height, grid_height, interp_kind='none',
         data_out = np.ma.masked_values(f(grid_height), fill_value)
 
     return data_out
+
+
+def get_fixed_angle_order(radar):
+    """
+    Get the sweep indices sorted by fixed angle. The order is computed once
+    and stored in the radar object so that all the products generated from
+    the same radar object share it
+
+    Parameters
+    ----------
+    radar : radar object
+        The radar object
+
+    Returns
+    -------
+    order : int array
+        The sweep indices sorted by increasing fixed angle
+
+    """
+    fixed_angle = radar.fixed_angle['data']
+    cached = getattr(radar, '_sorted_fa_order', None)
+    if cached is not None and cached[0] is fixed_angle:
+        return cached[1]
+
+    order = np.argsort(fixed_angle, kind='stable')
+    radar._sorted_fa_order = (fixed_angle, order)
+
+    return order
+
+
+@lru_cache(maxsize=128)
+def get_field_metadata(field_name):
+    """
+    Gets the default Py-ART metadata of a field. The metadata is cached
+    since it is requested by products every volume. It is returned as a
+    read-only mapping because all the callers share it
+
+    Parameters
+    ----------
+    field_name : str
+        name of the field
+
+    Returns
+    -------
+    field_dict : read-only mapping
+        the field metadata
+
+    """
+    return MappingProxyType(pyart.config.get_metadata(field_name))
+
+
+def _find_rng_indices(rng_vec, rng_list, rng_tol=0.):
+    """
+    Find the range indices corresponding to a list of ranges. All the
+    ranges are looked up at once with a binary search, the range data
+    array being sorted
+
+    Parameters
+    ----------
+    rng_vec : float array
+        The sorted range data array where to look for
+    rng_list : list of floats
+        The ranges to search
+    rng_tol : float
+        Tolerance [m]
+
+    Returns
+    -------
+    ind_rng : int array
+        The range indices. -1 if no range gate is found within the
+        tolerance
+
+    """
+    rng = np.asarray(rng_list, dtype=float)
+    if rng_vec.size == 1:
+        ind_rng = np.zeros(rng.size, dtype=int)
+    else:
+        # closest of the two neighbouring gates. On a tie the first one is
+        # kept, as np.argmin does
+        ind_rng = np.clip(np.searchsorted(rng_vec, rng), 1, rng_vec.size-1)
+        ind_rng -= (
+            rng-rng_vec[ind_rng-1] <= rng_vec[ind_rng]-rng).astype(int)
+    ind_rng[np.abs(rng_vec[ind_rng]-rng) > rng_tol] = -1
+
+    return ind_rng
+
+
+def _find_ang_indices(ang_vec, ang_list, ang_tol=0.):
+    """
+    Find the angle indices corresponding to a list of fixed angles. The
+    distances between all the angles are computed at once
+
+    Parameters
+    ----------
+    ang_vec : float array
+        The angle data array where to look for
+    ang_list : list of floats
+        The angles to search
+    ang_tol : float
+        Tolerance [deg]
+
+    Returns
+    -------
+    ind_ang : int array
+        The angle indices. -1 if no angle is found within the tolerance
+
+    """
+    ang = np.asarray(ang_list, dtype=float)
+    dist = np.abs(ang_vec[np.newaxis, :]-ang[:, np.newaxis])
+    ind_ang = np.argmin(dist, axis=1)
+    ind_ang[dist[np.arange(ang.size), ind_ang] > ang_tol] = -1
+
+    return ind_ang
@@ -9,6 +9,7 @@ Miscellaneous functions dealing with statistics
 
     quantiles_weighted
     ratio_bootstrapping
+    _sorted_quantiles
 
 """
 
@@ -54,6 +55,7 @@ def quantiles_weighted(values, weight_vector=None, quantiles=np.array([0.5]),
 
     """
 
+    uniform_weights = weight_vector is None
     if weight_vector is not None:
         if weight_vector.size != values.shape[0]:
             raise Exception(
@@ -97,22 +99,27 @@ def quantiles_weighted(values, weight_vector=None, quantiles=np.array([0.5]),
 
     # sort the valid data
     values = values[~mask]
-    weight_vector = weight_vector[~mask]
+    if uniform_weights:
+        quants = _sorted_quantiles(
+            np.sort(np.ma.getdata(values), axis=None), quantiles, 0, nvalid)
+    else:
+        weight_vector = weight_vector[~mask]
 
-    sorter = np.argsort(values, axis=None)
-    values = values[sorter]
-    weight_vector = weight_vector[sorter]
+        sorter = np.argsort(values, axis=None)
+        values = values[sorter]
+        weight_vector = weight_vector[sorter]
 
-    weighted_quantiles = np.cumsum(weight_vector) - 0.5 * weight_vector
+        weighted_quantiles = (
+            np.cumsum(weight_vector) - 0.5 * weight_vector)
 
-    weighted_quantiles /= total_weight
+        weighted_quantiles /= total_weight
 
-    # As done by np.percentile():
-    # weighted_quantiles -= weighted_quantiles[0]
-    # weighted_quantiles /= weighted_quantiles[-1]
+        # As done by np.percentile():
+        # weighted_quantiles -= weighted_quantiles[0]
+        # weighted_quantiles /= weighted_quantiles[-1]
 
-    # Note: Does not extrapolate
-    quants = np.interp(quantiles, weighted_quantiles, values)
+        # Note: Does not extrapolate
+        quants = np.interp(quantiles, weighted_quantiles, values)
 
     if data_is_log:
         # Convert lin to log
@@ -154,3 +161,42 @@ def ratio_bootstrapping(nominator, denominator, nsamples=1000):
         samples[i] = (np.ma.sum(nominator[ind_sample]) /
                       np.ma.sum(denominator[ind_sample]))
     return samples
+
+
+def _sorted_quantiles(sorted_values, quantiles, starts, nvalid):
+    """
+    Computes the quantiles of one or several segments of sorted data with
+    uniform weights. The result is the same as the one of
+    quantiles_weighted without weights but the values are looked up
+    directly at the quantile positions
+
+    Parameters
+    ----------
+    sorted_values : 1D array of floats
+        The valid values. Each segment must be sorted in increasing order
+    quantiles : array of floats
+        The quantiles to be computed
+    starts : int or 1D array of ints
+        The position of the first value of each segment
+    nvalid : int or 1D array of ints
+        The number of values of each segment. Must be larger than 0
+
+    Returns
+    -------
+    quants : array of floats
+        The quantiles. If starts and nvalid are arrays it has shape
+        (number of segments, number of quantiles)
+
+    """
+    starts = np.asarray(starts)[..., np.newaxis]
+    nvalid = np.asarray(nvalid)[..., np.newaxis]
+
+    # position of each quantile within the segment. The value of the
+    # k-th sorted point is attributed to the quantile (k+0.5)/nvalid
+    pos = np.clip(np.asarray(quantiles)*nvalid-0.5, 0, nvalid-1)
+    ind_low = np.floor(pos).astype(int)
+    ind_high = np.minimum(ind_low+1, nvalid-1)
+    weight = pos-ind_low
+
+    return (sorted_values[starts+ind_low]*(1.-weight) +
+            sorted_values[starts+ind_high]*weight)